@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""MCPサーバーのベンチマーク: 大きなワークスペースを決まった乱数で作り、ツールの関数を直接呼んで測る。
+`cd mcp && python3 bench.py` で全部走る。
+
+長く使われたワークスペース（materials/ に1万ファイル、500KBの entry_draft.md、100万行の journal.jsonl、1万人の名簿）を
+シナリオごとに用意し、1回の呼び出しの時間（中央値）とメモリの山（tracemalloc）を測って
+bench_baseline.json の基準値と比べる。しきい値は bench_budget.yaml。超えたシナリオがあれば終了コード1。
+  -k 語       名前にその語を含むシナリオだけ走らせる（例: -k journal）
+  -n N        時間を測る回数（既定 5。cold のシナリオは常に1回）
+  --update    実測値で bench_baseline.json を書き直す（走らせたシナリオの分だけ）
+ワークスペースは一時フォルダに作って最後に消す。サーバーの .state.json には触らない。"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import pathlib
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+import server as S
+
+HERE = pathlib.Path(__file__).resolve().parent
+BASELINE_FILE = HERE / "bench_baseline.json"
+BUDGET_FILE = HERE / "bench_budget.yaml"
+SEED = 20250801
+
+
+# ---------- ワークスペースの生成 ----------
+# 本文は質問バンクの記入例（日本語の実文）を乱数で継ぎ合わせる。検索の索引の大きさが実際に近くなるように
+
+def _phrases() -> list[str]:
+    out = [f["example"] for b in S.bank["blocks"] for f in b["fields"] if f.get("example")]
+    return [ln for ex in out for ln in ex.splitlines() if ln.strip()]
+
+
+def _text(rng: random.Random, phrases: list[str], size: int) -> str:
+    parts, n = [], 0
+    while n < size:
+        p = rng.choice(phrases) + ("\n\n" if rng.random() < 0.2 else "\n")
+        parts.append(p)
+        n += len(p.encode())
+    return "".join(parts)
+
+
+def _workspace(root: pathlib.Path, name: str) -> pathlib.Path:
+    ws = root / name
+    for sub in ("materials", "fukabori", "review"):
+        (ws / sub).mkdir(parents=True, exist_ok=True)
+    return ws
+
+
+def make_materials(root: pathlib.Path) -> pathlib.Path:
+    """materials/ に1万ファイル（100フォルダ×100、200B〜2KB。md・txt・csv）"""
+    rng, phrases = random.Random(SEED), _phrases()
+    ws = _workspace(root, "materials10k")
+    for d in range(100):
+        sub = ws / "materials" / f"d{d:03}"
+        sub.mkdir()
+        for i in range(100):
+            ext = rng.choice((".md", ".txt", ".csv"))
+            if ext == ".csv":
+                body = "年度,売上高,営業利益\n" + "".join(
+                    f"{2000 + y},{rng.randint(1, 90)}億,{rng.randint(1, 900)}万\n" for y in range(rng.randint(5, 60)))
+            else:
+                body = _text(rng, phrases, rng.randint(200, 2000))
+            (sub / f"f{i:03}{ext}").write_text(body)
+    return ws
+
+
+def make_draft(root: pathlib.Path) -> pathlib.Path:
+    """500KB の entry_draft.md（版が2つ）と、数字のある深掘りの記録"""
+    rng, phrases = random.Random(SEED + 1), _phrases()
+    ws = _workspace(root, "draft500k")
+    S.STATE_FILE.write_text(json.dumps({"workspace": str(ws)}))
+    draft = _text(rng, phrases, 500 * 1024)
+    S.workspace_record("entry_draft", draft)
+    lines = draft.splitlines(keepends=True)
+    for i in range(0, len(lines), 200):  # 200行ごとに1行を書き換えた版
+        lines[i] = "（改）" + lines[i]
+    S.workspace_record("entry_draft", "".join(lines))
+    for b in S.bank["blocks"]:
+        if b["id"] in ("q6_market", "q8_bm", "q10_budget"):
+            S.workspace_record(f"fukabori/{b['id']}", "\n".join(f["example"] for f in b["fields"]))
+    return ws
+
+
+def make_journal(root: pathlib.Path) -> pathlib.Path:
+    """100万行の journal.jsonl（記録・初期化の事象を1秒刻みで）"""
+    rng = random.Random(SEED + 2)
+    ws = _workspace(root, "journal1m")
+    sections = list(S.SECTIONS) + [f"fukabori/{b['id']}" for b in S.bank["blocks"]]
+    with (ws / "journal.jsonl").open("w") as f:
+        for i in range(1_000_000):
+            ts = f"2026-{1 + i // 2_600_000:02}-{1 + i // 86_400 % 28:02}T{i // 3600 % 24:02}:{i // 60 % 60:02}:{i % 60:02}+09:00"
+            f.write(json.dumps({"event": "record", "section": rng.choice(sections), "mode": "append",
+                                "chars": rng.randint(10, 4000), "rev": i // 50 + 1, "ts": ts}) + "\n")
+    return ws
+
+
+def make_roster(root: pathlib.Path) -> pathlib.Path:
+    """1万人の名簿 roster.csv（セミナーの参加者名簿。4人に1人は立場が「不明」で読めない）"""
+    rng = random.Random(SEED + 3)
+    ws = _workspace(root, "roster10k")
+    with (ws / "roster.csv").open("w", encoding="utf-8-sig") as f:
+        f.write("氏名,生年月日,立場,中小企業,承継の時期\n")
+        for i in range(10_000):
+            born = f"{rng.randint(1970, 2002)}/{rng.randint(1, 12)}/{rng.randint(1, 28)}"
+            pos = rng.choice(("後継者", "別法人の代表", "どちらでもない", "不明"))
+            f.write(f"参加者{i:05},{born},{pos},{rng.choice(('はい', 'わからない', 'いいえ'))},"
+                    f"{rng.choice(('はい', '未定', 'いいえ', ''))}\n")
+    return ws
+
+
+FIXTURES = {"materials10k": make_materials, "draft500k": make_draft, "journal1m": make_journal,
+            "roster10k": make_roster}
+
+
+# ---------- シナリオ ----------
+# (ワークスペース, 呼ぶ関数, cold) 。cold は1回だけ測る（初回の索引づくりなど、2回目からは別物になるもの）
+
+def _cold_search():
+    S._materials_cache.clear()
+    shutil.rmtree(S._ws() / ".cache", ignore_errors=True)
+    return S.workspace_search("売上 営業利益")
+
+
+def _coverage_500k():
+    return S.fukabori_coverage("roots", (S._ws() / "entry_draft.md").read_text())
+
+
+SCENARIOS = {
+    "state:materials10k": ("materials10k", S.workspace_state, False),
+    "search:materials10k:cold": ("materials10k", _cold_search, True),
+    "search:materials10k:warm": ("materials10k", lambda: S.workspace_search("売上 営業利益"), False),
+    "record:append:draft500k": ("draft500k", lambda: S.workspace_record("entry_draft", "追記の段落です。\n", "append"), False),
+    "history:draft500k": ("draft500k", lambda: S.workspace_history("entry_draft"), False),
+    "diff:draft500k": ("draft500k", lambda: S.workspace_diff("entry_draft", 1, 2), False),
+    "coverage:draft500k": ("draft500k", _coverage_500k, False),
+    "cross_check:draft500k": ("draft500k", lambda: S.cross_check(), False),
+    "export:md:draft500k": ("draft500k", lambda: S.workspace_export("md"), False),
+    "journal:append:1m": ("journal1m", lambda: S._journal(S._ws(), {"event": "bench"}), False),
+    "state:journal1m": ("journal1m", S.workspace_state, False),
+    "screen:roster10k": ("roster10k", lambda: S.screen_candidates("roster.csv"), False),
+}
+
+
+def measure(fn, repeat: int) -> dict:
+    """時間は tracemalloc なしで repeat 回の中央値、メモリの山は別の1回で測る"""
+    fn()  # 1回目（読み込み・キャッシュづくり）は測らない
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"ms": round(statistics.median(times), 2), "peak_kb": round(peak / 1024)}
+
+
+def measure_cold(fn) -> dict:
+    gc.collect()
+    t0 = time.perf_counter()
+    fn()
+    ms = (time.perf_counter() - t0) * 1000
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"ms": round(ms, 2), "peak_kb": round(peak / 1024)}
+
+
+# ---------- 基準値との比較 ----------
+
+def load_budget() -> dict:
+    b = yaml.safe_load(BUDGET_FILE.read_text())
+    return {name: {**b["default"], **(b.get("scenarios") or {}).get(name, {})} for name in SCENARIOS}
+
+
+def regressions(name: str, got: dict, base: dict | None, budget: dict) -> list[str]:
+    """基準値より time_ratio 倍（かつ min_ms 以上）遅い・memory_ratio 倍（かつ min_kb 以上）重いもの"""
+    if not base:
+        return []
+    out = []
+    if got["ms"] > base["ms"] * budget["time_ratio"] and got["ms"] - base["ms"] > budget["min_ms"]:
+        out.append(f"{name}: {got['ms']}ms（基準 {base['ms']}ms の {got['ms'] / max(base['ms'], 0.01):.1f}倍）")
+    if got["peak_kb"] > base["peak_kb"] * budget["memory_ratio"] and got["peak_kb"] - base["peak_kb"] > budget["min_kb"]:
+        out.append(f"{name}: メモリ {got['peak_kb']}KB（基準 {base['peak_kb']}KB の "
+                   f"{got['peak_kb'] / max(base['peak_kb'], 1):.1f}倍）")
+    return out
+
+
+def write_baseline(rows: dict) -> None:
+    """1シナリオ1行のJSON（キー順固定。差分がそのまま読めるように）。走らせなかったシナリオは前の値を残す"""
+    base = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    base.update(rows)
+    lines = [f'  "{name}": {json.dumps(base[name], sort_keys=True)}' for name in sorted(base) if name in SCENARIOS]
+    BASELINE_FILE.write_text("{\n" + ",\n".join(lines) + "\n}\n", encoding="utf-8")
+    print(f"→ {BASELINE_FILE.name}（{len(rows)}シナリオを更新）")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("-k", dest="keyword", default="")
+    ap.add_argument("-n", dest="repeat", type=int, default=5)
+    ap.add_argument("--update", action="store_true")
+    args = ap.parse_args(argv)
+
+    names = [n for n in SCENARIOS if args.keyword in n]
+    if not names:
+        print(f"該当するシナリオがない: -k {args.keyword}")
+        return 1
+    budgets = load_budget()
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    rows, failures = {}, []
+    with tempfile.TemporaryDirectory(prefix="shinseider-bench-") as tmp:
+        root = pathlib.Path(tmp)
+        S.STATE_FILE = root / "state.json"  # 利用者の .state.json は触らない
+        made = {}
+        for name in names:
+            fixture, fn, cold = SCENARIOS[name]
+            if fixture not in made:
+                t0 = time.perf_counter()
+                made[fixture] = FIXTURES[fixture](root)
+                print(f"  （生成 {fixture}: {time.perf_counter() - t0:.1f}s）")
+            S.STATE_FILE.write_text(json.dumps({"workspace": str(made[fixture])}))
+            rows[name] = measure_cold(fn) if cold else measure(fn, args.repeat)
+            base = baseline.get(name)
+            fs = regressions(name, rows[name], base, budgets[name])
+            failures += fs
+            ref = f"基準 {base['ms']:>9.2f}ms {base['peak_kb']:>8}KB" if base else "基準なし"
+            print(f"  {rows[name]['ms']:>9.2f}ms {rows[name]['peak_kb']:>8}KB  {ref}  "
+                  f"{'NG' if fs else 'ok'}  {name}")
+    if args.update:
+        write_baseline(rows)
+        return 0
+    if failures:
+        print("NG（基準値より遅い・重い）:")
+        for f in failures:
+            print(" -", f)
+        return 1
+    print(f"OK: {len(names)}シナリオ / 基準値の範囲内")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
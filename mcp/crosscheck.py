@@ -0,0 +1,278 @@
+"""質問バンクの横断整合（cross_checks）のうち、数字で検算できるものの計算（MCPサーバーが使う）。
+
+深掘りの記録と申請書の原稿から、日本語の単位つきの数（円・万円・億円・人・社・件・%など）を拾って
+そろえ、(1) 1行の式（A × B = C、A - B = C、… = 合計D）の計算、(2) 月額↔年額の書き添え、
+(3) ブロックをまたぐ数字のつながり（単価×数量↔売上↔SOM、初期投資↔利益の回収年数、運営費↔売上）を確かめる。
+1ファイルから拾った結果は中身のハッシュごとに持ち回すので、変わっていない記録は読み直さない。
+数字の意味（どの数が何を表すか）の判定は見出し語による目安。最終的な指摘はLLMが原文と照らして行う。
+mcp パッケージには依存しない。
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+_INT = r"(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?"
+_QTY = re.compile(rf"([△▲]|(?<![\w)）])-)?((?:{_INT}[億万千]?)+)(円|人|名|社|件|台|個|%|ヶ月|か月|カ月|年)?(?:\s*/\s*(月|年))?")
+_PART = re.compile(rf"({_INT})([億万千]?)")
+_MULT = {"億": 1e8, "万": 1e4, "千": 1e3, "": 1}
+_OPS = re.compile(r"[×✕*÷+]|\s[-−ー]\s")
+_PER_PREFIX = {"月": ("月間", "月次", "毎月", "月額"), "年": ("年間", "年商", "毎年", "年額")}
+_BOUNDARY = re.compile(r".*[=×✕*÷+/、，,：:（(]")
+
+# 見出し語 → 数字の種類。どれも円（または単位なしの万・億）の数だけ拾う
+LABELS = {
+    "unit_price": ("単価",),
+    "revenue": ("売上",),
+    "profit": ("利益",),
+    "capex": ("初期投資", "CAPEX", "設備投資"),
+    "opex": ("運営費", "OPEX"),
+    "som": ("SOM",),
+}
+LABEL_NAMES = {"unit_price": "単価", "revenue": "売上", "profit": "利益", "capex": "初期投資",
+               "opex": "運営費", "som": "SOM"}
+ANNUAL = {"revenue", "profit", "opex"}  # 月額なら12倍して年額でそろえる種類
+TOTALS = {"capex", "opex"}              # 内訳を並べて「合計」で締める種類（合計の値を取る）
+TOLERANCE = 0.01        # 計算の一致とみなす相対誤差（端数の丸め分）
+PAYBACK_WARN_YEARS = 5  # 回収年数がこれを超えたら指摘（補助事業の計画期間の目安）
+
+_cache: dict[str, dict] = {}
+
+
+def yen(v: float) -> str:
+    """金額の表記（1,600億円 / 6,400万円 / △40万円）"""
+    sign, v = ("△" if v < 0 else ""), abs(v)
+    for div, suf in ((1e8, "億円"), (1e4, "万円"), (1, "円")):
+        if v >= div or div == 1:
+            x = v / div
+            return sign + (f"{x:,.0f}" if x == int(x) else f"{x:,.2f}".rstrip("0")) + suf
+    return ""
+
+
+def _fmt(q: dict) -> str:
+    s = yen(q["value"]) if q["unit"] in ("円", "") and abs(q["value"]) >= 1e4 else f"{q['value']:,g}{q['unit']}"
+    return s + (f"/{q['per']}" if q["per"] else "")
+
+
+def quantities(line: str) -> list[dict]:
+    """1行の中の単位つきの数。value は円・人・件などの素の値（4億8,000万円 → 480000000）"""
+    out = []
+    for m in _QTY.finditer(line):
+        sign, numeral, unit, per = m.groups()
+        value = sum(float(n.replace(",", "")) * _MULT[k] for n, k in _PART.findall(numeral))
+        if sign:
+            value = -value
+        unit = {"名": "人", "か月": "ヶ月", "カ月": "ヶ月"}.get(unit or "", unit or "")
+        if not per:
+            head = _BOUNDARY.sub("", line[:m.start()])
+            per = next((p for p, words in _PER_PREFIX.items() if any(w in head for w in words)), None)
+            if not per and head.endswith("月") and unit == "円":
+                per = "月"
+        out.append({"value": value, "unit": unit, "per": per, "start": m.start(), "end": m.end(),
+                    "text": m.group(0)})
+    return out
+
+
+def _evaluate(expr: str) -> tuple[float, str] | None:
+    """数と演算子だけの式を計算する（×÷を先に）。各項に数がちょうど1つでなければ None"""
+    ops = [m.group(0).strip() for m in _OPS.finditer(expr)]
+    terms = [quantities(t) for t in _OPS.split(expr)]
+    if not ops or any(len(t) != 1 for t in terms):
+        return None
+    vals = [t[0]["value"] / 100 if t[0]["unit"] == "%" else t[0]["value"] for t in terms]
+    unit = "円" if any(t[0]["unit"] == "円" for t in terms) else terms[0][0]["unit"]
+    total, acc = 0.0, vals[0]
+    for op, v in zip(ops, vals[1:]):
+        if op in "×✕*":
+            acc *= v
+        elif op == "÷":
+            if v == 0:
+                return None
+            acc /= v
+        else:
+            total += acc
+            acc = -v if op in "-−ー" else v
+    return total + acc, unit
+
+
+def _close(a: float, b: float) -> bool:
+    return abs(a - b) <= max(TOLERANCE * max(abs(a), abs(b)), 0.5)
+
+
+def _equations(lines: list[str], name: str) -> list[dict]:
+    """1行の式の検算。合わない式だけを所見として返す"""
+    findings = []
+    for no, line in enumerate(lines, 1):
+        where = f"{name}:{no}"
+        segs = line.split("=")
+        for left, right in zip(segs, segs[1:]):
+            rq = quantities(right)
+            if not rq:
+                continue
+            result = rq[0]
+            head = right[:result["start"]]
+            got = _evaluate(left)
+            if got is None and "合計" in head:
+                # 「A / B / C = 合計D」: 左辺の同じ単位の数の和
+                items = [q["value"] for q in quantities(left) if q["unit"] == result["unit"]]
+                got = (sum(items), result["unit"]) if len(items) >= 2 else None
+            if got is None:
+                continue
+            if not _close(got[0], result["value"]):
+                findings.append({"level": "error", "kind": "arithmetic", "where": where,
+                                 "message": f"計算が合わない: {left.strip()} は {_fmt({**result, 'value': got[0]})}"
+                                            f"（記載は {result['text']}）"})
+        # 「400万円/月（4,800万円/年）」の月額↔年額
+        qs = quantities(line)
+        for a, b in zip(qs, qs[1:]):
+            if a["per"] == "月" and b["per"] == "年" and line[a["end"]:b["start"]].strip() in ("（", "("):
+                if not _close(a["value"] * 12, b["value"]):
+                    findings.append({"level": "error", "kind": "arithmetic", "where": where,
+                                     "message": f"月額×12が年額と合わない: {a['text']} ×12 = {_fmt({**a, 'value': a['value'] * 12, 'per': '年'})}"
+                                                f"（記載は {b['text']}）"})
+    return findings
+
+
+def _figures(lines: list[str], name: str) -> dict[str, list[dict]]:
+    """見出し語（単価・売上・利益・初期投資・運営費・SOM）に結びついた金額"""
+    out: dict[str, list[dict]] = {}
+    carry: list[str] = []
+    for no, line in enumerate(lines, 1):
+        qs = quantities(line)
+        money = [q for q in qs if q["unit"] in ("円", "") and abs(q["value"]) >= 1000]
+        found = []
+        if carry and "=" in line and qs:
+            found += [(kind, quantities(line.split("=")[-1])[:1]) for kind in carry]
+        carry = []
+        for kind, words in LABELS.items():
+            for w in words:
+                for m in re.finditer(re.escape(w), line):
+                    eq = line.find("=", m.end())
+                    total = kind in TOTALS and re.search(r"合計", line[m.end():])
+                    if total:
+                        pick = [q for q in money if q["start"] >= m.end() + total.start()][:1]
+                    elif eq != -1 and not [q for q in qs if m.end() <= q["start"] < eq]:
+                        pick = quantities(line.split("=")[-1])[:1]
+                        if not qs:
+                            carry.append(kind)  # 「売上 = 月間案件数 × 平均単価」→ 次の行の式の答え
+                    else:
+                        pick = [q for q in qs if q["start"] >= m.end()][:1]
+                    found.append((kind, pick))
+        for kind, pick in found:
+            for q in pick:
+                if q["unit"] in ("円", "") and abs(q["value"]) >= 1000:
+                    out.setdefault(kind, []).append({**q, "where": f"{name}:{no}"})
+    return out
+
+
+def file_facts(name: str, text: str) -> dict:
+    """1ファイル分の検算と金額の拾い出し（中身のハッシュが同じなら前回の結果）"""
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    key = f"{name}:{digest}"
+    if key not in _cache:
+        lines = unicodedata.normalize("NFKC", text).splitlines()
+        _cache[key] = {"equations": _equations(lines, name), "figures": _figures(lines, name),
+                       "quantities": sum(len(quantities(ln)) for ln in lines)}
+    return _cache[key]
+
+
+def _annual(q: dict, kind: str) -> float:
+    return q["value"] * 12 if kind in ANNUAL and q["per"] == "月" else q["value"]
+
+
+def _money_links(figs: dict[str, list[dict]]) -> list[dict]:
+    """money_consistency: 単価×数量↔収益式↔投資回収"""
+    out = []
+    prices = {}
+    for q in figs.get("unit_price", []):
+        prices.setdefault(round(q["value"]), q)
+    if len(prices) > 1:
+        out.append({"level": "warn", "kind": "link", "where": " / ".join(q["where"] for q in prices.values()),
+                    "message": "単価が記録によって違う: " + "、".join(_fmt(q) for q in prices.values())})
+    revenue = max((_annual(q, "revenue") for q in figs.get("revenue", []) if q["per"]), default=None)
+    som = max((q["value"] for q in figs.get("som", [])), default=None)
+    if revenue is not None and som:
+        level = "warn" if revenue > som * (1 + TOLERANCE) else "info"
+        out.append({"level": level, "kind": "link", "where": "売上↔SOM",
+                    "message": f"年間売上 {yen(revenue)} はSOM {yen(som)} の {revenue / som:.0%}"
+                               + ("（獲得可能な市場を超えている）" if level == "warn" else "")})
+    profits = [q for q in figs.get("profit", []) if q["per"]]
+    capex = max((q["value"] for q in figs.get("capex", [])), default=None)
+    if profits and capex:
+        profit = _annual(profits[-1], "profit")
+        if profit <= 0:
+            out.append({"level": "warn", "kind": "link", "where": profits[-1]["where"],
+                        "message": f"年間利益が {yen(profit)} のため、初期投資 {yen(capex)} を回収できない"})
+        else:
+            years = capex / profit
+            out.append({"level": "warn" if years > PAYBACK_WARN_YEARS else "info", "kind": "link",
+                        "where": "初期投資↔利益",
+                        "message": f"回収年数 = 初期投資 {yen(capex)} ÷ 年間利益 {yen(profit)} = {years:.1f}年"})
+    opex = [q for q in figs.get("opex", []) if q["per"]]
+    if opex and revenue is not None and _annual(opex[-1], "opex") > revenue:
+        out.append({"level": "warn", "kind": "link", "where": opex[-1]["where"],
+                    "message": f"年間運営費 {yen(_annual(opex[-1], 'opex'))} が年間売上 {yen(revenue)} を上回る（赤字）"})
+    return out
+
+
+def _draft_links(records: dict[str, list[dict]], draft: dict[str, list[dict]]) -> list[dict]:
+    """申請書の金額が、深掘りの記録のどの値とも合わないもの"""
+    out = []
+    for kind, qs in draft.items():
+        known = records.get(kind, [])
+        if not known:
+            continue
+        for q in qs:
+            if not any(_close(_annual(q, kind), _annual(k, kind)) for k in known):
+                out.append({"level": "warn", "kind": "draft", "where": q["where"],
+                            "message": f"申請書の{LABEL_NAMES[kind]} {_fmt(q)} が深掘りの記録（"
+                                       + "、".join(f"{_fmt(k)}＠{k['where']}" for k in known[:3]) + "）と合わない"})
+    return out
+
+
+RELATIONS = {"money_consistency": _money_links}
+
+
+def run(cross_checks: list[dict], records: dict[str, str], draft: str | None) -> dict:
+    """records: {ブロックid: 深掘りの記録の本文}。draft: 申請書の原稿（なければ None）"""
+    facts = {bid: file_facts(f"fukabori/{bid}", text) for bid, text in records.items()}
+    draft_facts = file_facts("entry_draft", draft) if draft else None
+    checks = []
+    for c in cross_checks:
+        relation = RELATIONS.get(c["id"])
+        if not relation:
+            checks.append({"id": c["id"], "rule": c["rule"], "status": "llm",
+                           "note": "数字の検算ではない観点。LLMが原文で判断する。"})
+            continue
+        used = [b for b in c["blocks"] if b in facts]
+        figs: dict[str, list[dict]] = {}
+        for b in used:
+            for kind, qs in facts[b]["figures"].items():
+                figs.setdefault(kind, []).extend(qs)
+        findings = [f for b in used for f in facts[b]["equations"]] + relation(figs)
+        if draft_facts:
+            findings += draft_facts["equations"] + _draft_links(figs, draft_facts["figures"])
+            findings += relation(draft_facts["figures"]) if not used else []
+        checks.append({
+            "id": c["id"], "rule": c["rule"], "status": "computed",
+            "blocks_found": used, "blocks_missing": [b for b in c["blocks"] if b not in facts],
+            "figures": {LABEL_NAMES[k]: [f"{_fmt(q)}＠{q['where']}" for q in v] for k, v in figs.items()},
+            "findings": findings,
+        })
+    return {"checks": checks}
+
+
+def report(result: dict) -> str:
+    """検算の結果をプロンプトに差し込む文章に（所見がなければ空）"""
+    lines = []
+    for c in result["checks"]:
+        if c["status"] != "computed":
+            continue
+        for f in c["findings"]:
+            mark = {"error": "✗", "warn": "△", "info": "・"}[f["level"]]
+            lines.append(f"{mark} [{c['id']}] {f['message']}（{f['where']}）")
+    if not lines:
+        return ""
+    return ("\n\n## ツールによる検算の結果（計算は済んでいる。再計算せず、この結果を原文と照らして指摘に使う）\n"
+            + "\n".join(lines))
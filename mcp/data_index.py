@@ -0,0 +1,100 @@
+"""data/*.yaml の1パス索引（MCPサーバーとサイトのビルドで共有）。
+
+各ファイルを1回だけたどり、dictのノードごとに YAMLパス・見出し・本文（直下のスカラー値）と、
+実効の出典（自分で持つか、最も近い祖先から引き継いだ provenance / source / source_url・accessed・confidence）
+を記録する。索引はファイルの中身のハッシュごとに持ち回すので、変わっていないファイルはたどり直さない。
+mcp パッケージには依存しない（site/build.py も読み込む）。
+"""
+from __future__ import annotations
+
+import hashlib
+import pathlib
+
+import yaml
+
+# 出典を表すキー。これらは本文にも子ノードにもしない
+META_KEYS = {"provenance", "source", "source_url", "url", "accessed", "confidence", "source_title"}
+_PROV_KEYS = ("source_url", "source_title", "accessed", "confidence")
+_cache: dict[str, tuple[str, list[dict]]] = {}
+
+
+def _own_provenance(node: dict) -> dict:
+    """ノード自身が宣言している出典（なければ空）。provenance（dict/list/文字列）と source（dict）の両方の書き方を読む"""
+    prov = node.get("provenance", node.get("source"))
+    if isinstance(prov, list) and prov:
+        prov = prov[0]  # 複数あるときは先頭が主たる出典（build.py の benefit["provenance"][0] と同じ）
+    if isinstance(prov, str):
+        return {"note": prov}
+    if isinstance(prov, dict):
+        out = {k: prov[k] for k in _PROV_KEYS if k in prov}
+        if "url" in prov and "source_url" not in out:
+            out["source_url"] = prov["url"]
+        if "title" in prov and "source_title" not in out:
+            out["source_title"] = prov["title"]
+        return out
+    return {k: node[k] for k in _PROV_KEYS if k in node}
+
+
+def _walk(node, path: str, inherited: dict, out: list[dict]) -> None:
+    if isinstance(node, list):
+        for i, v in enumerate(node):
+            _walk(v, f"{path}[{i}]", inherited, out)
+        return
+    if not isinstance(node, dict):
+        return
+    own = _own_provenance(node)
+    prov = {**inherited, **own} if own else inherited
+    lines = []
+    rec = {"path": path, "title": "", "text": "", "own": bool(own),
+           **{k: None if prov.get(k) is None else str(prov[k]) for k in (*_PROV_KEYS, "note")}}
+    out.append(rec)
+    for k, v in node.items():
+        if k in META_KEYS:
+            continue
+        if isinstance(v, (str, int, float)) and not isinstance(v, bool):
+            lines.append(f"{k}: {v}")
+        elif isinstance(v, list) and v and all(isinstance(x, (str, int, float)) for x in v):
+            lines.append(f"{k}: {' / '.join(map(str, v))}")
+        else:
+            _walk(v, path + ("" if path.endswith(":") else ".") + k, prov, out)
+    tail = path.split(":", 1)[1]
+    rec["title"] = next((str(node[k]) for k in ("title", "name", "label", "id") if k in node),
+                        tail.rsplit(".", 1)[-1] if tail else path[:-1])
+    rec["text"] = "\n".join(lines)
+
+
+def file_records(f: pathlib.Path) -> list[dict]:
+    """1ファイル分のノード記録（中身のハッシュが前回と同じなら前回の結果をそのまま返す）"""
+    raw = f.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    hit = _cache.get(str(f))
+    if hit and hit[0] == digest:
+        return hit[1]
+    out: list[dict] = []
+    _walk(yaml.safe_load(raw), f.name + ":", {}, out)
+    _cache[str(f)] = (digest, out)
+    return out
+
+
+def records(data_dir: pathlib.Path) -> list[dict]:
+    """data_dir 以下の全YAMLのノード記録。path は「ファイル:YAMLパス」"""
+    return [r for f in sorted(data_dir.glob("*.yaml")) for r in file_records(f)]
+
+
+def snapshot() -> tuple:
+    """いま索引に載っているファイルと中身のハッシュ（索引から派生させたものを作り直すかの判定用）"""
+    return tuple(sorted((name, digest) for name, (digest, _) in _cache.items()))
+
+
+def confirmed_dates(recs: list[dict]) -> list[str]:
+    """記録に出てくる確認日（accessed）。出典を自分で宣言したノードだけ数える（引き継ぎ分を重複させない）"""
+    return sorted(str(r["accessed"]) for r in recs if r["own"] and r["accessed"])
+
+
+def confidence_stats(recs: list[dict]) -> dict[str, int]:
+    """confidence 値ごとのノード数（自分で宣言したものだけ）"""
+    stats: dict[str, int] = {}
+    for r in recs:
+        if r["own"] and r["confidence"]:
+            stats[r["confidence"]] = stats.get(r["confidence"], 0) + 1
+    return stats
@@ -0,0 +1,270 @@
+"""政策系譜（data/policy_lineage.yaml）のグラフ（MCPサーバーとサイトのビルドで共有）。
+
+系譜のデータは、まとまりごとの入れ子で書かれている。並びは世界の現実・世界の指針と時事・先進国の指針・
+ドメインの状態 → 層 L1〜L5 → 解釈。つながりは driven_by（駆動因）・upstream（層の上流）・grounds（解釈の根拠）。
+読み込みの時点で id を解決して隣接リストにし、ノードごとに上流（祖先）と下流（子孫）の閉包、
+そのノードか上流を根拠にする解釈、申請書への指針を前計算する。「この補助金はなぜあるか」は
+trace で1回引くだけで答えられる（17KBのファイルを丸ごと読ませない）。
+つながりの約束:
+- 層（layers）は書いた順に並ぶ。upstream のない層は、1つ前の層のノード全部を上流に持つ
+- upstream・driven_by・grounds には、ノードの id かまとまりの名前（world_model・L1_national_policy 等）を書ける。
+  まとまりは中のノード全部に広げる
+- 層のノードの subsidy_id は atotsugi_benefit_map.yaml の subsidy_directory の制度 id
+参照先の id がない・つながりが循環している場合は、読み込みの時点で ValueError（どのノードか）。
+mcp パッケージには依存しない（site/build.py も読み込む）。
+"""
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import re
+from dataclasses import dataclass
+
+import yaml
+
+FILE = "policy_lineage.yaml"
+# 層でないまとまり（上流ほど前）と表示名
+GROUP_NAMES = {
+    "world_model": "世界の現実",
+    "global_frameworks_and_events": "世界の指針と時事",
+    "peer_nation_policies": "先進国の指針",
+    "domain_state": "ドメインの状態",
+}
+INTERPRETATIONS = "interpretations"
+# サイト（「国の狙い」ページ）に出す見出し。上の表示名は設計の語彙なので読者には出さない。
+# まとまりを足したらここにも足す（ないとサイトのビルドが止まる）
+READER_NAMES = {
+    "world_model": "社会と経済の大きな流れ",
+    "global_frameworks_and_events": "世界の動き",
+    "peer_nation_policies": "他国の政策",
+    "domain_state": "事業承継をめぐる状況",
+    "L1_national_policy": "国の方針",
+    "L2_ministry_programs": "省庁の施策",
+    "L3_budget_programs": "予算事業",
+    "L4_program_design": "制度の設計（公募要領）",
+    "L5_execution": "執行の実績",
+    INTERPRETATIONS: "読み解き",
+}
+_TOKEN = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+_FOLD = re.compile(r"(?<=[^\x00-\x7f])\s+(?=[^\x00-\x7f])")  # 折り返し（>-）で和文の間に入った空白
+_OPEN, _CLOSE = "「『（(【", "」』）)】"
+
+
+@dataclass(slots=True, frozen=True)
+class Node:
+    id: str
+    group: str       # まとまりの名前（world_model・L2_ministry_programs・interpretations 等）
+    rank: int        # まとまりの並び（上流ほど小さい）
+    label: str       # 見出し（name。なければ fact・claim の最初の文）
+    confirmed: bool  # 確かめられたもの（confidence: unconfirmed の候補は False）
+    raw: dict
+
+
+@dataclass(slots=True, frozen=True)
+class Graph:
+    nodes: dict[str, Node]                    # id → ノード（データの順）
+    groups: dict[str, tuple[str, ...]]        # まとまりの名前 → 中のノードの id
+    group_names: dict[str, str]               # まとまりの名前 → 表示名
+    parents: dict[str, tuple[str, ...]]
+    children: dict[str, tuple[str, ...]]
+    ancestors: dict[str, tuple[str, ...]]     # 上流の閉包（近いまとまりから）
+    descendants: dict[str, tuple[str, ...]]   # 下流の閉包（近いまとまりから）
+    explained_by: dict[str, tuple[str, ...]]  # そのノードか上流を根拠にする解釈の id
+    guidance: dict[str, tuple[str, ...]]      # そのノード・上流・解釈に触れる申請書への指針
+    by_subsidy: dict[str, tuple[str, ...]]    # 制度 id → その制度の層のノード
+
+
+def _headline(text: str) -> str:
+    """fact・claim の最初の文（括弧の外の「。」まで）。頭の【見出し】は落とす"""
+    text = _FOLD.sub("", " ".join(str(text).split()))
+    text = re.sub(r"^【[^】]*】", "", text)
+    depth = 0
+    for i, ch in enumerate(text):
+        if ch in _OPEN:
+            depth += 1
+        elif ch in _CLOSE:
+            depth = max(0, depth - 1)
+        elif ch == "。" and depth == 0:
+            return text[:i + 1]
+    return text
+
+
+def _label(raw: dict) -> str:
+    if raw.get("name"):
+        return _FOLD.sub("", str(raw["name"]))
+    return _headline(raw.get("claim") or raw.get("fact") or "")
+
+
+def _members(doc: dict) -> list[tuple[str, str, dict]]:
+    """(まとまりの名前, 表示名, ノードの元dict) をデータの順に。ノードの id は raw["id"]"""
+    out = []
+    for wid, w in (doc.get("world_model") or {}).items():
+        out.append(("world_model", GROUP_NAMES["world_model"], {"id": wid, **w}))
+    gfe = doc.get("global_frameworks_and_events") or {}
+    for n in (gfe.get("frameworks") or []) + (gfe.get("events") or []):
+        out.append(("global_frameworks_and_events", GROUP_NAMES["global_frameworks_and_events"], n))
+    pn = doc.get("peer_nation_policies") or {}
+    for n in pn.get("candidates_to_research") or []:
+        out.append(("peer_nation_policies", GROUP_NAMES["peer_nation_policies"],
+                    {"confidence": pn.get("confidence"), **n}))
+    ds = doc.get("domain_state") or {}
+    for n in ds.get("indicators") or []:
+        out.append(("domain_state", f"{ds.get('domain', 'ドメイン')}の状態", n))
+    for key, layer in (doc.get("layers") or {}).items():
+        for n in layer.get("nodes") or []:
+            out.append((key, str(layer.get("name", key)).split("（")[0], n))
+    for n in doc.get(INTERPRETATIONS) or []:
+        out.append((INTERPRETATIONS, "解釈", n))
+    return out
+
+
+def build(doc: dict, subsidy_ids=None) -> Graph:
+    """policy_lineage.yaml の中身からグラフを作る。subsidy_ids を渡すと subsidy_id をその中にあるか確かめる"""
+    nodes, groups, group_names = {}, {}, {}
+    for group, gname, raw in _members(doc):
+        nid = raw.get("id")
+        if not nid:
+            raise ValueError(f"{FILE}:{group}: id のないノードがある")
+        if nid in nodes or nid in groups:
+            raise ValueError(f"{FILE}:{group}: id が重複: {nid}")
+        group_names.setdefault(group, gname)
+        groups.setdefault(group, [])
+        groups[group].append(nid)
+        nodes[nid] = Node(nid, group, list(group_names).index(group), _label(raw),
+                          raw.get("confidence") != "unconfirmed", raw)
+    # 見出しの中の id（「L0_demographicsの…」）は、そのノードの短い名前に置き換える
+    ids = re.compile("|".join(map(re.escape, sorted(nodes, key=len, reverse=True))))
+    nodes = {nid: dataclasses.replace(n, label=ids.sub(lambda m: nodes[m.group()].label.split("（")[0], n.label))
+             for nid, n in nodes.items()}
+    groups = {g: tuple(ids) for g, ids in groups.items()}
+    for g in GROUP_NAMES:
+        groups.setdefault(g, ())
+    aliases = {"L0": groups["world_model"],
+               **{g.split("_")[0]: ids for g, ids in groups.items() if re.match(r"L\d_", g)}}
+
+    def expand(ref, where):
+        if ref in groups:
+            return groups[ref]
+        if ref in nodes:
+            return (ref,)
+        raise ValueError(f"{FILE}:{where}: 参照先がない: {ref}")
+
+    parents = {nid: [] for nid in nodes}
+    for nid, n in nodes.items():
+        for key in ("driven_by", "grounds"):
+            for ref in n.raw.get(key) or []:
+                parents[nid] += expand(ref, f"{nid}.{key}")
+    prev = None
+    for key, layer in (doc.get("layers") or {}).items():
+        ups = [u for ref in layer["upstream"] for u in expand(ref, f"layers.{key}.upstream")] \
+            if layer.get("upstream") else list(groups[prev]) if prev else []
+        for nid in groups.get(key, ()):
+            parents[nid] += ups
+        prev = key
+    parents = {nid: tuple(dict.fromkeys(ps)) for nid, ps in parents.items()}
+    children = {nid: [] for nid in nodes}
+    for nid, ps in parents.items():
+        for p in ps:
+            children[p].append(nid)
+
+    # 閉包: 上流から順に（Kahn）。残りが出たら循環
+    order, pending = [], {nid: len(ps) for nid, ps in parents.items()}
+    ready = [nid for nid, k in pending.items() if k == 0]
+    while ready:
+        nid = ready.pop(0)
+        order.append(nid)
+        for c in children[nid]:
+            pending[c] -= 1
+            if pending[c] == 0:
+                ready.append(c)
+    if len(order) < len(nodes):
+        raise ValueError(f"{FILE}: つながりが循環している: {sorted(set(nodes) - set(order))}")
+    pos = {nid: i for i, nid in enumerate(nodes)}
+
+    def nearest(ids, up):
+        return tuple(sorted(ids, key=lambda i: ((-1 if up else 1) * nodes[i].rank, pos[i])))
+    anc = {}
+    for nid in order:
+        anc[nid] = set(parents[nid]).union(*(anc[p] for p in parents[nid]))
+    desc = {}
+    for nid in reversed(order):
+        desc[nid] = set(children[nid]).union(*(desc[c] for c in children[nid]))
+
+    interp = groups.get(INTERPRETATIONS, ())
+    explained = {nid: tuple(i for i in interp if set(parents[i]) & (anc[nid] | {nid}))
+                 if nodes[nid].group != INTERPRETATIONS else () for nid in nodes}
+    directives = []
+    for text in doc.get("drafting_directives") or []:
+        refs = set()
+        for tok in _TOKEN.findall(text):
+            if tok in nodes:
+                refs.add(tok)
+            else:
+                refs.update(groups.get(tok) or aliases.get(tok) or ())
+        directives.append((text, refs))
+    guidance = {nid: tuple(t for t, refs in directives if refs & (anc[nid] | {nid} | set(explained[nid])))
+                for nid in nodes}
+
+    by_subsidy = {}
+    for nid, n in nodes.items():
+        sid = n.raw.get("subsidy_id")
+        if sid:
+            if subsidy_ids is not None and sid not in subsidy_ids:
+                raise ValueError(f"{FILE}:{nid}.subsidy_id: 制度一覧にない: {sid}")
+            by_subsidy.setdefault(sid, []).append(nid)
+
+    return Graph(nodes, groups, group_names, parents, {nid: tuple(cs) for nid, cs in children.items()},
+                 {nid: nearest(a, True) for nid, a in anc.items()},
+                 {nid: nearest(d, False) for nid, d in desc.items()},
+                 explained, guidance, {sid: tuple(ids) for sid, ids in by_subsidy.items()})
+
+
+def load(data_dir: pathlib.Path, subsidy_ids=None) -> Graph:
+    return build(yaml.safe_load((data_dir / FILE).read_text(encoding="utf-8")), subsidy_ids)
+
+
+def summary(g: Graph, nid: str) -> dict:
+    n = g.nodes[nid]
+    out = {"id": nid, "label": n.label, "confirmed": n.confirmed}
+    if n.raw.get("value"):
+        out["value"] = n.raw["value"]
+    src = n.raw.get("source")
+    if isinstance(src, dict):
+        out["source"] = {k: src[k] for k in ("title", "url", "ref", "accessed", "confidence") if k in src}
+    return out
+
+
+def _by_group(g: Graph, ids) -> list[dict]:
+    out = []
+    for nid in ids:
+        group = g.nodes[nid].group
+        if not out or out[-1]["group"] != group:
+            out.append({"group": group, "name": g.group_names[group], "nodes": []})
+        out[-1]["nodes"].append(summary(g, nid))
+    return out
+
+
+def trace(g: Graph, key: str) -> dict:
+    """ノードの id か制度の id から、上流の系譜（近いまとまりから）・下流・それを根拠にする解釈・
+    申請書への指針をまとめる。前計算した閉包を引くだけ"""
+    if key in g.nodes:
+        starts = (key,)
+    elif key in g.by_subsidy:
+        starts = g.by_subsidy[key]
+    else:
+        raise ValueError(f"系譜に見つかりません: {key}（ノードの id か、制度の id {sorted(g.by_subsidy)}）")
+
+    pos = {nid: i for i, nid in enumerate(g.nodes)}
+
+    def union(table, up):
+        seen = dict.fromkeys(i for s in starts for i in table[s] if i not in starts)
+        return sorted(seen, key=lambda i: ((-1 if up else 1) * g.nodes[i].rank, pos[i]))
+    interp = dict.fromkeys(i for s in starts for i in g.explained_by[s])
+    return {
+        "matched": [summary(g, s) for s in starts],
+        "upstream": _by_group(g, union(g.ancestors, True)),
+        "downstream": _by_group(g, [i for i in union(g.descendants, False) if g.nodes[i].group != INTERPRETATIONS]),
+        "interpretations": [{"id": i, "claim": g.nodes[i].label, "grounds": list(g.parents[i]),
+                             "status": g.nodes[i].raw.get("status")} for i in interp],
+        "drafting_directives": list(dict.fromkeys(t for s in starts for t in g.guidance[s])),
+    }
@@ -0,0 +1,198 @@
+"""掲載データの型付きモデル（MCPサーバーとサイトのビルドで共有）。
+
+data/*.yaml（締切・逆算プラン・補助金・優遇段階・申請書のテーマ）を読み込みの時点で1回だけ検査し、
+よく引くもの（補助金の枠・申請書のテーマ・制度ごとの優遇）に索引を張る。テンプレートやリソースが
+丸ごと使う部分は raw（元のdict）のまま持つ。形が崩れていれば、描画の途中ではなく読み込みの時点で
+ValueError（どのファイルのどこか）になる。mcp パッケージには依存しない（site/build.py も読み込む）。
+"""
+from __future__ import annotations
+
+import pathlib
+from dataclasses import dataclass
+from datetime import datetime
+
+import yaml
+
+
+def _get(d, key: str, where: str, kind: type | tuple = object):
+    if not isinstance(d, dict) or key not in d:
+        raise ValueError(f"{where}: {key} がない")
+    if not isinstance(d[key], kind):
+        raise ValueError(f"{where}.{key}: 形が違う（{type(d[key]).__name__}）")
+    return d[key]
+
+
+def _index(items, where: str) -> dict:
+    out = {}
+    for it in items:
+        if it.id in out:
+            raise ValueError(f"{where}: id が重複: {it.id}")
+        out[it.id] = it
+    return out
+
+
+@dataclass(slots=True, frozen=True)
+class Schedule:
+    entry_end: datetime   # エントリー登録の締切
+    docs_end: datetime    # 書類提出の締切
+    entry_end_iso: str    # 元データの表記（ページのスクリプトへはこのまま渡す）
+    docs_end_iso: str
+    raw: dict
+
+
+@dataclass(slots=True, frozen=True)
+class PaceBucket:
+    min_days: int
+    message: str
+
+
+@dataclass(slots=True, frozen=True)
+class Pace:
+    submit_target: str
+    buckets: tuple[PaceBucket, ...]        # 逆算プラン用。min_days の大きい順
+    check_buckets: tuple[PaceBucket, ...]  # 適合チェック・締切表示用。同上
+    closed_message: str
+    closed_message_docs: str
+
+    @staticmethod
+    def message(buckets: tuple[PaceBucket, ...], days: int) -> str:
+        return next((b.message for b in buckets if days >= b.min_days), "")
+
+
+@dataclass(slots=True, frozen=True)
+class Track:
+    id: str
+    name: str
+    raw: dict
+
+
+@dataclass(slots=True, frozen=True)
+class Requirement:
+    id: str
+    label: str
+    severity: str
+
+
+@dataclass(slots=True, frozen=True)
+class Subsidy:
+    id: str
+    name: str
+    tracks: dict[str, Track]
+    requirements: tuple[Requirement, ...]
+    raw: dict
+
+
+@dataclass(slots=True, frozen=True)
+class Unlock:
+    stage: str        # 優遇段階の表示名（benefit_ladder の label）
+    subsidy_id: str
+    effect: str
+
+
+@dataclass(slots=True, frozen=True)
+class DirectoryEntry:
+    id: str
+    name: str
+    perks: tuple[Unlock, ...]
+    raw: dict
+
+
+@dataclass(slots=True, frozen=True)
+class EntrySection:
+    id: str
+    title: str
+    elements: tuple[str, ...]
+    raw: dict
+
+
+@dataclass(slots=True, frozen=True)
+class Model:
+    schedule: Schedule
+    pace: Pace
+    subsidy: Subsidy
+    sections: dict[str, EntrySection]                 # 申請書のテーマ（id → テーマ。定義順）
+    unlocks_by_subsidy: dict[str, tuple[Unlock, ...]]  # 制度id → その制度で解放される優遇
+    directory: tuple[DirectoryEntry, ...]             # 補助金ページの一覧（制度×優遇段階）
+    benefit: dict
+    entry: dict
+
+
+def _schedule(benefit: dict) -> Schedule:
+    where = "atotsugi_benefit_map.yaml:event.schedule"
+    sch = _get(_get(benefit, "event", "atotsugi_benefit_map.yaml", dict), "schedule", where, dict)
+    entry_iso = str(_get(_get(sch, "entry_period", where, dict), "end", where + ".entry_period"))
+    docs_iso = str(_get(_get(sch, "document_deadline", where, dict), "value", where + ".document_deadline"))
+    try:
+        entry_end, docs_end = datetime.fromisoformat(entry_iso), datetime.fromisoformat(docs_iso)
+    except ValueError as e:
+        raise ValueError(f"{where}: 締切が日時として読めない（{e}）") from None
+    if entry_end.tzinfo is None or docs_end.tzinfo is None:
+        raise ValueError(f"{where}: 締切に時差（+09:00）がない")
+    if docs_end < entry_end:
+        raise ValueError(f"{where}: 書類提出締切がエントリー締切より前")
+    return Schedule(entry_end, docs_end, entry_iso, docs_iso, sch)
+
+
+def _buckets(pace: dict, key: str) -> tuple[PaceBucket, ...]:
+    where = f"koshien_entry.yaml:pace.{key}"
+    items = [PaceBucket(int(_get(b, "min_days", where)), str(_get(b, "message", where)))
+             for b in _get(pace, key, "koshien_entry.yaml:pace", list)]
+    if not items:
+        raise ValueError(f"{where}: 空")
+    return tuple(sorted(items, key=lambda b: -b.min_days))
+
+
+def _pace(entry_def: dict) -> Pace:
+    pace = _get(entry_def, "pace", "koshien_entry.yaml", dict)
+    return Pace(str(_get(pace, "submit_target", "koshien_entry.yaml:pace")),
+                _buckets(pace, "buckets"), _buckets(pace, "check_buckets"),
+                str(_get(pace, "closed_message", "koshien_entry.yaml:pace")),
+                str(_get(pace, "closed_message_docs", "koshien_entry.yaml:pace")))
+
+
+def _subsidy(subsidy_file: dict) -> Subsidy:
+    s = _get(subsidy_file, "subsidy", "jigyo_shokei_ma.yaml", dict)
+    where = "jigyo_shokei_ma.yaml:subsidy"
+    tracks = _index((Track(str(_get(t, "id", where + ".tracks")), str(_get(t, "name", where + ".tracks")), t)
+                     for t in _get(s, "tracks", where, list)), where + ".tracks")
+    reqs = tuple(Requirement(str(_get(r, "id", where + ".requirements.items")),
+                             str(_get(r, "label", where + ".requirements.items")),
+                             str(_get(r, "severity", where + ".requirements.items")))
+                 for r in _get(_get(s, "requirements", where, dict), "items", where + ".requirements", list))
+    _index(reqs, where + ".requirements.items")
+    return Subsidy(str(_get(s, "id", where)), str(_get(s, "name", where)), tracks, reqs, s)
+
+
+def _unlocks(benefit: dict) -> dict[str, tuple[Unlock, ...]]:
+    where = "atotsugi_benefit_map.yaml:benefit_ladder"
+    out: dict[str, list[Unlock]] = {}
+    for step in _get(benefit, "benefit_ladder", "atotsugi_benefit_map.yaml", list):
+        for u in step.get("unlocks", []):
+            if u.get("subsidy_id"):
+                out.setdefault(u["subsidy_id"], []).append(
+                    Unlock(str(_get(step, "label", where)), u["subsidy_id"], str(_get(u, "effect", where + ".unlocks"))))
+    return {k: tuple(v) for k, v in out.items()}
+
+
+def build(subsidy_file: dict, benefit: dict, entry_def: dict) -> Model:
+    """読み込み済みのYAML（dict）からモデルを作る。形が崩れていれば ValueError"""
+    unlocks = _unlocks(benefit)
+    where = "atotsugi_benefit_map.yaml:subsidy_directory"
+    directory = tuple(
+        DirectoryEntry(str(_get(e, "id", where)), str(_get(e, "name", where)), unlocks.get(e["id"], ()), e)
+        for e in _get(benefit, "subsidy_directory", "atotsugi_benefit_map.yaml", list))
+    missing = [e.id for e in directory if not e.perks]
+    if missing:
+        raise ValueError(f"{where}: benefit_ladder に優遇のない制度: {missing}")
+    where = "koshien_entry.yaml:entry_sections"
+    sections = _index((EntrySection(str(_get(s, "id", where)), str(_get(s, "title", where)),
+                                    tuple(_get(s, "elements", where, list)), s)
+                       for s in _get(entry_def, "entry_sections", "koshien_entry.yaml", list)), where)
+    return Model(_schedule(benefit), _pace(entry_def), _subsidy(subsidy_file), sections, unlocks,
+                 directory, benefit, entry_def)
+
+
+def load(data_dir: pathlib.Path) -> Model:
+    def read(name):
+        return yaml.safe_load((data_dir / name).read_text(encoding="utf-8"))
+    return build(read("jigyo_shokei_ma.yaml"), read("atotsugi_benefit_map.yaml"), read("koshien_entry.yaml"))
@@ -0,0 +1,121 @@
+"""プロンプトの組み立て（MCPサーバーとサイトのビルドで共有）。
+
+mcp パッケージには依存しない（site/build.py がプロンプトの大きさを測るために読み込む）。
+各関数は部品の並び [(出所, 文字列), ...] を返す。つなげば本文（text）、出所ごとに数えれば
+どのデータがプロンプトの大きさを食っているかが分かる。出所は「ファイル:キー」で書く。
+"""
+from __future__ import annotations
+
+import re
+
+Parts = list[tuple[str, str]]
+
+
+def text(parts: Parts) -> str:
+    return "".join(t for _, t in parts)
+
+
+def fill(source: str, template: str, **subs: Parts) -> Parts:
+    """template の {名前} を subs の部品で置き換える。それ以外の地の文は source の部品になる。"""
+    parts: Parts = []
+    pieces = re.split("\\{(" + "|".join(map(re.escape, subs)) + ")\\}", template)
+    for i, piece in enumerate(pieces):
+        if i % 2:
+            parts += subs[piece]
+        elif piece:
+            parts.append((source, piece))
+    return parts
+
+
+def dialogue_policy(bank: dict) -> Parts:
+    """質問バンクの対話規律。聞き出す系プロンプトの前置き。"""
+    pol = bank["dialogue_policy"]
+    rules = "\n".join(f"- {r['rule']}" for r in pol["rules"])
+    return [("question_bank.yaml:dialogue_policy",
+             f"# 対話の規律（この規律がテーマ固有の指示より優先される）\n"
+             f"{pol['fact_vs_interpretation']}\n{rules}\n\n")]
+
+
+def entry_prompt(entry_def: dict) -> Parts:
+    """エントリー文の骨子づくり指示文。テーマ×要素（旧システム53項目の蒸留）をデータから組み立てる。"""
+    theme_lines = [
+        f"{i}. {s['title']} — " + "／".join(s["elements"])
+        for i, s in enumerate(entry_def["entry_sections"], 1)
+    ]
+    return fill("koshien_entry.yaml:prompt_template", entry_def["prompt_template"],
+                theme_elements=[("koshien_entry.yaml:entry_sections", "\n".join(theme_lines))])
+
+
+def review_prompt(entry_def: dict, draft: str = "") -> Parts:
+    """予行審査の指示文。draft は利用者の原稿（大きさの計測では空）。"""
+    return fill("koshien_entry.yaml:review_prompt_template", entry_def["review_prompt_template"],
+                draft=[("draft", draft)])
+
+
+def fukabori_chapter(fukabori: dict, chapter_no: int, fields: bool = True) -> Parts:
+    """フカボリの章別インタビュー指示文。器の定義は groups から生成（単一ソース）。
+    fields: 各ブロックの項目（key=ラベル、任意項目は*）まで並べる。MCPはブロック名だけ渡す。"""
+    g = fukabori["groups"][chapter_no - 1]
+    if fields:
+        structure = "\n".join(
+            f"- {b['key']}「{b['title']}」:" + "/".join(
+                f"{f['key']}={f['label']}" + ("" if f.get("required") else "*")
+                for f in b["fields"])
+            for b in g["blocks"])
+    else:
+        structure = "\n".join(f"- {b['title']}" for b in g["blocks"])
+    return fill("fukabori.yaml:chapter_prompt", fukabori["chapter_prompt"],
+                chapter_no=[("fukabori.yaml:chapter_prompt", str(chapter_no))],
+                chapter_title=[(f"fukabori.yaml:groups[{chapter_no - 1}].title", g["title"])],
+                structure=[(f"fukabori.yaml:groups[{chapter_no - 1}].blocks", structure)])
+
+
+def dr_review(bank: dict, draft: str = "", computed: str = "") -> Parts:
+    """DR: 申請書から質問バンクの各設問への答えが読み取れるかを、引用必須で照合させる。
+    computed: crosscheck.report() の検算結果（大きさの計測では空）。"""
+    lines = "\n".join(
+        f"- {b['id']}: {b['title']}（期待される場所: {'・'.join(b['entry_themes'])} / "
+        f"観点: {'・'.join(b['review_axes'])} / DoD: {b['dod']}）"
+        for b in bank["blocks"])
+    checks = "\n".join(f"- {c['rule']}" for c in bank["cross_checks"])
+    return fill("mcp/prompts.py:dr_review", DR_TEMPLATE,
+                blocks=[("question_bank.yaml:blocks", lines)],
+                checks=[("question_bank.yaml:cross_checks", checks)],
+                computed=[("crosscheck", computed)],
+                draft=[("draft", draft)])
+
+
+DR_TEMPLATE = """あなたは申請書のデザインレビュー担当です。忖度は不要です。
+以下の申請書を、設問リストに対して照合してください。
+
+# 判定ルール（厳守）
+- 各設問について「申請書から答えが読み取れるか」を判定する。
+- 読み取れると主張する場合は、必ず申請書から該当箇所を原文引用する。引用できなければ「読み取れない」とする。
+- 「期待される場所」の段落を優先的に見るが、全文を対象とする。別の場所に書かれていれば所在を示す。
+- 出典のない数値は（仮）扱いとして指摘する。
+
+# 設問リスト
+{blocks}
+
+# 横断整合（数字の検算）
+{checks}{computed}
+
+# 出力形式
+1. 観点別サマリー（承継の物語/実現性/独自性/事業価値/波及ごとに、読み取れた設問数と最重要の欠落）
+2. 設問別の判定表（読み取れる=引用 / 読み取れない=どこに何を足すか）
+3. 横断整合の検算結果
+4. 直すなら最初の一手（1つ）
+
+---
+{draft}"""
+
+
+def mcp_prompts(entry_def: dict, bank: dict, fukabori: dict) -> dict[str, Parts]:
+    """MCPサーバーが返すプロンプト全部（原稿は空で）。build.py の大きさ計測用。"""
+    return {
+        "mcp:entry_interview": dialogue_policy(bank) + entry_prompt(entry_def),
+        "mcp:mock_review": review_prompt(entry_def),
+        "mcp:dr_review": dr_review(bank),
+        **{f"mcp:fukabori_chapter:{n}": dialogue_policy(bank) + fukabori_chapter(fukabori, n, fields=False)
+           for n in range(1, len(fukabori["groups"]) + 1)},
+    }
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""適合チェックの判定と、名簿の一括判定（MCPサーバーの check_eligibility・screen_candidates と CLI が使う）。
+
+判定はサイトの30秒チェック（_checkform.html・checkform.js）と同じ規則:
+年齢（年齢要件の日以降の生まれ）・立場（家業があり代表ではない／別法人の代表で承継予定か経営資源の活用あり）・
+企業規模（中小企業にあてはまらない、でなければ可）。承継の時期感は補助金〈促進枠〉の見立てにだけ使う。
+答えの組み合わせは72通りしかないので、判定結果は組み合わせごとに1回だけ作って表で引く。
+
+一括判定は名簿（CSV か JSONL。1行1人）を先頭から BATCH 行ずつ読み、列の位置は見出しで1回だけ決め、
+判定を書き足した行を同じ形式で書き出す。名簿全体を持たないので、何万行でもメモリは一定。
+読めない行は止めずに verdict_code=unknown と error を書いて先へ進む。
+年齢要件の日は data/seasons.yaml の今の回（birth_cutoff）。mcp パッケージには依存しない。
+  python3 screening.py 名簿.csv -o 判定.csv     （- で標準入出力。形式は拡張子か --format）
+"""
+from __future__ import annotations
+
+import argparse
+import codecs
+import csv
+import functools
+import io
+import itertools
+import json
+import pathlib
+import re
+import sys
+import time
+from datetime import date
+
+import yaml
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+BATCH = 2048
+SNIFF_BYTES = 64 * 1024  # 文字コードの見分けに読む先頭の大きさ（UTF-8でなければ cp932 とみなす）
+
+SME_HINT = ("目安（中小企業基本法）: 製造業・建設業・運輸業などは資本金3億円以下または従業員300人以下、"
+            "卸売業は1億円以下または100人以下、サービス業は5,000万円以下または100人以下、"
+            "小売業は5,000万円以下または50人以下。")
+VERDICTS = {
+    "eligible": ("エントリー資格を満たしています", ""),
+    "likely": ("エントリー資格に適合の見込み",
+               "年齢と立場は要件に合っています。残る確認は、家業が中小企業の定義に"
+               "あてはまるかどうかです。現在の代表に会社のことを聞く良い機会になります。"),
+    "not_eligible": ("資格要件に合わない可能性",
+                     "年齢・立場・企業規模の要件は公式のエントリー要領で必ず確認してください（例外や詳細条件があります）。"),
+}
+OUTLOOKS = {
+    "yes": "事業承継・M&A補助金〈促進枠〉の主要な入口要件を満たしそうです。認定支援機関への相談と投資内容の具体化が次の一歩。",
+    "undecided": "この補助金は『5年以内の承継』を決めないと使えません。甲子園への挑戦は、その話を始めるきっかけと締切になります。",
+    "no": "促進枠は対象外の見込み（承継予定が前提の制度のため）。",
+}
+
+# 名簿の列（見出し）と値の言い換え。サイトのフォームの値（yes/alt/maybe 等）と日本語の答えも受ける
+COLUMNS = {
+    "birth_date": ("birth_date", "birthdate", "生年月日", "生まれ"),
+    "born_1987_04_or_later": ("born_1987_04_or_later", "age_ok", "q_age", "年齢要件"),
+    "position": ("position", "q_pos", "立場"),
+    "sme_status": ("sme_status", "sme", "q_sme", "中小企業", "企業規模"),
+    "succession_within_5y": ("succession_within_5y", "succession", "q_succ", "承継時期", "承継の時期"),
+}
+POSITIONS = {
+    "successor": ("successor", "yes", "後継者", "後継予定", "家業があり代表ではない"),
+    "other_company_rep": ("other_company_rep", "alt", "別法人代表", "別法人の代表"),
+    "neither": ("neither", "no", "どちらでもない", "該当なし"),
+}
+SMES = {
+    "yes": ("yes", "はい", "あてはまる", "中小企業", "true", "1"),
+    "unsure": ("unsure", "maybe", "わからない", "不明", "確信がない"),
+    "no": ("no", "いいえ", "あてはまらない", "大企業", "false", "0"),
+}
+SUCCESSIONS = {
+    "yes": ("yes", "はい", "合意済み", "5年以内"),
+    "undecided": ("undecided", "maybe", "未定", "まだ", "話せていない"),
+    "no": ("no", "いいえ", "予定なし", "なし"),
+}
+BOOLS = {True: ("yes", "true", "1", "はい", "以降"), False: ("no", "false", "0", "いいえ", "以前")}
+OUT_FIELDS = ("row", "verdict_code", "verdict", "subsidy_outlook", "error")
+_DATE = re.compile(r"(\d{4})\s*[-/.年]\s*(\d{1,2})\s*[-/.月]\s*(\d{1,2})\s*日?")
+
+
+def birth_cutoff(data_dir: pathlib.Path = ROOT / "data") -> date:
+    """今の回の年齢要件（この日以降の生まれ）。data/seasons.yaml の current の birth_cutoff"""
+    seasons = yaml.safe_load((data_dir / "seasons.yaml").read_text(encoding="utf-8"))["seasons"]
+    cur = next(s for s in seasons if s["status"] == "current")
+    return date.fromisoformat(str(cur["birth_cutoff"]))
+
+
+def judge(age_ok: bool, position: str, sme_status: str, succession_within_5y: str | None = None) -> dict:
+    """1人分の判定（check_eligibility と同じ返り値。disclaimer はつけない）"""
+    ok = age_ok and position in ("successor", "other_company_rep") and sme_status != "no"
+    code = "eligible" if ok and sme_status == "yes" else "likely" if ok else "not_eligible"
+    verdict, detail = VERDICTS[code]
+    result = {"verdict_code": code, "verdict": verdict, "detail": detail,
+              "sme_hint": SME_HINT if sme_status == "unsure" else None}
+    if succession_within_5y in OUTLOOKS:
+        result["subsidy_outlook"] = OUTLOOKS[succession_within_5y]
+    return result
+
+
+# 答えの組み合わせ → 判定（一括判定はこの表を引くだけ）
+TABLE = {(a, p, s, c): judge(a, p, s, c)
+         for a, p, s, c in itertools.product((True, False), POSITIONS, SMES, (*SUCCESSIONS, None))}
+
+
+def _lookup(aliases: dict) -> dict:
+    return {v.casefold(): key for key, vs in aliases.items() for v in vs}
+
+
+_POS, _SME, _SUCC, _BOOL = _lookup(POSITIONS), _lookup(SMES), _lookup(SUCCESSIONS), _lookup(BOOLS)
+
+
+@functools.lru_cache(maxsize=65536)
+def _born(text: str) -> date:
+    t = text.strip()
+    m = _DATE.fullmatch(t) or (re.fullmatch(r"(\d{4})(\d{2})(\d{2})", t))
+    if not m:
+        raise ValueError(f"生年月日が読めない: {text}（西暦で 1990-04-01 などと書く）")
+    return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+
+def _value(table: dict, text, what: str):
+    key = table.get(str(text).strip().casefold())
+    if key is None:
+        raise ValueError(f"{what}が読めない: {text}")
+    return key
+
+
+def _columns(header) -> dict:
+    """見出し → 判定に使う列の名前。立場・企業規模と、年齢（生年月日か年齢要件の可否）は必須"""
+    found = {}
+    names = {h.strip().casefold(): h for h in header}
+    for field, aliases in COLUMNS.items():
+        hit = next((names[a.casefold()] for a in aliases if a.casefold() in names), None)
+        if hit is not None:
+            found[field] = hit
+    missing = [f for f in ("position", "sme_status") if f not in found]
+    if "birth_date" not in found and "born_1987_04_or_later" not in found:
+        missing.append("birth_date（または born_1987_04_or_later）")
+    if missing:
+        raise ValueError(f"名簿に必要な列がない: {missing}（見出しの候補: {dict(COLUMNS)}）")
+    return found
+
+
+def _record(line: str) -> dict | ValueError:
+    """JSONL の1行を dict に。読めなければ例外を投げずに ValueError を返す（その行だけ unknown にする）"""
+    try:
+        obj = json.loads(line)
+    except json.JSONDecodeError as e:
+        return ValueError(f"JSONとして読めない: {e}")
+    if not isinstance(obj, dict):
+        return ValueError(f"1行が1つのオブジェクトになっていない: {line.strip()[:40]}")
+    return obj
+
+
+def screen_batch(rows: list[dict | ValueError], cols: dict, cutoff: date, start: int) -> list[dict]:
+    """BATCH 行をまとめて判定する。列ごとに値をそろえてから、組み合わせの表を引く。
+    rows の要素が ValueError（JSONL の読めない行）なら、その行は unknown にする"""
+    ok = [r if isinstance(r, dict) else {} for r in rows]
+    births = [r.get(cols["birth_date"]) for r in ok] if "birth_date" in cols else None
+    flags = [r.get(cols["born_1987_04_or_later"]) for r in ok] if "born_1987_04_or_later" in cols else None
+    out = []
+    for i, r in enumerate(ok):
+        try:
+            if isinstance(rows[i], ValueError):
+                raise rows[i]
+            if births is not None and str(births[i] or "").strip():
+                age_ok = _born(str(births[i])) >= cutoff
+            elif flags is not None:
+                age_ok = _value(_BOOL, flags[i], "年齢要件")
+            else:
+                raise ValueError("生年月日が空")
+            pos = _value(_POS, r.get(cols["position"]), "立場")
+            sme = _value(_SME, r.get(cols["sme_status"]), "企業規模")
+            succ_text = str(r.get(cols["succession_within_5y"]) or "").strip() if "succession_within_5y" in cols else ""
+            succ = _value(_SUCC, succ_text, "承継の時期") if succ_text else None
+            j = TABLE[(age_ok, pos, sme, succ)]
+            out.append({"row": start + i, "verdict_code": j["verdict_code"], "verdict": j["verdict"],
+                        "subsidy_outlook": j.get("subsidy_outlook", ""), "error": ""})
+        except ValueError as e:
+            out.append({"row": start + i, "verdict_code": "unknown", "verdict": "", "subsidy_outlook": "", "error": str(e)})
+    return out
+
+
+def _text(binary) -> io.TextIOWrapper:
+    """バイト列の入力を文字に。BOMつき・UTF-8 はそのまま、先頭が UTF-8 として読めなければ cp932"""
+    buf = io.BufferedReader(binary, SNIFF_BYTES)
+    head = buf.peek(SNIFF_BYTES)[:SNIFF_BYTES]
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        enc = "utf-8-sig"
+    except UnicodeDecodeError:
+        enc = "cp932"
+    return io.TextIOWrapper(buf, encoding=enc, newline="")
+
+
+def run(src, dst, fmt: str, cutoff: date) -> dict:
+    """src（バイト列の入力）の名簿を判定して dst（文字の出力）へ同じ形式で書く。集計を返す"""
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError("形式は csv か jsonl")
+    t0 = time.perf_counter()
+    text = _text(src)
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        header = reader.fieldnames or []
+        cols = _columns(header)
+        writer = csv.DictWriter(dst, [*header, *(f for f in OUT_FIELDS if f not in header)], extrasaction="ignore")
+        writer.writeheader()
+        rows = iter(reader)
+    else:
+        # 列は最初に読めた行の見出しで決める。それより前の読めない行も unknown として書き出す
+        lines = (ln for ln in text if ln.strip())
+        head = []
+        for ln in lines:
+            head.append(ln)
+            if isinstance(first := _record(ln), dict):
+                break
+        else:
+            raise ValueError("名簿に読める行がない" if head else "名簿が空")
+        cols = _columns(first.keys())
+        rows = itertools.chain(head, lines)
+    counts = {"eligible": 0, "likely": 0, "not_eligible": 0, "unknown": 0}
+    errors, n = [], 0
+    while batch := list(itertools.islice(rows, BATCH)):
+        if fmt == "jsonl":
+            batch = [_record(ln) for ln in batch]
+        results = screen_batch(batch, cols, cutoff, n + 1)
+        for r, res in zip(batch, results):
+            counts[res["verdict_code"]] += 1
+            if res["error"] and len(errors) < 10:
+                errors.append({"row": res["row"], "error": res["error"]})
+            if fmt == "csv":
+                writer.writerow({**r, **res})
+            else:
+                dst.write(json.dumps({**r, **res} if isinstance(r, dict) else res, ensure_ascii=False) + "\n")
+        n += len(batch)
+    return {"rows": n, "counts": counts, "errors": errors, "columns": cols,
+            "birth_cutoff": cutoff.isoformat(), "ms": round((time.perf_counter() - t0) * 1000, 1)}
+
+
+def guess_format(path: str, fmt: str | None) -> str:
+    if fmt:
+        return fmt
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("input", help="名簿（CSV か JSONL）。- で標準入力")
+    ap.add_argument("-o", dest="output", default="-", help="書き出し先（既定は標準出力）")
+    ap.add_argument("--format", choices=("csv", "jsonl"))
+    args = ap.parse_args(argv)
+
+    fmt = guess_format(args.input if args.input != "-" else args.output, args.format)
+    if args.input != "-" and not pathlib.Path(args.input).is_file():
+        print(f"error: 名簿が見つからない: {args.input}", file=sys.stderr)
+        return 1
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    # 書き出しは <出力>.part に書いて、最後まで判定できたときだけ置き換える（失敗で前の結果を消さない）。
+    # CSV はBOMつき（表計算ソフトでそのまま開けるように）
+    target = None if args.output == "-" else pathlib.Path(args.output)
+    tmp = target.with_name(target.name + ".part") if target else None
+    dst = sys.stdout if tmp is None else tmp.open("w", encoding="utf-8-sig" if fmt == "csv" else "utf-8", newline="")
+    try:
+        summary = run(src, dst, fmt, birth_cutoff())
+        if tmp is not None:
+            dst.close()
+            tmp.replace(target)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if tmp is not None:
+            dst.close()
+            tmp.unlink(missing_ok=True)
+    print(json.dumps({k: v for k, v in summary.items() if k != "columns"}, ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
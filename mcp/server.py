@@ -8,30 +8,50 @@
 """
 from __future__ import annotations
 
+import difflib
+import hashlib
+import html
+import html.parser
 import json
+import math
+import mmap
 import pathlib
 import re
+import unicodedata
+import zipfile
+import zlib
 from datetime import datetime, timedelta, timezone
+from urllib.parse import unquote
 
 import yaml
 from mcp.server import MCPServer
 
+import crosscheck
+import data_index
+import lineage
+import model
+import prompts
+import screening
+
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 DATA = ROOT / "data"
 STATE_FILE = pathlib.Path(__file__).resolve().parent / ".state.json"
 JST = timezone(timedelta(hours=9))
 
-entry_def = yaml.safe_load((DATA / "koshien_entry.yaml").read_text())
-benefit = yaml.safe_load((DATA / "atotsugi_benefit_map.yaml").read_text())
+# 締切・逆算プラン・補助金は型付きモデル（読み込み時に形を検査。build.py と共有）
+M = model.load(DATA)
+entry_def = M.entry
 bank = yaml.safe_load((DATA / "question_bank.yaml").read_text())
-subsidy = yaml.safe_load((DATA / "jigyo_shokei_ma.yaml").read_text())
 ambassadors = yaml.safe_load((DATA / "ambassadors.yaml").read_text())
 fukabori = yaml.safe_load((DATA / "fukabori.yaml").read_text())
+# 政策の系譜: id を解決し、ノードごとの上流・下流の閉包まで読み込み時に作っておく（build.py と共有）
+LINEAGE = lineage.load(DATA, {e.id for e in M.directory})
 
-SCHEDULE = benefit["event"]["schedule"]
-ENTRY_END = datetime.fromisoformat(str(SCHEDULE["entry_period"]["end"]))
-DOCS_END = datetime.fromisoformat(str(SCHEDULE["document_deadline"]["value"]))
-PACE = entry_def["pace"]
+SCHEDULE = M.schedule.raw
+ENTRY_END = M.schedule.entry_end
+DOCS_END = M.schedule.docs_end
+PACE = M.pace
+BIRTH_CUTOFF = screening.birth_cutoff(DATA)  # 年齢要件（今の回。seasons.yaml）
 
 DISCLAIMER = (
     "※非公式ツール「シンセイダー」の簡易判定です。"
@@ -44,6 +64,12 @@ app = MCPServer(
     instructions=(
         "アトツギ甲子園への挑戦と申請準備を支援する非公式・無償ツール。"
         "数値・期日は必ず get_deadlines / resources から取り、自前知識で答えないこと。"
+        "個別の事実（要件・加点・DoD等）の確認は search_knowledge で該当箇所だけを引き、出典と取得日を添える。"
+        "取得日が古い値は data_freshness で確かめ、（要確認）と明示する。"
+        "利用者の手元資料（ワークスペースの materials/）は丸ごと読まず、workspace_search で該当段落だけを引く。"
+        "数字のつじつま（単価×数量・売上・投資回収）は cross_check の検算結果を使い、自分で再計算しない。"
+        "名簿の複数人の資格確認は screen_candidates で一括判定する（1人ずつ check_eligibility を回さない）。"
+        "制度がつくられた理由・国の狙いは trace_policy で系譜を引く（policy_lineage を丸ごと読まない）。"
         "進行は『概要をまとめる』が既定。質問バンクの深掘りは利用者が要望したときだけ。"
         "出典のない数字は（仮）と明示する。"
         "対話では、自明な事実は入力されたまま記録して聞き返し、非自明な主張は否定でなく"
@@ -79,13 +105,11 @@ def get_deadlines() -> dict:
     stage = _stage()
     days = max(0, _days_left_jst(ENTRY_END))
     if stage == "open":
-        pace_msg = next(
-            (b["message"] for b in sorted(PACE["check_buckets"], key=lambda b: -b["min_days"])
-             if days >= b["min_days"]), "")
+        pace_msg = PACE.message(PACE.check_buckets, days)
     elif stage == "docs_only":
-        pace_msg = PACE["closed_message_docs"]
+        pace_msg = PACE.closed_message_docs
     else:
-        pace_msg = PACE["closed_message"]
+        pace_msg = PACE.closed_message
     return {
         "entry_deadline": ENTRY_END.isoformat(),
         "document_deadline": DOCS_END.isoformat(),
@@ -109,43 +133,52 @@ def check_eligibility(
     position: successor(家業があり代表ではない) / other_company_rep(別法人代表だが承継予定・経営資源活用あり) / neither
     sme_status: yes(中小企業にあてはまる) / unsure / no
     succession_within_5y: yes / undecided / no / None（補助金の見立て。任意）"""
-    ok = born_1987_04_or_later and position in ("successor", "other_company_rep") and sme_status != "no"
-    if ok and sme_status == "yes":
-        verdict = "エントリー資格を満たしています"
-        detail = ""
-    elif ok:
-        verdict = "エントリー資格に適合の見込み"
-        detail = ("年齢と立場は要件に合っています。残る確認は、家業が中小企業の定義に"
-                  "あてはまるかどうかです。現在の代表に会社のことを聞く良い機会になります。")
-    else:
-        verdict = "資格要件に合わない可能性"
-        detail = "年齢・立場・企業規模の要件は公式のエントリー要領で必ず確認してください（例外や詳細条件があります）。"
-    result = {"verdict": verdict, "detail": detail, "sme_hint": (
-        "目安（中小企業基本法）: 製造業・建設業・運輸業などは資本金3億円以下または従業員300人以下、"
-        "卸売業は1億円以下または100人以下、サービス業は5,000万円以下または100人以下、"
-        "小売業は5,000万円以下または50人以下。") if sme_status == "unsure" else None}
-    if succession_within_5y == "yes":
-        result["subsidy_outlook"] = "事業承継・M&A補助金〈促進枠〉の主要な入口要件を満たしそうです。認定支援機関への相談と投資内容の具体化が次の一歩。"
-    elif succession_within_5y == "undecided":
-        result["subsidy_outlook"] = "この補助金は『5年以内の承継』を決めないと使えません。甲子園への挑戦は、その話を始めるきっかけと締切になります。"
-    elif succession_within_5y == "no":
-        result["subsidy_outlook"] = "促進枠は対象外の見込み（承継予定が前提の制度のため）。"
+    result = screening.judge(born_1987_04_or_later, position, sme_status, succession_within_5y)
+    del result["verdict_code"]
     result["disclaimer"] = DISCLAIMER
     return result
 
 
+@app.tool()
+def screen_candidates(path: str, out_path: str | None = None, format: str | None = None) -> dict:
+    """説明会の参加者名簿などを、check_eligibility と同じ規則で一括判定する（1人ずつ check_eligibility を呼ばないこと）。
+    path: 名簿（CSV か JSONL。1行1人）。相対パスはワークスペースから。列は生年月日（または年齢要件の可否）・
+    立場・企業規模が必須、承継の時期は任意（見出しは英語・日本語・サイトのフォームの値のどれでも）。
+    判定（verdict_code: eligible / likely / not_eligible / unknown、verdict、subsidy_outlook、error）を書き足した名簿を
+    out_path（省略時は名簿の隣の <名前>.screened.<拡張子>）に書き出す。中身は返さない（件数の集計と読めなかった行の先頭だけ）。
+    format: csv / jsonl（省略時は拡張子から）。"""
+    src = pathlib.Path(path).expanduser()
+    if not src.is_absolute():
+        src = _ws() / src
+    if not src.is_file():
+        raise ValueError(f"名簿が見つかりません: {src}")
+    fmt = screening.guess_format(src.name, format)
+    target = pathlib.Path(out_path).expanduser() if out_path else src.with_name(f"{src.stem}.screened{src.suffix}")
+    if not target.is_absolute():
+        target = _ws() / target
+    tmp = target.with_suffix(target.suffix + ".part")
+    try:
+        with src.open("rb") as f, tmp.open("w", encoding="utf-8-sig" if fmt == "csv" else "utf-8", newline="") as out:
+            summary = screening.run(f, out, fmt, BIRTH_CUTOFF)
+        tmp.replace(target)
+    finally:
+        tmp.unlink(missing_ok=True)  # 途中で止まったときの書きかけ
+    return {**summary, "path": str(target), "format": fmt,
+            "note": "中身は読み込まずにパスと件数を利用者へ伝えること。unknown の行は error を見て名簿を直す。",
+            "disclaimer": DISCLAIMER}
+
+
 @app.tool()
 def get_pace_plan() -> dict:
     """今日から始めた場合の逆算プラン（サイトの「間に合うか」と同一ロジック）を返す。"""
     stage = _stage()
     if stage != "open":
-        return {"stage": stage, "message": PACE["closed_message_docs"] if stage == "docs_only" else PACE["closed_message"],
+        return {"stage": stage, "message": PACE.closed_message_docs if stage == "docs_only" else PACE.closed_message,
                 "disclaimer": DISCLAIMER}
     now = _now()
     days = _days_left_jst(ENTRY_END)
-    bucket = next((b["message"] for b in sorted(PACE["buckets"], key=lambda b: -b["min_days"])
-                   if days >= b["min_days"]), "")
-    target = datetime.fromisoformat(PACE["submit_target"] + "T23:59:00+09:00")
+    bucket = PACE.message(PACE.buckets, days)
+    target = datetime.fromisoformat(PACE.submit_target + "T23:59:00+09:00")
     d_t = max(1, (target.date() - now.date()).days)
     fmt = lambda d: f"{d.month}/{d.day}"
     plus = lambda n: now + timedelta(days=n)
@@ -153,13 +186,14 @@ def get_pace_plan() -> dict:
     if d_t <= 3:
         steps = [["今日", "AIとインタビューして骨子を作る"],
                  ["明日", "声に出して読み合わせ、現経営者に話す"],
-                 [f"{fmt(target)}まで", "公式サイトから送信（締切は11/25 18:00）"]]
+                 [f"{fmt(target)}まで", f"公式サイトから送信（締切は{fmt(ENTRY_END)} {ENTRY_END:%H:%M}）"]]
     else:
         steps = [
             [f"{fmt(plus(max(1, jround(d_t * 0.15))))}まで", "現経営者と、承継の話を始める（いちばん重い一歩）"],
             [f"{fmt(plus(jround(d_t * 0.5)))}まで", "AIとインタビューして骨子を作る"],
             [f"{fmt(plus(jround(d_t * 0.8)))}まで", "読み合わせて磨く。会社名でエントリーすることに合意をとる"],
-            [f"{fmt(target)}まで", "公式サイトからエントリー（締切前日推奨）。書類は届くフォーマットで11/27 12:00までにPDF提出"],
+            [f"{fmt(target)}まで",
+             f"公式サイトからエントリー（締切前日推奨）。書類は届くフォーマットで{fmt(DOCS_END)} {DOCS_END:%H:%M}までにPDF提出"],
         ]
     return {"days_to_entry": days, "message": bucket, "plan": steps, "disclaimer": DISCLAIMER}
 
@@ -182,6 +216,12 @@ def _ws() -> pathlib.Path:
     return pathlib.Path(st["workspace"])
 
 
+def _files(ws: pathlib.Path):
+    """利用者のファイル（履歴 .history・資料の索引 .cache など、. で始まるフォルダは除く）"""
+    return (p for p in ws.rglob("*")
+            if p.is_file() and not any(part.startswith(".") for part in p.relative_to(ws).parts[:-1]))
+
+
 def _journal(ws: pathlib.Path, event: dict) -> None:
     event["ts"] = _now().isoformat()
     with (ws / "journal.jsonl").open("a") as f:
@@ -197,30 +237,38 @@ def workspace_init(path: str) -> dict:
         (ws / sub).mkdir(parents=True, exist_ok=True)
     STATE_FILE.write_text(json.dumps({"workspace": str(ws)}, ensure_ascii=False))
     _journal(ws, {"event": "init"})
-    files = sorted(str(p.relative_to(ws)) for p in ws.rglob("*") if p.is_file())
+    files = sorted(str(p.relative_to(ws)) for p in _files(ws))
     return {"workspace": str(ws), "files": files,
             "note": "profile/outline/entry_draft は workspace_record で記録。既存ファイルがあれば読み込んで文脈を復元すること。"}
 
 
+def _target(ws: pathlib.Path, section: str) -> pathlib.Path:
+    if section in SECTIONS:
+        return ws / SECTIONS[section]
+    if re.fullmatch(r"(fukabori|review|materials)/[\w\-\.ぁ-んァ-ヶ一-龠]+", section):
+        return ws / (section + ("" if "." in section.split("/")[1] else ".md"))
+    raise ValueError(f"不正なsection: {section}")
+
+
 @app.tool()
 def workspace_record(section: str, content: str, mode: str = "replace") -> dict:
     """ワークスペースへ記録する。section: profile / outline / entry_draft /
     fukabori/<ブロックid> / review/<名前> / materials/<名前>。mode: replace / append。
-    利用者の入力・確定事項・成果物は必ずここに記録し、会話にだけ残さないこと。"""
+    利用者の入力・確定事項・成果物は必ずここに記録し、会話にだけ残さないこと。
+    保存のたびに版が残る（workspace_history / workspace_diff / workspace_restore）。"""
     ws = _ws()
-    if section in SECTIONS:
-        target = ws / SECTIONS[section]
-    elif re.fullmatch(r"(fukabori|review|materials)/[\w\-\.ぁ-んァ-ヶ一-龠]+", section):
-        target = ws / (section + ("" if "." in section.split("/")[1] else ".md"))
-    else:
-        raise ValueError(f"不正なsection: {section}")
+    target = _target(ws, section)
     target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() and not _revisions(ws, section):
+        _snapshot(ws, section, target.read_bytes(), "before_history")  # 履歴を取り始める前の中身も残す
     if mode == "append" and target.exists():
         target.write_text(target.read_text() + "\n" + content)
     else:
         target.write_text(content)
-    _journal(ws, {"event": "record", "section": section, "mode": mode, "chars": len(content)})
-    return {"written": str(target), "chars": len(content)}
+    rev = _snapshot(ws, section, target.read_bytes(), mode)
+    _journal(ws, {"event": "record", "section": section, "mode": mode, "chars": len(content),
+                  "rev": rev["rev"]})
+    return {"written": str(target), "chars": len(content), "rev": rev["rev"], "new_chunks": rev["new_chunks"]}
 
 
 @app.tool()
@@ -228,7 +276,7 @@ def workspace_state() -> dict:
     """ワークスペースの現状（ファイル一覧・深掘り済みブロック・充足の概観）を返す。
     別の会話から再開するときは、まずこれを呼んで文脈を復元すること。"""
     ws = _ws()
-    files = {str(p.relative_to(ws)): p.stat().st_size for p in ws.rglob("*") if p.is_file()}
+    files = {str(p.relative_to(ws)): p.stat().st_size for p in _files(ws)}
     done_blocks = [p.stem for p in (ws / "fukabori").glob("*.md")]
     all_blocks = [b["id"] for b in bank["blocks"]]
     return {"workspace": str(ws), "files": files,
@@ -237,17 +285,226 @@ def workspace_state() -> dict:
             "note": "未着手ブロックは深掘りの候補だが、利用者が要望したときだけ進めること。"}
 
 
+# 書き出し: 見出し・並び順（質問バンクのブロック順）を決めて、ファイルを少しずつ1つの束に流し込む。
+# 中身はモデルの文脈に通さず、返すのはパス・大きさ・節ごとのハッシュだけ
+SECTION_TITLES = {"profile": "プロフィール", "outline": "骨子", "entry_draft": "エントリー文（下書き）"}
+EXPORT_CHUNK = 64 * 1024
+
+
+def _export_sections(ws: pathlib.Path) -> list[tuple[str, str, pathlib.Path]]:
+    """(節名, 見出し, ファイル) を書き出す順に。materials（資料の原本）は含めない"""
+    out = [(name, SECTION_TITLES[name], ws / fn) for name, fn in SECTIONS.items() if (ws / fn).is_file()]
+    order = {b["id"]: (i, b["title"]) for i, b in enumerate(bank["blocks"])}
+    fk = sorted((ws / "fukabori").glob("*.md"), key=lambda p: (order.get(p.stem, (len(order),))[0], p.stem))
+    out += [(f"fukabori/{p.stem}", "フカボリ: " + order.get(p.stem, (0, p.stem))[1], p) for p in fk]
+    out += [(f"review/{p.stem}", "レビュー: " + p.stem, p) for p in sorted((ws / "review").glob("*.md"))]
+    return out
+
+
+def _copy(src: pathlib.Path, write) -> tuple[int, str]:
+    h, n = hashlib.sha256(), 0
+    with src.open("rb") as f:
+        while chunk := f.read(EXPORT_CHUNK):
+            h.update(chunk)
+            n += len(chunk)
+            write(chunk)
+    return n, h.hexdigest()[:16]
+
+
+@app.tool()
+def workspace_export(format: str = "md") -> dict:
+    """ワークスペースの成果物（profile / outline / entry_draft / フカボリ各ブロック / レビュー）を1つにまとめて
+    export/ に書き出す。format: md（1本のMarkdown。フカボリは質問バンクのブロック順）/ zip（ファイルのまま）。
+    中身は返さない（パス・バイト数・節ごとのsha256だけ）。メンター・アンバサダーへの受け渡しに使う。"""
+    if format not in ("md", "zip"):
+        raise ValueError("format は md か zip")
+    ws = _ws()
+    sections = _export_sections(ws)
+    if not sections:
+        raise ValueError("書き出すものがありません。先に workspace_record で記録してください。")
+    (ws / "export").mkdir(exist_ok=True)
+    target = ws / "export" / f"shinseider_{_now().strftime('%Y%m%d_%H%M')}.{format}"
+    tmp = target.with_suffix(target.suffix + ".part")
+    digests = []
+    if format == "zip":
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, title, path in sections:
+                with zf.open(str(path.relative_to(ws)), "w") as out:
+                    n, digest = _copy(path, out.write)
+                digests.append({"section": name, "title": title, "bytes": n, "sha256": digest})
+    else:
+        with tmp.open("wb") as out:
+            out.write(f"# シンセイダー 書き出し（{ws.name}・{_now().strftime('%Y-%m-%d %H:%M')}）\n".encode())
+            for name, title, path in sections:
+                out.write(f"\n\n---\n\n## {title}\n\n".encode())
+                n, digest = _copy(path, out.write)
+                digests.append({"section": name, "title": title, "bytes": n, "sha256": digest})
+            out.write(b"\n")
+    tmp.replace(target)
+    _journal(ws, {"event": "export", "format": format, "path": str(target.relative_to(ws)), "sections": len(digests)})
+    return {"path": str(target), "bytes": target.stat().st_size, "format": format, "sections": digests,
+            "missing": [n for n in SECTIONS if not (ws / SECTIONS[n]).is_file()],
+            "note": "中身は読み込まずにパスを利用者へ伝えること。missing は未作成の基本ファイル。"}
+
+
+# ---------- 一覧の分割取得 ----------
+# 一覧系ツールは limit 件ずつ返し、続きがあれば next_cursor を添える（次の呼び出しにそのまま渡す）。
+# fields を渡すとその項目だけに絞る。会話に要る分だけ読ませ、1回の応答を小さく保つため
+LIST_LIMIT = 10
+
+# 大会の地方大会ブロック＝経済産業局の管轄（data/regions.yaml。サイトのビルドと同じものを読む）
+REGIONS = {b["name"]: b["prefs"] for b in yaml.safe_load((DATA / "regions.yaml").read_text())["blocks"]}
+
+
+def _page(items: list[dict], cursor: str | None, limit: int, fields: list[str] | None) -> dict:
+    try:
+        start = int(cursor or 0)
+    except ValueError:
+        raise ValueError(f"cursor が不正です: {cursor}（前回の next_cursor をそのまま渡す）")
+    if limit < 1:
+        raise ValueError("limit は1以上")
+    if fields:
+        known = set().union(*(it.keys() for it in items)) if items else set()
+        unknown = [f for f in fields if f not in known]
+        if unknown:
+            raise ValueError(f"未知の項目: {unknown}（選べるのは {sorted(known)}）")
+    chunk = items[start:start + limit]
+    if fields:
+        chunk = [{f: it[f] for f in fields if f in it} for it in chunk]
+    end = start + len(chunk)
+    return {"items": chunk, "total": len(items),
+            "next_cursor": str(end) if end < len(items) else None}
+
+
+def _prefs(region: str) -> list[str]:
+    """地方ブロック名（関東・九州・沖縄 等）か都道府県名（福岡・福岡県）を都道府県の一覧にする。"""
+    region = region.strip()
+    if region in REGIONS:
+        return REGIONS[region]
+    for prefs in REGIONS.values():
+        for p in prefs:
+            if region in (p, p.rstrip("都府県")):
+                return [p]
+    raise ValueError(f"地域が見つかりません: {region}（ブロック名 {list(REGIONS)} か都道府県名）")
+
+
+# ---------- 履歴 ----------
+# 保存ごとに版を残す。中身は段落の切れ目（空行）で断片に分け、断片の sha256 を名前にして
+# .history/objects/ に1回だけ置く（zlib圧縮）。版は断片の並びだけを持つので、
+# 一部を直した保存で増えるのは直した段落の分だけ。版の一覧は .history/revs/<section>.jsonl
+HISTORY = ".history"
+CHUNK_MIN, CHUNK_MAX = 512, 8192  # 断片の大きさ（バイト）。空行でも CHUNK_MIN までは切らない
+
+
+def _chunks(data: bytes) -> list[bytes]:
+    out, cur = [], bytearray()
+    for line in data.splitlines(keepends=True):
+        cur += line
+        if (len(cur) >= CHUNK_MIN and not line.strip()) or len(cur) >= CHUNK_MAX:
+            out.append(bytes(cur))
+            cur = bytearray()
+    if cur:
+        out.append(bytes(cur))
+    return out
+
+
+def _object(ws: pathlib.Path, digest: str) -> pathlib.Path:
+    return ws / HISTORY / "objects" / digest[:2] / digest[2:]
+
+
+def _revisions(ws: pathlib.Path, section: str) -> list[dict]:
+    f = ws / HISTORY / "revs" / (section + ".jsonl")
+    return [json.loads(line) for line in f.read_text().splitlines() if line] if f.exists() else []
+
+
+def _snapshot(ws: pathlib.Path, section: str, data: bytes, mode: str) -> dict:
+    """data を版として残す（直前の版と同じ中身なら、その版を返すだけ）"""
+    revs = _revisions(ws, section)
+    digest = hashlib.sha256(data).hexdigest()
+    if revs and revs[-1]["sha256"] == digest:
+        return {**revs[-1], "new_chunks": 0}
+    hashes, new = [], 0
+    for chunk in _chunks(data):
+        h = hashlib.sha256(chunk).hexdigest()
+        obj = _object(ws, h)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            tmp = obj.with_suffix(".part")
+            tmp.write_bytes(zlib.compress(chunk))
+            tmp.replace(obj)
+            new += 1
+        hashes.append(h)
+    rev = {"rev": len(revs) + 1, "ts": _now().isoformat(), "mode": mode, "bytes": len(data),
+           "sha256": digest, "chunks": hashes, "new_chunks": new}
+    f = ws / HISTORY / "revs" / (section + ".jsonl")
+    f.parent.mkdir(parents=True, exist_ok=True)
+    with f.open("a") as out:
+        out.write(json.dumps(rev) + "\n")
+    return rev
+
+
+def _rev_text(ws: pathlib.Path, section: str, rev: int) -> str:
+    revs = _revisions(ws, section)
+    if not 1 <= rev <= len(revs):
+        raise ValueError(f"版が見つかりません: {section} の {rev}（1〜{len(revs)}）")
+    data = b"".join(zlib.decompress(_object(ws, h).read_bytes()) for h in revs[rev - 1]["chunks"])
+    return data.decode("utf-8")
+
+
+@app.tool()
+def workspace_history(section: str, cursor: str | None = None, limit: int = LIST_LIMIT) -> dict:
+    """記録の版の一覧（新しい順）。section は workspace_record と同じ。
+    各版: rev（版番号）・ts・mode・bytes・new_chunks（その保存で新たに増えた断片の数）。"""
+    ws = _ws()
+    _target(ws, section)
+    revs = [{k: r[k] for k in ("rev", "ts", "mode", "bytes", "new_chunks")} for r in reversed(_revisions(ws, section))]
+    if not revs:
+        raise ValueError(f"版がありません: {section}")
+    return _page(revs, cursor, limit, None)
+
+
+@app.tool()
+def workspace_diff(section: str, rev_a: int, rev_b: int | None = None, max_lines: int = 200) -> dict:
+    """2つの版の差分（unified diff）。rev_b を省略すると最新の版と比べる。
+    差分が max_lines 行を超えたら先頭だけ返す（truncated=true）。"""
+    ws = _ws()
+    _target(ws, section)
+    revs = _revisions(ws, section)
+    rev_b = rev_b or len(revs)
+    a, b = _rev_text(ws, section, rev_a), _rev_text(ws, section, rev_b)
+    lines = list(difflib.unified_diff(a.splitlines(), b.splitlines(), f"{section}@{rev_a}", f"{section}@{rev_b}",
+                                      lineterm=""))
+    return {"section": section, "rev_a": rev_a, "rev_b": rev_b, "diff": "\n".join(lines[:max_lines]),
+            "changed_lines": sum(1 for ln in lines[2:] if ln[:1] in "+-"), "truncated": len(lines) > max_lines}
+
+
+@app.tool()
+def workspace_restore(section: str, rev: int) -> dict:
+    """指定の版の中身に戻す。戻したこと自体も新しい版として残るので、戻し直しもできる。"""
+    ws = _ws()
+    target = _target(ws, section)
+    text = _rev_text(ws, section, rev)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text)
+    new = _snapshot(ws, section, target.read_bytes(), f"restore:{rev}")
+    _journal(ws, {"event": "restore", "section": section, "from_rev": rev, "rev": new["rev"]})
+    return {"written": str(target), "chars": len(text), "restored_from": rev, "rev": new["rev"]}
+
+
 # ---------- 質問バンク ----------
 
 @app.tool()
-def list_question_blocks(group: str | None = None) -> list[dict]:
-    """質問バンクの一覧（id/グループ/タイトル/DoD/調査区分/写像）を返す。
-    group: 足元 / 外部環境 / 競争構造 / 新事業10問（省略で全件）。"""
-    return [
+def list_question_blocks(group: str | None = None, fields: list[str] | None = None,
+                         cursor: str | None = None, limit: int = LIST_LIMIT) -> dict:
+    """質問バンクの一覧（id/グループ/タイトル/DoD/調査区分/写像）を limit 件ずつ返す。
+    group: 足元 / 外部環境 / 競争構造 / 新事業10問（省略で全件）。
+    fields: 返す項目を絞る（例: ["id", "title"]）。続きは next_cursor を cursor に渡して取る。"""
+    blocks = [
         {k: b[k] for k in ("id", "group", "title", "subtitle", "dod", "research",
                            "sources_required", "entry_themes", "review_axes")}
         for b in bank["blocks"] if group is None or b["group"] == group
     ]
+    return _page(blocks, cursor, limit, fields)
 
 
 @app.tool()
@@ -276,71 +533,410 @@ def fukabori_coverage(block_id: str, text: str) -> dict:
             "note": "機械チェックのみ。DoDの意味的な充足（固有名詞・機会2脅威2など）はLLMが判断し、（仮）の数字が残っていれば指摘すること。"}
 
 
-# ---------- Prompts ----------
+# ---------- 数字の横断整合 ----------
+# 質問バンクの cross_checks のうち数字で確かめられるもの（money_consistency）を crosscheck.py で検算する。
+# 深掘りの記録・原稿から拾った数は中身のハッシュごとに持ち回す
+
+def _cross_check(draft: str | None) -> dict:
+    blocks = {b for c in bank["cross_checks"] for b in c["blocks"]}
+    try:
+        ws = _ws()
+    except ValueError:
+        ws = None  # ワークスペースなし: 原稿だけで検算
+    records = {b: (ws / "fukabori" / f"{b}.md").read_text()
+               for b in sorted(blocks) if ws and (ws / "fukabori" / f"{b}.md").exists()}
+    if draft is None and ws and (ws / SECTIONS["entry_draft"]).exists():
+        draft = (ws / SECTIONS["entry_draft"]).read_text()
+    return crosscheck.run(bank["cross_checks"], records, draft or None)
+
+
+@app.tool()
+def cross_check(draft: str | None = None) -> dict:
+    """数字の横断整合の検算。深掘りの記録（市場規模・ビジネスモデル・必要資金）と原稿から単位つきの数を拾い、
+    1行の式の計算、月額↔年額、単価×数量↔売上↔SOM、初期投資↔利益（回収年数）、運営費↔売上を確かめる。
+    draft を省略するとワークスペースの entry_draft を使う。計算はこの結果を使い、LLMは再計算しないこと。
+    level: error（計算違い）/ warn（つながりの矛盾）/ info（参考値）。"""
+    result = _cross_check(draft)
+    result["note"] = ("どの数が何を表すかは見出し語（単価・売上・利益・初期投資・運営費・SOM）による目安。"
+                      "指摘するときは where の原文を確かめること。数字の検算でない観点（status=llm）はLLMが判断する。")
+    return result
+
+
+# ---------- 政策の系譜 ----------
+
+@app.tool()
+def trace_policy(node_or_subsidy_id: str) -> dict:
+    """制度がなぜあるか（政策の系譜）を1回で引く。制度の id（jigyo_shokei_ma 等）か系譜のノードの id
+    （L4_atotsugi_7th・L0_demographics 等）を渡す。
+    upstream: 上流の系譜を近いまとまりから（予算事業 → 省庁施策 → 我が国の方針 → … → 世界の現実）。
+    downstream: そのノードが及ぶ先。interpretations: それを根拠にする解釈（運営者の読み。事実と分けて扱う）。
+    drafting_directives: 申請書の書き方への指針。confirmed=false は未確認の候補なので断定に使わないこと。"""
+    return {**lineage.trace(LINEAGE, node_or_subsidy_id.strip()),
+            "subsidies": sorted(LINEAGE.by_subsidy), "disclaimer": DISCLAIMER}
+
 
-def _dialogue_policy() -> str:
-    """質問バンクの対話規律を、聞き出す系プロンプトの前置きとして描画する。"""
-    pol = bank["dialogue_policy"]
-    rules = "\n".join(f"- {r['rule']}" for r in pol["rules"])
-    return (f"# 対話の規律（この規律がテーマ固有の指示より優先される）\n"
-            f"{pol['fact_vs_interpretation']}\n{rules}\n\n")
+# ---------- 相談先 ----------
+
+@app.tool()
+def list_ambassadors(region: str | None = None, fields: list[str] | None = None,
+                     cursor: str | None = None, limit: int = LIST_LIMIT) -> dict:
+    """相談できる人（アトツギ甲子園アンバサダー）を limit 件ずつ返す。
+    region: 地方ブロック名（関東 等）か都道府県名（省略で全員）。fields・cursor は list_question_blocks と同じ。"""
+    people = ambassadors["people"]
+    if region:
+        prefs = set(_prefs(region))
+        people = [p for p in people if p.get("pref") in prefs]
+    return _page(people, cursor, limit, fields)
+
+
+# ---------- 知識検索 ----------
+# data/*.yaml の各レコード（dict。直下のスカラー値が本文）を1文書とし、文字bigramのBM25で引く。
+# レコードと出典（自身か最も近い祖先の provenance / accessed）は data_index の索引から取り、
+# 転置索引はその中身（各YAMLのハッシュ）ごとに1回だけ作る
+_index_cache: dict = {}
+
+
+def _bigrams(text: str) -> list[str]:
+    """NFKC・小文字化した字・数字の連なりごとの2文字組（site/build.py の bigrams と同じ規則）"""
+    out, run = [], []
+    for ch in unicodedata.normalize("NFKC", text).lower() + " ":
+        if ch.isalnum():
+            run.append(ch)
+            continue
+        out += [run[i] + run[i + 1] for i in range(len(run) - 1)]
+        run = []
+    return out
+
+
+def _provenance(rec: dict) -> dict:
+    return {k: rec[k] for k in ("source_url", "source_title", "accessed", "confidence", "note") if rec[k]}
+
+
+def _knowledge_index() -> dict:
+    recs = [r for r in data_index.records(DATA) if r["text"]]
+    key = data_index.snapshot()
+    if _index_cache.get("key") == key:
+        return _index_cache
+    docs = [{"path": r["path"], "title": r["title"], "text": r["text"], "provenance": _provenance(r)}
+            for r in recs]
+    _index_cache.clear()
+    _index_cache.update(key=key, docs=docs, **_postings([r["title"] + "\n" + r["text"] for r in recs]))
+    return _index_cache
+
+
+def _postings(texts: list[str]) -> dict:
+    """文書ごとのbigramの数から転置索引（postings・文書長・平均長）を作る"""
+    postings, lengths = {}, []
+    for i, text in enumerate(texts):
+        counts: dict[str, int] = {}
+        for bg in _bigrams(text):
+            counts[bg] = counts.get(bg, 0) + 1
+        for bg, n in counts.items():
+            postings.setdefault(bg, []).append((i, n))
+        lengths.append(sum(counts.values()))
+    return {"postings": postings, "lengths": lengths, "avglen": sum(lengths) / max(1, len(lengths))}
+
+
+def _bm25(idx: dict, query: str, k: int) -> list[tuple[int, float]]:
+    """(文書番号, スコア) の上位k件（最大20）"""
+    # 語ごとに重みを揃える（bigramの数で割る）: 長い語（例: アトツギ甲子園）が短い語（加点）を押し流さないように
+    words = [(w, list(dict.fromkeys(_bigrams(w)))) for w in query.split()]
+    words = [(w, qb) for w, qb in words if qb]
+    if not words:
+        raise ValueError("2文字以上の語で検索してください。")
+    k1, b, n_docs = 1.2, 0.75, len(idx["lengths"])
+    scores: dict[int, float] = {}
+    for _, qb in words:
+        for bg in qb:
+            post = idx["postings"].get(bg, [])
+            idf = math.log(1 + (n_docs - len(post) + 0.5) / (len(post) + 0.5))
+            for d, tf in post:
+                norm = k1 * (1 - b + b * idx["lengths"][d] / idx["avglen"])
+                scores[d] = scores.get(d, 0.0) + idf * tf * (k1 + 1) / (tf + norm) / len(qb)
+    return sorted(scores.items(), key=lambda ds: -ds[1])[:max(1, min(k, 20))]
+
+
+def _snippet(text: str, query: str, width: int = 160) -> str:
+    low = unicodedata.normalize("NFKC", text).lower()
+    needles = [w for w in unicodedata.normalize("NFKC", query).lower().split() if len(w) >= 2] + _bigrams(query)
+    pos = next((p for p in (low.find(n) for n in needles) if p != -1), 0)
+    start = max(0, pos - width // 4)
+    return ("…" if start else "") + text[start:start + width] + ("…" if start + width < len(text) else "")
+
+
+@app.tool()
+def search_knowledge(query: str, k: int = 5) -> dict:
+    """data/*.yaml 全体（補助金の要件・加点、質問バンクの設問とDoD、日程、アンバサダー等）を検索し、
+    該当箇所の抜粋を上位k件（最大20）返す。1つの事実を確かめたいときは、リソースを丸ごと読まずにまずこれを使う。
+    各結果の path（ファイル:YAMLパス）・provenance（出典・取得日・確認状態）を回答に添えること。"""
+    idx = _knowledge_index()
+    top = _bm25(idx, query, k)
+    return {
+        "query": query,
+        "results": [{
+            "path": idx["docs"][d]["path"],
+            "title": idx["docs"][d]["title"],
+            "score": round(score, 3),
+            "snippet": _snippet(idx["docs"][d]["text"], query),
+            "provenance": idx["docs"][d]["provenance"] or None,
+            "confirmed": idx["docs"][d]["provenance"].get("accessed"),
+        } for d, score in top],
+        "note": "confirmed（取得日）が古い・provenanceがない値は、回答で（仮）または要確認と明示すること。",
+        "disclaimer": DISCLAIMER,
+    }
+
+
+# ---------- 手元資料の検索 ----------
+# workspace/materials/ の資料（会社の沿革・決算のCSV・貼り付けたWebページ等）を数百字の段落に切り、
+# 知識検索と同じ文字bigramのBM25で引く。大きなファイルはメモリマップで少しずつ読む。
+# 切った段落はファイルの中身のハッシュごとに .cache/materials/ へ保存し、変わっていないファイルは読み直さない
+MATERIAL_SUFFIXES = {".md", ".txt", ".csv", ".tsv", ".html", ".htm", ".json", ".yaml", ".yml", ".docx"}
+PASSAGE_CHARS = 400          # 段落の目安の長さ（字）
+MMAP_MIN = 1024 * 1024       # これ以上のファイルはメモリマップで読む
+_materials_cache: dict = {}
+
+
+class _HTMLText(html.parser.HTMLParser):
+    """HTMLの本文だけを行に（script/style は捨て、ブロック要素の切れ目で改行）"""
+    BLOCKS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "table"}
+
+    def __init__(self):
+        super().__init__()
+        self.parts, self._skip = [], 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        if tag in self.BLOCKS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self._skip = max(0, self._skip - 1)
+        if tag in self.BLOCKS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+    def take(self, final: bool = False) -> list[str]:
+        """ここまでの行。final でなければ書きかけの最後の行は次に回す"""
+        lines = "".join(self.parts).split("\n")
+        self.parts = [] if final else [lines.pop()]
+        return lines
+
+
+def _digest(path: pathlib.Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(EXPORT_CHUNK):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _byte_blocks(path: pathlib.Path):
+    """ファイルの中身を、行の途中で切らずに少しずつ（大きなファイルはメモリマップで）"""
+    size = path.stat().st_size
+    if size < MMAP_MIN:
+        yield path.read_bytes()
+        return
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = 0
+        while pos < size:
+            end = min(size, pos + MMAP_MIN)
+            if end < size:
+                end = mm.rfind(b"\n", pos, end) + 1 or end  # 改行で切る（UTF-8でもShift_JISでも文字を割らない）
+            yield mm[pos:end]
+            pos = end
+
+
+def _material_lines(path: pathlib.Path):
+    """資料の本文を1行ずつ。UTF-8で読めなければ Shift_JIS（cp932。Excel書き出しのCSVに多い）"""
+    if path.suffix == ".docx":
+        with zipfile.ZipFile(path) as z:
+            xml = z.read("word/document.xml").decode("utf-8")
+        for para in re.split(r"</w:p>", xml):
+            yield html.unescape(re.sub(r"<[^>]+>", "", para))
+        return
+    encoding, parser = None, _HTMLText() if path.suffix in (".html", ".htm") else None
+    for block in _byte_blocks(path):
+        if encoding is None:
+            try:
+                block.decode("utf-8")
+                encoding = "utf-8-sig"
+            except UnicodeDecodeError:
+                encoding = "cp932"
+        text = block.decode(encoding, errors="replace")
+        if parser:
+            parser.feed(text)
+            yield from parser.take()
+        else:
+            yield from text.splitlines()
+    if parser:
+        parser.close()
+        yield from parser.take(final=True)
+
+
+def _passages(path: pathlib.Path) -> list[dict]:
+    """資料を段落（空行か PASSAGE_CHARS 字で区切る）に。CSV/TSV は各段落の頭に見出し行を付ける"""
+    out, cur, start, header = [], [], 1, None
+    table = path.suffix in (".csv", ".tsv")
+
+    def flush():
+        body = "\n".join(cur).strip()
+        if body:
+            out.append({"line": start, "text": (header + "\n" + body) if header and start > 1 else body})
+
+    for no, line in enumerate(_material_lines(path), 1):
+        if table and no == 1:
+            header = line
+        if not line.strip() or sum(map(len, cur)) + len(line) > PASSAGE_CHARS:
+            flush()
+            cur, start = [], no + (not line.strip())
+        if line.strip():
+            cur.append(line.rstrip())
+    flush()
+    return out
+
+
+def _materials_index(ws: pathlib.Path) -> dict:
+    """materials/ の段落の索引。ファイルの大きさ・更新時刻が前回と同じならハッシュも取り直さない"""
+    cache_dir = ws / ".cache" / "materials"
+    manifest_file = cache_dir / "manifest.json"
+    manifest = json.loads(manifest_file.read_text()) if manifest_file.exists() else {}
+    new_manifest, stats = {}, {"processed": 0, "reused": 0, "skipped": []}
+    for f in sorted(_files(ws / "materials")) if (ws / "materials").exists() else []:
+        rel = str(f.relative_to(ws))
+        if f.suffix.lower() not in MATERIAL_SUFFIXES:
+            stats["skipped"].append(rel)
+            continue
+        st = f.stat()
+        prev = manifest.get(rel)
+        if prev and prev["size"] == st.st_size and prev["mtime_ns"] == st.st_mtime_ns:
+            digest = prev["sha256"]
+        else:
+            digest = _digest(f)
+        cached = cache_dir / f"{digest}.json"
+        if not cached.exists():
+            try:
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                cached.write_text(json.dumps(_passages(f), ensure_ascii=False))
+            except (KeyError, zipfile.BadZipFile):  # 中身が壊れたdocx等
+                stats["skipped"].append(rel)
+                continue
+            stats["processed"] += 1
+        else:
+            stats["reused"] += 1
+        new_manifest[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+    if new_manifest != manifest:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest_file.write_text(json.dumps(new_manifest, ensure_ascii=False, indent=1))
+        live = {f"{m['sha256']}.json" for m in new_manifest.values()}
+        for old in cache_dir.glob("*.json"):
+            if old.name != manifest_file.name and old.name not in live:
+                old.unlink()  # 書き換え前・削除済みの資料の段落
+    key = (str(ws), tuple(sorted((rel, m["sha256"]) for rel, m in new_manifest.items())))
+    if _materials_cache.get("key") != key:
+        docs = [{"file": rel, **p} for rel, m in new_manifest.items()
+                for p in json.loads((cache_dir / f"{m['sha256']}.json").read_text())]
+        _materials_cache.clear()
+        _materials_cache.update(key=key, docs=docs, **_postings([d["text"] for d in docs]))
+    return {**_materials_cache, "stats": stats}
+
+
+@app.tool()
+def workspace_search(query: str, k: int = 5) -> dict:
+    """ワークスペースの materials/ に置いた資料（沿革・決算CSV・Webページの保存・docx 等）を検索し、
+    該当する段落を上位k件（最大20）返す。深掘りや申請書の数字は、資料を丸ごと読まずにまずこれで引き、
+    file と line（段落の開始行）を根拠として添えること。新しく置いた・書き換えた資料だけが読み直される。"""
+    idx = _materials_index(_ws())
+    if not idx["docs"]:
+        raise ValueError("materials/ に検索できる資料がありません（対応形式: "
+                         + " ".join(sorted(MATERIAL_SUFFIXES)) + "）。")
+    return {
+        "query": query,
+        "results": [{
+            "file": idx["docs"][d]["file"],
+            "line": idx["docs"][d]["line"],
+            "score": round(score, 3),
+            "passage": idx["docs"][d]["text"],
+        } for d, score in _bm25(idx, query, k)],
+        "indexed": {"files": len({d["file"] for d in idx["docs"]}), "passages": len(idx["docs"]),
+                    **idx["stats"]},
+    }
 
 
+# ---------- データの鮮度 ----------
+# 出典と確認日は data_index の索引（1ファイル1回のたどり）から集める
+STALE_DAYS = 60
+
+
+@app.tool()
+def data_freshness(file: str | None = None, older_than_days: int = STALE_DAYS,
+                   cursor: str | None = None, limit: int = LIST_LIMIT) -> dict:
+    """掲載データの鮮度。ファイルごとの確認日（最古・最新）と確認状態の内訳、および確認から
+    older_than_days 日を過ぎた・確認日のない出典（要再確認）の一覧を古い順に返す。
+    file: data/ のファイル名（例: jigyo_shokei_ma.yaml。省略で全部）。続きは next_cursor を cursor に渡す。"""
+    today = _now().date()
+    recs = [r for r in data_index.records(DATA) if r["own"]]
+    if file:
+        recs = [r for r in recs if r["path"].startswith(file + ":")]
+        if not recs:
+            names = sorted({r["path"].split(":", 1)[0] for r in data_index.records(DATA) if r["own"]})
+            raise ValueError(f"出典を持つデータが見つかりません: {file}（選べるのは {names}）")
+
+    def age(r):
+        return (today - datetime.fromisoformat(r["accessed"]).date()).days if r["accessed"] else None
+
+    files: dict[str, dict] = {}
+    for r in recs:
+        name = r["path"].split(":", 1)[0]
+        files.setdefault(name, []).append(r)
+    summary = {}
+    for name, rs in files.items():
+        dates = data_index.confirmed_dates(rs)
+        summary[name] = {"sources": len(rs), "oldest": dates[0] if dates else None,
+                         "newest": dates[-1] if dates else None,
+                         "confidence": data_index.confidence_stats(rs),
+                         "stale": sum(1 for r in rs if age(r) is None or age(r) > older_than_days)}
+    stale = [{"path": r["path"], "title": r["title"], "accessed": r["accessed"], "age_days": age(r),
+              "confidence": r["confidence"], "source_url": r["source_url"]}
+             for r in recs if age(r) is None or age(r) > older_than_days]
+    stale.sort(key=lambda it: -1 if it["age_days"] is None else -it["age_days"])
+    return {"as_of": today.isoformat(), "older_than_days": older_than_days, "files": summary,
+            "stale": _page(stale, cursor, limit, None),
+            "note": "stale の値を回答に使うときは、確認日を添えて（要確認）と明示し、出典の原文を当たるよう促すこと。"}
+
+
+# ---------- Prompts ----------
+
+# 組み立ては prompts.py（サイトのビルドが大きさを測るのにも使う）
+
 @app.prompt()
 def entry_interview() -> str:
     """エントリー文（申請書5テーマ）の骨子づくりインタビューを開始する。"""
-    return _dialogue_policy() + entry_def["prompt_template"]
+    return prompts.text(prompts.dialogue_policy(bank) + prompts.entry_prompt(entry_def))
 
 
 @app.prompt()
 def mock_review(draft: str) -> str:
     """予行審査。審査委員視点・忖度なしでエントリー文の骨子を評価する。"""
-    return entry_def["review_prompt_template"].replace("{draft}", draft)
+    return prompts.text(prompts.review_prompt(entry_def, draft))
 
 
 @app.prompt()
 def dr_review(draft: str) -> str:
-    """DR: 申請書から質問バンクの各設問への答えが読み取れるかを、引用必須で照合する。"""
-    lines = []
-    for b in bank["blocks"]:
-        lines.append(f"- {b['id']}: {b['title']}（期待される場所: {'・'.join(b['entry_themes'])} / 観点: {'・'.join(b['review_axes'])} / DoD: {b['dod']}）")
-    checks = "\n".join(f"- {c['rule']}" for c in bank["cross_checks"])
-    return f"""あなたは申請書のデザインレビュー担当です。忖度は不要です。
-以下の申請書を、設問リストに対して照合してください。
-
-# 判定ルール（厳守）
-- 各設問について「申請書から答えが読み取れるか」を判定する。
-- 読み取れると主張する場合は、必ず申請書から該当箇所を原文引用する。引用できなければ「読み取れない」とする。
-- 「期待される場所」の段落を優先的に見るが、全文を対象とする。別の場所に書かれていれば所在を示す。
-- 出典のない数値は（仮）扱いとして指摘する。
-
-# 設問リスト
-{chr(10).join(lines)}
-
-# 横断整合（数字の検算）
-{checks}
-
-# 出力形式
-1. 観点別サマリー（承継の物語/実現性/独自性/事業価値/波及ごとに、読み取れた設問数と最重要の欠落）
-2. 設問別の判定表（読み取れる=引用 / 読み取れない=どこに何を足すか）
-3. 横断整合の検算結果
-4. 直すなら最初の一手（1つ）
-
----
-{draft}"""
+    """DR: 申請書から質問バンクの各設問への答えが読み取れるかを、引用必須で照合する。
+    数字の横断整合はツールで検算した結果を添える（ワークスペースがあれば深掘りの記録とも突き合わせる）。"""
+    return prompts.text(prompts.dr_review(bank, draft, crosscheck.report(_cross_check(draft))))
 
 
 @app.prompt()
 def fukabori_chapter(chapter_no: str) -> str:
     """フカボリの章別インタビュー（1=足元 2=外部環境 3=競争構造 4=新事業10問）。"""
-    groups = fukabori["groups"]
-    idx = int(chapter_no) - 1
-    g = groups[idx]
-    structure = "\n".join(f"- {b['title']}" for b in g["blocks"])
-    return _dialogue_policy() + (fukabori["chapter_prompt"]
-            .replace("{chapter_no}", str(chapter_no))
-            .replace("{chapter_title}", g["title"])
-            .replace("{structure}", structure))
+    return prompts.text(prompts.dialogue_policy(bank)
+                        + prompts.fukabori_chapter(fukabori, int(chapter_no), fields=False))
 
 
 # ---------- Resources ----------
@@ -350,8 +946,8 @@ def koshien_basics() -> str:
     """アトツギ甲子園の基本（資格・二段階締切・日程・出典）"""
     return yaml.dump({
         "大会": "アトツギ甲子園（中小企業庁主催・39歳以下の後継予定者のピッチ大会）",
-        "エントリー締切": str(SCHEDULE["entry_period"]["end"]),
-        "書類提出締切": str(SCHEDULE["document_deadline"]["value"]),
+        "エントリー締切": M.schedule.entry_end_iso,
+        "書類提出締切": M.schedule.docs_end_iso,
         "schedule": SCHEDULE,
         "checklist": entry_def.get("checklist"),
         "免責": DISCLAIMER,
@@ -360,22 +956,47 @@ def koshien_basics() -> str:
 
 @app.resource("shinseider://subsidy/shokei-ma")
 def subsidy_resource() -> str:
-    """事業承継・M&A補助金〈促進枠〉の要件・加点・審査観点（出典・取得日付き）"""
-    return yaml.dump(subsidy["subsidy"], allow_unicode=True, sort_keys=False)
+    """事業承継・M&A補助金〈促進枠〉の要件・加点・審査観点（出典・取得日付き）。
+    一部だけ要るときは shinseider://subsidy/shokei-ma/{section}"""
+    return yaml.dump(M.subsidy.raw, allow_unicode=True, sort_keys=False)
+
+
+@app.resource("shinseider://subsidy/shokei-ma/{section}")
+def subsidy_section_resource(section: str) -> str:
+    """事業承継・M&A補助金の1項目だけ（requirements / scoring / rounds / required_documents 等）"""
+    section = unquote(section)
+    if section not in M.subsidy.raw:
+        raise ValueError(f"項目が見つかりません: {section}（選べるのは {list(M.subsidy.raw)}）")
+    return yaml.dump({section: M.subsidy.raw[section]}, allow_unicode=True, sort_keys=False)
 
 
 @app.resource("shinseider://consult")
 def consult_resource() -> str:
-    """相談できる人（アトツギ甲子園アンバサダー）"""
+    """相談できる人（アトツギ甲子園アンバサダー）全員。地域で絞るときは shinseider://consult/{region}"""
     return yaml.dump(ambassadors, allow_unicode=True, sort_keys=False)
 
 
+@app.resource("shinseider://consult/{region}")
+def consult_region_resource(region: str) -> str:
+    """指定地域のアンバサダー（region: 地方ブロック名か都道府県名）"""
+    prefs = _prefs(unquote(region))
+    people = [p for p in ambassadors["people"] if p.get("pref") in prefs]
+    return yaml.dump({"region": unquote(region), "prefectures": prefs, "people": people},
+                     allow_unicode=True, sort_keys=False)
+
+
 @app.resource("shinseider://question-bank")
 def bank_resource() -> str:
-    """質問バンク全体（24ブロック78項目・DoD・写像・横断整合）"""
+    """質問バンク全体（24ブロック78項目・DoD・写像・横断整合）。1ブロックだけなら shinseider://question-bank/{block_id}"""
     return yaml.dump(bank, allow_unicode=True, sort_keys=False)
 
 
+@app.resource("shinseider://question-bank/{block_id}")
+def bank_block_resource(block_id: str) -> str:
+    """質問バンクの1ブロック（設問・必須・記入例・DoD）"""
+    return yaml.dump(get_question_block(unquote(block_id)), allow_unicode=True, sort_keys=False)
+
+
 @app.resource("shinseider://about")
 def about_resource() -> str:
     """運営者と方針（非公式・無償・原文優先）"""
@@ -10,23 +10,50 @@ data/*.yaml（正本）→ site/dist/ の静的HTML。
   （バッジなしで unreviewed データを表示するテンプレートを書けない構造にする）
 - サイト全体に PREVIEW バナー（公開ゲート6項目クリアまで externally 公開しない）
 """
+import bisect
 import datetime as dt
+import functools
+import gzip
+import hashlib
+import inspect
+import itertools
 import json
+import math
 import subprocess
+import sys
+import unicodedata
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
 
 import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import jinja2
+from jinja2 import (Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, meta,
+                    select_autoescape)
 
 ROOT = Path(__file__).resolve().parent.parent
 SITE = ROOT / "site"
 DIST = SITE / "dist"
 
+# データのモデル・索引とプロンプトの組み立てはMCPサーバーと共有（mcp/model.py・data_index.py・prompts.py。mcpパッケージには依存しない）
+sys.path.insert(0, str(ROOT / "mcp"))
+import data_index  # noqa: E402
+import lineage  # noqa: E402
+import model  # noqa: E402
+import prompts  # noqa: E402
+
 PREVIEW = True  # 公開ゲート6項目クリアで False にする
 SITE_URL = "https://shinseider.onrender.com"
 
 
 def load(name):
+    # 監視モード（serve.py）で同じプロセスから繰り返し呼ばれるため、更新時刻が変わったファイルだけ読み直す
+    return _load_cached(name, (ROOT / "data" / name).stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_cached(name, _mtime_ns):
     with open(ROOT / "data" / name, encoding="utf-8") as f:
         return yaml.safe_load(f)
 
@@ -41,20 +68,19 @@ def git_log(n=12):
         return []
 
 
-def collect_confidence_stats(obj, stats=None):
-    """データ木からconfidence値を集計（信頼面ページ用）"""
-    if stats is None:
-        stats = {}
-    if isinstance(obj, dict):
-        c = obj.get("confidence")
-        if isinstance(c, str):
-            stats[c] = stats.get(c, 0) + 1
-        for v in obj.values():
-            collect_confidence_stats(v, stats)
-    elif isinstance(obj, list):
-        for v in obj:
-            collect_confidence_stats(v, stats)
-    return stats
+def datasets_ctx(datasets):
+    """情報源ページのデータ一覧。files を持つものは、最終確認日を data/ の索引（そのファイルで出典が宣言する
+    accessed の最新）から出す（手で書いた日付が元データとずれないように）"""
+    recs = data_index.records(ROOT / "data")
+    out = []
+    for d in datasets:
+        if d.get("files"):
+            dates = data_index.confirmed_dates([r for r in recs if r["path"].split(":", 1)[0] in d["files"]])
+            assert dates, f"site_sources.yaml: 確認日（accessed）を持つ出典が見つからない: {d['files']}"
+            d = {**d, "accessed": dates[-1]}
+        assert d.get("accessed"), f"site_sources.yaml: 最終確認日がない: {d['name']}"
+        out.append(d)
+    return out
 
 
 # 都道府県タイル地図（列,行）。地理の近似でよい（押す場所の案内が目的）
@@ -78,33 +104,15 @@ PREF_GRID = {
     # 沖縄（1行あけて左下に離す）
     "沖縄県": (1, 14),
 }
-REGIONS = [
-    # 大会の地方大会ブロック区分（経済産業局の管轄に一致）。
-    # 根拠: 第6回関東ブロック決勝進出=山梨・静岡・東京、ブロック賞は「関東経済産業局長賞」
-    # （kyodonewsprwire.jp/release/202601263015）。中部ブロックに石川の受賞者（202601232954）。
-    ("北海道・東北", ["北海道", "青森県", "岩手県", "宮城県", "秋田県", "山形県", "福島県"]),
-    ("関東", ["茨城県", "栃木県", "群馬県", "埼玉県", "千葉県", "東京都", "神奈川県",
-              "新潟県", "山梨県", "長野県", "静岡県"]),
-    ("中部", ["富山県", "石川県", "岐阜県", "愛知県", "三重県"]),
-    ("近畿", ["福井県", "滋賀県", "京都府", "大阪府", "兵庫県", "奈良県", "和歌山県"]),
-    ("中国・四国", ["鳥取県", "島根県", "岡山県", "広島県", "山口県", "徳島県", "香川県", "愛媛県", "高知県"]),
-    ("九州・沖縄", ["福岡県", "佐賀県", "長崎県", "熊本県", "大分県", "宮崎県", "鹿児島県", "沖縄県"]),
-]
 
-# トップの塗り分け地図用: (ブロック名, 塗り色, 開催都市, 開催日)。
-# 日程の根拠は中企庁8/3プレス（data/events.yamlと同一）。REGIONSと同順であること
-BLOCK_META = [
-    ("北海道・東北", "#adc3cf", "仙台", "1/19"),
-    ("関東", "#d3a08e", "東京・品川", "1/25"),
-    ("中部", "#cfc08d", "名古屋", "1/28"),
-    ("近畿", "#c2a3b4", "大阪", "2/1"),
-    ("中国・四国", "#a9c0a4", "高松", "2/4"),
-    ("九州・沖縄", "#d9b98f", "熊本", "2/8"),
-]
+
+def regions():
+    """地方大会ブロック [(ブロック名, 都道府県の一覧, 塗り色)]（data/regions.yaml。MCPサーバーも同じものを読む）"""
+    return [(b["name"], b["prefs"], b["color"]) for b in load("regions.yaml")["blocks"]]
 
 
 def build_japan_blocks_svg():
-    """トップ用: 地方大会6ブロックで塗り分けた日本地図を dist/static に書き出す。
+    """トップ用: 地方大会6ブロックで塗り分けた日本地図（dist/static/japan-blocks.svg の中身）を返す。
     <img>単体で表示するためfillはインラインで持つ。構図の組み替え3手順は
     build_japan_svgと同じ（境界線除去・鹿児島の転置離島省略・沖縄インセット）。"""
     import xml.etree.ElementTree as ET
@@ -133,11 +141,7 @@ def build_japan_blocks_svg():
         "fill": "#7a7466", "font-size": "13"})
     label.text = "沖縄県"
 
-    color_by_pref = {}
-    for (rname, prefs), (bname, color, _city, _date) in zip(REGIONS, BLOCK_META):
-        assert rname == bname, "REGIONSとBLOCK_METAの順序が食い違っている"
-        for p in prefs:
-            color_by_pref[p] = color
+    color_by_pref = {p: color for _name, prefs, color in regions() for p in prefs}
 
     def walk(parent):
         for child in list(parent):
@@ -152,10 +156,10 @@ def build_japan_blocks_svg():
             else:
                 walk(child)
     walk(prefs_g)
-    (DIST / "static" / "japan-blocks.svg").write_bytes(ET.tostring(root))
+    return ET.tostring(root)
 
 
-def events_jsonld(ev_data):
+def events_jsonld(ev_data, season):
     """イベントページ用のEvent構造化データ（schema.org）。行事のみ
     （説明会・キャンプ・地方大会・決勝）。締切・受付開始は行事ではないため含めない。"""
     import re as _re
@@ -169,7 +173,7 @@ def events_jsonld(ev_data):
             start += f"T{m.group(1)}:00+09:00"
         item = {
             "@type": "Event",
-            "name": "第7回アトツギ甲子園 " + e["title"],
+            "name": season["name"] + "アトツギ甲子園 " + e["title"],
             "startDate": start,
             "endDate": str(e.get("end", e["start"])),
             "eventStatus": "https://schema.org/EventScheduled",
@@ -185,6 +189,28 @@ def events_jsonld(ev_data):
     return json.dumps({"@context": "https://schema.org", "@graph": items}, ensure_ascii=False)
 
 
+def hero_blocks(ev_data):
+    """トップの塗り分け地図の凡例: 地方大会ブロックごとの色・開催都市・開催日（日程に載っているブロックだけ）"""
+    taikai = {e["block"]: e for e in ev_data["events"] if e.get("kind") == "taikai"}
+    return [{"name": name, "color": color, "city": taikai[name]["city"], "date": jdate(taikai[name]["start"], "{M}/{D}")}
+            for name, _prefs, color in regions() if name in taikai]
+
+
+def policy_traces(graph, directory):
+    """「国の狙い」ページ: 系譜のある制度ごとに、上流を近いまとまりから。未確認の候補（先進国の指針など）は載せない。
+    まとまりの見出しは読者向けの名前（lineage.READER_NAMES）だけを渡し、内部の名前は出さない"""
+    names = {e.id: e.name for e in directory}
+    out = []
+    for sid in graph.by_subsidy:
+        groups = []
+        for g in lineage.trace(graph, sid)["upstream"]:
+            assert g["group"] in lineage.READER_NAMES, f"lineage.READER_NAMES に見出しがない: {g['group']}"
+            groups.append({"title": lineage.READER_NAMES[g["group"]],
+                           "nodes": [n for n in g["nodes"] if n["confirmed"]]})
+        out.append({"id": sid, "name": names[sid], "upstream": [g for g in groups if g["nodes"]]})
+    return out
+
+
 def group_by_region(people):
     """人のリストを地域→県→人に組む（載っている県だけ）"""
     return [
@@ -192,7 +218,7 @@ def group_by_region(people):
             {"pref": p, "people": [a for a in people if a["pref"] == p]}
             for p in prefs if any(a["pref"] == p for a in people)
         ]}
-        for name, prefs in REGIONS
+        for name, prefs, _color in regions()
         if any(a["pref"] in prefs for a in people)
     ]
 
@@ -291,9 +317,33 @@ def build_japan_svg(has_prefs):
 WEEKDAY_JA = ["月", "火", "水", "木", "金", "土", "日"]
 
 
+class IntervalIndex:
+    """閉区間 [start, end] の重なり検索。開始日順に並べ、終了日の累積最大で左端を二分探索で切る
+    （日単位に展開しないので、複数シーズン・長い受付期間でも要素数は予定の数のまま）"""
+
+    def __init__(self, items):
+        self.items = sorted(items, key=lambda it: it[0])  # (start, end, value)
+        self.starts = [it[0] for it in self.items]
+        self.max_end = list(itertools.accumulate((it[1] for it in self.items), max))
+
+    def overlapping(self, lo, hi):
+        i = bisect.bisect_left(self.max_end, lo)
+        j = bisect.bisect_right(self.starts, hi)
+        return [v for s, e, v in self.items[i:j] if e >= lo]
+
+
+def month_range(d0, d1):
+    """d0の月からd1の月までの (年, 月)"""
+    y, m = d0.year, d0.month
+    while (y, m) <= (d1.year, d1.month):
+        yield y, m
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+
+
 def events_ctx(ev_data, news_data):
     """「動き」ページ: 時系列リスト+月グリッド+カレンダー登録リンク。
-    月グリッドはシーズン範囲（2026-08〜2027-02）を全部プリレンダし、表示切替はクライアント側"""
+    月グリッドの範囲はデータの最初の予定から最後の予定まで。月ごとに別の断片（cal-YYYY-MM.js）にし、
+    ページには初期表示の1か月だけを埋める（残りは月めくりで読む）"""
     import calendar as calmod
     import urllib.parse
 
@@ -315,60 +365,135 @@ def events_ctx(ev_data, news_data):
             "details": "出典: " + e["source_url"],
             "location": e.get("venue", e.get("format", "")),
         })
-        events.append({**e, "d0": d0.isoformat(), "date_disp": date_disp,
+        events.append({**e, "d0": d0.isoformat(), "d1": d1.isoformat(), "date_disp": date_disp,
                        "past": d1 < dt.date.today(),  # ビルド時点の判定。閲覧時はJSが再判定
                        "gcal_url": "https://calendar.google.com/calendar/render?" + q})
 
-    by_date = {}
-    for e in events:
-        d = dt.date.fromisoformat(e["d0"])
-        d1 = dt.date.fromisoformat(str(e.get("end", e["start"])))
-        while d <= d1:
-            by_date.setdefault(d, []).append(e)
-            d += dt.timedelta(days=1)
-
+    index = IntervalIndex((dt.date.fromisoformat(e["d0"]), dt.date.fromisoformat(e["d1"]), e) for e in events)
     cal = calmod.Calendar(firstweekday=6)  # 日曜はじまり
-    months, (y, m) = [], (2026, 8)
-    while (y, m) <= (2027, 2):
-        weeks = [[{"day": d.day, "in_month": d.month == m, "iso": d.isoformat(),
-                   "events": by_date.get(d, []) if d.month == m else []}
-                  for d in wk]
-                 for wk in cal.monthdatescalendar(y, m)]
-        months.append({"y": y, "m": m, "weeks": weeks})
-        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    months = []
+    first, last = min(index.starts), max(index.max_end)
+    for y, m in month_range(first, last):
+        m0 = dt.date(y, m, 1)
+        m1 = dt.date(y, m, calmod.monthrange(y, m)[1])
+        weeks = []
+        for wk in cal.monthdatescalendar(y, m):
+            # 週（のうち月内の日）に重なる予定だけを引き、その中から各日にかかるものを拾う。
+            # ISO の日付文字列は辞書順が日付順なので、そのまま比べる
+            hits = index.overlapping(max(wk[0], m0), min(wk[-1], m1))
+            weeks.append([{"day": d.day, "in_month": d.month == m, "iso": d.isoformat(),
+                           "events": [e for e in hits if e["d0"] <= d.isoformat() <= e["d1"]] if d.month == m else []}
+                          for d in wk])
+        months.append({"y": y, "m": m, "ym": f"{y}-{m:02d}", "weeks": weeks})
+    # 初期表示はビルド日の月（範囲外なら近い端）。閲覧時の月はJSが読み直す
+    today = dt.date.today()
+    initial = months[0] if today < first.replace(day=1) else months[-1] if today > last else next(
+        mo for mo in months if (mo["y"], mo["m"]) == (today.year, today.month))
 
     news = sorted(news_data["items"], key=lambda n: n["date"], reverse=True)
-    return {"events": events, "months": months, "news": news, "ev_note": ev_data["meta"]["note"]}
+    return {"events": events, "months": months, "initial_month": initial,
+            "news": news, "ev_note": ev_data["meta"]["note"]}
 
 
-def build_ics(ev_data):
-    """主要日程の .ics（終日形式・時刻はタイトルに併記。今日以降のみ）"""
-    today = dt.date.today()
-    stamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    lines = ["BEGIN:VCALENDAR", "VERSION:2.0",
-             "PRODID:-//shinseider//koshien7//JA", "CALSCALE:GREGORIAN"]
+@functools.lru_cache(maxsize=None)
+def ics_event(event_json, round_no):
+    """予定1件の VEVENT。中身（JSON）が同じなら作り直さない。DTSTAMP は出典の確認日にして、
+    データが変わらない限りフィードのバイト列（＝ETag）が変わらないようにする"""
+    e = json.loads(event_json)
+    d0 = dt.date.fromisoformat(str(e["start"]))
+    d1 = dt.date.fromisoformat(str(e.get("end", e["start"])))
+    stamp = dt.date.fromisoformat(str(e.get("accessed", e["start"]))).strftime("%Y%m%dT000000Z")
+
     def esc(s):
         return s.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;")
+    title = e["title"] + ("（" + e["time"] + "）" if e.get("time") else "") + "｜アトツギ甲子園"
+    lines = ["BEGIN:VEVENT",
+             f"UID:{e['id']}-r{round_no}@shinseider",
+             f"DTSTAMP:{stamp}",
+             f"DTSTART;VALUE=DATE:{d0.strftime('%Y%m%d')}",
+             f"DTEND;VALUE=DATE:{(d1 + dt.timedelta(days=1)).strftime('%Y%m%d')}",
+             f"SUMMARY:{esc(title)}",
+             f"DESCRIPTION:{esc('出典: ' + e['source_url'])}"]
+    if e.get("venue"):
+        lines.append(f"LOCATION:{esc(e['venue'])}")
+    lines.append("END:VEVENT")
+    return "\r\n".join(lines)
+
+
+def build_ics(ev_data, season):
+    """回の主要日程の .ics（終日形式・時刻はタイトルに併記）。今の回は今日以降のみ、archived の回は全日程。
+    予定ごとの VEVENT は ics_event が中身単位で持ち回す"""
+    today = dt.date.today() if season["status"] == "current" else dt.date.min
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0",
+             f"PRODID:-//shinseider//koshien{season['round']}//JA", "CALSCALE:GREGORIAN"]
     for e in ev_data["events"]:
-        d0 = dt.date.fromisoformat(str(e["start"]))
-        d1 = dt.date.fromisoformat(str(e.get("end", e["start"])))
-        if d1 < today:
+        if dt.date.fromisoformat(str(e.get("end", e["start"]))) < today:
             continue
-        title = e["title"] + ("（" + e["time"] + "）" if e.get("time") else "") + "｜アトツギ甲子園"
-        lines += ["BEGIN:VEVENT",
-                  f"UID:{e['id']}-r7@shinseider",
-                  f"DTSTAMP:{stamp}",
-                  f"DTSTART;VALUE=DATE:{d0.strftime('%Y%m%d')}",
-                  f"DTEND;VALUE=DATE:{(d1 + dt.timedelta(days=1)).strftime('%Y%m%d')}",
-                  f"SUMMARY:{esc(title)}",
-                  f"DESCRIPTION:{esc('出典: ' + e['source_url'])}"]
-        if e.get("venue"):
-            lines.append(f"LOCATION:{esc(e['venue'])}")
-        lines.append("END:VEVENT")
+        lines.append(ics_event(json.dumps(e, ensure_ascii=False, sort_keys=True, default=str), season["round"]))
     lines.append("END:VCALENDAR")
     return "\r\n".join(lines) + "\r\n"
 
 
+# ---------- 回（シーズン） ----------
+# 回の定義は data/seasons.yaml。今の回はページの本文に、過去の回（archived）は日程のカレンダーだけに出る。
+# 過去の回の出力は元データと作り方が変わらない限り同じなので、ROUND_CACHE（.gitignore）に
+# 中身のハッシュで置いて使い回す（回が増えてもビルドの手間は今の回の分とほぼ同じ）
+ROUND_CACHE = SITE / ".round-cache"
+
+
+def seasons():
+    """回の一覧。各回に出力名（ics）を添える。current はちょうど1つ"""
+    ss = load("seasons.yaml")["seasons"]
+    assert all(s["status"] in ("current", "archived") for s in ss), "seasons.yaml: status は current / archived"
+    assert sum(s["status"] == "current" for s in ss) == 1, "seasons.yaml: current の回はちょうど1つ"
+    assert len({s["round"] for s in ss}) == len(ss), "seasons.yaml: 同じ回が2つある"
+    return [{**s, "ics": f"koshien{s['round']}.ics"} for s in ss]
+
+
+def current_season():
+    return next(s for s in seasons() if s["status"] == "current")
+
+
+@functools.lru_cache(maxsize=None)
+def round_code():
+    """回の出力の作り方（関数のソース）のハッシュ。変えたら過去の回のキャッシュも作り直す"""
+    src = "".join(inspect.getsource(f) for f in (ics_event, build_ics))
+    return hashlib.sha256(src.encode()).hexdigest()[:16]
+
+
+def round_outputs(season, ev_data):
+    """1つの回の出力 {出力名: 中身}。archived の回は ROUND_CACHE にあればそれを返す"""
+    if season["status"] == "current":
+        return {season["ics"]: build_ics(ev_data, season)}
+    key = hashlib.sha256(json.dumps([season, ev_data, round_code()], ensure_ascii=False,
+                                    sort_keys=True, default=str).encode()).hexdigest()[:16]
+    cached = ROUND_CACHE / f"{season['ics']}.{key}"
+    if cached.exists():
+        return {season["ics"]: cached.read_bytes().decode("utf-8")}
+    text = build_ics(ev_data, season)
+    ROUND_CACHE.mkdir(exist_ok=True)
+    for old in ROUND_CACHE.glob(season["ics"] + ".*"):
+        old.unlink()
+    cached.write_bytes(text.encode("utf-8"))
+    return {season["ics"]: text}
+
+
+def build_rounds(wanted):
+    """全部の回の出力。元データは load のキャッシュで共有し（同じファイルは1回だけ読む）、回ごとに並列で作る"""
+    todo = [(s, load(s["events"])) for s in seasons() if wanted(s["ics"])]
+    out = {}
+    with ThreadPoolExecutor() as pool:
+        for got in pool.map(lambda r: round_outputs(*r), todo):
+            out.update(got)
+    return out
+
+
+def jdate(v, fmt="{Y}年{M}月{D}日 {hm}"):
+    """ISOの日付・日時を本文の表記に（テンプレートのフィルタ）。{Y}{M}{D} はゼロ詰めなし、{hm} は HH:MM"""
+    d = dt.datetime.fromisoformat(str(v))
+    return fmt.format(Y=d.year, M=d.month, D=d.day, hm=d.strftime("%H:%M"))
+
+
 def ambassadors_ctx(amb):
     cur_round = amb["meta"]["current_round"]
     people = amb["people"]
@@ -389,128 +514,584 @@ def ambassadors_ctx(amb):
     }
 
 
-def main():
-    import urllib.parse
-    subsidy = load("jigyo_shokei_ma.yaml")["subsidy"]
+# ---------- 書き出し前の変換 ----------
+# レンダリング結果の文字列に、書き出す前にメモリ上でかける。distを読み直さない（各出力の書き込みは1回）。
+# 変換は入力だけで結果が決まる関数にすること: 結果は (変換名, 入力のハッシュ) で覚えておき、
+# 監視モードで同じ入力が来たら計算し直さない
+
+def inject_faq_jsonld(html):
+    """出たくない理由ページ: 本文の問い/答えからFAQ構造化データを自動生成（二重管理を避ける）"""
+    import re as _re
+    qas = _re.findall(r'<div class="objection">\s*<h2>(.*?)</h2>\s*<p>(.*?)</p>', html, _re.S)
+    if not qas:
+        return html
+    faq = {"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": [
+        {"@type": "Question",
+         "name": _re.sub(r"<[^>]+>", "", q).strip("「」").replace("&amp;", "&"),
+         "acceptedAnswer": {"@type": "Answer",
+                            "text": _re.sub(r"<[^>]+>", "", a).replace("&amp;", "&")}}
+        for q, a in qas]}
+    return html.replace("</head>", '<script type="application/ld+json">'
+                        + json.dumps(faq, ensure_ascii=False) + "</script>\n</head>")
+
+
+# (出力名のglob, 変換関数)。上から順にかける。最適化のパスを足すときはここに並べる
+TRANSFORMS = [
+    ("cool.html", inject_faq_jsonld),
+]
+_transform_cache = {}
+
+
+def apply_transforms(out, text):
+    import fnmatch
+    for pattern, fn in TRANSFORMS:
+        if not fnmatch.fnmatch(out, pattern):
+            continue
+        key = (fn.__name__, hashlib.sha256(text.encode("utf-8")).hexdigest())
+        if key not in _transform_cache:
+            _transform_cache[key] = fn(text)
+        text = _transform_cache[key]
+    return text
+
+
+# ---------- プロンプトの大きさ ----------
+# 生成するプロンプト（サイトのAIボタン・MCPのprompts）を毎回測り、prompt_budget.yaml の予算を
+# 超えたらビルドを止める。実測値は site/.reports/prompt_report.json に1プロンプト1行で書く
+# （生成物なのでコミットしない。.gitignore。予算を上げるときは実測値をコミットに書く）
+PROMPT_BUDGET_FILE = SITE / "prompt_budget.yaml"
+REPORTS = SITE / ".reports"
+PROMPT_REPORT_FILE = REPORTS / "prompt_report.json"
+
+
+def estimate_tokens(text):
+    """推定トークン数。トークナイザは持たないので概算: 非ASCII（日本語など）は1字1トークン、ASCIIは4字1トークン"""
+    n_ascii = sum(1 for ch in text if ord(ch) < 128)
+    return len(text) - n_ascii + math.ceil(n_ascii / 4)
+
+
+def measure_prompts(named_parts, prefill_urls):
+    """{名前: 部品} を測る。prefill_urls: URLに載せて渡すプロンプトの名前 → URLの雛形（{prompt}入り）の一覧"""
+    rows = {}
+    for name, parts in named_parts.items():
+        text = prompts.text(parts)
+        by_source = {}
+        for src, t in parts:
+            if t:
+                by_source[src] = by_source.get(src, 0) + len(t)
+        encoded = len(urllib.parse.quote(text))
+        row = {"chars": len(text), "encoded": encoded, "tokens": estimate_tokens(text),
+               "top": sorted(by_source.items(), key=lambda kv: -kv[1])[:3]}
+        if name in prefill_urls:
+            row["url"] = max(len(u.replace("{prompt}", "")) + encoded for u in prefill_urls[name])
+        rows[name] = row
+    return rows
+
+
+def check_prompt_budgets(rows):
+    """予算超過・予算のないプロンプトがあれば SystemExit（理由は全部まとめて出す）"""
+    budget = yaml.safe_load(PROMPT_BUDGET_FILE.read_text(encoding="utf-8"))
+    limits = budget.get("prompts") or {}
+    errors = [f"prompt_budget.yaml に予算がないプロンプト: {sorted(set(rows) - set(limits))}"] if set(rows) - set(limits) else []
+    for name, row in rows.items():
+        lim = {**budget.get("default", {}), **(limits.get(name) or {})}
+        for key, actual_key in (("chars", "chars"), ("tokens", "tokens"), ("url_chars", "url")):
+            if actual_key in row and key in lim and row[actual_key] > lim[key]:
+                top = "、".join(f"{src} {n}字" for src, n in row["top"])
+                errors.append(f"{name}: {key} {row[actual_key]} > 予算 {lim[key]}（大きい部品: {top}）")
+    if errors:
+        raise SystemExit("プロンプトの大きさが予算超過。指示文かデータを圧縮すること\n  " + "\n  ".join(errors))
+
+
+def write_prompt_report(rows):
+    lines = [f'  "{name}": {json.dumps(rows[name], ensure_ascii=False, sort_keys=True)}' for name in sorted(rows)]
+    text = "{\n" + ",\n".join(lines) + "\n}\n"
+    if not PROMPT_REPORT_FILE.exists() or PROMPT_REPORT_FILE.read_text(encoding="utf-8") != text:
+        REPORTS.mkdir(exist_ok=True)
+        PROMPT_REPORT_FILE.write_text(text, encoding="utf-8")
+        print(f"→ {PROMPT_REPORT_FILE.relative_to(ROOT)}（{len(rows)}件）")
+
+
+# ---------- 共有スクリプトとデータ（指紋付き） ----------
+# site/js/*.js と、YAMLから作るページ用データ（window.SHINSEIDER_DATA.<key> に入れるスクリプト）を
+# dist/static/js/<名前>.<中身のハッシュ>.js に書く。中身が変われば名前も変わるので長期キャッシュしてよく、
+# 2ページ目からはページ固有のHTMLだけを読めば済む。テンプレートからは {{ asset('pace.js') }} で参照する。
+# データをJSONのfetchでなく<script src>にしているのは、file://（test_site.py）でも読み込み順どおり同期で動かすため
+ASSET_DIR = "static/js"
+
+
+def data_module(key, obj):
+    # プレビューはこの中身を<script>にそのまま埋めるので、< はエスケープしておく
+    return ("(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {})." + key + " = "
+            + json.dumps(obj, ensure_ascii=False).replace("<", "\\u003c") + ";\n")
+
+
+def fingerprint(sources):
+    """{論理名: 中身} → {論理名: (distでの相対パス, 中身)}"""
+    out = {}
+    for name, text in sources.items():
+        stem, ext = name.rsplit(".", 1)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]
+        out[name] = (f"{ASSET_DIR}/{stem}.{digest}.{ext}", text)
+    return out
+
+
+# ---------- サイト内検索（文字bigramの転置索引） ----------
+# 書き出すページの<main>を見出し（h2/h3）ごとの節に分け、質問バンク（24ブロック78項目）も足して文書にする。
+# 索引は bigram → [文書番号の差分, 出現数, ...] を SEARCH_SHARDS 個に分けた指紋付きデータスクリプト。
+# 検索ページは文書一覧と、問い合わせの bigram が入っている分片だけを読む（search.js と分け方を揃えること）
+SEARCH_SHARDS = 16
+SEARCH_SNIPPET_CHARS = 600  # 文書ごとに持つ本文（抜粋表示用）の上限
+_SKIP_TAGS = {"script", "style", "template", "textarea", "pre", "svg", "button", "select"}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class _Sections(HTMLParser):
+    """<main>の中身を [アンカー, 見出し, 本文の断片] の節に分ける。アンカーは見出しのid、なければ直近の親のid"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []  # (タグ, id, 読み飛ばし中か)
+        self.skip, self.in_main, self.in_head = 0, False, None
+        self.h1, self.sections = "", [["", "", []]]
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "main":
+            self.in_main = True
+        if not self.in_main or tag in _VOID_TAGS:
+            return
+        skipping = tag in _SKIP_TAGS or "hidden" in attrs
+        self.stack.append((tag, attrs.get("id"), skipping))
+        if skipping:
+            self.skip += 1
+        elif tag in ("h1", "h2", "h3") and not self.skip:
+            self.in_head = tag
+            if tag != "h1":
+                anchor = attrs.get("id") or next((i for _, i, _ in reversed(self.stack[:-1]) if i), "")
+                self.sections.append([anchor, "", []])
+
+    def handle_endtag(self, tag):
+        if tag == "main":
+            self.in_main = False
+        if not any(t == tag for t, _, _ in self.stack):
+            return
+        while self.stack:
+            t, _, skipping = self.stack.pop()
+            self.skip -= skipping
+            if t == tag:
+                break
+        if tag == self.in_head:
+            self.in_head = None
+
+    def handle_data(self, data):
+        if not self.in_main or self.skip:
+            return
+        if self.in_head == "h1":
+            self.h1 += data
+        elif self.in_head:
+            self.sections[-1][1] += data
+        else:
+            self.sections[-1][2].append(data)
+
+
+def _norm(text):
+    """表示・索引用の正規化: NFKC・空白を1つに（大文字小文字は索引時にだけ揃える）"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def bigrams(text):
+    """文字（字・数字）の連なりごとの2文字組（小文字化）。句読点・空白はまたがない。search.js の bigrams と同じ"""
+    out, run = [], []
+    for ch in text.lower() + " ":
+        if ch.isalnum():
+            run.append(ch)
+            continue
+        out += [run[i] + run[i + 1] for i in range(len(run) - 1)]
+        run = []
+    return out
+
+
+def search_shard(bigram):
+    return (ord(bigram[0]) * 31 + ord(bigram[1])) % SEARCH_SHARDS
+
+
+@functools.lru_cache(maxsize=64)
+def page_docs(out, html):
+    """ページ1枚分の文書。差分ビルドでは変わらなかったページの分をキャッシュから返す"""
+    parser = _Sections()
+    parser.feed(html)
+    page = _norm(parser.h1) or out
+    docs = []
+    for anchor, head, body in parser.sections:
+        text = _norm(" ".join(body))
+        if len(text) < 20:
+            continue
+        head = _norm(head)
+        docs.append({"t": page + (" › " + head if head else ""),
+                     "u": out + ("#" + anchor if anchor else ""), "x": text})
+    return docs
+
+
+def question_bank_docs(bank):
+    return [{
+        "t": f"フカボリ › {b['title']}（{b['subtitle']}）",
+        "u": f"fukabori.html#fk-{b['id']}",
+        "x": _norm(" ".join([b["dod"]] + [f"{f['label']}: {f.get('example', '')}" for f in b["fields"]])),
+    } for b in bank["blocks"]]
+
+
+def build_search_index(docs):
+    """文書 → {アセット名: 中身}（search-docs.js と search-<分片>.js）"""
+    shards = [{} for _ in range(SEARCH_SHARDS)]
+    lengths = []
+    for d, doc in enumerate(docs):
+        counts = {}
+        for bg in bigrams(doc["t"]):
+            counts[bg] = counts.get(bg, 0) + 3  # 見出しに出る語は本文の3倍に数える
+        body = bigrams(doc["x"])
+        for bg in body:
+            counts[bg] = counts.get(bg, 0) + 1
+        lengths.append(len(body))
+        for bg, n in counts.items():
+            shards[search_shard(bg)].setdefault(bg, []).append((d, n))
+    sources = {"search-docs.js": data_module("search_docs", {
+        "n": len(docs), "avglen": round(sum(lengths) / max(1, len(lengths)), 1),
+        "docs": [{**doc, "x": doc["x"][:SEARCH_SNIPPET_CHARS], "len": n} for doc, n in zip(docs, lengths)],
+    })}
+    for i, shard in enumerate(shards):
+        packed = {}
+        for bg, posting in sorted(shard.items()):
+            flat, prev = [], 0
+            for d, n in posting:
+                flat += [d - prev, n]
+                prev = d
+            packed[bg] = flat
+        sources[f"search-{i}.js"] = data_module(f"search_{i}", packed)
+    return sources
+
+
+# ---------- オフライン（service worker） ----------
+# 書き終えたdistのうち、ここに当たるファイルを事前キャッシュする。中身のハッシュが変わったものだけ
+# 利用者のブラウザで取り直される。sitemap・ics・事前圧縮版・OGP画像など、ページ表示に要らないものは入れない
+PRECACHE = ["*.html", "favicon.ico", "static/style.css", "static/logo.png", "static/favicon.png",
+            "static/japan-blocks.svg", f"{ASSET_DIR}/*.js"]
+
+
+def build_service_worker(lastmod):
+    """dist/sw.js の中身: 事前キャッシュ一覧（パス → 中身のハッシュ）+ site/sw.js。
+    ページのハッシュは lastmod.json のもの（ビルド日時を除いた中身）: 日時しか違わないページは取り直させない"""
+    files = sorted({f for pat in PRECACHE for f in DIST.glob(pat) if f.is_file()})
+    manifest = {}
+    for f in files:
+        rel = f.relative_to(DIST).as_posix()
+        manifest[rel] = (lastmod[rel]["sha256"] if rel in lastmod
+                         else hashlib.sha256(f.read_bytes()).hexdigest())[:10]
+    return ("var PRECACHE = " + json.dumps(manifest, indent=1) + ";\n"
+            + (SITE / "sw.js").read_text(encoding="utf-8"))
+
+
+# ---------- 更新日の台帳（lastmod.json） ----------
+# 出力ごとの中身のハッシュと、その中身になった日。sitemap の lastmod・dist/changes.json（ミラー向けの
+# 変更一覧）・sw.js の事前キャッシュ・開発サーバーのETagがこれを使う。ハッシュはフッターのビルド日時を
+# 除いて取るので、日時しか違わない再ビルドでは lastmod が動かない（クローラーに全ページを取り直させない）。
+# Render は毎回まっさらな状態からビルドするため、元になる台帳（LASTMOD_FILE）はリポジトリに置いてコミットする。
+# ただし書き換えるのは --update-lastmod を付けた全体ビルド（公開作業）だけ。ふだんのビルド・テスト・
+# プレビューは作業用の台帳（LASTMOD_CACHE。.gitignore）に書くので、作業ツリーに差分を残さない。
+# 作業用の台帳は元の台帳のハッシュを持ち、元の台帳が更新されたら（pull など）捨てて元から数え直す。
+# CIはなく Render は素のビルドを走らせるだけなので、元の台帳の更新忘れは全体ビルドのたびに警告する
+# （--check-lastmod なら止める）。放っておくと公開のたびに、食い違う出力の lastmod がその日に進む
+LASTMOD_FILE = SITE / "lastmod.json"
+LASTMOD_CACHE = SITE / ".lastmod-cache.json"
+
+
+def _ledger_digest():
+    return hashlib.sha256(LASTMOD_FILE.read_bytes()).hexdigest()[:16] if LASTMOD_FILE.exists() else ""
+
+
+def load_lastmod():
+    """いまの台帳: 作業用があってその元が今の元の台帳ならそれ、なければ元の台帳"""
+    if LASTMOD_CACHE.exists():
+        cache = json.loads(LASTMOD_CACHE.read_text(encoding="utf-8"))
+        if cache.get("base") == _ledger_digest():
+            return cache["files"]
+    return json.loads(LASTMOD_FILE.read_text(encoding="utf-8")) if LASTMOD_FILE.exists() else {}
+
+
+def content_digest(data, built_at):
+    raw = data.replace(built_at, "").encode("utf-8") if isinstance(data, str) else data
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def tracked(out):
+    """台帳に載せる出力（指紋付きファイルと事前圧縮版は名前が中身を表すので載せない）"""
+    return not out.startswith(ASSET_DIR + "/") and not out.endswith(".gz")
+
+
+def update_lastmod(manifest, digests, today):
+    """中身が変わった出力だけ lastmod を today にした新しい台帳と、変わった出力名"""
+    changed = sorted(out for out, h in digests.items() if manifest.get(out, {}).get("sha256") != h)
+    return {**manifest, **{out: {"sha256": digests[out], "lastmod": today} for out in changed}}, changed
+
+
+def ledger_drift(manifest):
+    """元の台帳（LASTMOD_FILE）とハッシュが食い違う出力名（全体ビルドの台帳と比べる）"""
+    seed = json.loads(LASTMOD_FILE.read_text(encoding="utf-8")) if LASTMOD_FILE.exists() else {}
+    return sorted(out for out in manifest.keys() | seed.keys()
+                  if manifest.get(out, {}).get("sha256") != seed.get(out, {}).get("sha256"))
+
+
+def write_lastmod(manifest, commit=False):
+    """commit なら元の台帳へ1出力1行で（キー順固定。コミットの差分で、どのページの中身が変わったかが読める）。
+    どちらでも作業用の台帳は書き直す"""
+    if commit:
+        lines = [f'  "{out}": {json.dumps(manifest[out], sort_keys=True)}' for out in sorted(manifest)]
+        LASTMOD_FILE.write_text("{\n" + ",\n".join(lines) + "\n}\n", encoding="utf-8")
+        print(f"→ {LASTMOD_FILE.relative_to(ROOT)}（{len(manifest)}件）")
+    LASTMOD_CACHE.write_text(json.dumps({"base": _ledger_digest(), "files": manifest}), encoding="utf-8")
+
+
+# 差分ビルド用: 出力ごとに読むデータファイル。ヘッダーの締切チップ・適合チェック・逆算プランは
+# 全ページ共通のglobalsから出るので、その元データは COMMON_DATA として全ページの依存に数える
+# （seasons.yaml は回の呼び名がヘッダーの締切チップに出るので共通）。
+# events.yaml は今の回の日程（seasons.yaml の current の events）を指す名前として書く
+COMMON_DATA = {"atotsugi_benefit_map.yaml", "koshien_entry.yaml", "jigyo_shokei_ma.yaml", "seasons.yaml"}
+PAGE_DATA = {
+    "index.html": {"events.yaml", "regions.yaml"},
+    "workspace.html": {"fukabori.yaml"},
+    "fukabori.html": {"fukabori.yaml"},
+    # 最終確認日は site_sources.yaml の files の出典から出す（COMMON_DATA 以外の分）
+    "trust.html": {"site_updates.yaml", "site_sources.yaml", "ambassadors.yaml", "events.yaml", "news.yaml"},
+    "ambassadors.html": {"ambassadors.yaml", "regions.yaml"},
+    "policy.html": {"policy_lineage.yaml"},
+    "news.html": {"events.yaml", "news.yaml"},
+    "search.html": {"question_bank.yaml"},
+}
+
+
+# テンプレートのコンパイル結果の置き場所（どちらも .gitignore）。
+# JINJA_CACHE: バイトコードのキャッシュ。テンプレートごとに中身のハッシュで引くので、変わったものだけ作り直す
+# JINJA_COMPILED: --compile-templates で書き出すPythonモジュール。全部のテンプレートの中身が
+#   書き出したときと同じなら、全体ビルドはソースを読まずにこれを読み込む（違えばソースから。警告を出す）
+JINJA_CACHE = SITE / ".jinja-cache"
+JINJA_COMPILED = SITE / ".jinja-compiled"
+ENV_OPTIONS = dict(autoescape=select_autoescape(["html"]), trim_blocks=True, lstrip_blocks=True)
+FILTERS = {"jdate": jdate}
+
+
+def templates_digest():
+    """全テンプレートの中身とjinjaの版のハッシュ（書き出したモジュールが今のテンプレートと同じかの判定用）"""
+    h = hashlib.sha256(jinja2.__version__.encode())
+    for f in sorted((SITE / "templates").rglob("*.html")):
+        h.update(f.relative_to(SITE / "templates").as_posix().encode() + b"\0" + f.read_bytes() + b"\0")
+    return h.hexdigest()
+
+
+def compile_templates():
+    """全テンプレートをPythonモジュールに書き出す（ModuleLoader 用）"""
+    env = Environment(loader=FileSystemLoader(SITE / "templates"), **ENV_OPTIONS)
+    env.filters.update(FILTERS)
+    if JINJA_COMPILED.exists():
+        for f in JINJA_COMPILED.iterdir():
+            f.unlink()
+    env.compile_templates(str(JINJA_COMPILED), zip=None, ignore_errors=False)
+    (JINJA_COMPILED / "manifest.json").write_text(json.dumps({"templates": templates_digest()}))
+    print(f"compiled templates → {JINJA_COMPILED}")
+
+
+@functools.lru_cache(maxsize=2)
+def make_env(compiled=False):
+    """テンプレート環境は1つを使い回す（変更されたテンプレートだけjinjaが再コンパイルする）。
+    compiled: 書き出し済みのモジュールが今のテンプレートと同じならそれを使う（全体ビルド用。
+    ModuleLoader はソースを持たないので、依存をたどる監視モードでは使わない）"""
+    manifest = JINJA_COMPILED / "manifest.json"
+    if compiled and manifest.exists():
+        if json.loads(manifest.read_text())["templates"] == templates_digest():
+            env = Environment(loader=ModuleLoader(str(JINJA_COMPILED)), **ENV_OPTIONS)
+            env.filters.update(FILTERS)
+            return env
+        print("warning: compiled templates are stale; compiling from source (rerun with --compile-templates)")
+    JINJA_CACHE.mkdir(exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(SITE / "templates"),
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE)),
+        **ENV_OPTIONS,
+    )
+    env.filters.update(FILTERS)
+    return env
+
+
+def template_closure(env, name, seen=None):
+    """テンプレートが extends/include する先を再帰でたどった集合（自分を含む）"""
+    seen = set() if seen is None else seen
+    if name in seen:
+        return seen
+    seen.add(name)
+    src = env.loader.get_source(env, name)[0]
+    for ref in meta.find_referenced_templates(env.parse(src)):
+        if ref:
+            template_closure(env, ref, seen)
+    return seen
+
+
+def affected_outputs(env, pages, changed):
+    """変更ファイル（絶対パス）から作り直すべき出力名を求める。Noneなら全部"""
+    if changed is None:
+        return None
+    out = set()
+    current = current_season()
+    for path in changed:
+        rel = path.relative_to(ROOT).as_posix()
+        if rel.startswith("data/"):
+            name = path.name
+            out |= {s["ics"] for s in seasons() if name in (s["events"], "seasons.yaml")}
+            if name == current["events"]:
+                name = "events.yaml"  # PAGE_DATA では今の回の日程をこの名前で書く
+            out |= {o for o in pages if name in COMMON_DATA or name in PAGE_DATA.get(o, ())}
+            if name == "regions.yaml":
+                out.add("static/japan-blocks.svg")
+        elif rel.startswith("site/templates/"):
+            out |= {o for o, (tpl, _) in pages.items() if path.name in template_closure(env, tpl)}
+        elif rel.startswith("site/js/"):
+            # 指紋が変わるので、そのスクリプトを読み込むページを作り直す
+            ref = f"asset('{path.name}')"
+            out |= {o for o, (tpl, _) in pages.items()
+                    if any(ref in env.loader.get_source(env, t)[0] for t in template_closure(env, tpl))}
+        elif rel.startswith("site/static/"):
+            out.add("static/" + path.name)
+            if path.name == "japan-map.svg":
+                out |= {"static/japan-blocks.svg", "ambassadors.html"}
+            if path.name == "favicon.png":
+                out.add("favicon.ico")
+    # 検索の索引は全ページの中身から作るので、どれかのページが変われば検索ページごと作り直す
+    if out & set(pages):
+        out.add("search.html")
+    return out
+
+
+def main(changed=None, update_ledger=False, check_ledger=False):
+    """ビルドして、書き出した出力名のリストを返す。
+    changed: 変更されたファイルの絶対パス（監視モード用）。指定時はそれに依存する出力だけ作り直す
+    update_ledger: 全体ビルドのとき、更新日の台帳（lastmod.json）も書き直す（--update-lastmod）
+    check_ledger: 全体ビルドで台帳がコミットされたものと食い違ったら止める（--check-lastmod）"""
     benefit = load("atotsugi_benefit_map.yaml")
-    lineage = load("policy_lineage.yaml")
     entry_def = load("koshien_entry.yaml")
     amb = load("ambassadors.yaml")
     fukabori = load("fukabori.yaml")
-    ev_data = load("events.yaml")
+    season = current_season()
+    ev_data = load(season["events"])
     news_data = load("news.yaml")
 
-    env = Environment(
-        loader=FileSystemLoader(SITE / "templates"),
-        autoescape=select_autoescape(["html"]),
-        trim_blocks=True, lstrip_blocks=True,
-    )
+    env = make_env(compiled=changed is None)
     env.globals.update({
         "site_url": SITE_URL,
         "preview": PREVIEW,
         "built_at": dt.datetime.now(dt.timezone(dt.timedelta(hours=9))).strftime("%Y-%m-%d %H:%M JST"),
         "site_name": "シンセイダー",
+        "season": season,  # 今の回（呼び名・.ics の出力名）
     })
 
     DIST.mkdir(parents=True, exist_ok=True)
-    (DIST / "static").mkdir(exist_ok=True)
-    # CSS/JSコピー
-    for f in (SITE / "static").glob("*"):
-        (DIST / "static" / f.name).write_bytes(f.read_bytes())
-    build_japan_blocks_svg()
+    (DIST / ASSET_DIR).mkdir(parents=True, exist_ok=True)
 
-    track = next(t for t in subsidy["tracks"] if t["id"] == "succession_promotion")
-    entry_end = benefit["event"]["schedule"]["entry_period"]["end"]  # ISO文字列
-    docs_end = benefit["event"]["schedule"]["document_deadline"]["value"]  # 書類提出締切（ISO文字列）
+    # 締切・逆算プラン・補助金・優遇段階は型付きモデルで（形の検査は読み込み時に1回。MCPサーバーと共有）
+    m = model.build(load("jigyo_shokei_ma.yaml"), benefit, entry_def)
+    subsidy = m.subsidy.raw
+    track = m.subsidy.tracks["succession_promotion"].raw
+    entry_end = m.schedule.entry_end_iso  # ISO文字列
+    docs_end = m.schedule.docs_end_iso    # 書類提出締切（ISO文字列）
 
     # 補助金ページの一覧: 制度（subsidy_directory）×優遇段階（benefit_ladderが正）を結合
-    def perks_for(sid):
-        return [
-            {"stage": step["label"], "effect": u["effect"]}
-            for step in benefit["benefit_ladder"]
-            for u in step.get("unlocks", [])
-            if u.get("subsidy_id") == sid
-        ]
-    subsidy_rows = [{**e, "perks": perks_for(e["id"])} for e in benefit["subsidy_directory"]]
-    assert all(r["perks"] for r in subsidy_rows), "directoryの制度がladderに見当たらない"
+    subsidy_rows = [{**e.raw, "perks": [{"stage": u.stage, "effect": u.effect} for u in e.perks]}
+                    for e in m.directory]
+    # 政策の系譜（id の解決と上流・下流の閉包。MCPサーバーの trace_policy と同じグラフ）
+    graph = lineage.build(load("policy_lineage.yaml"), {e.id for e in m.directory})
     env.globals["entry_deadline"] = entry_end  # ヘッダーの締切チップ用（全ページ）
     env.globals["docs_deadline"] = docs_end    # 書類提出締切（チップ・カウントダウンの第二段階表示用）
 
     # インタビュー指示文: テーマ×要素（旧システム53項目の蒸留）をデータから組み立てる
-    theme_lines = [
-        f"{i}. {s['title']} — " + "／".join(s["elements"])
-        for i, s in enumerate(entry_def["entry_sections"], 1)
-    ]
-    prompt_text = entry_def["prompt_template"].replace("{theme_elements}", "\n".join(theme_lines))
-    # プリフィルURLが長すぎるとAI側で受け取れない・途中で切れる。上限8000字を超えたらビルドを止める
-    for t in entry_def["ai_targets"]:
-        if t.get("mode") == "prefill":
-            _u = t["url"].replace("{prompt}", urllib.parse.quote(prompt_text))
-            assert len(_u) <= 8000, f"プリフィルURLが上限超過({len(_u)}字): {t['id']}。prompt_templateを圧縮すること"
-
-    # フカボリ: 章単位のインタビュー指示文。器の定義はgroupsから生成（単一ソース）。
-    # 1章=1会話に区切ることで指示文を短くし、URL渡し（押したら入っている）を成立させる
+    prompt_text = prompts.text(prompts.entry_prompt(entry_def))
+
+    # フカボリ: 章単位のインタビュー指示文。1章=1会話に区切ることで指示文を短くし、
+    # URL渡し（押したら入っている）を成立させる
     fk_chapters = [
-        {
-            "title": g["title"],
-            "prompt": fukabori["chapter_prompt"]
-            .replace("{chapter_no}", str(gi + 1))
-            .replace("{chapter_title}", g["title"])
-            .replace("{structure}", "\n".join(
-                f"- {b['key']}「{b['title']}」:" + "/".join(
-                    f"{f['key']}={f['label']}" + ("" if f.get("required") else "*")
-                    for f in b["fields"])
-                for b in g["blocks"])),
-        }
+        {"title": g["title"], "prompt": prompts.text(prompts.fukabori_chapter(fukabori, gi + 1))}
         for gi, g in enumerate(fukabori["groups"])
     ]
-    for _ch in fk_chapters:
-        _u = "https://claude.ai/new?q=" + urllib.parse.quote(_ch["prompt"])
-        assert len(_u) <= 8000, f"フカボリ章プロンプトが上限超過({len(_u)}字): {_ch['title']}"
+
+    # プロンプトの大きさ: プリフィルURLが長すぎるとAI側で受け取れない・途中で切れる。
+    # サイトとMCPの全プロンプトを測り、予算（prompt_budget.yaml）を超えたらビルドを止める
+    prefill = [t["url"] for t in entry_def["ai_targets"] if t.get("mode") == "prefill"]
+    prompt_rows = measure_prompts({
+        "site:entry": prompts.entry_prompt(entry_def),
+        "site:review": prompts.review_prompt(entry_def),
+        **{f"site:fukabori:{gi + 1}": prompts.fukabori_chapter(fukabori, gi + 1)
+           for gi in range(len(fukabori["groups"]))},
+        "site:fukabori_critique": [("fukabori.yaml:companion_prompt", fukabori["companion_prompt"])],
+        **prompts.mcp_prompts(entry_def, load("question_bank.yaml"), fukabori),
+    }, {"site:entry": prefill, **{f"site:fukabori:{gi + 1}": prefill for gi in range(len(fukabori["groups"]))}})
+    check_prompt_budgets(prompt_rows)
+    write_prompt_report(prompt_rows)
 
     # 「間に合うか」メッセージと逆算プラン（データ駆動）
-    pace = entry_def["pace"]
-    env.globals["pace_json"] = json.dumps({
+    pace = m.pace
+    pace_data = {
         "entry_deadline": entry_end,
         "docs_deadline": docs_end,
-        "submit_target": pace["submit_target"],
-        "buckets": sorted(pace["buckets"], key=lambda b: -b["min_days"]),
-        "closed_message": pace["closed_message"],
-        "closed_message_docs": pace["closed_message_docs"],
-    }, ensure_ascii=False).replace("<", "\\u003c")
+        "submit_target": pace.submit_target,
+        "buckets": [{"min_days": b.min_days, "message": b.message} for b in pace.buckets],
+        "closed_message": pace.closed_message,
+        "closed_message_docs": pace.closed_message_docs,
+    }
 
-    # 適合チェック用データ（YAML→JSON埋め込み。ロジックのフロント直書きをしない）
+    # 適合チェック用データ（YAML→データスクリプト。ロジックのフロント直書きをしない）
     check_data = {
-        "birth_cutoff": "1987-04-01",
+        "birth_cutoff": str(season["birth_cutoff"]),  # 年齢要件は回ごと（seasons.yaml。MCPの一括判定も同じ値）
         "entry_deadline": entry_end,
-        "pace_buckets": sorted(pace["check_buckets"], key=lambda b: -b["min_days"]),
+        "pace_buckets": [{"min_days": b.min_days, "message": b.message} for b in pace.check_buckets],
         "docs_deadline": docs_end,
-        "closed_message": pace["closed_message"],
-        "closed_message_docs": pace["closed_message_docs"],
-        "requirements": [
-            {"id": r["id"], "label": r["label"], "severity": r["severity"]}
-            for r in subsidy["requirements"]["items"]
-        ],
+        "closed_message": pace.closed_message,
+        "closed_message_docs": pace.closed_message_docs,
+        "requirements": [{"id": r.id, "label": r.label, "severity": r.severity} for r in m.subsidy.requirements],
     }
-    # JSONをscriptタグへ安全に埋め込む: autoescapeを外す代わりに < をエスケープ
-    env.globals["check_json"] = json.dumps(check_data, ensure_ascii=False).replace("<", "\\u003c")
+
+    # 「動き」ページの月グリッドは1か月1ファイル（中身が変わった月だけ指紋が変わる）
+    ev_ctx = events_ctx(ev_data, news_data)
+    assets = fingerprint({
+        **{f.name: f.read_text(encoding="utf-8") for f in sorted((SITE / "js").glob("*.js"))},
+        **{f"cal-{mo['ym']}.js": data_module("cal_" + mo["ym"].replace("-", "_"),
+                                             env.get_template("_calmonth.html").render(mo=mo))
+           for mo in ev_ctx["months"]},
+        "pace-data.js": data_module("pace", pace_data),
+        "check-data.js": data_module("check", check_data),
+        "entry-data.js": data_module("entry", {
+            "sections": [{"id": s.id, "title": s.title} for s in m.sections.values()],
+            "validation": entry_def["validation"],
+            "prompt": prompt_text,
+            "review_prompt": entry_def["review_prompt_template"],
+        }),
+        # フカボリの指示文は1章1ファイル。一度に開くのは1章なので、ページは章のボタンに
+        # 触れた（hover/focus）時点で該当章だけ読み込む
+        **{f"fukabori-ch{i + 1}.js": data_module(f"fukabori_{i}", ch) for i, ch in enumerate(fk_chapters)},
+        "fukabori-critique.js": data_module(
+            "fukabori_critique", {"title": "検算・ダメ出し", "prompt": fukabori["companion_prompt"]}),
+    })
+    env.globals["asset"] = lambda name: assets[name][0]
 
     pages = {
         "index.html": ("index.html", {
             "benefit": benefit, "subsidy": subsidy, "track": track,
             "entry_end": entry_end,
-            "hero_blocks": [{"name": n, "color": c, "city": city, "date": d}
-                            for n, c, city, d in BLOCK_META],
+            "hero_blocks": hero_blocks(ev_data),
         }),
         "workspace.html": ("workspace.html", {
             "entry_end": entry_end,
-            "entry_total": len(entry_def["entry_sections"]),
+            "entry_total": len(m.sections),
             "fk_total": sum(len(b["fields"]) for g in fukabori["groups"] for b in g["blocks"]),
         }),
         "schedule.html": ("schedule.html", {}),
         "cool.html": ("cool.html", {}),
         "entry.html": ("entry.html", {
-            "sections": entry_def["entry_sections"],
+            "sections": [s.raw for s in m.sections.values()],
             "checklist": entry_def["checklist"],
             "prompt_text": prompt_text,
             "sample": entry_def["sample_entry"],
@@ -518,79 +1099,156 @@ def main():
                 {**t, "url_filled": t["url"].replace("{prompt}", urllib.parse.quote(prompt_text))}
                 for t in entry_def["ai_targets"]
             ],
-            # プリフィルURLが長すぎるとAI側で受け取れない（8000字を上限とする。超えたらビルドを止める）
-            "entry_json": json.dumps({
-                "sections": [{"id": s["id"], "title": s["title"]} for s in entry_def["entry_sections"]],
-                "validation": entry_def["validation"],
-                "prompt": prompt_text,
-                "review_prompt": entry_def["review_prompt_template"],
-            }, ensure_ascii=False).replace("<", "\\u003c"),
         }),
         "fukabori.html": ("fukabori.html", {
             "groups": fukabori["groups"],
             "ai_targets": entry_def["ai_targets"],
-            "fk_prompts_json": json.dumps(
-                {"chapters": fk_chapters, "critique": fukabori["companion_prompt"]},
-                ensure_ascii=False),
         }),
         "subsidy.html": ("subsidy.html", {"s": subsidy, "track": track,
                                           "subsidy_rows": subsidy_rows,
                                           "benefit_notes": benefit["conditions_and_notes"],
                                           "benefit_src": benefit["provenance"][0]}),
         "check.html": ("check.html", {}),
+        "policy.html": ("policy.html", {"traces": policy_traces(graph, m.directory)}),
         # 信頼面: 内部語彙（confidence値・git生ログ）は出さず、人の言葉の更新履歴のみ
         "trust.html": ("trust.html", {
             "updates": load("site_updates.yaml")["updates"],
-            "datasets": load("site_sources.yaml")["datasets"],
+            "datasets": datasets_ctx(load("site_sources.yaml")["datasets"]),
         }),
         "about.html": ("about.html", {}),
         "ambassadors.html": ("ambassadors.html", ambassadors_ctx(amb)),
-        "news.html": ("news.html", {**events_ctx(ev_data, news_data), "ev_jsonld": events_jsonld(ev_data)}),
+        "news.html": ("news.html", {**ev_ctx, "ev_jsonld": events_jsonld(ev_data, season)}),
+        # 索引が他のページの最終形から決まるので、描画は最後（下の render）
+        "search.html": ("search.html", {"search_shards": SEARCH_SHARDS}),
     }
-    # 古いビルドの残骸を掃除（定義にないHTMLをdistに残さない）
-    for stale in DIST.glob("*.html"):
-        if stale.name not in pages:
-            stale.unlink()
-            print("removed stale", stale.name)
+    targets = affected_outputs(env, pages, changed)
 
-    (DIST / "koshien7.ics").write_text(build_ics(ev_data), encoding="utf-8")
+    def wanted(out):
+        return targets is None or out in targets
 
-    for out, (tpl, ctx) in pages.items():
+    # 出力はいったん {dist内の相対パス: 文字列またはバイト列} に集め、変換を通してから1回ずつ書く
+    outputs = {}
+    # 静的ファイル（CSS・画像）のコピーと、そこから派生するもの
+    for f in (SITE / "static").glob("*"):
+        if wanted("static/" + f.name):
+            outputs["static/" + f.name] = f.read_bytes()
+    if wanted("static/japan-blocks.svg"):
+        outputs["static/japan-blocks.svg"] = build_japan_blocks_svg()
+    if wanted("favicon.ico"):
+        outputs["favicon.ico"] = (SITE / "static" / "favicon.png").read_bytes()
+    def emit_assets(items):
+        # 指紋付きファイルは名前が同じなら中身も同じ: まだ無いものだけ書く。
+        # 事前圧縮版（.gz）も並べておく（配信側が gzip_static 等でそのまま返せる。mtime=0で毎回同じバイト列）
+        for path, text in items:
+            if not (DIST / path).exists():
+                outputs[path] = text
+            if not (DIST / (path + ".gz")).exists():
+                outputs[path + ".gz"] = gzip.compress(text.encode("utf-8"), compresslevel=9, mtime=0)
+
+    def render(out):
+        tpl, ctx = pages[out]
         ctx.setdefault("page", out.rsplit(".", 1)[0])  # ナビの現在地表示用
-        (DIST / out).write_text(env.get_template(tpl).render(**ctx), encoding="utf-8")
-        print("built", out)
-
-    # 検索エンジン向け: sitemap / robots / favicon（旧Reactサイトの索引残像を早く置き換えるため）
-    _today = dt.date.today().isoformat()
-    _urls = [SITE_URL + "/"] + [SITE_URL + "/" + out for out in pages if out != "index.html"]
-    (DIST / "sitemap.xml").write_text(
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        + "".join(f"  <url><loc>{u}</loc><lastmod>{_today}</lastmod></url>\n" for u in _urls)
-        + "</urlset>\n", encoding="utf-8")
-    # 出たくない理由ページ: 本文の問い/答えからFAQ構造化データを自動生成（二重管理を避ける）
-    import re as _re
-    _cool = (DIST / "cool.html").read_text(encoding="utf-8")
-    _qas = _re.findall(r'<div class="objection">\s*<h2>(.*?)</h2>\s*<p>(.*?)</p>', _cool, _re.S)
-    if _qas:
-        _faq = {"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": [
-            {"@type": "Question",
-             "name": _re.sub(r"<[^>]+>", "", q).strip("「」").replace("&amp;", "&"),
-             "acceptedAnswer": {"@type": "Answer",
-                                "text": _re.sub(r"<[^>]+>", "", a).replace("&amp;", "&")}}
-            for q, a in _qas]}
-        _cool = _cool.replace("</head>", '<script type="application/ld+json">'
-                              + json.dumps(_faq, ensure_ascii=False) + "</script>\n</head>")
-        (DIST / "cool.html").write_text(_cool, encoding="utf-8")
-
-    (DIST / "robots.txt").write_text(
-        f"User-agent: *\nAllow: /\nSitemap: {SITE_URL}/sitemap.xml\n", encoding="utf-8")
-    (DIST / "favicon.ico").write_bytes((SITE / "static" / "favicon.png").read_bytes())
-    # MCPセットアップ指示書（正本は mcp/、/mcp-setup.md で配信してAIに取得させる）
-    (DIST / "mcp-setup.md").write_bytes((ROOT / "mcp" / "mcp-setup.md").read_bytes())
+        outputs[out] = env.get_template(tpl).render(**ctx)
+
+    emit_assets(assets.values())
+    outputs.update(build_rounds(wanted))
+
+    for out in pages:
+        if out != "search.html" and wanted(out):
+            render(out)
+
+    if wanted("search.html"):
+        # 索引は他のページの最終形から作る（差分ビルドで作り直さなかったページはdistから読む）
+        docs = [doc for out in pages if out != "search.html"
+                for doc in page_docs(out, outputs[out] if out in outputs
+                                     else (DIST / out).read_text(encoding="utf-8"))]
+        docs += question_bank_docs(load("question_bank.yaml"))
+        index = fingerprint(build_search_index(docs))
+        assets.update(index)
+        emit_assets(index.values())
+        render("search.html")
+
+    # 古いビルドの残骸を掃除（定義にないHTMLをdistに残さない）
+    rounds = {s["ics"] for s in seasons()}
+    for stale in itertools.chain(DIST.glob("*.html"), DIST.glob("*.ics")):
+        if stale.name not in pages and stale.name not in rounds:
+            stale.unlink()
+            print("removed stale", stale.name)
+    # 古い指紋付きファイルの掃除は全体ビルドのときだけ（差分ビルドでは索引を作り直さないことがあり、
+    # その回の assets に載らない索引ファイルを消してしまうため）
+    if targets is None:
+        live = {name for path, _ in assets.values() for name in (path, path + ".gz")}
+        for stale in (DIST / ASSET_DIR).glob("*"):
+            if stale.relative_to(DIST).as_posix() not in live:
+                stale.unlink()
+
+    # 中身の台帳: 変わった出力だけ lastmod を進める（sitemap はそれを元に作るので、ページの後に）
+    built_at = env.globals["built_at"]
+    today = dt.datetime.now(dt.timezone(dt.timedelta(hours=9))).date().isoformat()
+    final = {out: apply_transforms(out, data) if isinstance(data, str) else data for out, data in outputs.items()}
+    old_lastmod = load_lastmod()
+    lastmod, changed_outputs = update_lastmod(
+        old_lastmod, {out: content_digest(d, built_at) for out, d in final.items() if tracked(out)}, today)
+    if targets is None:
+        # 検索エンジン向け: sitemap / robots（旧Reactサイトの索引残像を早く置き換えるため）。
+        # lastmod は中身が変わった日なので、変わっていないページはクローラーに取り直されない
+        _urls = [(SITE_URL + "/", "index.html")] + [(SITE_URL + "/" + out, out) for out in pages if out != "index.html"]
+        final["sitemap.xml"] = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            + "".join(f"  <url><loc>{u}</loc><lastmod>{lastmod[out]['lastmod']}</lastmod></url>\n" for u, out in _urls)
+            + "</urlset>\n")
+        final["robots.txt"] = f"User-agent: *\nAllow: /\nSitemap: {SITE_URL}/sitemap.xml\n"
+        # MCPセットアップ指示書（正本は mcp/、/mcp-setup.md で配信してAIに取得させる）
+        final["mcp-setup.md"] = (ROOT / "mcp" / "mcp-setup.md").read_bytes()
+        lastmod, more = update_lastmod(lastmod, {out: content_digest(final[out], built_at)
+                                                 for out in ("sitemap.xml", "robots.txt", "mcp-setup.md")}, today)
+        changed_outputs += more
+
+    for out, data in final.items():
+        if isinstance(data, str):
+            (DIST / out).write_text(data, encoding="utf-8")
+        else:
+            (DIST / out).write_bytes(data)
+        if out in pages:
+            print("built", out)
+
+    written = list(final)
+
+    # 事前キャッシュ一覧はディスク上の最終形から取る（差分ビルドで書かなかったファイルも含めるため）
+    sw = build_service_worker(lastmod)
+    if not (DIST / "sw.js").exists() or (DIST / "sw.js").read_text(encoding="utf-8") != sw:
+        (DIST / "sw.js").write_text(sw, encoding="utf-8")
+        written.append("sw.js")
+    lastmod, more = update_lastmod(lastmod, {"sw.js": content_digest(sw, built_at)}, today)
+    changed_outputs += more
+
+    if lastmod != old_lastmod or (update_ledger and targets is None):
+        write_lastmod(lastmod, commit=update_ledger and targets is None)
+    if targets is None and not update_ledger:
+        drift = ledger_drift(lastmod)
+        if drift:
+            msg = (f"{LASTMOD_FILE.relative_to(ROOT)} がこのビルドと{len(drift)}件食い違う: {', '.join(drift)}\n"
+                   "  このまま公開すると、これらの lastmod が公開のたびにその日に進む。\n"
+                   "  python3 site/build.py --update-lastmod を走らせて lastmod.json をコミットすること")
+            if check_ledger:
+                raise SystemExit(msg)
+            print("=" * 72 + "\nwarning: " + msg + "\n" + "=" * 72, file=sys.stderr)
+    if targets is None:
+        # ミラー・下流の取得元向けの変更一覧: 全出力の中身のハッシュと lastmod、今回のビルドで変わったもの
+        (DIST / "changes.json").write_text(json.dumps({
+            "site": SITE_URL,
+            "built_at": built_at,
+            "changed": changed_outputs,
+            "files": {out: {"url": f"{SITE_URL}/{out}", **lastmod[out]} for out in sorted(lastmod)
+                      if (DIST / out).exists()},
+        }, ensure_ascii=False, indent=1), encoding="utf-8")
 
     print(f"→ {DIST}")
+    return written
 
 
 if __name__ == "__main__":
-    main()
+    if "--compile-templates" in sys.argv[1:]:
+        compile_templates()
+    main(update_ledger="--update-lastmod" in sys.argv[1:], check_ledger="--check-lastmod" in sys.argv[1:])
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).cal_2026_08 = "\u003ctable class=\"calgrid\" data-ym=\"2026-08\" data-title=\"2026年8月\" hidden>\n  \u003cthead>\u003ctr>\u003cth>日\u003c/th>\u003cth>月\u003c/th>\u003cth>火\u003c/th>\u003cth>水\u003c/th>\u003cth>木\u003c/th>\u003cth>金\u003c/th>\u003cth>土\u003c/th>\u003c/tr>\u003c/thead>\n  \u003ctbody>\n    \u003ctr>\n      \u003ctd class=\"out\" data-iso=\"2026-07-26\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-07-27\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-07-28\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-07-29\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-07-30\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-07-31\">\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-01\">\n        \u003cspan class=\"cal-num\">1\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-08-02\">\n        \u003cspan class=\"cal-num\">2\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-03\">\n        \u003cspan class=\"cal-num\">3\u003c/span>\n        \u003cspan class=\"cal-ev k-milestone\" title=\"第7回エントリー受付開始\">受付開始\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-04\">\n        \u003cspan class=\"cal-num\">4\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-05\">\n        \u003cspan class=\"cal-num\">5\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-06\">\n        \u003cspan class=\"cal-num\">6\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-07\">\n        \u003cspan class=\"cal-num\">7\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-08\">\n        \u003cspan class=\"cal-num\">8\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-08-09\">\n        \u003cspan class=\"cal-num\">9\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-10\">\n        \u003cspan class=\"cal-num\">10\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-11\">\n        \u003cspan class=\"cal-num\">11\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-12\">\n        \u003cspan class=\"cal-num\">12\u003c/span>\n        \u003cspan class=\"cal-ev k-briefing\" title=\"第1回オンライン説明会（14:00〜16:00）\">説明会\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-13\">\n        \u003cspan class=\"cal-num\">13\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-14\">\n        \u003cspan class=\"cal-num\">14\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-15\">\n        \u003cspan class=\"cal-num\">15\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-08-16\">\n        \u003cspan class=\"cal-num\">16\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-17\">\n        \u003cspan class=\"cal-num\">17\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-18\">\n        \u003cspan class=\"cal-num\">18\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-19\">\n        \u003cspan class=\"cal-num\">19\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-20\">\n        \u003cspan class=\"cal-num\">20\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-21\">\n        \u003cspan class=\"cal-num\">21\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-22\">\n        \u003cspan class=\"cal-num\">22\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-08-23\">\n        \u003cspan class=\"cal-num\">23\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-24\">\n        \u003cspan class=\"cal-num\">24\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-25\">\n        \u003cspan class=\"cal-num\">25\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-26\">\n        \u003cspan class=\"cal-num\">26\u003c/span>\n        \u003cspan class=\"cal-ev k-deadline\" title=\"サマーキャンプ申込締切\">キャンプ締切\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-27\">\n        \u003cspan class=\"cal-num\">27\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-28\">\n        \u003cspan class=\"cal-num\">28\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-29\">\n        \u003cspan class=\"cal-num\">29\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-08-30\">\n        \u003cspan class=\"cal-num\">30\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-08-31\">\n        \u003cspan class=\"cal-num\">31\u003c/span>\n        \u003cspan class=\"cal-ev k-camp\" title=\"アトツギサマーキャンプ2026（DAY1 13:00〜20:00／DAY2 10:00〜16:30）\">キャンプ\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-09-01\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-09-02\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-09-03\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-09-04\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-09-05\">\n      \u003c/td>\n    \u003c/tr>\n  \u003c/tbody>\n\u003c/table>";
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).cal_2026_11 = "\u003ctable class=\"calgrid\" data-ym=\"2026-11\" data-title=\"2026年11月\" hidden>\n  \u003cthead>\u003ctr>\u003cth>日\u003c/th>\u003cth>月\u003c/th>\u003cth>火\u003c/th>\u003cth>水\u003c/th>\u003cth>木\u003c/th>\u003cth>金\u003c/th>\u003cth>土\u003c/th>\u003c/tr>\u003c/thead>\n  \u003ctbody>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-11-01\">\n        \u003cspan class=\"cal-num\">1\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-02\">\n        \u003cspan class=\"cal-num\">2\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-03\">\n        \u003cspan class=\"cal-num\">3\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-04\">\n        \u003cspan class=\"cal-num\">4\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-05\">\n        \u003cspan class=\"cal-num\">5\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-06\">\n        \u003cspan class=\"cal-num\">6\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-07\">\n        \u003cspan class=\"cal-num\">7\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-11-08\">\n        \u003cspan class=\"cal-num\">8\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-09\">\n        \u003cspan class=\"cal-num\">9\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-10\">\n        \u003cspan class=\"cal-num\">10\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-11\">\n        \u003cspan class=\"cal-num\">11\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-12\">\n        \u003cspan class=\"cal-num\">12\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-13\">\n        \u003cspan class=\"cal-num\">13\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-14\">\n        \u003cspan class=\"cal-num\">14\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-11-15\">\n        \u003cspan class=\"cal-num\">15\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-16\">\n        \u003cspan class=\"cal-num\">16\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-17\">\n        \u003cspan class=\"cal-num\">17\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-18\">\n        \u003cspan class=\"cal-num\">18\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-19\">\n        \u003cspan class=\"cal-num\">19\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-20\">\n        \u003cspan class=\"cal-num\">20\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-21\">\n        \u003cspan class=\"cal-num\">21\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-11-22\">\n        \u003cspan class=\"cal-num\">22\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-23\">\n        \u003cspan class=\"cal-num\">23\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-24\">\n        \u003cspan class=\"cal-num\">24\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-25\">\n        \u003cspan class=\"cal-num\">25\u003c/span>\n        \u003cspan class=\"cal-ev k-deadline\" title=\"エントリー締切（18:00）\">エントリー締切\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-26\">\n        \u003cspan class=\"cal-num\">26\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-27\">\n        \u003cspan class=\"cal-num\">27\u003c/span>\n        \u003cspan class=\"cal-ev k-deadline\" title=\"応募書類の提出締切（PDF）（12:00）\">書類締切\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-28\">\n        \u003cspan class=\"cal-num\">28\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-11-29\">\n        \u003cspan class=\"cal-num\">29\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-11-30\">\n        \u003cspan class=\"cal-num\">30\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-01\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-02\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-03\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-04\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-05\">\n      \u003c/td>\n    \u003c/tr>\n  \u003c/tbody>\n\u003c/table>";
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).cal_2026_12 = "\u003ctable class=\"calgrid\" data-ym=\"2026-12\" data-title=\"2026年12月\" hidden>\n  \u003cthead>\u003ctr>\u003cth>日\u003c/th>\u003cth>月\u003c/th>\u003cth>火\u003c/th>\u003cth>水\u003c/th>\u003cth>木\u003c/th>\u003cth>金\u003c/th>\u003cth>土\u003c/th>\u003c/tr>\u003c/thead>\n  \u003ctbody>\n    \u003ctr>\n      \u003ctd class=\"out\" data-iso=\"2026-11-29\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-11-30\">\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-01\">\n        \u003cspan class=\"cal-num\">1\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-02\">\n        \u003cspan class=\"cal-num\">2\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-03\">\n        \u003cspan class=\"cal-num\">3\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-04\">\n        \u003cspan class=\"cal-num\">4\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-05\">\n        \u003cspan class=\"cal-num\">5\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-12-06\">\n        \u003cspan class=\"cal-num\">6\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-07\">\n        \u003cspan class=\"cal-num\">7\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-08\">\n        \u003cspan class=\"cal-num\">8\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-09\">\n        \u003cspan class=\"cal-num\">9\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-10\">\n        \u003cspan class=\"cal-num\">10\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-11\">\n        \u003cspan class=\"cal-num\">11\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-12\">\n        \u003cspan class=\"cal-num\">12\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-12-13\">\n        \u003cspan class=\"cal-num\">13\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-14\">\n        \u003cspan class=\"cal-num\">14\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-15\">\n        \u003cspan class=\"cal-num\">15\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-16\">\n        \u003cspan class=\"cal-num\">16\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-17\">\n        \u003cspan class=\"cal-num\">17\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-18\">\n        \u003cspan class=\"cal-num\">18\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-19\">\n        \u003cspan class=\"cal-num\">19\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-12-20\">\n        \u003cspan class=\"cal-num\">20\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-21\">\n        \u003cspan class=\"cal-num\">21\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-22\">\n        \u003cspan class=\"cal-num\">22\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-23\">\n        \u003cspan class=\"cal-num\">23\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-24\">\n        \u003cspan class=\"cal-num\">24\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-25\">\n        \u003cspan class=\"cal-num\">25\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-26\">\n        \u003cspan class=\"cal-num\">26\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2026-12-27\">\n        \u003cspan class=\"cal-num\">27\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-28\">\n        \u003cspan class=\"cal-num\">28\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-29\">\n        \u003cspan class=\"cal-num\">29\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-30\">\n        \u003cspan class=\"cal-num\">30\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2026-12-31\">\n        \u003cspan class=\"cal-num\">31\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-01-01\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-01-02\">\n      \u003c/td>\n    \u003c/tr>\n  \u003c/tbody>\n\u003c/table>";
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).cal_2027_01 = "\u003ctable class=\"calgrid\" data-ym=\"2027-01\" data-title=\"2027年1月\" hidden>\n  \u003cthead>\u003ctr>\u003cth>日\u003c/th>\u003cth>月\u003c/th>\u003cth>火\u003c/th>\u003cth>水\u003c/th>\u003cth>木\u003c/th>\u003cth>金\u003c/th>\u003cth>土\u003c/th>\u003c/tr>\u003c/thead>\n  \u003ctbody>\n    \u003ctr>\n      \u003ctd class=\"out\" data-iso=\"2026-12-27\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-28\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-29\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-30\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2026-12-31\">\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-01\">\n        \u003cspan class=\"cal-num\">1\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-02\">\n        \u003cspan class=\"cal-num\">2\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-01-03\">\n        \u003cspan class=\"cal-num\">3\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-04\">\n        \u003cspan class=\"cal-num\">4\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-05\">\n        \u003cspan class=\"cal-num\">5\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-06\">\n        \u003cspan class=\"cal-num\">6\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-07\">\n        \u003cspan class=\"cal-num\">7\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-08\">\n        \u003cspan class=\"cal-num\">8\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-09\">\n        \u003cspan class=\"cal-num\">9\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-01-10\">\n        \u003cspan class=\"cal-num\">10\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-11\">\n        \u003cspan class=\"cal-num\">11\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-12\">\n        \u003cspan class=\"cal-num\">12\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-13\">\n        \u003cspan class=\"cal-num\">13\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-14\">\n        \u003cspan class=\"cal-num\">14\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-15\">\n        \u003cspan class=\"cal-num\">15\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-16\">\n        \u003cspan class=\"cal-num\">16\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-01-17\">\n        \u003cspan class=\"cal-num\">17\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-18\">\n        \u003cspan class=\"cal-num\">18\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-19\">\n        \u003cspan class=\"cal-num\">19\u003c/span>\n        \u003cspan class=\"cal-ev k-taikai\" title=\"地方大会 北海道・東北ブロック\">仙台\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-20\">\n        \u003cspan class=\"cal-num\">20\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-21\">\n        \u003cspan class=\"cal-num\">21\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-22\">\n        \u003cspan class=\"cal-num\">22\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-23\">\n        \u003cspan class=\"cal-num\">23\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-01-24\">\n        \u003cspan class=\"cal-num\">24\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-25\">\n        \u003cspan class=\"cal-num\">25\u003c/span>\n        \u003cspan class=\"cal-ev k-taikai\" title=\"地方大会 関東ブロック\">東京\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-26\">\n        \u003cspan class=\"cal-num\">26\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-27\">\n        \u003cspan class=\"cal-num\">27\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-28\">\n        \u003cspan class=\"cal-num\">28\u003c/span>\n        \u003cspan class=\"cal-ev k-taikai\" title=\"地方大会 中部ブロック\">名古屋\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-29\">\n        \u003cspan class=\"cal-num\">29\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-01-30\">\n        \u003cspan class=\"cal-num\">30\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-01-31\">\n        \u003cspan class=\"cal-num\">31\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-02-01\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-02-02\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-02-03\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-02-04\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-02-05\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-02-06\">\n      \u003c/td>\n    \u003c/tr>\n  \u003c/tbody>\n\u003c/table>";
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).cal_2027_02 = "\u003ctable class=\"calgrid\" data-ym=\"2027-02\" data-title=\"2027年2月\" hidden>\n  \u003cthead>\u003ctr>\u003cth>日\u003c/th>\u003cth>月\u003c/th>\u003cth>火\u003c/th>\u003cth>水\u003c/th>\u003cth>木\u003c/th>\u003cth>金\u003c/th>\u003cth>土\u003c/th>\u003c/tr>\u003c/thead>\n  \u003ctbody>\n    \u003ctr>\n      \u003ctd class=\"out\" data-iso=\"2027-01-31\">\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-01\">\n        \u003cspan class=\"cal-num\">1\u003c/span>\n        \u003cspan class=\"cal-ev k-taikai\" title=\"地方大会 近畿ブロック\">大阪\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-02\">\n        \u003cspan class=\"cal-num\">2\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-03\">\n        \u003cspan class=\"cal-num\">3\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-04\">\n        \u003cspan class=\"cal-num\">4\u003c/span>\n        \u003cspan class=\"cal-ev k-taikai\" title=\"地方大会 中国・四国ブロック\">高松\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-05\">\n        \u003cspan class=\"cal-num\">5\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-06\">\n        \u003cspan class=\"cal-num\">6\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-02-07\">\n        \u003cspan class=\"cal-num\">7\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-08\">\n        \u003cspan class=\"cal-num\">8\u003c/span>\n        \u003cspan class=\"cal-ev k-taikai\" title=\"地方大会 九州・沖縄ブロック\">熊本\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-09\">\n        \u003cspan class=\"cal-num\">9\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-10\">\n        \u003cspan class=\"cal-num\">10\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-11\">\n        \u003cspan class=\"cal-num\">11\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-12\">\n        \u003cspan class=\"cal-num\">12\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-13\">\n        \u003cspan class=\"cal-num\">13\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-02-14\">\n        \u003cspan class=\"cal-num\">14\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-15\">\n        \u003cspan class=\"cal-num\">15\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-16\">\n        \u003cspan class=\"cal-num\">16\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-17\">\n        \u003cspan class=\"cal-num\">17\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-18\">\n        \u003cspan class=\"cal-num\">18\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-19\">\n        \u003cspan class=\"cal-num\">19\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-20\">\n        \u003cspan class=\"cal-num\">20\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-02-21\">\n        \u003cspan class=\"cal-num\">21\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-22\">\n        \u003cspan class=\"cal-num\">22\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-23\">\n        \u003cspan class=\"cal-num\">23\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-24\">\n        \u003cspan class=\"cal-num\">24\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-25\">\n        \u003cspan class=\"cal-num\">25\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-26\">\n        \u003cspan class=\"cal-num\">26\u003c/span>\n        \u003cspan class=\"cal-ev k-final\" title=\"決勝大会\">決勝\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"\" data-iso=\"2027-02-27\">\n        \u003cspan class=\"cal-num\">27\u003c/span>\n      \u003c/td>\n    \u003c/tr>\n    \u003ctr>\n      \u003ctd class=\"\" data-iso=\"2027-02-28\">\n        \u003cspan class=\"cal-num\">28\u003c/span>\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-03-01\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-03-02\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-03-03\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-03-04\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-03-05\">\n      \u003c/td>\n      \u003ctd class=\"out\" data-iso=\"2027-03-06\">\n      \u003c/td>\n    \u003c/tr>\n  \u003c/tbody>\n\u003c/table>";
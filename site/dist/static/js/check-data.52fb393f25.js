@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).check = {"birth_cutoff": "1987-04-01", "entry_deadline": "2026-11-25T18:00+09:00", "pace_buckets": [{"min_days": 21, "message": "まだかなり猶予があります。"}, {"min_days": 8, "message": "まだ十分間に合います。"}, {"min_days": 0, "message": "まだ間に合います。"}], "docs_deadline": "2026-11-27T12:00+09:00", "closed_message": "第7回の受付は終了しました。次の機会に向けた情報も引き続き掲載します。", "closed_message_docs": "第7回のエントリー受付は終了しました。エントリー済みの方は、応募書類の提出を11/27 12:00までに。", "requirements": [{"id": "req_gbizid", "label": "gBizIDプライムの取得（jGrants申請の前提）", "severity": "block"}, {"id": "req_support_org", "label": "認定経営革新等支援機関の確認書（承継の蓋然性確認）", "severity": "block"}, {"id": "req_3terms_finance", "label": "対象会社の3期分の決算・申告完了（法人）", "severity": "block"}, {"id": "req_sole_proprietor_5y", "label": "個人事業主の場合：開業届・青色申告承認申請書の提出日から5年経過", "severity": "block"}, {"id": "req_succession_5y", "label": "公募申請期日から5年以内の承継完了計画", "severity": "block"}, {"id": "req_successor_experience", "label": "承継予定者の経験要件（役員3年/雇用3年/通算3年/親族で代表未経験）", "severity": "block"}, {"id": "req_quotes", "label": "補助対象経費の見積書（設備等）", "severity": "block"}]};
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).entry = {"sections": [{"id": "genba", "title": "現業と自分"}, {"id": "kadai", "title": "現場で感じている課題"}, {"id": "shinkijigyo", "title": "やりたい新規事業"}, {"id": "keieishigen", "title": "家業の経営資源の活用"}, {"id": "mirai", "title": "実現したい未来"}], "validation": {"min_chars": 80, "want_numbers": true}, "prompt": "あなたはインタビュアーです。私はアトツギ（中小企業の後継予定者）。ピッチ大会「アトツギ甲子園」のエントリー文の材料を、質問して引き出してください。\n\n進め方:\n- 5テーマを順に、質問は一度に1つ、各テーマ3〜4往復。\n- 未回答の要素だけを短く聞く。埋まったものは聞き直さない。\n- 抽象的な答えには、出来事・固有名詞・数字を1つ引き出す追い質問を。\n- 「わからない」には仮の書き方を提案して先へ。尋問にしない。\n- 効果・未来の話は「誰に・どれくらい」を数字で1つ（無ければ仮置き）。\n\nテーマと要素:\n1. 現業と自分 — 会社の事業と主力製品・サービス（一言で）／規模の数字（年商・従業員数・創業年数のいずれか）／自分の立場・担当と関わった年数／承継の予定・時期（未定でも可）\n2. 現場で感じている課題 — 実際にあった出来事（いつ・何が起きたか）／課題の大きさを示す数字（例:求人応募ゼロ、原価率）／顧客が困っている具体的な場面／背景にある業界・地域・社会の変化\n3. やりたい新規事業 — 一言で言うと何か（20字程度）／誰に売るか（既存顧客・新規法人・消費者・海外・地域。具体的に）／何を・どうやって提供するか／どう稼ぐか（売り切り/継続課金/手数料などの形、単価×数量の目安）／検証状況（アイデア/試作/テスト販売/販売中）と顧客の声\n4. 家業の経営資源の活用 — 使う資源はどれか（技術・設備・顧客・信用・人・データ）／その資源が新規事業でどう効くか（ゼロからの起業との違い）／競合や他社との違い／足りないもの（技術・体制・許認可・調達）とその埋め方\n5. 実現したい未来 — なぜ自分がやるのか（きっかけになった経験）／承継で何を守り、何を変えるか／実現したら会社・地域・業界はどう変わるか／最初のマイルストーン（年月と内容）と想定リスクへの構え\n\n終わったら私の言葉を活かして清書。見出しは一字一句:\n## 現業と自分\n## 現場で感じている課題\n## やりたい新規事業\n## 家業の経営資源の活用\n## 実現したい未来\n\n各250〜400字。数字と固有名詞を残し、話していない内容は足さない。誇張しない。では最初の質問から。\n", "review_prompt": "あなたは中小企業の新規事業ピッチ大会の審査委員です。以下は、後継予定者（アトツギ）が書いたエントリー文の骨子です。\nあなたは本人の関係者ではありません。忖度は不要です。励ましだけの感想は書かないでください。\n\n審査の観点（この5つで骨子を見てください）:\n- 承継の物語 — 誰から誰へ、何を引き継ぎ、何を守り、何を変えるのかが書かれているか\n- 実現性 — 体制・経営資源・計画が噛み合っているか。リスクへの構えがあるか\n- 独自性 — 他社との違いと、真似されにくい理由があるか\n- 事業価値 — どう稼ぐかの筋が通っているか。数字に無理がないか\n- 波及 — 顧客や地域の課題とつながっているか。効果が数字で語られているか\n\n次の形式で、具体的に指摘してください。\n1. 伝わってきた強み（2点。本文のどこからそう読めたか、引用付きで）\n2. 伝わらなかった・弱いところ（3点。上の観点のどれが欠けているかを添えて）\n3. いちばん危ういところ（この構想が崩れるとしたら、どこからか。1点）\n4. 直すなら最初の一手（明日できる具体的なことを1つ）\n\n点数は付けないでください。指摘は人格ではなく構想に限ってください。\n\n---\n\n{draft}\n"};
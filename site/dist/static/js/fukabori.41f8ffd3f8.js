@@ -0,0 +1,303 @@
+// フカボリ（fukabori.html）。章の指示文は章ごとのファイル（.fk-step の data-prompt-src）、保存は project.js
+(function(){
+  var project = loadProject();
+  function save(p){ saveProject(p, 'fk-save-msg'); }
+  project.fukabori = project.fukabori || {blocks:{}};
+
+  function fieldValue(bk, fk){ return (project.fukabori.blocks[bk] || {})[fk] || ''; }
+  function setField(bk, fk, v){
+    project.fukabori.blocks[bk] = project.fukabori.blocks[bk] || {};
+    project.fukabori.blocks[bk][fk] = v;
+  }
+
+  var groups = document.querySelectorAll('.fk-group');
+
+  function refresh(){
+    document.querySelectorAll('.fk-block').forEach(function(box){
+      var bk = box.getAttribute('data-block');
+      var total = 0, filled = 0;
+      box.querySelectorAll('.fk-text').forEach(function(ta){
+        var v = fieldValue(bk, ta.getAttribute('data-field'));
+        if (ta.value !== v) ta.value = v;
+        total++; if (v.trim()) filled++;
+      });
+      box.querySelector('.fk-status').textContent = '— ' + (filled ? filled + '/' + total : '未入力');
+    });
+    var chapterFill = [];
+    groups.forEach(function(g, i){
+      var total = 0, filled = 0;
+      g.querySelectorAll('.fk-text').forEach(function(ta){ total++; if (ta.value.trim()) filled++; });
+      g.querySelector('.fk-group-status').textContent = '— ' + filled + '/' + total;
+      chapterFill[i] = {filled: filled, total: total};
+    });
+    // ステップ表示: 進捗と「次はここ」
+    var nextMarked = false;
+    document.querySelectorAll('.fk-step').forEach(function(st){
+      var ch = st.getAttribute('data-chapter');
+      st.classList.remove('next');
+      if (ch === 'critique') {
+        var allDone = chapterFill.every(function(c){ return c.filled > 0; });
+        st.querySelector('.fk-step-status').textContent = allDone ? '— 準備OK' : '— 4章を進めてから';
+        if (!nextMarked && allDone) { st.classList.add('next'); nextMarked = true; }
+        return;
+      }
+      var c = chapterFill[+ch];
+      st.querySelector('.fk-step-status').textContent = c.filled ? '— ' + c.filled + '/' + c.total : '— 未着手';
+      if (!nextMarked && c.filled < c.total) { st.classList.add('next'); nextMarked = true; }
+    });
+  }
+
+  document.querySelectorAll('.fk-text').forEach(function(ta){
+    ta.addEventListener('input', function(){
+      var bk = ta.closest('.fk-block').getAttribute('data-block');
+      setField(bk, ta.getAttribute('data-field'), ta.value);
+      save(project); refresh();
+    });
+  });
+
+  // ---- 下書きの直列化（AIに渡す用。IDはAIだけが使う） ----
+  function draftLines(scope){
+    var md = '';
+    scope.querySelectorAll('.fk-block').forEach(function(box){
+      var lines = '';
+      box.querySelectorAll('.fk-text').forEach(function(ta){
+        var v = ta.value.trim();
+        if (!v) return;
+        var label = ta.previousElementSibling.textContent.replace('（任意）','').trim();
+        lines += '- ' + label + '（' + ta.getAttribute('data-field') + '）: ' + v.replace(/\n/g, ' ／ ') + '\n';
+      });
+      if (lines) md += '\n## ' + box.querySelector('h3').firstChild.textContent.trim() + '（ID: ' + box.getAttribute('data-block') + '）\n' + lines;
+    });
+    return md;
+  }
+  function fullDraft(){
+    var full = '';
+    document.querySelectorAll('.fk-block').forEach(function(box){
+      full += '\n## ' + box.querySelector('h3').firstChild.textContent.trim() + '（ID: ' + box.getAttribute('data-block') + '）\n';
+      box.querySelectorAll('.fk-text').forEach(function(ta){
+        var label = ta.previousElementSibling.textContent.replace('（任意）','').trim();
+        var v = ta.value.trim();
+        full += '- ' + label + '（' + ta.getAttribute('data-field') + '）: ' + (v ? v.replace(/\n/g, ' ／ ') : '（未入力）') + '\n';
+      });
+    });
+    return full;
+  }
+
+  // ---- 章の指示文は必要になってから読む ----
+  // 章のボタンに触れた（hover/focus/タップ開始）時点で読み込みを始め、押すときには手元にある状態にする。
+  // window.openはクリック処理の同期部分でしか呼べないので、押した瞬間に読み込み待ちはできない
+  function stepOf(ch){ return document.querySelector('.fk-step[data-chapter="' + ch + '"]'); }
+  function loadedPrompt(ch){ return (window.SHINSEIDER_DATA || {})['fukabori_' + ch] || null; }
+  function loadPrompt(ch){
+    if (loadedPrompt(ch)) return Promise.resolve(loadedPrompt(ch));
+    return loadDataScript(stepOf(ch).getAttribute('data-prompt-src')).then(function(){ return loadedPrompt(ch); });
+  }
+  document.querySelectorAll('.fk-step').forEach(function(st){
+    var warm = function(){ loadPrompt(st.getAttribute('data-chapter')).catch(function(){}); };
+    ['pointerenter', 'focusin', 'touchstart'].forEach(function(ev){
+      st.addEventListener(ev, warm, {passive: true});
+    });
+  });
+  // 読み込み済みの章の指示文（未読み込みならnull）
+  function promptFor(ch){
+    var p = loadedPrompt(ch);
+    if (!p) return null;
+    if (ch === 'critique') return p.prompt + '\n# ユーザー下書き（24ブロック）\n' + fullDraft();
+    var d = draftLines(groups[+ch]);
+    return p.prompt + (d ? '\n# この章の現在の下書き\n' + d : '');
+  }
+
+  // ---- AIの選択（記憶する） ----
+  var picks = document.querySelectorAll('.fk-ai-pick');
+  function selectedAi(){
+    var name = project.fukabori.ai || picks[0].getAttribute('data-name');
+    var el = null;
+    picks.forEach(function(b){
+      var on = b.getAttribute('data-name') === name;
+      b.classList.toggle('on', on);
+      if (on) el = b;
+    });
+    return el || picks[0];
+  }
+  picks.forEach(function(b){
+    b.addEventListener('click', function(){
+      project.fukabori.ai = b.getAttribute('data-name');
+      save(project); selectedAi();
+      document.querySelector('.fk-msg').textContent = b.getAttribute('data-name') + 'を使います。章のボタンを押してください。';
+    });
+  });
+
+  // ---- 章を始める ----
+  var msg = document.querySelector('.fk-msg');
+  document.querySelectorAll('.fk-step-start').forEach(function(btn){
+    btn.addEventListener('click', function(){
+      var ch = btn.closest('.fk-step').getAttribute('data-chapter');
+      var ai = selectedAi();
+      var prompt = promptFor(ch);
+      if (!prompt) {
+        // 触れずにいきなり押された（回線が遅い等）: 読み込んでから押し直してもらう
+        msg.textContent = '指示文を読み込んでいます…';
+        loadPrompt(ch).then(function(){
+          msg.textContent = '準備ができました。もう一度「' + btn.textContent.trim() + '」を押してください。';
+        }).catch(function(){
+          msg.textContent = '指示文を読み込めませんでした。通信を確認して、もう一度押してください。';
+        });
+        return;
+      }
+      var qbase = ai.getAttribute('data-qbase');
+      var url = qbase ? qbase + encodeURIComponent(prompt) : null;
+      // コピーはwindow.openより先に開始する（開いた後だとフォーカスが移って失敗する）
+      var copied = navigator.clipboard.writeText(prompt);
+      if (url && url.length <= 8000) {
+        window.open(url, '_blank', 'noopener');
+        copied.catch(function(){});
+        msg.textContent = ai.getAttribute('data-name') + 'が指示文入りで開きます。そのまま送信してください。';
+        return;
+      }
+      // 長文はURLに載らない: 指示文をmdファイルにして渡す（クリップボードにも保険で入れておく）
+      copied.catch(function(){});
+      var fname = 'fukabori_' + (ch === 'critique' ? 'kensan' : 'dai' + (+ch + 1) + 'sho') + '_' + fileStamp() + '.md';
+      var file = new File([prompt], fname, {type: 'text/markdown'});
+      // スマホ等は共有シートからAIアプリへファイルごと渡せる
+      if (navigator.canShare && navigator.canShare({files: [file]})) {
+        navigator.share({files: [file], title: 'フカボリ指示文'}).then(function(){
+          msg.textContent = '共有先でAIのアプリを選ぶと、指示文ファイルごと渡せます。';
+        }).catch(function(){
+          msg.textContent = '共有を中止しました。もう一度押すか、「指示文を見る」からコピーしてください。';
+        });
+        return;
+      }
+      downloadText(fname, prompt, 'text/markdown');
+      var helper = '※案内: 指示文ファイル「' + fname + '」がいまダウンロードされました。この案内文を消して、ファイルを添付（この画面にドラッグ、またはクリップのボタン）して送信してください。コピーもされているので、貼り付け（Cmd+V）でも構いません。もしこの案内文のまま送信された場合は「指示文ファイルを添付するか、コピーされている指示文を貼り付けてください」とだけ返答してください。';
+      window.open(qbase ? qbase + encodeURIComponent(helper) : ai.getAttribute('data-home'), '_blank', 'noopener');
+      copied.then(function(){
+        msg.textContent = '指示文ファイル（' + fname + '）を保存し、コピーもしました。開いた' + ai.getAttribute('data-name') + 'にファイルをドラッグするか、貼り付けて送信してください。';
+      }).catch(function(){
+        msg.textContent = '指示文ファイル（' + fname + '）を保存しました。開いた' + ai.getAttribute('data-name') + 'にドラッグして送信してください。';
+      });
+    });
+  });
+
+  // ---- 指示文を見る・コピー ----
+  var pv = document.getElementById('fk-prompt-pre');
+  var pvBox = document.getElementById('fk-prompt-details');
+  document.querySelectorAll('.fk-step-view').forEach(function(btn){
+    btn.addEventListener('click', function(){
+      var ch = btn.closest('.fk-step').getAttribute('data-chapter');
+      loadPrompt(ch).then(function(){
+        pv.textContent = promptFor(ch);
+        pvBox.open = true;
+        pvBox.scrollIntoView({behavior:'smooth', block:'nearest'});
+      }).catch(function(){
+        msg.textContent = '指示文を読み込めませんでした。通信を確認して、もう一度押してください。';
+      });
+    });
+  });
+  document.getElementById('fk-copy-prompt').addEventListener('click', function(){
+    if (!pv.textContent) { msg.textContent = '先に「指示文を見る」を押してください。'; return; }
+    navigator.clipboard.writeText(pv.textContent).then(function(){
+      msg.textContent = '指示文をコピーしました。AIに貼り付けてください。';
+    }).catch(function(){
+      msg.textContent = 'コピーできませんでした。';
+    });
+  });
+
+  // ---- コード抽出: ```json / ```なし / 前後に文章付き のどれでも拾う ----
+  function extractJson(raw){
+    var m = raw.match(/```(?:json)?\s*([\s\S]*?)```/i);
+    var cand = (m ? m[1] : raw).trim();
+    try { return JSON.parse(cand); } catch(_) {}
+    var s = cand.indexOf('{');
+    if (s < 0) throw new Error('no json');
+    var depth = 0;
+    for (var i = s; i < cand.length; i++) {
+      if (cand[i] === '{') depth++;
+      else if (cand[i] === '}') { depth--; if (depth === 0) return JSON.parse(cand.slice(s, i + 1)); }
+    }
+    throw new Error('unbalanced');
+  }
+
+  // ---- 取り込み（章のコードも検算のコードもここ。貼り付け・ファイル選択・ドロップの3経路） ----
+  var patchBox = document.getElementById('fk-patch');
+  function applyPatchText(raw){
+    var pmsg = document.getElementById('fk-patch-msg');
+    var box = patchBox;
+    var obj;
+    try { obj = extractJson(raw); }
+    catch(_) { pmsg.textContent = 'コードとして読めませんでした。AIの回答のうち、コードのかたまりを含む部分をそのまま貼ってください。'; return; }
+    if (!obj.blocks && (obj.entry || obj.fukabori)) { pmsg.textContent = 'これは控えファイルです。ページ下の「控えを読み込む」から選んでください。'; return; }
+    var blocks = obj.blocks || obj;
+    var applied = 0;
+    Object.keys(blocks).forEach(function(bk){
+      var blockEl = document.querySelector('.fk-block[data-block="' + bk + '"]');
+      if (!blockEl || typeof blocks[bk] !== 'object') return;
+      Object.keys(blocks[bk]).forEach(function(fk){
+        var v = blocks[bk][fk];
+        if (typeof v !== 'string' || !v.trim()) return;
+        if (!blockEl.querySelector('.fk-text[data-field="' + fk + '"]')) return;
+        var cur = fieldValue(bk, fk);
+        setField(bk, fk, cur.trim() ? cur + '\n\n[AI補強] ' + v : v);
+        applied++;
+      });
+    });
+    save(project); refresh();
+    pmsg.textContent = applied ? applied + '件を取り込みました。次の章に進めます。' : '取り込める内容が見つかりませんでした。';
+    if (applied) box.value = '';
+  }
+  document.getElementById('fk-apply').addEventListener('click', function(){ applyPatchText(patchBox.value); });
+  ['dragover', 'dragenter'].forEach(function(ev){
+    patchBox.addEventListener(ev, function(e){ e.preventDefault(); });
+  });
+  patchBox.addEventListener('drop', function(e){
+    e.preventDefault();
+    var f = e.dataTransfer.files && e.dataTransfer.files[0];
+    if (!f) return;
+    f.text().then(function(t){ patchBox.value = t; applyPatchText(t); });
+  });
+  document.getElementById('fk-patch-file').addEventListener('change', function(e){
+    var f = e.target.files[0];
+    if (!f) return;
+    f.text().then(function(t){ patchBox.value = t; applyPatchText(t); });
+    e.target.value = '';
+  });
+
+  // ---- 保存と持ち出し（控え = 読める下書き + 末尾にセーブデータ） ----
+  document.getElementById('fk-dl-md').addEventListener('click', function(){
+    var md = '# フカボリ 控え\n' + fullDraft() + '\n---\n' + hikaeSaveData(project);
+    downloadText('fukabori_hikae_' + fileStamp() + '.md', md, 'text/markdown');
+  });
+  document.getElementById('fk-dl-prompts').addEventListener('click', function(){
+    var steps = Array.prototype.map.call(document.querySelectorAll('.fk-step'), function(st){
+      return st.getAttribute('data-chapter');
+    });
+    Promise.all(steps.map(loadPrompt)).then(function(){ downloadPromptSet(steps); }).catch(function(){
+      msg.textContent = '指示文を読み込めませんでした。通信を確認して、もう一度押してください。';
+    });
+  });
+  function downloadPromptSet(steps){
+    var md = '# フカボリ 指示文セット\n\nシンセイダーのフカボリ（https://shinseider.onrender.com/fukabori.html）で使う、章別インタビューと検算の指示文一式です。\n1章ずつAIに渡して使います。章が終わるとAIがコード（セーブデータ）を出すので、フカボリのページで取り込んでください。\n';
+    steps.filter(function(ch){ return ch !== 'critique'; }).forEach(function(ch){
+      var p = loadedPrompt(ch);
+      md += '\n---\n\n# 第' + (+ch + 1) + '章 ' + p.title + '\n\n' + p.prompt + '\n';
+    });
+    md += '\n---\n\n# 仕上げ（検算・ダメ出し）\n\n' + loadedPrompt('critique').prompt + '\n\n※この指示文のあとに「# ユーザー下書き（24ブロック）」として、フカボリの「控えを保存」の中身（セーブデータの前まで）を貼って使います。\n';
+    downloadText('fukabori_prompts_' + fileStamp() + '.md', md, 'text/markdown');
+  }
+  document.getElementById('fk-up-json').addEventListener('change', function(e){
+    var f = e.target.files[0];
+    if (!f) return;
+    var r = new FileReader();
+    r.onload = function(){
+      var d = null;
+      try { d = extractJson(String(r.result)); } catch(_) {}
+      var msgEl = document.getElementById('fk-save-msg');
+      if (!restoreHikae(project, d)) { msgEl.textContent = '読み込めませんでした。「控えを保存」で作ったファイルを選んでください。'; return; }
+      save(project); refresh();
+      msgEl.textContent = '控えを読み込みました。';
+    };
+    r.readAsText(f);
+  });
+
+  selectedAi();
+  refresh();
+})();
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).pace = {"entry_deadline": "2026-11-25T18:00+09:00", "docs_deadline": "2026-11-27T12:00+09:00", "submit_target": "2026-11-24", "buckets": [{"min_days": 90, "message": "まだ十分間に合います。時間のある今なら、構想の言語化から磨き上げまで、じっくり進められます。"}, {"min_days": 45, "message": "間に合います。今月中にエントリー文の骨子まで進めておくと、後半に余裕ができます。"}, {"min_days": 21, "message": "まだ間に合います。エントリー文はAIとのインタビューで1〜2日あれば形になります。今週始めれば余裕があります。"}, {"min_days": 7, "message": "今からでも間に合います。今日インタビューを始めれば、数日で骨子→読み合わせ→送信までいけます。"}, {"min_days": 1, "message": "ぎりぎりですが、間に合います。今日中に骨子を作り、明日読み合わせて送信する日程です。"}, {"min_days": 0, "message": "本日が締切です。18:00までに公式サイトから送信を。"}], "closed_message": "第7回の受付は終了しました。次の機会に向けた情報も引き続き掲載します。", "closed_message_docs": "第7回のエントリー受付は終了しました。エントリー済みの方は、応募書類の提出を11/27 12:00までに。"};
@@ -0,0 +1,46 @@
+// 申請書の準備・フカボリ・適合チェック・進み具合で共有する部品: このブラウザ内の保存（localStorage）と、控えファイルの入出力
+var PROJECT_KEY = 'shinseider_project';
+var CHECK_KEY = 'shinseider_check';
+
+function loadProject(){
+  try { return JSON.parse(localStorage.getItem(PROJECT_KEY) || 'null') || {version:1, entry:{sections:{}, checklist:{}}}; }
+  catch(_) { return {version:1, entry:{sections:{}, checklist:{}}}; }
+}
+// 適合チェックの前回の回答（checkform.js が保存する。なければnull）
+function loadCheck(){
+  try { return JSON.parse(localStorage.getItem(CHECK_KEY) || 'null'); } catch(_) { return null; }
+}
+function saveProject(p, msgId){
+  p.updated = new Date().toISOString();
+  try { localStorage.setItem(PROJECT_KEY, JSON.stringify(p)); } catch(_) {}
+  var el = document.getElementById(msgId);
+  if (el) el.textContent = '自動保存済み（このブラウザのみ・' + new Date().toLocaleTimeString('ja-JP') + '）';
+}
+
+function downloadText(name, text, type){
+  var a = document.createElement('a');
+  a.href = URL.createObjectURL(new Blob([text], {type: type || 'text/plain'}));
+  a.download = name; a.click();
+  setTimeout(function(){ URL.revokeObjectURL(a.href); }, 5000);
+}
+// ダウンロードフォルダで見分けられるよう、ファイル名に日時（例: 260816_0932）を入れる
+function fileStamp(){
+  var d = new Date();
+  function p(n){ return (n < 10 ? '0' : '') + n; }
+  return String(d.getFullYear()).slice(2) + p(d.getMonth() + 1) + p(d.getDate()) + '_' + p(d.getHours()) + p(d.getMinutes());
+}
+
+// 控え = 読める下書き + 末尾にセーブデータ（1ファイルで転記元と再開の両方を担う）。これは末尾の部分
+function hikaeSaveData(project){
+  var check = loadCheck();
+  return '\n## セーブデータ\n「控えを読み込む」でこのファイルを選ぶと、この時点から再開できます。下のコードは編集しないでください。\n\n```json\n' +
+    JSON.stringify({version: 1, exported: new Date().toISOString(), profile: check, entry: project.entry, fukabori: project.fukabori || null}) + '\n```\n';
+}
+// 読み込んだセーブデータをprojectに戻す（適合チェックの回答も復元）。控えでなければfalse
+function restoreHikae(project, d){
+  if (!d || (!d.entry && !d.fukabori)) return false;
+  if (d.entry) project.entry = d.entry;
+  if (d.fukabori) project.fukabori = d.fukabori;
+  if (d.profile) { try { localStorage.setItem(CHECK_KEY, JSON.stringify(d.profile)); } catch(_) {} }
+  return true;
+}
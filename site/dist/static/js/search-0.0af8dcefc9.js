@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_0 = {"00": [0, 1, 1, 2, 2, 5, 1, 2, 3, 7, 3, 3, 1, 2, 1, 2, 1, 2, 1, 2, 9, 3, 1, 2, 11, 3, 10, 1, 1, 2, 1, 1, 4, 1, 10, 3, 2, 2, 2, 5, 5, 16, 6, 7, 35, 2, 2, 1, 4, 1, 1, 2, 1, 1, 4, 1, 10, 3, 2, 5, 2, 6], "0締": [113, 1], "11": [0, 1, 1, 1, 3, 3, 7, 5, 1, 2, 1, 2, 1, 4, 10, 2, 4, 1, 7, 4, 76, 2], "1週": [45, 2, 13, 1, 59, 2, 13, 1], "22": [80, 1], "2時": [23, 1], "4つ": [37, 1], "4億": [28, 1], "4年": [28, 1, 14, 1, 5, 1, 67, 1, 5, 1], "5日": [0, 1, 12, 1, 2, 1, 71, 1, 24, 1], "6ブ": [0, 1], "6件": [63, 1, 72, 1], "7万": [78, 1, 1, 1, 1, 1], "8月": [3, 1, 66, 1, 13, 1, 27, 1], "aa": [44, 1, 72, 1], "aq": [2, 1, 66, 1], "br": [40, 1], "cs": [47, 3, 64, 1, 8, 3], "ee": [113, 1], "ll": [24, 1, 1, 1], "mm": [44, 1, 15, 1, 57, 1, 15, 1], "oo": [88, 2, 2, 1, 19, 1, 2, 2], "pp": [111, 1], "q1": [7, 1, 69, 1], "ss": [80, 1], "s申": [71, 1], "tや": [27, 1, 61, 1], "xと": [56, 1, 72, 1], "いい": [20, 1, 1, 3, 6, 1, 9, 1, 73, 1], "いつ": [27, 2, 15, 2, 41, 2, 31, 1], "い場": [15, 3, 12, 1, 7, 1, 37, 1], "うゆ": [108, 1], "う取": [25, 1], "おり": [3, 1, 24, 1, 8, 1], "かか": [37, 1], "かに": [0, 3, 1, 3, 1, 3, 1, 3, 19, 1], "かる": [37, 1, 2, 1], "か見": [30, 1], "がゼ": [81, 1], "が二": [79, 1], "が公": [68, 1], "が同": [78, 1], "が嫌": [19, 3], "が後": [79, 1, 1, 1], "が本": [35, 1, 50, 1, 1, 1], "が検": [0, 1], "が頼": [42, 1, 72, 1], "きそ": [7, 1, 69, 1], "くた": [18, 1], "くわ": [19, 3], "く問": [19, 1], "く支": [80, 1], "け持": [24, 1], "け渡": [36, 1], "げを": [46, 1, 72, 1], "ここ": [4, 1, 3, 2, 4, 2, 9, 1, 4, 2, 2, 3, 2, 1, 4, 1, 5, 1, 3, 1, 1, 1, 31, 3, 4, 1, 1, 1, 1, 1, 1, 3, 4, 1], "ご兄": [86, 1], "しで": [34, 3], "しょ": [13, 1, 4, 1, 4, 1, 87, 1], "すべ": [42, 2, 29, 1, 43, 1, 1, 1], "ず通": [13, 1], "せる": [13, 1, 12, 1, 11, 1, 7, 1, 13, 1, 10, 2, 49, 1, 13, 1], "ぜ独": [44, 2, 1, 2, 1, 2, 70, 1, 1, 1, 1, 1], "たく": [0, 1, 1, 1, 15, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 5, 1], "たは": [7, 6, 22, 1, 47, 6, 14, 1, 38, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "た実": [45, 1, 72, 1], "た氏": [85, 1, 1, 1], "だ一": [0, 1], "つい": [20, 1, 5, 1, 57, 1, 7, 3, 3, 1], "つつ": [42, 1, 14, 1, 22, 1, 1, 1, 35, 1, 14, 1], "つピ": [1, 1], "てて": [24, 1], "て他": [0, 1], "て外": [71, 1], "て忖": [2, 1], "でし": [17, 1, 62, 1], "でシ": [27, 4], "でデ": [50, 1, 72, 1], "で指": [27, 1], "で文": [66, 1], "で照": [86, 1], "で粗": [48, 2, 72, 2], "で顧": [60, 2, 72, 2], "とえ": [3, 1, 78, 1], "とと": [16, 1, 19, 1, 45, 1], "とエ": [14, 1], "と全": [85, 1, 1, 1], "と合": [7, 1, 69, 1], "と推": [74, 1], "と書": [74, 1], "と相": [14, 1, 32, 1, 20, 1, 52, 1], "なり": [0, 4, 13, 1, 1, 1, 4, 1, 2, 1, 7, 1, 4, 1, 5, 1, 1, 2, 29, 2, 10, 1, 2, 1, 3, 1, 12, 1], "にせ": [19, 1], "にセ": [37, 1], "に事": [24, 1, 45, 1, 17, 1], "に任": [27, 1, 39, 1], "に始": [13, 1], "に戻": [26, 3, 14, 1], "に残": [22, 1], "に活": [81, 3], "に登": [13, 1, 97, 1], "に移": [24, 1, 55, 1, 15, 1], "に見": [13, 1, 14, 1, 52, 1, 2, 1], "のの": [24, 1, 86, 1], "のま": [3, 1, 23, 1, 1, 2, 3, 1, 6, 1, 31, 1], "のノ": [28, 1], "のマ": [49, 1, 31, 1, 41, 1], "の低": [50, 1, 72, 1], "の収": [73, 1], "の回": [40, 1, 51, 1, 4, 1, 7, 1], "の対": [13, 1, 1, 1, 8, 1, 27, 1, 1, 1, 23, 1, 3, 1, 45, 1, 1, 1], "の差": [53, 1, 1, 1, 71, 1, 1, 1], "の明": [73, 2], "の普": [51, 1, 72, 1], "の汎": [53, 1, 72, 1], "の派": [22, 1], "の現": [12, 1, 68, 1, 1, 1], "の目": [28, 1, 45, 1], "の税": [47, 1, 72, 1], "の種": [88, 1], "の過": [93, 1], "は使": [88, 1], "は原": [85, 1], "は真": [0, 1], "ば地": [14, 1], "ば数": [27, 1], "ば最": [20, 1], "へと": [14, 1], "ほか": [68, 1], "まの": [3, 1, 26, 1, 50, 1], "まま": [3, 1, 14, 1, 9, 1, 1, 2, 3, 1, 6, 1, 31, 1], "みた": [13, 1, 22, 1], "も2": [82, 1], "もア": [86, 1], "も参": [51, 1, 72, 1], "も関": [32, 1], "らど": [90, 1], "らス": [42, 1, 72, 1], "ら利": [25, 1, 2, 3], "ら継": [78, 1], "ら義": [47, 1, 72, 1], "りな": [26, 1, 2, 1], "り上": [19, 3, 4, 1], "り出": [13, 1], "り悪": [48, 1, 72, 1], "り株": [105, 1], "り確": [35, 1], "るか": [0, 1, 1, 1, 1, 3, 1, 3, 4, 3, 4, 1, 3, 1, 1, 3, 4, 1, 3, 1, 1, 1, 2, 1, 14, 1, 1, 1, 36, 4, 12, 1], "るに": [68, 1], "るル": [37, 1], "る下": [36, 1, 31, 1], "る事": [16, 1, 56, 1], "る構": [0, 1], "る立": [17, 1], "る見": [68, 1], "れが": [33, 1], "をひ": [35, 1, 44, 1, 2, 1], "をも": [24, 1, 3, 1], "を客": [0, 1], "を探": [1, 1], "を求": [57, 2, 72, 1], "を獲": [44, 1, 72, 1], "を育": [78, 1], "を進": [27, 1, 53, 1], "を関": [28, 1], "ィン": [64, 1, 27, 1, 16, 1, 29, 1], "イヤ": [62, 2, 72, 1], "ウザ": [24, 1, 12, 2, 31, 2, 21, 2], "キネ": [97, 1], "クは": [95, 1], "コン": [4, 1, 3, 1, 17, 1, 3, 1, 9, 1, 1, 1, 10, 1, 20, 2, 6, 1, 3, 1, 4, 1, 8, 1, 3, 1, 17, 1, 11, 1], "シェ": [49, 1, 12, 1, 60, 1, 12, 1], "ショ": [22, 1, 21, 3, 19, 1, 2, 2, 29, 1, 14, 1, 8, 5, 19, 1, 2, 1], "ジと": [27, 1, 58, 1], "ジへ": [2, 1], "ジ案": [1, 3], "ジ記": [113, 1], "ズ把": [73, 1], "タワ": [111, 1], "トと": [2, 1, 58, 1, 6, 1, 7, 1, 12, 1, 25, 1, 22, 1], "トへ": [35, 1, 51, 1], "ト月": [63, 1, 72, 1], "ト編": [45, 1, 72, 1], "ドラ": [34, 1, 17, 2, 1, 2, 1, 2, 1, 2, 1, 2, 41, 1, 27, 1, 1, 1, 1, 1, 1, 1, 1, 1], "ナリ": [2, 3, 7, 1, 5, 2, 9, 1, 45, 4, 1, 1, 3, 3, 18, 1, 3, 1, 2, 1], "ネ設": [47, 2, 72, 2], "プし": [1, 1], "プ受": [43, 1, 72, 1], "ホに": [4, 1, 3, 1, 17, 1, 13, 1, 39, 1], "ャッ": [25, 2, 23, 1, 16, 2, 56, 1, 16, 1], "ュフ": [48, 1, 72, 1], "リリ": [72, 1, 13, 1], "ルか": [40, 1], "ルに": [50, 1, 72, 1], "レー": [24, 1, 13, 1, 70, 1], "ーが": [0, 1, 88, 1, 6, 2], "ーボ": [40, 1, 7, 2, 72, 2], "ー後": [14, 3, 21, 1, 2, 1, 49, 1], "上上": [70, 1], "中国": [100, 3, 7, 3, 4, 1], "予選": [0, 2, 3, 1, 5, 1, 60, 1, 4, 2], "事に": [81, 1], "事例": [43, 2, 72, 2], "五つ": [0, 1], "人喪": [80, 1], "人確": [85, 1, 1, 1], "仕入": [52, 1, 72, 1], "付記": [92, 1], "代3": [114, 1], "以内": [3, 1, 4, 1, 3, 1, 35, 1, 2, 1, 10, 1, 1, 1, 11, 1, 1, 3, 1, 1, 5, 1, 41, 1, 2, 1, 10, 1, 1, 1], "任せ": [24, 1, 3, 1, 39, 1], "会な": [20, 1, 92, 1], "会出": [2, 1, 7, 1, 59, 4, 17, 1, 1, 1, 9, 1], "佐賀": [101, 1], "作が": [57, 1, 72, 1], "使わ": [88, 1], "価1": [60, 1, 72, 1], "価a": [44, 1, 72, 1], "係あ": [7, 1, 69, 1], "備等": [71, 1, 1, 1], "働き": [49, 2, 29, 1, 43, 2], "兆円": [80, 1], "先へ": [27, 1], "入さ": [25, 1], "具で": [0, 1], "典へ": [84, 1], "再製": [57, 1, 3, 1, 69, 1, 3, 1], "処理": [88, 1], "出な": [16, 1], "出会": [89, 1], "出発": [79, 1], "切で": [14, 1], "別法": [7, 1, 69, 1], "制度": [0, 1, 3, 1, 45, 1, 20, 3, 7, 1, 3, 1, 2, 6, 12, 1, 28, 1], "割を": [25, 1], "勘と": [42, 1, 72, 1], "化戦": [80, 1], "北海": [96, 4, 7, 4, 8, 1], "原稿": [36, 1], "合と": [4, 1], "合計": [64, 1, 1, 2, 71, 1, 1, 2], "名前": [0, 1], "向け": [28, 1, 50, 1, 15, 1, 18, 1], "品メ": [57, 1, 72, 1], "品採": [55, 1, 72, 1], "員1": [28, 1], "器部": [42, 1, 2, 1, 70, 1, 2, 1], "回の": [28, 1, 15, 1, 3, 1, 22, 1, 11, 1, 6, 2, 1, 3, 9, 3, 7, 1, 7, 1, 1, 3, 1, 3, 1, 3, 1, 4, 2, 1, 3, 1], "図っ": [56, 1, 72, 1], "固定": [63, 2, 72, 2], "園を": [78, 1], "園ア": [0, 1], "均受": [51, 1, 72, 1], "域は": [33, 1], "報共": [46, 1, 72, 1], "場や": [29, 1], "場歴": [85, 1, 1, 2, 23, 1], "増し": [2, 1], "始か": [74, 1], "字で": [30, 1, 9, 1], "存と": [36, 3, 31, 3], "存在": [52, 1, 1, 1, 71, 1, 1, 1], "実感": [30, 1], "宮城": [96, 1], "宮崎": [101, 1, 7, 1], "密試": [58, 1, 72, 1], "小規": [2, 1, 46, 1, 3, 1, 17, 2, 2, 1, 50, 1, 3, 1], "展さ": [43, 1, 13, 1, 59, 1, 13, 1], "岡山": [100, 1, 7, 1], "帝国": [78, 1, 4, 1], "常単": [45, 1, 72, 1], "常陸": [97, 1], "年4": [0, 1, 7, 1, 69, 1], "府県": [94, 1, 1, 3], "引5": [59, 1, 72, 1], "形も": [78, 1, 1, 1], "待さ": [79, 1], "得し": [91, 1], "得で": [51, 1, 72, 1], "得率": [53, 1, 72, 1], "忖度": [0, 2, 2, 1, 15, 1, 17, 3, 55, 1], "応が": [57, 1, 72, 1], "応完": [47, 1, 72, 1], "性で": [25, 1], "愛媛": [100, 1, 7, 1], "慎吾": [98, 1], "成拠": [49, 1, 72, 1], "手に": [44, 1, 12, 1, 10, 1, 15, 1, 12, 1, 23, 1, 12, 1], "択の": [80, 1, 7, 1], "持ち": [18, 1, 3, 1, 15, 3, 1, 1, 29, 1, 1, 3], "描く": [0, 1], "改革": [49, 1, 33, 1, 39, 1], "放置": [80, 1], "文で": [34, 1, 51, 1, 28, 1], "方改": [49, 1, 72, 1], "族承": [78, 1], "日以": [58, 1, 53, 1, 19, 1], "昇圧": [48, 1, 72, 1], "昇率": [72, 1], "最新": [56, 1, 13, 1, 59, 1], "有効": [25, 3], "望に": [58, 1, 72, 1], "期は": [28, 2], "期感": [7, 1, 69, 1], "未定": [79, 1, 1, 1], "未発": [74, 2], "未確": [80, 1], "末か": [3, 1], "本格": [42, 1, 72, 1], "本県": [101, 1, 7, 1], "査に": [2, 3], "栗林": [97, 1], "格が": [48, 1, 72, 1], "検証": [57, 1, 72, 1], "次a": [63, 1, 72, 1], "次要": [10, 1], "気で": [0, 3, 1, 3, 1, 3, 1, 3], "決定": [54, 1, 28, 1, 44, 1], "注単": [51, 1, 72, 1], "活か": [56, 1, 2, 1, 23, 3, 47, 1, 2, 1], "消え": [36, 1, 30, 1, 1, 1], "済全": [80, 1], "済合": [19, 1], "準化": [42, 1, 10, 1, 1, 1, 3, 1, 3, 1, 55, 1, 10, 1, 1, 1, 3, 1, 3, 1], "画に": [81, 3], "省庁": [80, 1], "短納": [45, 2, 6, 1, 2, 1, 2, 1, 1, 1, 4, 1, 2, 1, 55, 2, 6, 1, 2, 1, 2, 1, 1, 1, 4, 1, 2, 1], "確な": [27, 1, 62, 1], "確定": [68, 1], "社の": [0, 1, 20, 1, 4, 1, 4, 2, 1, 1, 8, 1, 2, 1, 3, 3, 17, 2, 12, 1, 2, 1, 5, 1, 17, 1, 19, 3, 17, 1], "社マ": [97, 1, 2, 1], "社斎": [97, 1], "社森": [107, 1], "祖父": [28, 1], "種類": [88, 1], "算し": [12, 1], "給制": [78, 1, 2, 3], "継す": [20, 1], "羅さ": [20, 1], "義務": [47, 1, 72, 1], "者5": [46, 1, 72, 1], "自な": [44, 2, 1, 2, 1, 2, 70, 1, 1, 1, 1, 1], "藤澤": [101, 2], "表と": [85, 1, 1, 2], "見せ": [13, 1], "見る": [23, 1, 2, 1, 3, 1, 14, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 47, 3], "見立": [7, 2, 8, 1, 61, 1], "視化": [42, 1, 72, 1], "覧で": [68, 1], "解散": [80, 1], "計部": [57, 1, 72, 1], "記と": [35, 1], "設業": [7, 1, 69, 1], "証が": [57, 1, 72, 1], "談し": [14, 1], "談で": [1, 1, 84, 1, 8, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "請に": [14, 1, 55, 1], "象企": [61, 1, 72, 1], "資で": [48, 1, 72, 1], "足元": [39, 1, 2, 1], "送信": [4, 1, 3, 1, 6, 1, 11, 1, 1, 1, 2, 2, 8, 1, 2, 1, 39, 1, 12, 2, 3, 1], "造技": [64, 1, 72, 1], "重ね": [43, 1, 72, 1], "金1": [68, 1], "鐵工": [97, 1], "開始": [50, 1, 24, 3, 39, 1, 9, 1], "関係": [7, 1, 39, 1, 5, 1, 1, 1, 7, 1, 12, 1, 5, 1, 42, 1, 5, 1, 1, 1, 7, 1], "阜県": [98, 1, 7, 1], "除や": [36, 1, 31, 1], "陸風": [97, 1], "際に": [18, 1, 12, 1], "青色": [71, 1], "非対": [58, 2, 72, 1], "響く": [79, 1], "頼が": [42, 1, 72, 1], "類の": [13, 1, 11, 1, 68, 1, 19, 1], "風と": [39, 1], "風月": [97, 1], "馬県": [97, 1, 7, 1], "高付": [48, 2, 72, 2]};
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_1 = {"01": [28, 1, 14, 1, 1, 1, 1, 1, 15, 1, 1, 1, 19, 1, 1, 1, 34, 1, 1, 1, 1, 1, 15, 1, 1, 1], "12": [4, 1, 7, 1, 1, 1, 1, 1, 1, 2, 10, 1, 11, 2, 28, 2, 16, 1, 1, 1, 6, 1, 25, 1, 24, 3], "3d": [50, 1, 5, 4, 67, 1, 5, 4], "3つ": [23, 1, 12, 1], "3億": [7, 1, 69, 1], "3年": [28, 1, 16, 1, 3, 1, 16, 1, 8, 3, 45, 1, 3, 1, 16, 1], "45": [80, 1, 29, 1], "5f": [39, 1, 11, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 68, 3, 1, 3, 1, 3, 1, 3, 1, 3], "5テ": [40, 1], "7へ": [2, 1], "7月": [85, 2, 17, 1, 7, 1], "ab": [40, 1], "ar": [63, 3, 72, 2], "ct": [94, 1], "de": [27, 2, 39, 4, 22, 1], "ef": [94, 1], "fで": [24, 2, 62, 1], "gx": [80, 1], "hi": [2, 1, 38, 1], "iz": [71, 1], "iな": [27, 1], "lm": [24, 1, 1, 1], "mの": [28, 1, 33, 1, 72, 3], "m精": [44, 1, 15, 1, 57, 1, 15, 1], "no": [48, 3, 2, 3, 70, 3, 2, 3], "op": [65, 2, 23, 2, 49, 1], "pa": [94, 1], "q2": [7, 1, 69, 1], "rc": [39, 1, 11, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 68, 3, 1, 3, 1, 3, 1, 3, 1, 3], "rs": [27, 1], "sd": [80, 1], "st": [39, 1, 7, 1, 1, 3, 1, 3, 1, 3, 1, 3, 69, 3, 1, 3, 1, 3, 1, 3], "te": [0, 1, 2, 2, 7, 1, 14, 1, 27, 3, 18, 1, 20, 1, 34, 3], "tu": [94, 1], "vg": [94, 1], "あっ": [30, 1], "いさ": [107, 1], "い脅": [52, 1, 1, 1, 1, 1, 70, 1, 1, 1, 1, 1], "い評": [0, 1, 89, 1], "い違": [84, 1], "うで": [21, 3], "う切": [13, 1], "えす": [43, 1, 72, 1], "えら": [23, 1], "かが": [39, 1, 38, 1], "がそ": [27, 1, 61, 1], "が中": [28, 1, 50, 1], "が伝": [81, 1], "が保": [34, 1], "が好": [19, 1], "が融": [43, 1, 72, 1], "が読": [57, 1, 31, 1, 41, 1], "きの": [26, 1, 10, 1, 1, 1, 42, 1], "きま": [0, 2, 2, 1, 1, 3, 10, 2, 1, 1, 4, 1, 2, 1, 4, 2, 3, 1, 1, 2, 6, 2, 2, 1, 1, 2, 1, 1, 29, 1, 9, 1, 1, 1, 9, 1, 1, 1, 22, 2, 1, 1], "ぎ支": [72, 1, 8, 1], "くだ": [16, 1, 9, 2, 1, 2, 1, 1, 1, 1, 6, 1, 6, 2, 26, 1, 2, 1, 1, 1, 18, 1, 5, 1, 17, 1], "けを": [0, 1], "し書": [18, 1], "すな": [81, 3], "ずに": [19, 1, 5, 1, 18, 1, 72, 1], "その": [0, 4, 1, 3, 1, 3, 1, 5, 4, 1, 7, 3, 1, 1, 2, 1, 3, 1, 4, 1, 2, 1, 1, 3, 7, 1, 2, 1, 1, 1, 28, 1, 2, 1, 1, 2, 2, 1, 6, 2, 1, 1, 2, 2, 1, 2, 1, 1, 7, 1, 22, 1, 1, 1, 26, 1], "た成": [79, 1], "た材": [11, 1, 26, 1], "だa": [88, 1], "だけ": [2, 1, 2, 1, 1, 1, 2, 2, 6, 1, 5, 1, 2, 1, 2, 1, 1, 1, 1, 1, 3, 1, 8, 1, 2, 1, 1, 1, 21, 3, 7, 1, 2, 1, 8, 3, 2, 1, 3, 2, 10, 1, 40, 3], "だ品": [43, 1, 72, 1], "だ話": [7, 1, 69, 1], "ち時": [28, 1], "つづ": [79, 1], "つ以": [35, 1, 93, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "て大": [89, 1], "でエ": [0, 1, 12, 1], "で単": [28, 1], "で掘": [37, 1], "で消": [36, 1, 31, 1], "で済": [1, 1], "で表": [68, 1, 44, 1], "で輸": [48, 1, 72, 1], "で部": [28, 1], "とす": [71, 3], "と効": [56, 1, 72, 1], "と審": [34, 1], "と改": [82, 1], "と方": [0, 1, 26, 1, 1, 1, 59, 1, 3, 3, 1, 3, 1, 3, 1, 3, 5, 1], "と温": [44, 1, 72, 1], "なか": [22, 1, 57, 1], "なほ": [31, 1], "なる": [0, 1, 1, 1, 12, 1, 1, 1, 8, 1, 6, 2, 11, 1, 4, 1, 25, 1, 3, 1, 9, 1, 35, 1], "なニ": [57, 3, 72, 3], "なル": [6, 1], "に作": [11, 1], "に公": [84, 1], "に応": [7, 1, 61, 1], "に本": [0, 3, 1, 3, 1, 3, 1, 3, 39, 1, 72, 1], "に検": [66, 1], "に経": [80, 1], "に行": [35, 1], "に説": [71, 1], "に貼": [25, 1, 2, 1, 11, 1], "ねま": [3, 1], "のく": [25, 1, 13, 3], "のた": [0, 1, 19, 1, 45, 1, 15, 1, 57, 1, 1, 1], "のは": [3, 2, 15, 2, 3, 1, 1, 1, 2, 2, 4, 1, 40, 1, 10, 1, 1, 3], "のみ": [23, 1, 57, 1, 8, 1], "のハ": [46, 1, 72, 1], "の偏": [66, 1], "の副": [46, 1, 72, 1], "の原": [84, 3, 1, 2, 28, 1], "の問": [0, 1, 5, 1, 19, 1], "の実": [30, 1, 30, 3, 13, 1, 59, 4], "の意": [74, 1], "の承": [7, 2, 64, 1, 5, 2], "の描": [0, 1], "の支": [79, 1], "の機": [20, 1], "の良": [0, 2], "の規": [7, 1, 28, 1, 41, 1], "の調": [54, 1, 72, 1], "の透": [52, 1, 72, 1], "は最": [14, 1], "は枠": [94, 1, 18, 1], "は締": [35, 1], "ば1": [3, 1], "へ変": [79, 1], "まく": [21, 1, 6, 1], "また": [7, 6, 59, 1, 10, 6, 14, 1, 38, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "まは": [28, 1], "まわ": [78, 1], "もっ": [26, 1], "も間": [0, 1], "や内": [84, 1], "や担": [29, 1], "らお": [110, 1], "らな": [0, 1, 7, 2, 12, 6, 3, 4, 54, 2, 4, 1], "ら届": [24, 1], "りか": [22, 1], "りに": [0, 2, 17, 3, 10, 1, 11, 1], "りる": [18, 1], "り下": [27, 1], "り事": [19, 1], "り巻": [39, 1], "るが": [37, 1], "るぼ": [72, 1], "る公": [68, 1, 17, 1], "る後": [69, 1], "る県": [94, 1], "る補": [68, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 2, 1], "る証": [72, 2], "を3": [46, 1, 72, 1], "をc": [66, 1], "をこ": [26, 3], "をコ": [25, 1, 2, 1], "を図": [46, 1, 10, 1, 24, 1, 38, 1, 10, 1], "を想": [14, 1], "を揃": [74, 1], "を正": [28, 1], "を考": [17, 1], "を解": [31, 1, 25, 1, 72, 1], "を足": [0, 1], "アッ": [1, 1, 26, 1, 1, 1, 16, 1, 72, 1], "アン": [0, 1, 1, 1, 12, 1, 34, 1, 33, 1, 5, 2, 1, 2, 4, 2, 3, 3, 1, 5, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 4, 1, 6, 1], "ウェ": [95, 1], "カボ": [6, 4, 18, 1, 2, 1, 10, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 47, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "カレ": [110, 1, 1, 12, 1, 3], "カー": [44, 1, 3, 2, 10, 2, 39, 1, 20, 1, 3, 2, 10, 2], "ギ支": [77, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "ゲッ": [57, 1, 16, 1, 56, 3], "コピ": [25, 2, 2, 2, 13, 1], "スナ": [101, 1], "スリ": [72, 1, 13, 1], "ス伊": [103, 1], "ス確": [68, 1], "ズか": [57, 3, 72, 3], "セー": [37, 1, 1, 1], "ゼロ": [28, 1, 4, 1, 12, 1, 37, 1, 35, 1], "タバ": [78, 1, 4, 1], "ダメ": [0, 1, 17, 1, 22, 1], "デジ": [42, 3, 38, 1, 34, 3], "トラ": [47, 2, 72, 2, 15, 1], "ト特": [2, 1], "ナカ": [98, 1], "ニー": [51, 1, 6, 6, 16, 1, 50, 1, 6, 7], "ブデ": [38, 1], "ブ大": [111, 1], "プト": [24, 1, 1, 4, 48, 1], "ペル": [57, 2, 72, 1], "ホー": [100, 1, 7, 1, 4, 3], "マは": [14, 1, 19, 1], "マク": [80, 1], "ム山": [100, 1], "メモ": [91, 1], "ラ株": [105, 1], "ルー": [6, 1, 18, 1, 2, 1, 11, 1, 2, 1, 2, 1, 1, 3, 72, 3], "ル完": [49, 1, 72, 1], "ンや": [4, 1, 3, 1, 17, 1, 13, 1, 30, 1, 9, 1, 12, 1, 3, 1], "ーネ": [96, 1], "ーポ": [107, 1], "ー前": [93, 1], "ー名": [86, 1], "一次": [84, 1], "上に": [25, 1], "下が": [78, 1], "与支": [70, 1, 8, 1], "中対": [80, 1], "主催": [0, 1, 19, 1, 24, 1, 72, 1], "九州": [101, 3, 7, 3, 3, 1], "了で": [27, 1], "京都": [97, 1, 2, 1, 5, 1, 2, 1], "人に": [13, 1, 10, 1, 11, 1], "人ほ": [0, 1], "人事": [71, 1, 10, 1], "人手": [49, 1, 19, 1, 53, 1], "以外": [22, 1, 69, 1], "件受": [46, 1, 72, 1], "会に": [18, 1, 62, 1, 5, 1, 4, 1], "体的": [3, 3, 23, 1, 5, 1, 27, 4, 72, 6], "何度": [28, 1], "作業": [27, 1, 15, 1, 5, 1, 67, 1, 5, 1], "価2": [44, 1, 72, 1], "係図": [71, 1], "保の": [49, 1, 72, 1], "元貴": [96, 1], "公設": [68, 1], "具合": [4, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "兼ね": [3, 1], "円で": [137, 1], "出せ": [28, 1], "出る": [3, 2], "出身": [42, 1, 72, 1], "分で": [13, 1, 7, 1, 5, 1, 2, 2], "初の": [14, 1, 6, 1, 3, 1], "初回": [58, 1, 72, 1], "別化": [51, 1, 2, 1, 1, 1, 8, 3, 61, 1, 2, 1, 1, 1, 8, 4], "利な": [22, 1], "利益": [63, 1, 10, 1, 62, 2], "制強": [47, 1, 72, 1], "削減": [47, 1, 2, 1, 1, 1, 4, 1, 6, 1, 59, 1, 2, 1, 1, 1, 4, 1, 6, 1], "前の": [1, 2, 92, 1], "加価": [48, 2, 30, 2, 1, 1, 1, 1, 40, 2], "助上": [3, 1, 67, 2], "動化": [47, 1, 1, 1, 2, 1, 30, 1, 39, 1, 1, 1, 2, 1], "化し": [28, 1, 16, 1, 36, 1, 36, 1], "化で": [0, 1, 47, 1, 2, 1, 70, 1, 2, 1], "化シ": [42, 1, 72, 1], "半減": [50, 1, 72, 1], "占め": [54, 1, 72, 1], "取得": [44, 1, 7, 1, 18, 1, 2, 1, 4, 3, 9, 1, 1, 3, 6, 1, 1, 1, 24, 1, 7, 1], "受付": [0, 1, 4, 1, 64, 1, 6, 1], "受注": [28, 3, 14, 2, 2, 1, 2, 1, 5, 2, 2, 1, 10, 1, 51, 2, 2, 1, 2, 1, 5, 2, 2, 1, 10, 1, 2, 1], "受領": [58, 1, 72, 1], "各項": [110, 1, 4, 1], "同業": [28, 1, 15, 1, 3, 1, 7, 1, 62, 1, 3, 1, 7, 1], "名の": [44, 1, 2, 1, 40, 1, 9, 1, 21, 1, 2, 1], "名詞": [116, 1, 1, 1, 1, 1, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "命の": [10, 3], "品を": [57, 1, 72, 1], "員も": [17, 1], "員を": [85, 1, 1, 1], "唯一": [69, 1], "商店": [96, 1, 7, 1, 4, 1], "営し": [78, 1], "営資": [7, 1, 15, 1, 6, 1, 4, 3, 3, 1, 41, 1, 3, 1], "囲ん": [112, 1], "国の": [0, 3, 14, 1, 9, 1, 46, 1, 8, 3, 1, 4, 1, 3, 1, 5, 1, 3, 1, 3], "均8": [61, 2, 72, 2], "均単": [61, 2, 2, 1, 70, 2, 2, 1], "均案": [55, 1, 72, 1], "報を": [86, 1], "場5": [59, 1, 72, 1], "場以": [85, 1], "場内": [50, 1, 72, 1], "場者": [0, 1, 1, 1, 2, 1, 5, 1, 60, 3, 4, 1, 6, 1, 31, 1], "増え": [2, 1, 23, 1], "壺屋": [96, 1], "大陸": [90, 1, 7, 1, 12, 1], "威2": [119, 1, 1, 1, 1, 1, 1, 1], "媛県": [100, 1, 7, 1], "字と": [81, 1], "安定": [44, 1, 4, 1, 4, 1, 64, 1, 4, 1, 4, 1], "定に": [35, 1], "定費": [63, 2, 72, 2], "客観": [0, 1], "将志": [107, 1], "小限": [20, 1], "山形": [96, 1], "川野": [98, 2], "工化": [45, 1, 72, 1], "工学": [42, 1, 72, 1], "差は": [28, 1], "年以": [3, 1, 4, 1, 3, 1, 37, 1, 12, 1, 10, 1, 2, 1, 5, 1, 43, 1, 12, 1], "年春": [28, 1], "度で": [57, 1, 72, 1], "庫県": [99, 1, 7, 1], "後製": [97, 1], "性と": [59, 1, 72, 3], "息子": [42, 2, 72, 2], "想い": [43, 1, 72, 1], "戦で": [28, 1], "戦資": [0, 1], "手が": [28, 1, 50, 1], "択は": [38, 1], "指摘": [17, 1, 7, 1, 3, 1, 39, 1], "接取": [55, 1, 72, 1], "控え": [36, 3, 30, 3, 1, 3], "提条": [61, 2, 72, 2], "携に": [59, 1, 3, 1, 69, 1, 3, 1], "改定": [54, 1, 72, 1], "文と": [38, 1], "文脈": [66, 1], "方な": [13, 1], "族だ": [78, 1], "日取": [69, 1], "易的": [23, 1], "時代": [78, 1], "時間": [13, 1, 7, 4, 2, 1, 1, 3, 2, 1, 1, 1, 2, 1, 9, 1, 8, 1, 2, 2, 1, 2, 1, 3, 1, 3, 8, 1, 1, 1, 1, 2, 57, 1, 2, 2, 1, 2, 1, 3, 1, 3, 8, 1, 1, 1, 1, 2], "最近": [25, 1], "期負": [60, 1, 72, 1], "本命": [10, 3], "朱色": [94, 1], "材価": [48, 1, 72, 1], "械向": [28, 1], "業の": [0, 1, 7, 2, 15, 2, 2, 1, 4, 1, 4, 4, 3, 1, 2, 1, 2, 1, 7, 1, 3, 2, 9, 1, 3, 1, 15, 2, 3, 2, 1, 2, 38, 1, 3, 2, 9, 3, 3, 1], "業ま": [78, 1], "業目": [68, 1], "機械": [28, 1, 14, 1, 5, 1, 3, 1, 1, 1, 63, 1, 5, 1, 3, 1, 1, 1], "次課": [60, 3, 72, 3], "正直": [19, 1, 2, 3], "段取": [28, 1], "況を": [78, 1], "注継": [51, 1, 72, 1], "洋和": [98, 1], "浪費": [25, 1], "済安": [80, 1], "火薬": [99, 1], "点措": [2, 2, 66, 2], "然性": [71, 1], "照合": [85, 1, 1, 2], "特定": [88, 1], "特殊": [51, 1, 72, 1], "率表": [72, 1], "現可": [73, 1], "現実": [12, 1], "理し": [24, 1], "理で": [39, 1], "理シ": [44, 1, 6, 2, 9, 1, 6, 1, 51, 1, 6, 2, 9, 1, 6, 1], "理性": [19, 1], "生田": [90, 2, 7, 2, 12, 1], "産年": [78, 1, 2, 1, 1, 1], "用す": [19, 1, 5, 1, 1, 1, 2, 6], "由を": [77, 1], "画レ": [71, 1], "白榮": [98, 1], "的内": [58, 1, 72, 3], "益構": [63, 1, 72, 3], "益見": [73, 1], "直接": [28, 1, 13, 1, 14, 1, 7, 1, 65, 1, 7, 1], "真珠": [98, 1], "短縮": [49, 1, 11, 1, 61, 1, 11, 1], "確か": [1, 1, 10, 1, 4, 3, 7, 1, 61, 1, 1, 1], "確に": [24, 1], "確立": [48, 1, 72, 1], "社タ": [100, 1], "稼働": [45, 1, 5, 1, 67, 1, 5, 1], "積の": [54, 1, 72, 1], "積回": [58, 1, 72, 1], "積精": [28, 1], "章1": [38, 1], "策で": [47, 1, 72, 1], "系譜": [80, 3], "継続": [43, 1, 1, 1, 2, 1, 5, 1, 3, 1, 9, 1, 9, 1, 1, 1, 42, 1, 1, 1, 2, 1, 5, 1, 3, 1, 9, 1], "続力": [72, 1], "練工": [49, 2, 72, 2], "聞く": [1, 1, 15, 1], "能の": [49, 1, 72, 1], "自治": [44, 1, 72, 1], "自身": [13, 1, 20, 1, 56, 1], "船株": [108, 1], "色申": [71, 1], "藤井": [100, 2], "藤工": [96, 1], "藤鐵": [97, 1], "行き": [2, 1], "術交": [43, 1, 3, 1, 69, 1, 3, 1], "術的": [50, 3, 72, 4], "術蓄": [56, 1, 72, 1], "要求": [51, 1, 72, 1], "見本": [28, 1, 58, 1], "見込": [35, 1, 12, 1, 21, 1, 51, 1], "視し": [50, 1, 72, 1], "視指": [123, 1, 1, 1, 1, 1, 1, 1, 1, 1], "観的": [0, 1], "記す": [36, 1], "記載": [84, 1, 1, 2, 1, 1, 16, 1, 11, 1], "設の": [66, 1], "詞o": [116, 1, 1, 1, 1, 1], "試算": [79, 1, 1, 1], "詰め": [26, 1, 2, 1], "話を": [0, 2, 11, 1, 2, 1, 8, 1, 2, 1], "該当": [71, 1, 14, 1], "認の": [80, 1, 6, 1, 27, 1], "読ま": [36, 1, 52, 1], "談相": [17, 3, 49, 1, 27, 1], "請が": [2, 1, 66, 1], "費が": [48, 1, 72, 1], "費込": [61, 1, 72, 1], "資と": [65, 1, 72, 3], "質に": [42, 1, 2, 1, 70, 1, 2, 1], "身が": [33, 1, 6, 1, 50, 1], "逆算": [12, 1], "通る": [13, 1], "進ん": [18, 1, 48, 3], "選べ": [79, 1], "配慮": [17, 1], "配置": [45, 1, 72, 1], "野真": [98, 1], "量退": [49, 1, 72, 1], "金を": [3, 1, 44, 1, 32, 1, 40, 1], "針の": [72, 1, 14, 1], "鉄工": [90, 1, 7, 1, 11, 1], "長と": [73, 1], "長官": [90, 1], "開催": [0, 1, 75, 1, 10, 1, 28, 3], "降の": [111, 1], "限1": [1, 1], "階式": [9, 3], "隣協": [45, 1, 72, 1], "集し": [88, 1], "雇用": [71, 2, 9, 1], "頭の": [0, 1], "鳥取": [100, 1, 7, 1], "鹿児": [94, 1, 7, 1, 7, 1]};
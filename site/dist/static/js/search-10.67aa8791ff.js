@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_10 = {"0人": [7, 4, 69, 4], "1か": [74, 1], "3名": [49, 1, 15, 1, 22, 1, 35, 1, 15, 1], "4回": [109, 2], "60": [24, 1, 21, 1, 4, 1, 5, 1, 7, 1, 2, 1, 2, 2, 52, 1, 4, 1, 5, 1, 7, 1, 2, 1, 2, 2], "7次": [68, 1], "8時": [58, 1, 72, 1], "93": [86, 1], "9歳": [0, 1, 1, 1, 6, 1, 8, 1, 20, 1, 41, 1], "aに": [80, 1], "b検": [66, 1], "eo": [94, 1], "eは": [88, 1], "f提": [13, 1, 22, 1], "hr": [88, 1], "ic": [47, 3, 41, 1, 23, 1, 8, 3], "is": [80, 1], "ku": [90, 1], "rl": [88, 1], "tの": [66, 1], "々は": [56, 1, 72, 1], "あれ": [13, 1, 13, 1, 25, 1, 72, 1], "いの": [0, 1, 3, 1, 21, 1, 3, 1, 1, 1, 51, 1, 11, 1, 20, 1], "いま": [0, 1, 3, 1, 2, 1, 1, 1, 5, 1, 1, 1, 1, 1, 1, 4, 3, 1, 4, 1, 1, 2, 2, 2, 1, 2, 3, 4, 1, 2, 10, 1, 17, 1, 13, 2, 5, 1, 4, 4, 1, 4, 1, 1, 3, 1, 1, 2, 2, 2, 1, 1, 1, 2, 1, 1, 3, 2, 2, 2, 1, 1, 15, 1, 18, 1], "いノ": [19, 3], "い現": [30, 1], "い精": [55, 1, 72, 1], "うだ": [7, 1, 69, 1], "う成": [22, 1], "えを": [20, 1, 16, 2, 31, 2], "が6": [49, 1, 72, 1], "が取": [56, 1, 72, 3], "が苦": [18, 3], "が諦": [56, 1, 72, 1], "きで": [13, 1, 23, 1, 21, 1, 9, 1, 1, 1, 62, 1], "くら": [3, 3, 22, 1, 44, 1, 8, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "く利": [21, 1], "く効": [69, 1], "けに": [0, 2, 79, 1], "ける": [20, 3, 48, 1, 11, 1, 1, 1], "げが": [13, 1], "ころ": [17, 1, 17, 1, 2, 1], "さわ": [107, 1], "ずい": [30, 1], "ずつ": [27, 1, 10, 1], "そし": [39, 1], "たど": [77, 1], "たら": [33, 1, 47, 1, 4, 1], "た方": [102, 1], "だ出": [15, 3], "ちに": [37, 1, 37, 1], "ち手": [123, 1, 1, 1, 1, 1, 1, 1, 1, 1], "つの": [0, 1, 5, 1, 11, 1, 7, 1, 1, 2, 2, 1, 2, 3, 9, 1, 29, 2, 13, 1, 4, 1], "づく": [1, 1, 13, 1, 29, 2, 4, 1, 18, 1, 15, 1, 3, 1, 32, 2, 4, 1, 18, 1], "てp": [24, 1], "て地": [18, 1], "て数": [78, 1], "で1": [10, 1], "でa": [26, 1], "で価": [52, 1, 72, 1], "で向": [48, 1, 72, 1], "で品": [42, 1, 72, 1], "で次": [42, 1, 72, 1], "で深": [24, 1], "で省": [47, 1, 72, 1], "で繁": [49, 1, 72, 1], "で話": [18, 4, 1, 1, 19, 1, 1, 3], "とも": [14, 1, 4, 1, 1, 1, 24, 1, 3, 1, 20, 1, 14, 2, 29, 1, 6, 1, 3, 1], "とを": [1, 1, 3, 1, 27, 1, 48, 1], "とア": [69, 1], "と参": [59, 1, 72, 3], "と時": [26, 1, 34, 1, 72, 1], "と課": [60, 1, 72, 3], "と進": [2, 1, 12, 1], "どこ": [27, 1, 12, 1, 70, 1], "どっ": [77, 1], "どん": [25, 1, 6, 1, 26, 3, 72, 3], "ど代": [55, 1, 72, 1], "ない": [0, 9, 1, 3, 1, 1, 1, 1, 4, 8, 8, 3, 1, 5, 1, 5, 1, 3, 1, 9, 1, 6, 1, 3, 1, 7, 1, 3, 1, 1, 1, 2, 2, 2, 1, 2, 2, 1, 4, 1, 1, 1, 4, 1, 4, 1, 1, 2, 1, 1, 1, 1, 11, 2, 14, 1, 5, 8, 2, 1, 2, 1, 7, 3, 2, 1, 5, 1, 8, 1, 13, 1, 1, 4, 1, 3, 1, 3, 11, 2], "な判": [87, 1], "な答": [27, 1], "に仕": [37, 1], "に入": [26, 1, 2, 1, 7, 1, 1, 1, 31, 1, 24, 1, 20, 1], "に内": [35, 1], "に妥": [42, 1, 72, 1], "に必": [20, 1], "に評": [0, 1], "のと": [3, 1, 24, 1], "のよ": [35, 1, 31, 1, 15, 1], "のエ": [3, 1, 9, 1, 23, 1, 78, 1], "の予": [7, 1, 21, 1, 48, 1], "の先": [14, 1, 1, 1, 2, 1, 20, 1, 39, 1, 35, 3], "の全": [25, 1, 2, 1, 53, 1, 6, 1, 25, 1], "の勘": [42, 1, 72, 1], "の単": [28, 1], "の存": [52, 1, 72, 1], "の常": [54, 1, 72, 1], "の推": [51, 1, 72, 1], "の書": [86, 1], "の案": [44, 1, 1, 1, 71, 1, 1, 1], "の用": [24, 1], "の相": [17, 1, 36, 1, 13, 1, 27, 1, 32, 1], "の磨": [13, 2], "の表": [72, 1], "の計": [79, 1, 54, 1], "の記": [78, 1, 6, 1, 8, 1, 10, 1, 8, 1, 3, 3], "の選": [55, 1, 24, 1, 48, 1], "の骨": [13, 1, 7, 1, 4, 2, 64, 1, 3, 1], "の高": [44, 1, 5, 1, 11, 1, 20, 1, 36, 1, 5, 1, 11, 1], "はど": [29, 1, 4, 1], "は変": [42, 1, 36, 1, 6, 1, 8, 1, 22, 1], "は載": [80, 1], "ばお": [26, 1], "へ進": [24, 1], "まと": [4, 1, 9, 1, 7, 1, 1, 1, 4, 1, 41, 1, 3, 1, 42, 1], "めに": [19, 1], "める": [0, 4, 11, 1, 1, 4, 1, 3, 1, 3, 1, 3, 6, 1, 2, 1, 1, 4, 1, 5, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 10, 1, 10, 1, 1, 2, 10, 1, 7, 1, 6, 1, 38, 1, 10, 1, 1, 1], "も応": [90, 1], "も検": [40, 1], "やノ": [19, 1], "らこ": [7, 1, 18, 1, 42, 1], "らっ": [0, 3, 1, 3, 1, 3, 1, 3, 24, 1], "らコ": [0, 1, 14, 1], "りご": [31, 1, 36, 1], "りつ": [78, 1, 1, 1], "りや": [79, 1], "り柔": [45, 1, 72, 1], "り組": [25, 1, 17, 2, 4, 1, 10, 1, 58, 1, 4, 1, 10, 3], "り返": [38, 3], "るフ": [23, 1], "る仕": [25, 1, 17, 1, 14, 1, 58, 1, 14, 1], "る充": [80, 1], "る情": [88, 1, 3, 1], "れて": [0, 1, 7, 1, 13, 1, 8, 1, 13, 1, 25, 1, 2, 1, 8, 1, 2, 1, 1, 2, 9, 1], "ろで": [36, 1], "わら": [0, 1], "を作": [0, 1, 13, 1, 11, 2, 4, 1, 14, 1, 37, 1, 35, 1], "を公": [86, 2, 27, 1], "を兼": [3, 1], "を完": [27, 1], "を押": [25, 1, 11, 1, 31, 1], "を果": [25, 1], "を稼": [3, 1], "を経": [24, 1], "を背": [0, 1], "を貼": [40, 1], "を頼": [28, 1], "ん認": [72, 1], "アー": [86, 1], "イマ": [105, 1], "ギと": [89, 1], "クラ": [105, 1], "ク継": [44, 1, 72, 1], "グ株": [99, 1], "コロ": [42, 1, 72, 1], "ジを": [86, 1, 5, 1], "スコ": [58, 2, 72, 1], "ス体": [47, 1, 72, 1], "ス解": [88, 1], "ズご": [13, 3], "タス": [68, 1], "ツギ": [0, 4, 3, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 4, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 31, 4, 1, 6, 1, 3, 1, 3, 1, 8, 1, 3, 1, 3, 1, 4, 1, 2, 1, 4, 1, 5, 1, 3, 1, 3, 1, 3, 1, 4, 3, 1, 1, 1, 3, 2, 1, 1, 3, 1, 20, 3], "テム": [42, 1, 2, 1, 6, 2, 9, 1, 6, 2, 49, 1, 2, 1, 6, 2, 9, 1, 6, 2], "トを": [0, 1, 1, 1, 23, 1, 1, 1, 3, 2, 32, 1, 6, 2, 27, 1, 20, 1, 19, 1], "トア": [27, 1, 1, 1], "ト掲": [9, 1], "ニュ": [44, 1, 3, 2, 2, 2, 7, 1, 3, 1, 26, 1, 31, 1, 3, 2, 2, 2, 7, 1, 3, 1], "ネシ": [97, 1], "バリ": [43, 3, 72, 5], "フタ": [55, 1, 72, 1], "プチ": [72, 1], "ベン": [85, 3, 25, 1], "モー": [97, 1], "ラッ": [34, 1, 17, 1, 72, 1], "ラン": [44, 2, 12, 1, 24, 1, 15, 1, 16, 2, 5, 2, 12, 1], "リや": [25, 1], "リピ": [44, 1, 1, 1, 71, 1, 1, 1], "リ協": [80, 1], "ル工": [47, 1, 50, 1, 22, 1], "ンキ": [111, 1], "ンソ": [80, 1], "ン再": [80, 1], "ーブ": [37, 1, 1, 1, 73, 1], "ー化": [45, 1, 35, 1, 37, 1], "一人": [80, 1], "一番": [25, 1, 5, 1, 48, 1], "上4": [137, 1], "下さ": [25, 1], "下フ": [25, 1], "両立": [56, 1, 72, 1], "中で": [27, 1, 10, 1, 24, 1, 72, 1], "主張": [116, 1, 1, 1, 1, 1], "二度": [79, 1], "人的": [80, 1], "今年": [81, 1], "付終": [74, 1], "代名": [86, 1], "件数": [63, 1, 17, 1, 55, 1], "任さ": [28, 1], "伊藤": [103, 1], "伊達": [101, 1], "会イ": [43, 1, 72, 1], "会場": [85, 1], "会的": [49, 3, 72, 4], "佑麻": [108, 1], "作商": [96, 1], "価に": [89, 1], "俊直": [97, 1], "修部": [28, 1], "個別": [62, 1, 72, 1], "値ま": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "健寿": [101, 1], "側の": [28, 1], "働デ": [50, 1, 72, 1], "充実": [51, 1, 4, 1, 25, 1, 43, 1, 4, 1], "先あ": [17, 1], "入可": [51, 1, 72, 1], "典も": [66, 1], "典を": [80, 1, 12, 1, 18, 1], "出場": [0, 5, 1, 1, 1, 1, 1, 2, 5, 4, 1, 1, 10, 1, 49, 7, 1, 1, 3, 2, 6, 1, 7, 2, 1, 4, 9, 2, 14, 2], "分析": [44, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 66, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "切送": [91, 1], "利害": [0, 1, 17, 1, 4, 1], "制限": [49, 1, 72, 1], "削除": [36, 1, 31, 1], "前で": [18, 4], "力内": [88, 1], "力工": [45, 1, 72, 1], "加人": [64, 1, 72, 1], "動機": [42, 2, 72, 1], "勝で": [14, 1], "勝大": [14, 1, 71, 1, 1, 1, 23, 1, 2, 1, 2, 1], "募ス": [74, 3], "募方": [85, 1], "半径": [53, 1, 72, 1], "協の": [43, 1, 72, 1], "卸売": [7, 1, 69, 1], "厚い": [42, 1, 72, 1], "去フ": [93, 1], "取締": [90, 1], "受け": [24, 1, 12, 1, 7, 2, 11, 1, 14, 1, 11, 1, 9, 1, 27, 2, 11, 1], "各回": [109, 1], "各社": [86, 1, 9, 1], "合も": [27, 1], "名で": [2, 1, 11, 1, 22, 1, 33, 1, 18, 1], "向か": [39, 1], "命し": [93, 1], "品か": [28, 1], "品に": [42, 1, 72, 1], "員か": [0, 1, 2, 1, 12, 1], "員に": [0, 1, 14, 1, 4, 1, 68, 1], "員登": [13, 1], "回エ": [0, 1], "困り": [31, 1], "国g": [80, 1], "国デ": [78, 1, 4, 1], "園が": [69, 1], "報か": [83, 1], "報に": [92, 1], "場の": [30, 1, 13, 1, 8, 1, 17, 1, 5, 1, 8, 1, 34, 1, 8, 1], "場ま": [86, 1], "大1": [47, 1, 72, 1], "大企": [7, 1, 69, 1], "大征": [98, 1], "太輔": [100, 1], "奄美": [94, 1], "子会": [7, 1, 69, 1], "子株": [97, 1], "完了": [11, 1, 13, 1, 3, 1, 15, 1, 5, 1, 24, 2, 43, 1, 5, 1], "密加": [55, 1, 72, 1], "局発": [109, 1], "届い": [24, 1, 12, 1], "展機": [2, 1], "山添": [107, 1], "山電": [104, 1], "島田": [104, 1], "川し": [108, 1], "工実": [28, 1], "工機": [28, 1], "年の": [28, 2, 14, 1, 2, 1, 12, 1, 3, 1, 20, 1, 35, 1, 2, 1, 12, 1, 3, 1], "年ま": [80, 1], "年目": [28, 1], "庁主": [0, 1], "度加": [44, 1, 14, 1, 58, 1, 14, 1], "廃業": [28, 1, 42, 1, 10, 1], "式特": [72, 1], "引実": [52, 1, 72, 1], "形県": [96, 1], "待た": [28, 2], "従業": [7, 1, 21, 1, 48, 1, 4, 1], "得1": [63, 1, 72, 1], "応策": [51, 2, 1, 2, 1, 2, 1, 2, 1, 2, 68, 2, 1, 2, 1, 2, 1, 2, 1, 2], "性向": [52, 1, 21, 1, 51, 1], "悠太": [103, 1], "意義": [19, 1], "愛知": [98, 1, 7, 1], "慌て": [24, 1], "手さ": [22, 1], "手段": [55, 1, 72, 1], "手法": [73, 1], "承す": [42, 2, 14, 1, 58, 1, 14, 1], "承継": [0, 5, 2, 2, 1, 3, 4, 5, 1, 1, 1, 2, 1, 2, 1, 2, 2, 1, 1, 3, 5, 1, 1, 1, 1, 1, 2, 2, 5, 1, 14, 1, 26, 4, 1, 7, 2, 4, 1, 2, 1, 1, 2, 2, 1, 5, 2, 4, 1, 5, 1, 8, 2, 1, 3, 1, 1, 2, 3, 1, 25, 1], "択と": [79, 1], "拠な": [35, 1], "推進": [42, 1, 36, 1, 2, 1, 2, 1, 32, 1], "提出": [1, 1, 1, 1, 2, 1, 5, 1, 2, 1, 1, 1, 1, 2, 1, 2, 6, 1, 4, 3, 10, 1, 1, 5, 36, 1, 15, 2, 25, 1], "援の": [79, 1], "損得": [23, 3], "摘を": [24, 1, 3, 1], "断で": [79, 1], "日は": [14, 1, 78, 1], "明記": [2, 1, 66, 1, 12, 1], "書を": [24, 1, 2, 1], "月2": [0, 1, 12, 1, 2, 1], "月堂": [97, 1], "期務": [46, 1, 72, 1], "材株": [100, 1], "来像": [43, 2, 72, 1], "校か": [46, 1, 72, 1], "格化": [50, 1, 72, 1], "格競": [53, 1, 72, 1], "案参": [54, 1, 72, 1], "業し": [28, 1], "業で": [28, 1], "模事": [2, 1, 66, 2, 2, 1], "次に": [27, 1], "次運": [65, 1, 72, 1], "歴の": [109, 1], "段使": [24, 1], "汎用": [52, 1, 1, 1, 71, 1, 1, 1], "法は": [85, 1], "注を": [44, 1, 72, 1], "渡せ": [66, 1], "澤精": [101, 1], "物足": [26, 1], "率向": [48, 1, 2, 1, 70, 1, 2, 1], "珠養": [98, 1], "現と": [60, 1, 72, 3], "現在": [25, 1, 17, 1, 22, 1, 50, 3, 22, 1], "産業": [28, 1, 57, 2, 23, 1, 5, 2], "用を": [28, 1, 18, 1, 33, 1, 39, 1], "用時": [70, 1], "由に": [2, 1, 66, 1], "異な": [68, 1], "相互": [46, 1, 72, 1], "省力": [0, 1, 2, 1, 7, 1, 14, 1, 45, 2, 10, 1, 2, 1], "省系": [80, 1], "県順": [95, 3], "石川": [98, 1, 7, 1], "確約": [87, 1], "社8": [28, 1], "社と": [33, 1, 10, 1, 2, 1, 1, 2, 6, 2, 4, 2, 3, 1, 3, 1, 53, 1, 2, 1, 1, 2, 6, 2, 4, 1, 3, 1, 3, 3], "社岸": [107, 1], "社常": [97, 1], "社弘": [96, 1], "神奈": [97, 1], "禍で": [42, 1, 72, 1], "移動": [94, 1], "程入": [111, 1], "積文": [53, 1, 72, 1], "第6": [85, 3, 1, 2, 10, 3, 1, 6, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 3, 1, 4, 1, 3, 1, 6, 1, 7, 1, 3, 4, 1], "答の": [40, 1], "範の": [80, 1], "米中": [80, 1], "米国": [72, 1, 8, 1], "約社": [78, 1, 2, 2], "組の": [73, 4], "経営": [0, 1, 7, 2, 4, 1, 2, 2, 1, 1, 7, 1, 1, 1, 6, 1, 4, 3, 3, 2, 36, 1, 1, 3, 4, 2, 2, 3, 1, 1, 1, 4, 7, 1], "継3": [78, 1], "継促": [0, 1, 3, 1, 7, 1, 58, 1, 1, 3, 6, 1, 5, 1, 6, 1], "続い": [78, 1], "続年": [63, 1, 72, 1], "績と": [59, 1, 72, 1], "繰り": [48, 1, 72, 1], "置と": [45, 1, 72, 1], "群の": [79, 1], "者は": [92, 1], "肢が": [55, 1, 72, 1], "能で": [13, 1, 53, 1], "能性": [2, 1, 71, 1], "芦田": [106, 1], "葉産": [108, 1], "行う": [0, 1, 13, 1, 22, 2, 33, 1], "術伝": [42, 1, 72, 1], "表を": [113, 1], "要望": [58, 1, 72, 1], "計2": [86, 1], "記録": [27, 1, 59, 1, 6, 1, 10, 1, 8, 1, 3, 3], "設し": [86, 1], "証取": [51, 1, 72, 1], "話せ": [7, 1, 69, 1], "話に": [62, 1, 72, 1], "認し": [35, 1, 33, 1, 16, 1, 1, 1, 1, 1], "認で": [27, 1, 45, 2, 4, 1, 1, 1, 1, 3], "誤差": [28, 1], "課題": [28, 1, 2, 3, 5, 1, 25, 6, 18, 2, 2, 1, 52, 7], "請さ": [0, 1], "請者": [0, 1, 2, 1, 6, 1, 64, 1], "議決": [82, 1], "谷山": [101, 1], "象に": [0, 1, 14, 1, 62, 1], "資金": [39, 1, 9, 1, 17, 3, 55, 1, 17, 3], "賞と": [21, 3], "賞よ": [21, 1], "質的": [71, 1], "身内": [34, 1], "載っ": [72, 3, 11, 1], "辰太": [101, 1], "辺鉄": [108, 1], "迅速": [57, 1, 72, 1], "送る": [28, 1], "進行": [50, 1, 72, 1], "適正": [62, 1, 72, 1], "選を": [0, 1, 8, 1, 64, 1], "部離": [94, 1], "金に": [77, 1], "録が": [86, 1], "門会": [62, 1, 72, 1], "間不": [44, 1, 72, 1], "間短": [49, 1, 72, 1], "限り": [20, 1], "限会": [96, 1, 1, 2, 3, 1, 1, 1, 3, 1, 2, 1, 1, 2, 1, 1], "雅生": [96, 1], "青果": [97, 1], "高を": [48, 1, 72, 1], "高齢": [49, 1, 31, 2, 41, 1], "齊藤": [86, 1, 11, 1]};
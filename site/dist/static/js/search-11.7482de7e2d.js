@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_11 = {"0k": [53, 1, 72, 1], "0個": [58, 1, 72, 1], "1行": [114, 1], "2名": [42, 1, 2, 1, 2, 1, 18, 1, 22, 1, 9, 3, 14, 1, 4, 1, 1, 1, 2, 1, 2, 1, 18, 1], "3回": [86, 1, 4, 1, 19, 2], "3社": [45, 1, 7, 1, 2, 1, 63, 1, 7, 1, 2, 1], "50": [7, 1, 38, 1, 2, 1, 13, 1, 3, 2, 2, 2, 11, 1, 2, 1, 2, 1, 37, 1, 2, 1, 13, 1, 3, 2, 2, 2], "6次": [74, 1], "a補": [0, 1, 2, 2, 1, 1, 4, 1, 1, 1, 3, 1, 3, 2, 5, 1, 49, 3, 1, 3, 6, 1, 1, 1, 4, 1, 2, 1, 3, 1, 1, 1], "cn": [42, 1, 5, 1, 67, 1, 5, 1], "fa": [2, 1, 66, 1, 22, 1, 19, 1], "gb": [71, 1], "gr": [25, 1, 46, 1], "id": [40, 1, 31, 1], "it": [47, 3, 72, 3], "ni": [25, 1, 2, 1, 67, 1], "pか": [25, 1, 2, 3], "pに": [27, 1], "sn": [109, 1], "to": [2, 1, 78, 1], "t機": [50, 1, 72, 1], "いく": [3, 3, 10, 1, 3, 1, 1, 1, 59, 1, 8, 1], "いた": [14, 1, 10, 1, 3, 1, 6, 1, 1, 1, 2, 1, 1, 1, 42, 1, 5, 1], "いは": [0, 2], "いみ": [25, 1], "いわ": [0, 1], "い承": [0, 1], "い替": [36, 1, 31, 1], "うち": [22, 3, 46, 1, 6, 1, 6, 1, 1, 1, 21, 1], "がで": [13, 1, 11, 1, 9, 1, 24, 1, 72, 1], "が具": [31, 1], "が受": [24, 1], "が増": [2, 1, 53, 1, 72, 1], "が強": [44, 2, 1, 2, 1, 2, 70, 1, 1, 1, 1, 1], "が得": [91, 1], "が起": [2, 3], "が長": [34, 1], "が顧": [54, 1, 72, 1], "き合": [66, 1], "き表": [22, 1], "くな": [0, 2, 1, 1, 15, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 3, 1, 2, 1, 3, 1, 47, 1, 3, 1], "くり": [1, 1, 5, 3, 5, 1, 3, 1, 10, 1, 2, 1, 12, 3, 5, 2, 4, 1, 18, 1, 50, 2, 4, 1, 18, 1], "く人": [17, 1], "く出": [89, 1], "く自": [79, 1], "ぐる": [80, 1], "ぐ力": [78, 2, 1, 1, 1, 2], "けれ": [19, 1, 90, 1], "け補": [78, 1], "この": [0, 1, 1, 1, 2, 2, 11, 2, 3, 1, 7, 4, 1, 1, 2, 1, 1, 1, 2, 1, 6, 1, 2, 3, 2, 1, 26, 1, 1, 1, 1, 2, 1, 1, 2, 1, 3, 1, 7, 1, 6, 3, 2, 3, 2, 1, 20, 3], "こま": [4, 1, 7, 2], "しも": [26, 1, 2, 1], "し掲": [84, 1], "じっ": [6, 3, 18, 1, 2, 1], "じゃ": [22, 3], "すい": [79, 1], "せて": [7, 1, 4, 1, 2, 1, 11, 1, 42, 1, 10, 1, 19, 1], "たず": [91, 1], "たり": [26, 1, 1, 2, 53, 1], "た人": [34, 1], "た会": [2, 1, 66, 1], "た出": [30, 1], "た決": [79, 1], "た自": [33, 1], "だか": [78, 1], "だほ": [25, 1], "だ始": [5, 1, 1, 1], "ちが": [0, 1, 19, 3], "つく": [11, 1, 2, 1, 10, 1, 1, 3, 13, 1, 32, 1, 8, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "つ生": [42, 1, 72, 1], "て丁": [26, 1], "て渡": [34, 1], "て突": [66, 1], "て送": [27, 1], "で2": [47, 1, 72, 1], "であ": [0, 1, 8, 1, 17, 1, 43, 1, 4, 2, 6, 1, 1, 3, 3, 1], "でも": [7, 1, 11, 1, 2, 1, 1, 3, 4, 1, 26, 1, 16, 1, 9, 1, 7, 1, 40, 1], "でを": [89, 1], "で参": [19, 1, 3, 1], "で囲": [112, 1], "で売": [48, 1, 72, 1], "で時": [13, 1], "で終": [0, 1, 27, 1, 13, 1], "で進": [0, 1, 11, 1, 14, 1], "とc": [66, 1], "とこ": [17, 1, 17, 1, 2, 1], "とん": [101, 1], "と申": [71, 3], "と考": [89, 1], "と賃": [78, 2, 1, 1, 1, 1], "と連": [68, 1], "と間": [74, 1], "なさ": [25, 1], "な工": [43, 1, 72, 1], "な情": [89, 1], "にf": [109, 1], "に父": [28, 1], "に触": [0, 1, 2, 1], "に集": [55, 1, 72, 1], "のど": [35, 1, 22, 3, 72, 3], "のス": [68, 1], "のベ": [44, 1, 72, 1], "の候": [80, 1], "の利": [21, 1, 71, 1], "の変": [52, 1, 3, 1, 25, 2, 44, 1, 3, 1], "の審": [0, 2, 3, 1, 16, 1, 4, 1, 11, 1, 52, 1], "の恩": [43, 1, 72, 1], "の批": [0, 1], "の改": [43, 1, 72, 1], "の方": [24, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 42, 2, 2, 2, 6, 1], "の標": [52, 1, 1, 1, 71, 1, 1, 1], "の特": [69, 1, 8, 1], "の狙": [69, 1, 8, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "の継": [54, 1, 19, 1, 53, 1], "の販": [68, 1], "の適": [56, 2, 16, 1, 56, 1], "はず": [25, 1], "はな": [0, 1, 2, 1, 5, 2, 13, 4, 2, 1, 12, 1, 42, 2, 2, 1, 1, 1], "はリ": [66, 1], "は上": [3, 1, 37, 1], "は今": [78, 1], "は会": [0, 1, 13, 1, 22, 1], "は出": [27, 1, 1, 1, 52, 1], "は固": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "は確": [22, 1], "は続": [78, 1], "ばか": [0, 1, 67, 1], "ば見": [82, 1], "ふだ": [14, 1, 6, 1, 46, 1], "ほう": [25, 1], "ぼし": [72, 1], "ます": [0, 10, 1, 6, 1, 6, 1, 8, 4, 1, 5, 1, 1, 4, 1, 5, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 2, 1, 1, 1, 3, 2, 5, 1, 2, 1, 2, 1, 6, 1, 5, 1, 2, 2, 2, 1, 2, 1, 1, 1, 3, 2, 5, 1, 3, 1, 2, 2, 3, 1, 1, 15, 2, 10, 4, 1, 4, 2, 2, 5, 1, 2, 1, 1, 3, 1, 5, 1, 5, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 14, 2, 1, 2, 1, 1, 2, 1, 15, 2], "まら": [7, 1, 69, 1], "ま継": [79, 1], "みな": [25, 1], "めれ": [27, 1], "も読": [13, 1], "も追": [86, 1], "らい": [25, 1], "らつ": [57, 1, 72, 1], "ら返": [40, 1], "り日": [12, 1], "る制": [68, 1], "る準": [24, 1], "る状": [79, 1, 1, 1], "る理": [56, 1, 72, 1], "れで": [21, 1, 27, 1, 38, 1, 34, 1], "れ率": [54, 1, 72, 1], "わず": [88, 1], "わり": [7, 1, 7, 1, 13, 1, 2, 1, 4, 1, 5, 1, 4, 1, 36, 1, 1, 2, 2, 1, 5, 1, 6, 1, 22, 1], "をき": [79, 1], "を中": [93, 1], "を依": [13, 1], "を保": [36, 1, 6, 1, 14, 1, 10, 1, 1, 1, 25, 1, 22, 1, 14, 1], "を初": [71, 1, 7, 1], "を反": [86, 1], "を積": [43, 1, 72, 1], "を維": [52, 1, 72, 1], "を読": [36, 1, 31, 1], "を追": [47, 1, 39, 1, 33, 1], "を配": [91, 1, 3, 1], "を重": [43, 1, 72, 1], "んの": [21, 1, 45, 1, 12, 1, 11, 1], "ァレ": [111, 2], "ァー": [100, 1], "イク": [96, 1], "イミ": [105, 1], "ェア": [49, 1, 12, 1, 60, 1, 12, 1], "エビ": [116, 1, 1, 1, 1, 1], "エン": [0, 5, 1, 1, 1, 2, 1, 1, 1, 2, 5, 1, 2, 2, 1, 2, 1, 3, 1, 7, 4, 1, 2, 1, 3, 2, 1, 7, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 7, 1, 3, 1, 2, 2, 1, 1, 2, 28, 1, 9, 1, 8, 2, 1, 4, 2, 1, 3, 1, 1, 1, 1, 1, 18, 1, 2, 1], "クリ": [96, 1, 12, 1], "ク株": [108, 1], "ケー": [43, 1, 72, 1], "サダ": [0, 1, 1, 1, 12, 1, 67, 1, 5, 2, 1, 2, 4, 2, 3, 3, 1, 5, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 4, 1], "シア": [80, 1, 16, 1, 15, 1], "ジッ": [24, 1], "スや": [72, 1], "スイ": [105, 1], "スヤ": [97, 1], "タ削": [36, 1, 31, 1], "チー": [64, 4, 72, 6], "デア": [58, 3, 72, 3], "トッ": [27, 1], "パー": [53, 1, 5, 1, 1, 1, 5, 1, 9, 1, 52, 1, 5, 1, 1, 1, 5, 1], "プア": [27, 1], "ポジ": [62, 1, 2, 2, 70, 1, 2, 1], "マス": [97, 1], "ミナ": [93, 1], "ミリ": [80, 1], "ムか": [24, 1], "ム開": [65, 1, 72, 1], "メー": [44, 1, 13, 2, 59, 1, 13, 2], "ライ": [28, 1, 19, 2, 3, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 7, 1, 9, 1, 9, 1, 16, 1, 23, 2, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 7, 1], "ラツ": [62, 1, 72, 1], "リサ": [66, 2], "リュ": [43, 3, 72, 5], "ル化": [42, 2, 2, 1, 5, 1, 7, 1, 3, 1, 21, 1, 34, 2, 2, 1, 5, 1, 7, 1, 3, 1], "ロジ": [24, 1, 42, 1], "ロト": [134, 1], "ンの": [27, 1, 23, 1, 6, 1, 66, 1, 6, 1], "ーし": [2, 1, 22, 1, 3, 1, 7, 1, 34, 1], "ーで": [50, 1, 5, 1, 33, 1, 24, 3, 10, 1, 5, 1], "ーシ": [22, 1, 31, 1, 6, 1, 21, 1, 27, 1, 18, 1, 6, 1], "ープ": [58, 2, 72, 1], "ー受": [0, 1, 4, 1], "ー文": [0, 1, 1, 1, 10, 1, 2, 1, 1, 1, 6, 1, 3, 2, 1, 1, 11, 1, 2, 1, 2, 1, 1, 2, 37, 1, 9, 2, 2, 1, 3, 1], "一主": [56, 1, 72, 1], "一律": [2, 1], "一手": [39, 1], "一貫": [58, 1, 72, 1], "上入": [35, 1], "上段": [3, 1], "不在": [80, 1, 2, 1], "中部": [98, 3, 7, 3, 6, 1], "人以": [7, 4, 69, 4], "今日": [0, 1, 1, 1, 11, 4, 1, 3, 1, 3, 1, 3, 12, 1, 84, 1, 1, 1], "代の": [43, 1, 59, 3, 13, 1], "件1": [61, 1, 72, 1], "会フ": [90, 1], "会日": [110, 1], "伝え": [23, 1], "体の": [46, 1, 72, 1], "体目": [80, 1], "作し": [57, 2, 72, 2], "作で": [28, 2], "供給": [52, 5, 26, 1, 2, 3, 44, 7], "依存": [54, 1, 6, 1, 66, 1, 6, 1], "価が": [0, 1], "価格": [48, 4, 2, 1, 2, 3, 1, 1, 1, 2, 8, 3, 58, 4, 2, 1, 2, 3, 1, 1, 1, 2, 8, 3], "係維": [52, 1, 72, 1], "保存": [4, 1, 3, 1, 17, 2, 3, 1, 7, 1, 2, 6, 1, 1, 10, 1, 19, 1, 1, 6, 9, 1, 12, 1, 3, 1, 28, 1], "保守": [65, 1, 72, 1], "信が": [7, 1, 69, 1], "信頼": [42, 1, 4, 1, 13, 1, 14, 1, 41, 1, 4, 1, 13, 1], "偏り": [66, 1], "備ツ": [0, 1], "元の": [36, 1, 16, 1, 32, 1, 40, 1], "兄弟": [86, 1], "先代": [43, 1, 72, 1], "入材": [48, 1, 72, 1], "全体": [43, 1, 3, 1, 10, 1, 5, 1, 19, 1, 35, 1, 3, 1, 10, 1, 5, 1], "具を": [23, 1], "内造": [108, 1], "再編": [80, 1], "出展": [2, 1], "出日": [71, 1], "出来": [0, 1, 30, 1], "分け": [77, 1], "副会": [46, 1, 72, 1], "力化": [0, 1, 2, 1, 7, 1, 14, 1, 45, 2, 10, 1, 2, 1], "加費": [23, 1], "効い": [3, 1], "勝へ": [14, 1], "区別": [85, 1, 1, 1], "卓郎": [105, 1], "口の": [78, 1, 2, 1], "古機": [51, 1, 72, 1], "台か": [42, 1, 72, 1], "名又": [68, 1], "命推": [78, 1, 2, 1, 2, 1], "品が": [28, 1], "品ゼ": [44, 1, 72, 1], "員経": [71, 1], "商品": [73, 1], "回す": [28, 1], "地に": [37, 1], "城ス": [105, 1], "域お": [72, 1], "域未": [72, 1], "基づ": [69, 1, 11, 1, 6, 1], "場は": [85, 1], "場実": [47, 1, 72, 1], "場規": [26, 1, 35, 3, 5, 1, 67, 4], "境の": [86, 1], "声に": [35, 1], "売業": [7, 2, 69, 2], "変更": [73, 1, 11, 1], "大2": [3, 1, 7, 1], "子に": [40, 1], "定工": [44, 1, 72, 1], "定者": [0, 2, 1, 1, 14, 1, 56, 1, 2, 1], "実な": [21, 1], "実質": [71, 1, 9, 1], "客依": [60, 1, 72, 1], "客業": [54, 1, 72, 1], "害の": [0, 1, 17, 1], "対す": [1, 1, 15, 1, 7, 1], "局か": [24, 1, 62, 1], "山県": [98, 1, 2, 1, 7, 1], "岡県": [97, 1, 4, 1, 3, 1, 4, 1], "岸コ": [107, 1], "工所": [90, 1, 7, 2], "工技": [44, 1, 14, 1, 1, 1, 57, 1, 14, 1, 1, 1], "己作": [87, 1], "市中": [111, 1], "市名": [112, 1], "帰る": [18, 1], "平松": [108, 1], "年は": [81, 1], "年調": [78, 1], "庁が": [0, 1, 93, 1], "庁公": [78, 1], "度向": [60, 1, 72, 1], "度管": [44, 1, 72, 1], "式会": [90, 1, 6, 5, 1, 8, 1, 4, 1, 6, 1, 7, 1, 2, 2, 2, 1, 2, 1, 4, 1, 2, 1, 4, 1, 5], "式発": [85, 1, 1, 3, 23, 1, 1, 3, 1, 3, 1, 3, 1, 3], "当の": [39, 1], "当社": [61, 1, 72, 1], "応し": [27, 1], "応で": [45, 1, 2, 1, 13, 1, 57, 1, 2, 1, 13, 1], "性あ": [63, 1, 72, 1], "性を": [24, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 6, 1, 72, 1], "恩返": [43, 1, 72, 1], "想の": [17, 1], "態化": [54, 1, 72, 1], "手試": [62, 1, 72, 1], "手順": [27, 2, 15, 1, 72, 1], "押し": [36, 1, 31, 1], "掃社": [107, 1], "掘っ": [37, 2], "提に": [80, 1], "提供": [13, 1], "援機": [71, 1, 9, 1, 7, 1], "改善": [43, 2, 17, 1, 18, 1, 1, 1, 36, 2, 17, 1], "数か": [12, 1], "数供": [52, 1, 72, 1], "文を": [11, 1, 12, 1, 2, 1, 2, 1, 8, 1, 34, 1], "新事": [39, 1, 16, 1], "日数": [12, 1], "明す": [71, 1], "時短": [25, 1], "更は": [84, 1], "月3": [28, 1, 57, 1], "月間": [63, 1, 72, 1], "未来": [0, 1, 14, 1, 6, 1, 2, 1, 6, 1, 5, 4, 39, 1], "本店": [96, 1], "本文": [35, 1], "本気": [0, 4, 1, 3, 1, 3, 1, 3], "村本": [96, 1], "東京": [0, 1, 97, 1, 7, 1, 7, 1], "析に": [88, 1], "果指": [78, 1], "柔軟": [45, 1, 17, 1, 55, 1, 17, 1], "検算": [39, 1, 1, 2, 26, 3], "業じ": [22, 3], "業と": [7, 1, 21, 1, 1, 3, 3, 1, 44, 1], "業へ": [78, 1], "業計": [14, 1, 7, 1, 52, 3, 4, 1, 4, 3], "業選": [80, 1], "業高": [43, 1, 3, 1, 69, 1, 3, 1], "機会": [2, 1, 18, 1, 1, 1, 26, 2, 1, 2, 1, 2, 1, 2, 69, 2, 1, 2, 1, 2, 1, 2], "欄は": [40, 1], "次公": [0, 1, 3, 1, 5, 1, 60, 1, 1, 1, 6, 1, 7, 1, 3, 1, 1, 1], "正城": [100, 1], "流れ": [24, 1, 4, 1, 52, 1, 5, 3, 1, 2], "流行": [22, 1], "済産": [85, 2, 28, 2], "準品": [62, 1, 72, 1], "物ぴ": [111, 1], "状況": [78, 2, 1, 2, 1, 1], "狙い": [69, 1, 8, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "率を": [48, 2, 72, 2], "現す": [22, 1, 21, 1, 37, 1, 35, 1], "理由": [1, 2, 15, 5, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 33, 1, 13, 1, 8, 5, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 46, 3], "用3": [71, 1], "用境": [68, 1], "田屋": [107, 1], "由が": [77, 1], "町工": [28, 1, 14, 1, 1, 1, 71, 1, 1, 1], "画策": [72, 1], "発展": [43, 1, 13, 1, 17, 1, 42, 1, 13, 1], "目安": [7, 1, 21, 1, 48, 1], "目標": [28, 1, 15, 2, 4, 1, 14, 2, 19, 1, 35, 1, 4, 1, 14, 2], "直わ": [19, 1], "相当": [68, 1], "真太": [104, 1], "着手": [42, 1, 72, 1], "確さ": [73, 2], "示さ": [68, 1], "社嘉": [108, 1], "程度": [51, 1, 4, 1, 6, 1, 62, 1, 4, 1, 6, 1], "積と": [56, 1, 72, 1], "積書": [71, 1], "立て": [7, 2, 8, 1, 58, 3, 3, 1], "章立": [73, 3], "第7": [0, 2, 4, 1, 8, 1, 56, 1, 8, 1, 3, 1, 6, 4, 1, 2, 9, 3, 7, 1, 7, 1, 1, 3, 1, 3, 1, 3, 1, 6], "等研": [2, 1, 66, 1], "系化": [42, 1, 72, 1], "系試": [80, 1], "約は": [87, 1], "組み": [25, 1, 3, 1, 14, 3, 4, 1, 10, 1, 23, 2, 1, 1, 34, 2, 4, 1, 10, 1], "絡が": [109, 1], "継い": [43, 1, 36, 1, 36, 1], "緊急": [45, 1, 72, 1], "置す": [80, 1], "美早": [105, 1], "美樹": [107, 1], "考慮": [17, 1], "者一": [109, 1], "自動": [28, 1, 8, 1, 11, 1, 1, 1, 2, 1, 7, 1, 10, 1, 13, 1, 39, 1, 1, 1, 2, 1, 7, 1], "艶金": [98, 1], "芸鋳": [96, 1], "英里": [101, 1], "落と": [71, 3], "蓋然": [71, 1], "薬店": [99, 1], "融合": [43, 1, 13, 1, 59, 1, 13, 1], "行で": [34, 1], "術の": [53, 2, 2, 1, 70, 2, 2, 1], "術潮": [80, 1], "補強": [40, 1], "西塚": [105, 1], "西建": [99, 1], "見て": [0, 3, 1, 3, 1, 3, 1, 3, 24, 1, 1, 2, 6, 3, 5, 1], "設計": [28, 1, 26, 1, 3, 2, 1, 2, 20, 1, 1, 1, 47, 1, 3, 2, 1, 2], "話題": [19, 1], "認と": [24, 1], "認書": [71, 1], "認用": [57, 1, 72, 1], "誰か": [0, 3, 1, 3, 1, 3, 1, 3], "請準": [0, 1], "諦め": [56, 1, 72, 1], "象が": [3, 1], "象経": [71, 1], "貴宏": [108, 1], "資を": [68, 1], "軟な": [45, 1, 17, 1, 55, 1, 17, 1], "追記": [40, 1, 73, 1], "速な": [57, 1, 72, 1], "遇を": [68, 1], "運営": [0, 2, 26, 1, 1, 1, 38, 4, 13, 1, 1, 3, 3, 2, 3, 1, 1, 2, 3, 4, 1, 6, 1, 4, 1, 4, 5, 2, 12, 1, 28, 5], "過す": [2, 3, 12, 1], "達也": [99, 1], "選ん": [39, 3, 49, 1], "都合": [0, 1], "金が": [3, 1], "鋼シ": [99, 1], "長を": [46, 1, 72, 1], "間の": [13, 1, 7, 1, 3, 1], "間対": [59, 1, 1, 1, 71, 1, 1, 1], "降相": [68, 1], "集め": [92, 1], "集要": [92, 1], "静的": [91, 1], "頼性": [73, 1], "類審": [2, 2, 12, 2, 4, 1, 6, 1, 44, 4], "顧客": [32, 1, 13, 1, 6, 3, 2, 3, 1, 5, 3, 1, 2, 1, 1, 3, 1, 1, 1, 1, 1, 2, 10, 1, 44, 1, 6, 3, 2, 3, 1, 5, 3, 3, 2, 1, 1, 3, 1, 1, 1, 1, 1, 3]};
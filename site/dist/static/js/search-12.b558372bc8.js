@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_12 = {"1m": [44, 1, 15, 1, 57, 1, 15, 1], "1名": [64, 4, 72, 4], "2回": [109, 1], "2社": [44, 1, 72, 1], "2階": [69, 1], "3期": [46, 1, 25, 1, 47, 1], "40": [48, 1, 13, 2, 2, 2, 2, 1, 37, 1, 7, 1, 11, 1, 13, 2, 2, 4, 2, 2], "4章": [39, 1, 27, 1], "5次": [0, 1, 3, 1, 5, 1, 2, 1, 58, 1, 1, 1, 5, 3, 1, 1, 7, 1, 3, 1, 1, 1], "8年": [28, 1], "95": [44, 1, 16, 1, 56, 1, 16, 1], "am": [28, 1, 33, 8, 72, 10], "bマ": [64, 1, 72, 1], "co": [27, 1, 21, 3, 18, 1, 22, 2, 32, 3], "c機": [42, 1, 5, 1, 67, 1, 5, 1], "dp": [80, 1], "ea": [100, 1], "gs": [80, 1], "ie": [40, 1, 9, 3, 39, 1, 33, 3], "mi": [25, 1, 2, 1], "my": [48, 3, 72, 3], "ok": [2, 1, 23, 1, 63, 1, 2, 1, 19, 1, 2, 1], "pl": [111, 1], "p経": [88, 1], "so": [27, 1, 13, 1, 9, 3, 12, 4, 60, 3, 12, 5], "いだ": [43, 1, 36, 1, 36, 1], "い地": [28, 1, 52, 1], "い新": [28, 1, 3, 3], "う2": [79, 1], "うも": [22, 1, 66, 1], "うモ": [22, 1], "う関": [29, 1], "かし": [18, 1, 38, 1, 2, 1, 70, 1, 2, 1], "かで": [22, 1, 57, 1], "か迷": [109, 1], "がよ": [19, 3, 47, 1], "が付": [86, 1], "が常": [87, 1], "が消": [66, 1], "が選": [88, 1], "が高": [48, 1, 72, 1], "き役": [24, 1], "き方": [28, 1, 21, 1, 37, 1, 35, 1], "くる": [0, 1, 3, 1, 10, 1, 10, 1, 1, 3, 13, 1, 35, 1], "く事": [0, 1], "く始": [31, 1], "け保": [4, 1, 3, 1, 17, 1, 3, 1, 10, 1, 39, 1, 15, 1], "げの": [40, 1, 38, 1, 2, 1], "げま": [16, 1, 70, 1], "すさ": [49, 1, 72, 1], "す段": [28, 1], "たせ": [3, 1, 68, 1], "たに": [0, 1, 30, 1], "た事": [0, 1, 14, 1, 9, 1, 54, 1], "た画": [4, 1, 30, 1], "た開": [28, 1], "だが": [7, 1, 44, 1, 25, 1, 47, 1], "っく": [6, 3, 18, 1, 2, 1], "った": [0, 3, 1, 3, 1, 3, 1, 3, 8, 1, 11, 1, 1, 1, 3, 5, 1, 1, 1, 1, 2, 1, 7, 1, 4, 3, 1, 2, 38, 1, 1, 1, 9, 1, 24, 2], "てあ": [0, 1, 28, 1, 12, 1], "ても": [0, 4, 1, 3, 1, 3, 1, 3, 17, 1, 2, 1, 3, 1, 9, 3, 3, 1, 29, 1, 13, 1], "てア": [78, 1], "て進": [66, 1], "で3": [44, 1, 72, 1], "でコ": [25, 1, 22, 1, 72, 1], "で代": [71, 1], "で広": [86, 1], "で申": [13, 1], "で監": [50, 1, 72, 1], "で考": [79, 1], "で詳": [68, 1], "で連": [109, 1], "とd": [43, 1, 72, 1], "とい": [13, 1, 9, 1, 57, 1, 11, 1], "とつ": [19, 1, 60, 2, 2, 1], "と各": [86, 1], "と更": [92, 1], "と比": [21, 1], "と答": [24, 1], "ど評": [0, 1], "なう": [14, 1], "な取": [46, 1, 72, 1], "にし": [0, 2, 24, 2, 4, 1, 2, 1, 36, 1, 13, 2, 2, 1, 2, 1, 6, 1], "にで": [87, 3], "にプ": [25, 1], "に切": [34, 1], "に受": [28, 1], "に増": [2, 1], "に大": [18, 1], "に控": [66, 1], "に資": [73, 1], "のな": [0, 2, 2, 1, 15, 1, 26, 1, 41, 1, 5, 1, 13, 1, 13, 1], "のオ": [28, 1], "のペ": [24, 3, 2, 1, 1, 1, 13, 1, 28, 1, 6, 1, 11, 1, 1, 2, 2, 1, 4, 1], "のリ": [48, 1, 36, 1, 2, 1, 9, 1, 15, 1, 10, 1], "の人": [13, 1, 36, 2, 72, 2], "の会": [2, 1, 25, 1, 1, 3, 60, 1], "の優": [24, 1, 13, 1, 31, 2, 7, 1], "の出": [0, 1, 2, 1, 6, 1, 11, 1, 53, 1, 6, 1, 1, 1, 6, 1, 24, 2], "の区": [67, 1, 28, 1], "の基": [82, 1], "の多": [45, 1, 35, 1, 37, 1], "の未": [20, 1], "の決": [71, 1, 15, 1], "の発": [51, 1, 22, 1, 12, 2, 28, 1, 10, 1], "の確": [1, 2, 13, 1, 1, 1, 9, 1, 47, 1, 2, 1], "の自": [87, 1], "の質": [24, 1, 52, 1], "はか": [22, 1, 15, 1], "は下": [68, 1], "は事": [22, 1, 46, 1, 12, 1], "は手": [22, 1], "は運": [85, 1, 1, 1], "ほし": [90, 1], "まず": [30, 1], "まり": [18, 1, 2, 1, 8, 1, 13, 1, 19, 1, 72, 1], "ま続": [27, 1], "みか": [44, 2, 1, 2, 1, 2, 70, 1, 1, 1, 1, 1], "みる": [18, 1, 3, 1], "み手": [81, 1], "めき": [7, 1, 69, 1], "もの": [18, 1, 2, 1, 1, 1, 1, 1, 1, 4, 1, 1, 3, 2, 16, 1, 4, 1, 18, 1, 6, 3, 8, 2, 1, 2, 4, 1, 4, 1, 4, 2, 18, 1, 5, 1, 4, 1, 18, 1], "も社": [17, 1], "や数": [30, 1], "よい": [66, 1], "ら5": [71, 2], "らフ": [86, 1], "ら何": [27, 1], "ら評": [46, 1, 72, 1], "り取": [20, 1], "るデ": [85, 3], "る受": [36, 1], "る大": [32, 1], "る指": [34, 1], "る気": [20, 3], "れよ": [7, 1, 69, 1], "わか": [7, 1, 8, 1, 4, 4, 15, 1, 5, 1, 37, 1], "わせ": [11, 1, 55, 1, 20, 1, 9, 1], "わる": [32, 1, 5, 1, 34, 1, 6, 1, 7, 1], "をま": [4, 1, 16, 1, 5, 1, 41, 1], "を明": [24, 1, 56, 1], "を現": [7, 1, 69, 1], "を目": [47, 1, 14, 1, 58, 1, 14, 1], "を語": [14, 1, 19, 1], "んは": [25, 1], "ん使": [14, 1, 6, 1], "イダ": [27, 4, 61, 1, 1, 1], "イバ": [50, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 17, 1, 50, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "イム": [50, 1, 2, 1, 8, 1, 11, 1, 51, 1, 2, 1, 8, 1], "ェッ": [13, 2, 22, 3, 15, 1, 38, 1, 3, 1, 31, 1], "ェン": [66, 2], "クか": [110, 1], "クに": [24, 1], "クセ": [88, 1, 3, 1, 2, 1], "ザア": [24, 1], "シッ": [43, 1, 10, 1, 6, 1, 56, 1, 10, 1, 6, 1], "シャ": [99, 1], "シン": [25, 1, 2, 4, 61, 1, 1, 1, 22, 1], "セプ": [73, 1], "タル": [42, 3, 33, 1, 5, 1, 2, 1, 32, 3], "ダー": [0, 1, 1, 1, 12, 1, 14, 4, 53, 1, 5, 2, 1, 2, 2, 1, 1, 1, 1, 2, 3, 3, 1, 5, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 1, 1, 1, 12, 1, 3, 1, 1], "ック": [0, 2, 1, 1, 12, 2, 1, 1, 9, 1, 1, 1, 2, 1, 9, 3, 15, 1, 38, 1, 3, 1, 4, 2, 13, 2, 3, 6, 11, 1], "ディ": [100, 1, 7, 1], "デッ": [108, 1], "デン": [116, 1, 1, 1, 1, 1], "トツ": [0, 4, 3, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 4, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 31, 4, 1, 6, 1, 3, 1, 3, 1, 8, 1, 3, 1, 3, 1, 4, 1, 2, 1, 4, 1, 5, 1, 3, 1, 3, 1, 3, 1, 4, 3, 1, 1, 1, 3, 2, 1, 1, 3, 1, 20, 3], "ト側": [4, 1, 3, 1, 17, 1, 13, 1, 39, 1, 12, 1], "ト欄": [25, 1], "ネス": [22, 1, 41, 3, 41, 1, 31, 3], "ノリ": [19, 4], "バー": [50, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 17, 1, 16, 1, 3, 1, 31, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "パソ": [4, 1, 3, 1, 17, 1, 3, 1, 9, 1, 1, 1, 30, 2, 9, 1, 12, 1, 3, 1], "ファ": [2, 3, 7, 1, 5, 2, 9, 1, 11, 1, 2, 1, 4, 2, 26, 3, 1, 1, 1, 4, 1, 1, 3, 3, 8, 1, 10, 1, 3, 1, 2, 1, 5, 1, 11, 2], "ホで": [50, 1, 17, 1, 55, 1], "ムが": [50, 1, 72, 1], "ョン": [22, 1, 21, 6, 21, 2, 29, 1, 14, 1, 8, 10, 21, 1], "リテ": [50, 1, 22, 1, 50, 1], "リ試": [37, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "ルし": [49, 1, 72, 1], "ルで": [0, 1, 89, 1], "ルデ": [107, 1], "ワカ": [100, 1], "ンク": [44, 1, 31, 1, 3, 1, 4, 1, 2, 1, 2, 1, 9, 1, 13, 1, 2, 1, 6, 1], "ンタ": [43, 1, 7, 1, 5, 4, 11, 1, 6, 1, 8, 1, 31, 1, 4, 1, 7, 1, 5, 4], "ーへ": [14, 1], "ージ": [1, 3, 1, 1, 11, 1, 1, 1, 10, 3, 2, 1, 1, 1, 13, 1, 26, 2, 2, 2, 4, 1, 12, 1, 1, 4, 1, 3, 2, 2, 3, 1, 1, 1, 21, 2], "ート": [6, 1, 18, 1, 4, 1, 9, 1, 5, 1, 2, 1, 3, 2, 6, 1, 5, 1, 1, 1, 2, 1, 3, 1, 9, 1, 35, 1, 6, 1, 2, 1, 3, 2, 6, 1, 5, 1, 1, 1, 2, 1, 3, 1], "一般": [2, 1, 66, 1], "不利": [22, 1], "不安": [62, 1, 72, 1], "与上": [72, 1], "中特": [107, 1], "人件": [48, 2, 17, 1, 55, 2, 17, 1], "人化": [42, 1, 14, 1, 58, 1, 14, 1], "介し": [90, 1], "代は": [42, 1, 72, 1], "代替": [55, 6, 72, 8], "件を": [3, 1, 41, 1, 1, 1, 11, 1, 23, 1, 37, 1, 1, 1, 11, 1], "企業": [0, 2, 2, 2, 5, 3, 12, 1, 24, 3, 8, 1, 4, 1, 2, 2, 4, 2, 7, 3, 4, 2, 4, 3, 2, 5, 2, 3, 2, 3, 3, 3, 5, 1, 3, 1, 18, 1, 2, 2, 2, 3, 8, 1, 4, 1, 2, 2, 4, 2], "会う": [89, 1], "会テ": [14, 1, 19, 1], "会ブ": [95, 1], "作案": [61, 1, 72, 1], "作版": [4, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 26, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "例で": [28, 1], "供し": [13, 1], "備投": [47, 1, 4, 1, 9, 1, 59, 1, 4, 1, 9, 1], "元原": [36, 1], "入企": [51, 1, 4, 1, 68, 1, 4, 1], "入価": [52, 1, 72, 1], "全4": [66, 1], "具体": [3, 3, 23, 1, 2, 1, 3, 1, 27, 4, 15, 1, 55, 1, 1, 1, 1, 7, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "典つ": [66, 1], "円あ": [51, 1, 72, 1], "出て": [13, 1, 5, 1], "分あ": [18, 1], "分も": [20, 1], "分を": [0, 1, 13, 1], "制を": [46, 1, 12, 1, 60, 1, 12, 1], "前ド": [96, 1], "力し": [43, 1, 48, 1, 24, 1], "力デ": [91, 4], "力強": [72, 1], "助さ": [3, 3], "動向": [80, 1, 2, 1], "募に": [7, 1, 69, 1], "募開": [74, 1], "化を": [42, 1, 14, 1, 12, 1, 46, 1, 14, 1], "化進": [50, 1, 72, 1], "区分": [95, 1], "収益": [26, 1, 13, 1, 21, 1, 3, 3, 10, 2, 59, 1, 3, 5], "口実": [0, 1, 21, 1], "各地": [1, 1, 92, 1], "合い": [74, 1], "同じ": [66, 1], "否を": [92, 1], "命す": [0, 1], "品中": [62, 1, 72, 1], "品川": [0, 1, 111, 1], "商2": [28, 1], "問に": [24, 1, 3, 1, 49, 1, 52, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "善提": [43, 1, 72, 1], "喜館": [103, 1], "回り": [78, 1], "回出": [68, 1], "回決": [113, 1], "園の": [7, 1, 5, 1, 25, 1, 32, 1, 7, 1, 2, 1, 7, 1, 1, 1, 7, 1], "均3": [28, 1], "域か": [46, 1, 72, 1], "場負": [60, 1, 72, 1], "境規": [47, 1, 72, 1], "変動": [52, 1, 72, 1], "外も": [1, 1], "子が": [34, 1, 8, 1, 72, 1], "孝曉": [97, 1], "完全": [50, 1, 72, 1], "定化": [52, 1, 72, 1], "実に": [0, 1, 80, 1], "実際": [18, 1, 6, 1, 6, 1, 51, 1, 5, 2], "客の": [45, 1, 6, 2, 2, 2, 1, 1, 3, 1, 3, 1, 57, 1, 6, 2, 2, 2, 1, 1, 3, 3, 3, 1], "属人": [42, 1, 14, 1, 58, 1, 14, 1], "岐阜": [98, 1, 7, 1], "帰れ": [21, 1], "帳簿": [47, 2, 72, 2], "年数": [29, 1, 34, 1, 72, 1], "広く": [25, 1], "度も": [0, 1, 28, 1], "度を": [0, 1], "式に": [3, 1, 65, 1, 42, 1], "引企": [72, 1], "当た": [80, 2], "待ち": [28, 1], "律で": [2, 1], "後と": [60, 3, 72, 3], "得元": [84, 1], "必要": [2, 1, 11, 1, 7, 1, 27, 1, 16, 1, 1, 1, 1, 3, 3, 2, 5, 1, 46, 1, 16, 1, 1, 1, 1, 3], "応じ": [7, 1, 61, 1, 22, 1], "恐れ": [80, 1], "悠二": [99, 1], "悪化": [48, 2, 72, 2], "情報": [46, 1, 37, 4, 1, 4, 1, 3, 1, 4, 1, 4, 1, 4, 1, 1, 2, 1, 1, 3, 26, 1], "想は": [0, 2], "成果": [25, 1, 53, 2], "戦を": [0, 1, 78, 1], "批評": [0, 1], "拠が": [35, 1], "政治": [47, 3, 72, 4], "政運": [82, 1], "料仕": [52, 1, 72, 1], "新作": [96, 1], "方法": [13, 1, 11, 2, 61, 1], "族構": [80, 1], "日1": [113, 1], "明会": [112, 1, 1, 1], "明確": [24, 1, 49, 2], "昨年": [28, 1], "時の": [57, 1, 3, 3, 8, 1, 5, 1, 56, 1, 3, 4], "普及": [51, 1, 72, 1], "更新": [84, 1, 2, 3, 6, 1], "書い": [0, 2, 14, 1, 10, 1, 3, 1, 13, 1, 39, 1, 5, 1], "替手": [55, 1, 72, 1], "最後": [26, 1], "期ニ": [51, 1, 72, 1], "期費": [50, 1, 72, 1], "本8": [3, 1], "本全": [61, 1, 72, 1], "来メ": [108, 1], "林平": [107, 1], "果と": [78, 1], "査で": [0, 2, 3, 1, 16, 1, 4, 1, 21, 1, 72, 1], "査デ": [42, 1, 72, 1], "栄一": [96, 1], "格と": [13, 1], "械稼": [50, 1, 72, 1], "業務": [25, 1, 29, 1, 4, 1, 68, 1, 4, 1], "業等": [2, 1, 66, 2], "業継": [72, 1], "様ご": [86, 1], "機に": [79, 1, 10, 1], "止ま": [18, 1], "正式": [28, 1], "残し": [36, 1, 31, 1], "気代": [47, 1, 72, 1], "治具": [44, 1, 6, 1, 66, 1, 6, 1], "注側": [28, 1], "活性": [111, 1], "海道": [96, 4, 7, 4, 8, 1], "済的": [48, 3, 72, 4], "減圧": [49, 1, 5, 1, 67, 1, 5, 1], "濵﨑": [99, 2], "点さ": [3, 1, 5, 3], "照元": [80, 1, 8, 1], "率3": [49, 1, 72, 1], "理専": [64, 1, 72, 1], "甘い": [17, 1], "用い": [37, 1], "用水": [28, 1], "用約": [80, 1], "田県": [96, 1], "画で": [77, 1, 2, 1], "界全": [43, 1, 3, 1, 10, 1, 59, 1, 3, 1, 10, 1], "礼奈": [97, 1], "社な": [7, 1, 69, 1], "社ナ": [98, 1], "社伊": [101, 1], "社会": [43, 1, 6, 3, 29, 1, 2, 4, 35, 1, 6, 4], "社壺": [96, 1], "秒の": [15, 1], "移し": [24, 1], "税措": [72, 1, 8, 2], "稿に": [36, 1], "突き": [66, 1], "章が": [37, 1], "算3": [71, 1], "簿に": [86, 1, 16, 1], "組む": [56, 1, 72, 3], "経済": [19, 1, 29, 3, 15, 3, 10, 1, 7, 4, 2, 1, 3, 2, 28, 2, 7, 4, 15, 4], "継者": [3, 1, 7, 1, 59, 1, 9, 4, 1, 1, 1, 5, 2, 2, 11, 1], "続化": [0, 1, 2, 1, 7, 1, 5, 1, 9, 1, 45, 1], "者向": [93, 1], "者持": [2, 1, 66, 1], "能継": [49, 2, 72, 2], "脅威": [47, 2, 1, 2, 1, 2, 1, 2, 1, 4, 1, 1, 1, 2, 1, 1, 1, 4, 64, 2, 1, 2, 1, 2, 1, 2, 1, 5, 1, 1, 1, 4, 1, 1, 1, 5], "自分": [0, 2, 2, 2, 11, 1, 7, 1, 1, 1, 4, 1, 2, 2, 1, 1, 1, 3, 6, 1, 44, 1, 2, 1, 30, 1], "自然": [13, 1], "色の": [94, 1], "藤田": [97, 1], "規事": [28, 1, 3, 3, 47, 1, 1, 1], "設備": [28, 1, 4, 1, 13, 1, 2, 3, 4, 1, 2, 1, 3, 1, 3, 1, 1, 1, 5, 2, 6, 1, 1, 1, 45, 1, 2, 3, 4, 1, 2, 1, 3, 1, 3, 1, 1, 1, 5, 2], "評価": [0, 4, 44, 1, 2, 1, 33, 1, 10, 1, 27, 1, 2, 1], "認す": [0, 1, 23, 1, 1, 1, 47, 1], "誰が": [42, 2, 15, 2, 57, 1, 15, 1], "調査": [78, 1, 4, 1], "請で": [3, 1], "請受": [68, 1], "費率": [48, 1, 72, 1], "賀県": [99, 1, 2, 1], "資3": [51, 1, 72, 1], "資促": [80, 1], "資産": [59, 2, 72, 1], "賢亮": [96, 1], "起こ": [2, 3], "路開": [68, 1], "載内": [84, 1], "載情": [87, 1, 5, 1], "述が": [80, 1], "通商": [80, 2], "達一": [54, 1, 72, 1], "達成": [44, 1, 16, 1, 10, 1, 46, 1, 16, 1], "酒の": [101, 1], "金額": [68, 1, 2, 3, 13, 1, 1, 1, 1, 2], "開し": [28, 1], "開で": [36, 1, 1, 1, 30, 1], "開資": [78, 1], "間は": [37, 1], "関の": [71, 1], "関与": [54, 1, 72, 1], "関税": [72, 1, 8, 2], "限界": [42, 1, 72, 1], "集を": [113, 1], "電気": [47, 1, 57, 1, 15, 1], "青森": [96, 1], "面修": [57, 1, 72, 1], "題と": [78, 1], "類な": [88, 1], "養殖": [98, 1], "高い": [53, 1, 1, 1, 71, 1, 1, 1], "高澤": [97, 1]};
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_13 = {"0名": [102, 1, 7, 3], "1回": [38, 1, 5, 1, 3, 1, 39, 1, 24, 1, 6, 1, 3, 1], "30": [0, 1, 1, 1, 6, 4, 5, 1, 3, 1, 5, 1, 3, 2, 1, 2, 4, 1, 14, 1, 2, 1, 3, 1, 4, 1, 5, 1, 3, 1, 6, 1, 11, 4, 9, 1, 29, 1, 2, 1, 3, 1, 4, 1, 5, 1, 3, 1, 6, 1], "3章": [39, 1], "4次": [74, 1], "74": [28, 1], "7年": [0, 2, 3, 1, 4, 1, 4, 1, 7, 1, 10, 1, 40, 1, 8, 1, 2, 1, 1, 2, 1, 1], "85": [42, 1, 72, 1], "an": [71, 1, 17, 1, 6, 1, 6, 1], "bo": [40, 1, 50, 1, 19, 1], "cp": [24, 1, 1, 1, 2, 5, 61, 1], "eb": [64, 1, 1, 1, 1, 1, 24, 1, 19, 1, 27, 1, 1, 1], "er": [88, 1], "gd": [80, 1], "jg": [71, 1], "li": [27, 1, 20, 3, 72, 3], "ol": [47, 3, 3, 3, 44, 1, 25, 3, 3, 3], "ro": [25, 1, 63, 1], "ta": [61, 4, 72, 5], "ur": [27, 1, 61, 1, 6, 1], "vs": [27, 1], "wt": [80, 1], "あく": [82, 1], "あた": [69, 1], "いa": [25, 1], "いち": [78, 1, 11, 1], "い企": [57, 2, 72, 2], "い価": [79, 1], "うこ": [88, 1, 1, 1], "う連": [109, 3], "えフ": [66, 2], "お気": [26, 1, 83, 1], "かと": [19, 1], "かへ": [27, 1], "か月": [74, 1], "がど": [33, 1], "がら": [14, 1, 13, 1], "が変": [7, 1, 64, 1], "きな": [27, 1, 30, 1, 23, 1, 1, 1, 6, 3, 42, 1], "き上": [13, 2], "ぎに": [81, 1], "くれ": [0, 3, 25, 1, 1, 1, 1, 2], "く応": [37, 1], "く補": [69, 1], "けの": [24, 1, 4, 1, 7, 1, 43, 1, 10, 1, 5, 1], "げた": [27, 1], "こだ": [20, 1, 22, 1, 72, 1], "さア": [49, 1, 72, 1], "しい": [20, 3, 5, 1, 12, 1, 2, 1, 12, 1, 4, 1, 24, 1, 3, 1, 2, 1, 6, 1, 23, 1, 10, 1, 4, 1], "しつ": [56, 1, 72, 1], "し協": [72, 1], "じ内": [66, 1], "ずで": [25, 1], "そり": [105, 1], "そ株": [108, 1], "たが": [42, 1, 46, 1, 26, 1], "た経": [89, 1], "ちの": [22, 3, 59, 1], "つ品": [56, 1, 72, 1], "て3": [20, 1], "てc": [47, 1, 72, 1], "て申": [3, 1], "て考": [20, 1], "で4": [48, 1, 72, 1], "でい": [78, 1], "でご": [25, 1], "でつ": [78, 1], "でや": [37, 1], "で答": [66, 1], "で約": [74, 1], "とづ": [83, 1], "と何": [2, 3, 37, 1], "と別": [7, 1, 69, 1], "どう": [19, 1, 2, 3, 1, 6, 5, 1, 2, 1, 4, 2, 57, 1, 19, 3], "なし": [23, 1, 11, 3, 1, 1, 7, 1, 72, 1], "なシ": [45, 1, 72, 1], "なプ": [25, 1], "にと": [14, 1], "によ": [14, 1, 5, 1, 25, 1, 1, 1, 1, 1, 4, 1, 5, 1, 1, 1, 3, 2, 1, 1, 2, 2, 7, 1, 2, 1, 1, 2, 1, 1, 19, 1, 24, 1, 1, 1, 1, 1, 4, 1, 5, 1, 1, 1, 3, 2, 1, 1, 2, 2], "にエ": [68, 1], "に付": [79, 1], "に合": [0, 1, 74, 1, 12, 1, 9, 1], "に存": [53, 1, 72, 1], "に書": [40, 1], "に済": [24, 1], "に興": [28, 1], "に表": [94, 1], "に記": [85, 1, 17, 1], "のか": [0, 1, 37, 1, 7, 2, 1, 2, 1, 2, 10, 3, 21, 1, 2, 1, 37, 1, 1, 1, 1, 1, 10, 3], "のに": [27, 1, 53, 1], "のカ": [110, 1, 1, 1], "のセ": [93, 1], "のニ": [57, 1, 72, 3], "のル": [42, 3, 72, 3], "の下": [37, 1], "の事": [2, 1, 20, 3, 7, 1, 18, 1, 21, 3, 51, 1], "の例": [28, 2, 107, 2], "の力": [78, 1, 1, 1], "の手": [13, 1, 24, 1, 36, 1], "の構": [0, 5, 1, 3, 1, 3, 1, 3, 14, 1, 33, 1, 30, 2, 42, 1], "の活": [7, 1, 21, 1, 4, 3, 3, 1, 41, 1, 3, 1], "の減": [78, 1, 2, 1], "の立": [29, 1], "の系": [80, 3], "の蓋": [71, 1], "の見": [7, 1, 8, 1, 13, 2, 7, 1, 36, 1, 5, 1, 10, 1], "の運": [28, 1, 81, 1], "の開": [44, 1, 9, 1, 7, 1, 53, 2, 3, 1, 9, 1, 7, 1], "は公": [3, 1, 71, 1, 10, 1], "は経": [7, 1, 69, 1], "は行": [87, 1], "は責": [92, 1], "ば伝": [77, 1], "ば保": [36, 1, 31, 1], "ぶこ": [40, 1], "べて": [115, 1], "まか": [0, 1], "ませ": [0, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 2, 6, 1, 1, 1, 3, 1, 2, 1, 1, 1, 4, 1, 3, 2, 1, 2, 8, 1, 1, 1, 37, 1, 2, 2, 5, 1, 6, 2, 1, 3, 3, 2, 1, 2], "まる": [3, 1, 4, 1, 28, 1, 33, 1, 8, 1], "ま残": [17, 1], "ま見": [39, 1], "みが": [39, 1, 40, 1], "みれ": [22, 1], "み込": [36, 2, 31, 2], "む中": [68, 1], "めの": [0, 2, 24, 1, 55, 1], "めま": [28, 1], "も使": [19, 1, 17, 1], "も可": [72, 1], "も実": [86, 1], "やめ": [37, 1], "らう": [24, 1, 10, 3], "ら取": [28, 1, 12, 1, 44, 1, 1, 3], "ら準": [74, 1], "ら逆": [12, 1], "りで": [1, 1, 17, 1, 1, 1, 24, 1, 72, 1], "り大": [46, 1, 72, 1], "り複": [3, 1], "り資": [20, 1], "ると": [2, 3, 6, 3, 3, 1, 3, 1, 4, 1, 4, 2, 2, 1, 1, 2, 3, 2, 1, 1, 7, 1, 4, 1, 26, 1, 8, 1, 4, 1, 1, 1, 1, 1], "るよ": [27, 1, 56, 1], "る予": [80, 1], "る先": [28, 1], "る全": [14, 1], "る常": [66, 1], "る部": [13, 1], "る高": [56, 1, 72, 1], "れら": [111, 1], "われ": [17, 1, 7, 1], "をた": [77, 1], "を使": [7, 1, 6, 1, 11, 1, 1, 2, 7, 1, 34, 1, 10, 1, 12, 2], "を実": [32, 1, 12, 1, 1, 2, 1, 1, 10, 1, 24, 1, 6, 1, 30, 1, 1, 2, 1, 1, 10, 1], "を承": [20, 1], "を描": [22, 1], "を支": [28, 1, 15, 1, 25, 3, 24, 1, 23, 1], "を機": [79, 1, 10, 1], "を氏": [86, 1], "んだ": [25, 1, 3, 1, 13, 1, 25, 3, 22, 1], "アク": [88, 1, 3, 1], "アタ": [111, 1], "イチ": [80, 1], "ウッ": [100, 1], "ウン": [100, 1], "ジュ": [73, 1, 1, 3], "ステ": [42, 1, 2, 1, 6, 2, 9, 1, 6, 2, 3, 1, 23, 1, 23, 1, 2, 1, 6, 2, 9, 1, 6, 2], "ソナ": [57, 2, 72, 1], "ター": [28, 1, 14, 1, 1, 1, 2, 1, 5, 1, 5, 5, 2, 1, 4, 1, 10, 1, 1, 1, 1, 1, 7, 1, 31, 2, 3, 1, 1, 1, 2, 1, 5, 1, 5, 5, 2, 3, 4, 1], "ッグ": [34, 1], "ティ": [50, 1, 14, 1, 8, 1, 19, 1, 31, 1, 14, 1], "トフ": [51, 1, 72, 1], "ト工": [108, 1], "ベテ": [44, 1, 12, 1, 60, 1, 12, 1], "ペし": [25, 1], "マに": [40, 1], "マニ": [44, 1, 5, 2, 7, 1, 3, 1, 57, 1, 5, 2, 7, 1, 3, 1], "マホ": [4, 1, 3, 1, 17, 1, 1, 1, 11, 1, 1, 1, 13, 1, 16, 1, 1, 2, 9, 1, 12, 1, 3, 1, 31, 1], "マル": [99, 1, 6, 1], "ュア": [44, 1, 5, 2, 7, 1, 3, 1, 57, 1, 5, 2, 7, 1, 3, 1], "ラウ": [24, 1, 12, 2, 31, 2, 21, 2], "ラブ": [105, 1, 29, 1], "リで": [19, 3, 5, 1, 3, 1], "ルと": [66, 1], "レス": [72, 1, 13, 1], "レベ": [50, 1, 72, 1], "ロナ": [42, 1, 72, 1], "ワー": [56, 1, 3, 1, 52, 1, 17, 1, 3, 1], "ング": [49, 1, 13, 1, 2, 1, 8, 1, 19, 1, 5, 1, 3, 1, 6, 1, 2, 1, 14, 1, 13, 1, 2, 1], "ンダ": [110, 1, 1, 12, 1, 3], "ンバ": [0, 1, 1, 1, 12, 1, 67, 1, 5, 2, 1, 2, 4, 2, 3, 3, 1, 5, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 4, 1], "ーす": [24, 1, 91, 1], "ース": [43, 1, 29, 1, 2, 1, 11, 2, 30, 1], "ード": [23, 1, 15, 1, 2, 6, 12, 1, 8, 1, 64, 1, 8, 1], "ーラ": [105, 1], "ー等": [72, 1], "上で": [57, 1, 3, 1, 20, 1, 49, 1, 3, 1], "上乗": [70, 1], "上昇": [48, 3, 22, 1, 2, 1, 48, 3], "下書": [36, 1, 31, 1], "世代": [42, 1, 1, 1, 71, 1, 1, 1], "丸工": [106, 1], "交流": [43, 1, 3, 1, 69, 1, 3, 1], "人気": [42, 1, 72, 1], "他3": [65, 1, 72, 1], "付入": [1, 1], "会で": [0, 1, 79, 1], "会長": [46, 1, 72, 1], "低下": [48, 1, 1, 1, 71, 1, 1, 1], "佑亮": [99, 1], "何も": [0, 2], "何を": [25, 1, 2, 1, 2, 1, 2, 1, 11, 2, 15, 2, 20, 1, 37, 1, 15, 1], "作ら": [37, 1], "価の": [45, 1, 6, 1, 66, 1, 6, 1, 12, 1], "優遇": [0, 3, 2, 3, 1, 1, 6, 1, 14, 1, 24, 1, 21, 10, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 44, 1], "充を": [80, 1], "全日": [111, 1], "典情": [86, 1], "再確": [68, 1], "出し": [0, 2, 13, 1, 1, 1, 4, 1, 6, 1, 2, 2, 8, 1, 1, 1, 1, 3, 3, 1, 1, 4, 27, 3], "出率": [53, 1, 72, 1], "分解": [68, 1], "切や": [110, 1], "力と": [66, 1], "功後": [60, 3, 72, 3], "務化": [47, 1, 72, 1], "務取": [90, 1], "勝出": [95, 1], "募が": [74, 1, 7, 1], "区切": [36, 1, 31, 1], "双方": [78, 1], "台頭": [80, 1], "命発": [85, 1], "品の": [28, 1, 27, 1, 72, 3], "員の": [17, 1, 4, 1, 13, 1], "問題": [19, 1, 30, 1, 72, 1], "回か": [96, 3, 1, 6, 1, 1, 1, 2, 1, 2, 1, 1], "回に": [3, 1], "回る": [43, 1, 72, 1], "回任": [85, 2, 24, 2], "国決": [14, 1], "園は": [0, 1, 24, 1, 48, 3], "型案": [46, 1, 72, 1], "城ホ": [111, 1], "域経": [73, 1, 7, 1], "埼玉": [97, 1], "報の": [92, 1], "変化": [50, 1, 5, 1, 25, 3, 42, 1, 5, 1], "失の": [80, 1], "好循": [78, 1, 2, 1], "委員": [0, 2, 2, 1, 7, 1, 5, 1, 3, 1, 4, 1, 13, 1], "威の": [51, 2, 4, 2, 68, 1, 4, 1], "嫁の": [48, 1, 72, 1], "存さ": [4, 1, 3, 1, 17, 1, 3, 1, 7, 1, 2, 1, 1, 1, 30, 1, 9, 1, 12, 1, 3, 1], "存法": [47, 1, 72, 1], "定し": [14, 1, 34, 1, 72, 1], "定で": [28, 1, 43, 1], "定受": [44, 1, 72, 1], "定指": [51, 2, 1, 2, 1, 2, 1, 2, 1, 2, 68, 1, 1, 1, 1, 1, 1, 1, 1, 1], "実行": [80, 1], "対立": [80, 1], "尾に": [85, 1], "山崎": [100, 1], "岡崎": [105, 1], "川上": [100, 1], "年1": [0, 2, 12, 1, 6, 1, 27, 1, 16, 1, 7, 1, 49, 1, 16, 1], "庁の": [80, 1], "式公": [28, 1], "式呼": [80, 1], "強い": [80, 1], "形は": [20, 1, 3, 1], "径1": [53, 1, 72, 1], "後継": [0, 2, 1, 1, 2, 1, 7, 1, 5, 1, 20, 1, 34, 1, 9, 4, 1, 1, 1, 5, 2, 2, 11, 1], "応す": [58, 1, 72, 1], "念も": [56, 1, 72, 1], "感が": [19, 3, 11, 1], "懸念": [80, 1], "技能": [49, 3, 72, 3], "押す": [25, 1, 9, 1, 60, 1], "拓数": [54, 1, 72, 1], "持の": [79, 1], "採択": [87, 1], "携し": [68, 1], "携で": [49, 1, 9, 1, 63, 1, 9, 1], "文つ": [1, 1], "文や": [77, 1], "料商": [52, 1, 72, 1], "新設": [56, 1, 30, 1, 42, 1], "日あ": [13, 1], "日を": [84, 1], "日時": [85, 1, 28, 1], "時は": [113, 1], "時期": [7, 1, 69, 1, 8, 1], "景が": [81, 1], "最初": [14, 1, 6, 1, 3, 1, 15, 1, 33, 1], "最短": [28, 1], "月5": [63, 1, 72, 1], "月以": [0, 1, 7, 1, 50, 1, 19, 1, 53, 1], "本方": [82, 1], "本物": [34, 1], "来を": [14, 1, 8, 1, 11, 1], "果有": [97, 1], "果物": [25, 1], "格安": [52, 1, 72, 1], "格改": [54, 1, 72, 1], "案内": [1, 3], "森屋": [97, 1], "業な": [7, 1, 69, 1], "業会": [46, 1, 26, 1, 46, 1], "業基": [7, 1, 69, 1], "業届": [71, 1], "業株": [97, 2, 1, 1, 8, 1, 2, 1], "様々": [13, 1], "標準": [42, 1, 10, 1, 1, 1, 3, 1, 3, 1, 3, 1, 52, 1, 10, 1, 1, 1, 3, 1, 3, 1, 3, 1], "模の": [133, 1], "次の": [7, 1, 32, 1, 21, 2, 72, 1], "気や": [19, 1], "求は": [51, 1, 72, 1], "決し": [31, 1], "決算": [71, 1], "注サ": [28, 1], "活用": [7, 1, 13, 1, 8, 1, 4, 3, 3, 1, 12, 1, 29, 1, 3, 1, 40, 1], "派手": [22, 1], "添え": [80, 1], "温度": [44, 1, 72, 1], "潟県": [97, 1], "点化": [49, 1, 72, 1], "特化": [51, 1, 7, 1, 22, 1, 43, 1, 7, 1], "現任": [94, 2], "理想": [43, 1, 72, 1], "用サ": [57, 1, 72, 1], "由の": [88, 1], "画と": [14, 1], "療機": [42, 1, 2, 1, 13, 1, 57, 1, 2, 1, 13, 1], "的要": [47, 1, 1, 1, 1, 1, 1, 1, 69, 3, 1, 3, 1, 3, 1, 3], "益性": [60, 1, 13, 1, 59, 1], "盤1": [42, 1, 72, 1], "目に": [2, 1, 108, 1, 4, 1], "省の": [85, 2, 28, 1], "石材": [100, 1], "示し": [12, 1], "示文": [25, 2, 2, 1, 7, 3, 4, 1, 1, 1, 27, 4, 22, 1], "社か": [44, 1, 72, 1], "社に": [28, 1, 16, 1, 72, 1], "社カ": [96, 1, 4, 1, 4, 1], "社電": [106, 1], "私の": [77, 1, 2, 3, 3, 1], "程と": [110, 3, 1, 3, 1, 3, 1, 3], "空気": [19, 4], "競っ": [39, 1], "約1": [74, 1, 5, 1, 1, 1], "終わ": [0, 1, 27, 1, 10, 1, 1, 1], "給元": [52, 1, 72, 1], "続で": [78, 1, 1, 1], "続性": [73, 1], "続率": [51, 1, 72, 1], "総本": [96, 1], "績か": [28, 1], "置に": [72, 1], "者2": [64, 1, 72, 1], "者を": [113, 1], "者育": [80, 1, 2, 1], "育期": [49, 1, 72, 1], "能な": [45, 1, 72, 1], "自性": [59, 1, 57, 1, 1, 1, 1, 1, 13, 3], "良県": [99, 1], "行す": [80, 1], "行審": [34, 3, 52, 1], "術提": [62, 1, 72, 1], "表さ": [110, 1], "表サ": [72, 1], "表者": [0, 1, 8, 1, 64, 1], "補助": [0, 6, 1, 1, 1, 4, 1, 8, 4, 1, 1, 1, 2, 1, 1, 2, 3, 6, 1, 1, 4, 1, 2, 1, 2, 2, 14, 1, 10, 4, 18, 1, 3, 9, 1, 8, 1, 10, 1, 4, 1, 3, 1, 3, 1, 3, 1, 4, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 3, 2, 1, 1, 33, 4, 18, 1], "要の": [24, 1], "見え": [30, 1, 9, 1, 38, 1, 2, 1, 2, 1], "規格": [27, 1], "解析": [88, 1], "計5": [64, 1, 1, 1, 71, 1, 1, 1], "計さ": [78, 1], "計段": [54, 1, 72, 1], "記さ": [40, 1], "記入": [42, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 50, 1], "設ペ": [2, 1], "設定": [27, 2], "設株": [99, 1], "証す": [92, 1], "話の": [27, 1], "詳細": [1, 1, 2, 1, 55, 2, 11, 3, 6, 1, 55, 1], "詳述": [68, 1], "認定": [44, 1, 27, 1, 1, 3, 15, 1, 29, 1], "請書": [5, 4, 7, 1, 1, 4, 10, 1, 1, 2, 43, 1, 4, 1, 21, 1], "買い": [36, 1, 18, 4, 13, 1, 59, 6], "費用": [50, 1, 72, 1], "質で": [42, 1, 72, 1], "践を": [43, 1, 72, 1], "輸入": [48, 1, 72, 1], "通し": [73, 1], "通算": [71, 1], "造業": [7, 1, 36, 1, 3, 1, 3, 2, 5, 1, 7, 2, 15, 1, 39, 1, 3, 1, 3, 2, 5, 1, 7, 2], "進み": [4, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "運用": [28, 1], "運輸": [7, 1, 69, 1], "過去": [28, 1, 65, 1, 9, 1], "道だ": [89, 1], "適化": [52, 1, 72, 1], "重な": [3, 1], "金の": [0, 2, 3, 2, 11, 4, 1, 1, 4, 1, 4, 2, 16, 1, 29, 1, 8, 1, 2, 2, 2, 1], "金属": [28, 1], "録は": [27, 1, 65, 1], "長い": [34, 1], "長年": [28, 1], "間だ": [22, 1], "関わ": [29, 1, 3, 1, 52, 1], "閣議": [82, 1], "降り": [18, 1], "階か": [54, 1, 72, 1], "階に": [68, 1], "音声": [66, 1], "項を": [92, 1], "頭な": [3, 1], "頼す": [13, 1], "類型": [80, 1], "高評": [44, 1, 72, 1], "龍太": [107, 1]};
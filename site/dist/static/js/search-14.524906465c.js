@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_14 = {"0社": [53, 1, 8, 1, 2, 1, 62, 1, 8, 1, 2, 1], "20": [0, 3, 2, 2, 1, 3, 5, 1, 3, 2, 1, 1, 2, 2, 4, 1, 10, 3, 9, 1, 1, 1, 4, 4, 2, 1, 3, 2, 6, 1, 8, 1, 2, 1, 2, 1, 3, 2, 1, 1, 5, 6, 1, 3, 3, 4, 1, 2, 1, 7, 2, 3, 3, 8, 1, 6, 16, 1, 7, 4, 4, 4, 1, 4, 2, 1, 3, 2, 6, 1, 8, 1, 2, 2, 2, 1], "2章": [39, 1, 41, 1], "3次": [74, 1], "42": [86, 1, 9, 3, 14, 1, 4, 1], "4時": [45, 1, 14, 1, 1, 1, 57, 1, 14, 1, 1, 1], "6つ": [1, 1], "6年": [0, 1, 3, 2, 9, 1, 56, 1, 1, 1, 5, 2, 5, 1, 3, 1, 3, 1, 24, 3], "8件": [61, 1, 72, 1], "97": [28, 1], "a支": [80, 1], "ca": [28, 2, 35, 4, 2, 2, 70, 3, 2, 1], "db": [42, 1, 72, 1], "ec": [0, 1, 2, 2, 7, 1, 14, 1, 25, 3, 2, 3, 18, 1, 26, 1, 26, 3, 2, 3], "es": [39, 2, 7, 1, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 25, 1, 14, 2, 25, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "ge": [25, 1, 2, 1, 13, 1, 54, 1], "iで": [13, 1, 12, 1, 1, 1, 40, 1], "ki": [88, 1, 6, 1], "ky": [2, 1], "k等": [111, 1], "om": [48, 3, 13, 4, 59, 3, 13, 5], "rp": [63, 3, 72, 2], "r数": [116, 1, 1, 1, 1, 1], "sa": [40, 1, 21, 4, 72, 5], "us": [2, 1], "we": [64, 1, 1, 1, 1, 1, 47, 1, 23, 1, 1, 1], "いも": [43, 1, 72, 1], "いを": [43, 1, 72, 1], "い関": [54, 1, 72, 1], "う場": [109, 1], "う研": [68, 1], "えて": [2, 1, 22, 1, 1, 1, 2, 1, 1, 1, 2, 1, 36, 1, 8, 1, 3, 1, 3, 1, 9, 1], "かす": [81, 3], "かど": [19, 1, 3, 1], "から": [0, 5, 1, 2, 1, 1, 1, 1, 4, 3, 5, 5, 1, 5, 1, 4, 1, 3, 3, 1, 1, 3, 1, 1, 1, 1, 3, 6, 1, 1, 2, 4, 1, 5, 4, 1, 3, 2, 1, 1, 1, 2, 3, 2, 2, 3, 1, 1, 1, 1, 2, 2, 1, 1, 7, 1, 2, 1, 11, 2, 4, 2, 3, 3, 2, 2, 1, 1, 1, 1, 1, 5, 1, 1, 4, 2, 1, 4, 1, 3, 3, 1, 1, 1, 4, 3, 2, 3, 1, 6, 1, 1, 1, 2, 1, 2, 1, 1, 8, 1, 1, 1, 4, 5, 1, 1, 1, 1, 2, 2, 1, 1, 7, 1, 2, 1], "か挙": [16, 1], "がな": [3, 1, 4, 1, 17, 1, 52, 1], "がり": [78, 1], "がリ": [45, 1, 72, 1], "が人": [2, 1], "が今": [28, 1], "が出": [38, 1, 2, 4, 42, 1], "が半": [53, 1, 72, 1], "が厚": [42, 1, 72, 1], "が固": [28, 1], "が届": [0, 1, 11, 1, 3, 1, 4, 1, 6, 2, 4, 1, 58, 1], "が決": [3, 1, 75, 1], "が町": [42, 1, 72, 1], "が発": [57, 1, 72, 1], "が確": [36, 1, 31, 1, 5, 2], "が自": [27, 1, 46, 1], "きか": [37, 1, 51, 1], "きせ": [40, 1], "きる": [0, 2, 1, 1, 16, 1, 22, 1, 3, 1, 30, 2, 13, 1, 8, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 5, 1], "き手": [78, 1], "くそ": [67, 1], "く追": [39, 1], "けた": [22, 1, 1, 1], "け可": [59, 3, 72, 3], "げ加": [72, 1], "さん": [21, 1, 4, 1], "しさ": [53, 2, 72, 1], "し若": [49, 1, 72, 1], "じて": [7, 1, 21, 1, 2, 4, 38, 1, 10, 1], "すし": [19, 1], "すで": [40, 1], "す指": [25, 1, 14, 1], "す文": [25, 1], "せら": [27, 1], "ぜ自": [56, 3, 3, 3, 69, 3, 3, 3], "たキ": [48, 1, 72, 1], "た中": [41, 3], "た損": [92, 1], "ちた": [22, 1], "つあ": [78, 1, 1, 1], "つも": [19, 1, 8, 1], "てい": [0, 1, 5, 1, 1, 1, 1, 3, 5, 1, 1, 2, 1, 2, 1, 3, 2, 1, 3, 2, 4, 2, 1, 1, 3, 5, 1, 2, 1, 5, 3, 1, 2, 2, 2, 2, 2, 2, 17, 1, 10, 1, 2, 2, 1, 2, 3, 3, 4, 3, 1, 1, 1, 7, 1, 4, 1, 3, 1, 1, 2, 2, 1, 4, 1, 3, 1, 2, 2, 3, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 15, 1, 18, 1], "で5": [80, 1], "で何": [25, 1, 43, 1, 9, 1], "で工": [50, 1, 72, 1], "で待": [28, 2], "とユ": [63, 1, 72, 3], "と他": [81, 1], "どで": [21, 1], "ど強": [31, 1], "なと": [17, 1], "なエ": [66, 1], "な計": [71, 1], "にど": [27, 1], "にド": [34, 1, 6, 1], "に利": [0, 1, 19, 1], "に変": [28, 2, 58, 1], "に審": [27, 1], "に役": [25, 1], "に悩": [68, 1], "に早": [89, 1], "に特": [51, 1, 29, 1, 43, 1], "に継": [42, 1, 14, 1, 58, 1, 14, 1], "に載": [72, 3, 11, 1], "ねる": [43, 1, 72, 1], "のが": [18, 3, 18, 1, 31, 1, 12, 1], "のぼ": [80, 1], "のボ": [25, 1, 2, 1, 11, 1], "の作": [92, 1], "の公": [3, 1, 11, 1, 55, 1, 6, 1, 9, 1, 2, 3, 6, 1, 17, 1], "の双": [78, 1], "の同": [28, 1], "の完": [20, 1], "の後": [0, 2, 1, 1, 2, 2, 7, 1, 4, 2, 6, 1, 4, 1, 44, 1, 11, 1], "の応": [7, 1, 17, 1, 52, 1, 3, 1], "の検": [40, 1], "の県": [86, 1], "の経": [1, 1, 21, 1, 6, 1, 4, 3, 3, 1, 7, 1, 29, 1, 7, 2, 1, 1, 1, 2, 13, 1, 21, 1], "の補": [0, 2, 3, 2, 11, 1, 1, 1, 8, 1, 5, 1, 9, 1, 32, 1, 7, 1], "の説": [86, 1], "はき": [0, 1], "はそ": [14, 1, 65, 1, 2, 1], "は中": [19, 1], "は前": [17, 1], "は業": [25, 1], "は納": [57, 1, 72, 1], "は認": [87, 1], "は都": [0, 1], "は重": [72, 1], "ぴあ": [111, 1], "ほど": [0, 1, 31, 1], "まれ": [0, 1, 7, 3, 69, 3, 3, 1, 9, 1], "ま貼": [26, 1], "みそ": [105, 1, 3, 1], "み保": [88, 1], "み重": [43, 1, 72, 1], "むの": [28, 1, 13, 1], "めた": [4, 1, 8, 1, 19, 1, 4, 1], "も一": [36, 1, 20, 1, 10, 1, 1, 1, 61, 1], "も子": [22, 1], "も言": [0, 2], "よう": [24, 1, 1, 1, 2, 1, 8, 1, 31, 1, 15, 1, 2, 1], "らで": [7, 1, 7, 1, 62, 1], "ら受": [43, 1, 72, 1], "ら指": [44, 1, 72, 1], "りと": [1, 1, 41, 1, 72, 1], "り付": [25, 1, 1, 1, 54, 1], "り単": [44, 1, 72, 1], "り版": [6, 3, 18, 1, 2, 1], "る変": [84, 1], "る方": [24, 2], "る根": [35, 1], "る静": [91, 1], "れな": [0, 2, 17, 1, 11, 1], "を一": [91, 1], "を占": [54, 1, 72, 1], "を地": [1, 1, 85, 2], "を声": [35, 1], "を提": [11, 1, 2, 1, 7, 1], "を新": [31, 1, 55, 1], "を満": [3, 1, 76, 1], "を着": [80, 1], "を言": [0, 1], "を負": [92, 1], "ァミ": [80, 1], "ア0": [61, 1, 72, 1], "アム": [45, 1, 35, 1, 37, 1], "イア": [47, 1, 72, 1], "カラ": [94, 1], "ギー": [80, 1], "ギ本": [69, 1], "クロ": [80, 1], "グの": [91, 1], "コメ": [0, 2, 1, 1, 1, 2, 7, 1, 5, 1, 3, 1, 1, 1, 3, 1, 13, 1], "サン": [57, 1, 1, 1, 71, 1, 1, 1], "シフ": [45, 1, 3, 1, 69, 1, 3, 1], "シュ": [48, 1, 72, 1], "セス": [13, 1, 60, 1, 15, 1, 3, 1], "チ機": [66, 2], "ッケ": [105, 1], "ッチ": [0, 1, 14, 1, 58, 1, 7, 1], "ネル": [80, 1], "パタ": [71, 1], "フィ": [23, 1], "ホス": [91, 1], "ボリ": [6, 4, 18, 1, 2, 1, 10, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 47, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "マー": [64, 1, 72, 1], "ムの": [24, 1, 1, 1, 10, 1, 7, 1, 9, 1, 20, 1, 43, 1, 9, 1], "ム導": [42, 1, 72, 1], "リへ": [6, 1], "ルド": [97, 1], "ロか": [28, 1, 4, 1], "ロセ": [13, 1, 60, 1], "ーズ": [13, 3, 38, 1, 6, 6, 16, 1, 50, 1, 6, 7], "ーリ": [56, 2, 43, 1, 29, 1], "ー株": [98, 1], "ー確": [48, 1, 72, 1], "一郎": [96, 1], "上書": [40, 1], "上計": [72, 1], "中に": [0, 2, 27, 1, 64, 1], "中程": [51, 1, 4, 1, 68, 1, 4, 1], "中身": [13, 3, 11, 3, 3, 1, 9, 1, 3, 1, 2, 3, 26, 1, 4, 1], "主義": [56, 1, 72, 1], "事務": [24, 1, 23, 2, 17, 1, 22, 1, 23, 1, 10, 2, 17, 1], "井口": [97, 2], "京建": [111, 1], "人と": [3, 1], "介す": [109, 1], "件達": [70, 1], "会と": [22, 1, 58, 1], "会へ": [14, 1, 5, 1], "会計": [72, 1], "作り": [0, 1, 28, 1], "作リ": [60, 1, 72, 1], "使命": [43, 2, 72, 1], "価は": [0, 1], "信は": [35, 1], "値を": [79, 1], "働供": [78, 1, 2, 3], "優先": [87, 1], "入っ": [35, 1], "再開": [36, 1, 1, 1, 30, 1], "出典": [66, 2, 9, 3, 5, 8, 2, 3, 2, 1, 1, 4, 7, 1, 17, 2, 1, 1, 1, 9, 2, 5], "初に": [38, 1, 33, 1], "利率": [48, 2, 72, 2], "制整": [47, 1, 72, 1], "制約": [78, 1, 2, 3], "前に": [7, 1, 27, 1, 42, 1, 16, 1], "力点": [78, 1, 1, 1], "加導": [47, 1, 72, 1], "助率": [3, 1, 7, 1, 60, 4], "効率": [42, 1, 8, 1, 6, 1, 58, 1, 8, 1, 6, 1], "参加": [1, 3, 18, 2, 3, 1, 1, 1, 31, 1, 72, 1], "取組": [68, 1, 5, 5], "古参": [42, 1, 72, 1], "可能": [2, 1, 11, 1, 32, 1, 5, 1, 1, 1, 8, 3, 14, 1, 44, 1, 5, 1, 1, 1, 8, 3], "合う": [0, 1], "合他": [46, 1, 16, 1, 56, 1, 16, 3], "合理": [19, 1], "合試": [4, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "向調": [82, 1], "員た": [0, 1], "員は": [0, 1], "因の": [47, 1, 1, 1, 1, 1, 1, 1, 69, 3, 1, 3, 1, 3, 1, 3], "国際": [80, 1], "園加": [72, 1], "地の": [1, 1, 92, 1], "城県": [96, 1, 1, 1], "域ネ": [56, 1, 72, 1], "域製": [46, 1, 3, 1, 69, 1, 3, 1], "執念": [43, 1, 72, 1], "報は": [84, 1, 4, 1, 3, 1], "場も": [81, 1], "場を": [42, 1, 39, 1, 33, 1], "場面": [3, 1], "多様": [79, 1, 1, 1], "妥当": [73, 2], "存度": [54, 1, 6, 1, 66, 1, 6, 1], "存競": [53, 4, 72, 6], "守6": [65, 1, 72, 1], "安で": [48, 1, 72, 1], "定と": [79, 1], "客満": [60, 1, 72, 1], "対応": [27, 1, 18, 3, 2, 3, 2, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 2, 1, 1, 2, 1, 1, 1, 2, 2, 2, 11, 1, 44, 3, 2, 3, 2, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 2, 1, 1, 2, 1, 1, 1, 2, 2, 2], "専門": [28, 1, 34, 1, 25, 1, 47, 1], "小ロ": [28, 1, 23, 1, 72, 1], "少は": [78, 1], "岡は": [95, 1], "崎県": [101, 2, 7, 2], "崎竜": [105, 1], "崎薬": [101, 1], "年2": [46, 1, 72, 1], "年齢": [78, 1, 2, 1, 1, 1], "庁は": [78, 1], "度ご": [80, 3], "式ポ": [75, 1, 7, 1], "当1": [64, 1, 72, 1], "当パ": [71, 1], "影響": [72, 1], "得日": [92, 1], "忙し": [20, 3, 5, 1], "戻す": [26, 3], "打ち": [123, 1, 1, 1, 1, 1, 1, 1, 1, 1], "承認": [57, 1, 14, 1, 58, 1], "担当": [28, 1, 1, 1, 35, 1, 72, 1], "持た": [91, 1], "推薦": [85, 2], "描き": [22, 1], "援を": [80, 1], "数の": [0, 1, 13, 1, 67, 1], "文づ": [1, 1, 13, 1], "文フ": [34, 1], "料で": [30, 1], "新の": [69, 1, 23, 1], "新城": [108, 1], "方で": [84, 1], "方大": [0, 3, 2, 2, 7, 1, 2, 1, 3, 3, 4, 1, 1, 1, 49, 4, 17, 2, 1, 1, 9, 2, 14, 1, 2, 6, 1, 1], "更時": [73, 1], "最低": [48, 1, 72, 1], "月6": [3, 1, 66, 1, 13, 1], "有し": [46, 1, 72, 1], "本人": [69, 1, 16, 1, 1, 1], "東圏": [61, 2, 72, 2], "校生": [43, 1, 72, 1], "格決": [54, 1, 72, 1], "案件": [28, 1, 16, 1, 1, 2, 1, 1, 2, 1, 5, 1, 2, 1, 1, 1, 5, 2, 2, 1, 53, 1, 1, 2, 1, 1, 2, 1, 5, 1, 2, 1, 1, 1, 5, 2, 2, 1], "械導": [42, 1, 72, 1], "森県": [96, 1], "業か": [42, 1, 72, 3], "業に": [7, 1, 69, 1, 6, 1], "業主": [71, 1], "業手": [42, 1, 72, 1], "業構": [0, 1, 2, 1, 21, 1], "業活": [111, 1], "業費": [70, 1], "構築": [46, 1, 4, 1, 3, 1, 5, 1, 22, 1, 38, 1, 4, 1, 3, 1, 5, 1], "様化": [80, 1], "模感": [29, 1], "機能": [66, 3], "次実": [74, 1], "正価": [62, 1, 72, 1], "正要": [58, 1, 72, 1], "武藤": [96, 2], "歴を": [86, 1], "歴史": [42, 1, 72, 3], "氏名": [85, 1, 1, 2], "気工": [104, 1], "池野": [101, 1], "沖縄": [94, 1, 7, 3, 7, 4, 3, 1], "況は": [78, 1, 1, 1], "注競": [53, 1, 72, 1], "清掃": [107, 1], "渕石": [100, 1], "測定": [51, 2, 1, 2, 1, 2, 1, 2, 1, 2, 68, 1, 1, 1, 1, 1, 1, 1, 1, 1], "源の": [7, 1, 21, 1, 4, 3, 3, 1, 41, 1, 3, 1], "点で": [0, 1, 8, 1, 6, 1, 18, 1, 40, 1, 7, 2], "無償": [87, 1, 2, 1], "独自": [44, 4, 1, 3, 1, 3, 7, 1, 6, 1, 57, 6, 1, 5, 1, 5, 7, 1, 6, 3], "現が": [68, 1], "現れ": [80, 1], "現経": [0, 1, 7, 1, 4, 1, 2, 2, 1, 1, 7, 1, 14, 1, 41, 1, 2, 1, 2, 1], "生き": [17, 1], "産品": [58, 1, 72, 1], "産省": [80, 1, 5, 1], "用化": [52, 1, 1, 1, 71, 1, 1, 1], "由は": [69, 1, 16, 1], "甲子": [0, 4, 3, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 4, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 31, 4, 1, 5, 1, 3, 1, 3, 1, 8, 1, 3, 1, 3, 1, 4, 1, 2, 1, 1, 1, 3, 1, 2, 1, 1, 2, 1, 3, 1, 1, 1, 3, 1, 1, 1, 3, 1, 20, 2], "画変": [73, 1], "発と": [44, 1, 24, 1, 48, 1], "発案": [28, 1], "発注": [51, 1, 72, 1], "発表": [72, 1, 2, 2, 11, 6, 1, 3, 23, 2, 1, 5, 1, 3, 1, 3, 1, 11], "発部": [28, 1], "的ア": [58, 3, 72, 3], "益計": [73, 1], "社が": [53, 1, 1, 1, 2, 5, 23, 1, 1, 1, 45, 1, 1, 1, 2, 7], "社尼": [101, 1], "私は": [28, 1], "章の": [38, 2, 2, 1, 27, 1], "端設": [72, 1], "策群": [79, 1, 1, 1], "算さ": [66, 1], "簿保": [47, 1, 72, 1], "約2": [78, 1, 2, 2], "組を": [68, 1], "絡く": [109, 1], "絡は": [90, 1], "総額": [70, 1, 8, 1], "績が": [45, 1, 7, 1, 65, 1, 7, 1], "者3": [64, 1, 72, 1], "育成": [42, 1, 4, 1, 3, 2, 11, 1, 20, 1, 2, 1, 32, 1, 4, 1, 3, 2, 11, 1], "能力": [78, 2, 2, 1], "葉で": [0, 1, 21, 1], "行り": [22, 1], "規設": [65, 1, 72, 1], "覧内": [75, 1], "言語": [0, 1], "記憶": [38, 1], "語れ": [14, 1, 19, 1], "誰の": [31, 2, 26, 3, 72, 3], "象は": [1, 1, 21, 1], "財政": [82, 1], "貼り": [25, 1, 1, 1], "賃金": [48, 1, 30, 1, 1, 1, 1, 2, 40, 1], "質と": [56, 1, 72, 1], "質へ": [42, 1, 1, 1, 71, 1, 1, 1], "車部": [57, 1, 72, 1], "軽に": [26, 1, 1, 1, 82, 1], "載し": [86, 2], "近く": [109, 1], "近は": [25, 1], "近畿": [99, 3, 7, 3, 5, 1], "迫ら": [79, 1], "述の": [80, 1], "通じ": [78, 1], "通常": [45, 2, 72, 2], "造の": [80, 1], "連絡": [26, 1, 1, 1, 63, 1, 19, 5], "進む": [2, 1, 9, 1], "進枠": [0, 1, 3, 1, 4, 1, 3, 1, 58, 1, 1, 3, 6, 1, 1, 1, 4, 1, 5, 1, 1, 1], "遇さ": [0, 3], "遇段": [75, 1], "達も": [17, 1], "違っ": [84, 1], "選ぶ": [38, 1], "遼太": [100, 1], "部ブ": [111, 1], "部分": [13, 1], "野県": [90, 1, 7, 1, 12, 1], "金は": [79, 1], "録だ": [13, 1], "長さ": [28, 1], "長投": [10, 1, 59, 1, 10, 1], "門の": [28, 1], "関数": [28, 1], "降に": [7, 1, 69, 1], "限の": [20, 1], "非公": [0, 1], "革で": [49, 1, 72, 1], "頼り": [42, 1, 72, 1], "験要": [71, 1]};
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_15 = {"0問": [39, 1, 16, 1], "10": [7, 2, 4, 1, 17, 2, 9, 1, 1, 1, 1, 1, 3, 1, 3, 2, 1, 1, 1, 1, 6, 1, 2, 1, 3, 1, 3, 4, 2, 1, 2, 5, 5, 1, 6, 2, 37, 1, 1, 1, 3, 2, 1, 1, 1, 1, 6, 1, 5, 1, 3, 4, 2, 1, 2, 5], "1台": [42, 1, 72, 1], "1章": [38, 1, 1, 1], "2週": [57, 1, 72, 1], "32": [78, 1], "4観": [73, 3], "5つ": [5, 1, 15, 1, 4, 1, 2, 1, 2, 3], "5年": [3, 1, 4, 1, 3, 1, 32, 1, 4, 1, 1, 1, 12, 1, 10, 1, 2, 2, 5, 1, 2, 1, 2, 2, 2, 1, 3, 1, 17, 1, 7, 1, 5, 1, 4, 1, 1, 1, 12, 1], "65": [49, 1, 31, 1, 41, 1], "6日": [3, 1, 66, 1, 13, 1], "87": [0, 1, 7, 1, 69, 1], "8万": [61, 4, 2, 2, 70, 4, 2, 2], "98": [0, 1, 7, 1, 35, 1, 34, 1, 38, 1], "ap": [65, 2, 29, 1, 17, 1, 26, 1], "b管": [42, 1, 72, 1], "ed": [94, 1], "et": [49, 3, 72, 3], "fe": [94, 1], "fu": [40, 1], "iと": [6, 1, 8, 1, 10, 1, 2, 1, 1, 1, 10, 1], "on": [40, 1, 8, 3, 46, 1, 26, 3], "po": [47, 3, 72, 3], "ra": [71, 1], "sb": [80, 1], "tc": [88, 1], "ts": [71, 1], "ud": [27, 1, 39, 3, 22, 1], "ut": [111, 1], "ve": [40, 1], "xで": [49, 1, 72, 1], "zi": [71, 1], "いこ": [0, 1, 17, 1, 5, 1, 65, 3], "いっ": [90, 1], "いコ": [2, 1], "う段": [14, 1], "えで": [36, 1, 31, 1], "お助": [72, 1], "かず": [24, 1], "かな": [18, 1, 4, 1, 5, 1], "かり": [0, 2, 15, 1, 4, 1, 15, 1], "か確": [15, 3], "がか": [0, 1], "がる": [66, 1], "が任": [0, 1, 93, 1], "が始": [68, 1], "が減": [28, 1, 50, 1, 3, 1], "が見": [39, 1, 38, 1, 3, 1], "が運": [0, 1], "が開": [34, 1, 4, 1, 36, 1], "きれ": [7, 1, 69, 1], "き込": [28, 1, 13, 1], "くの": [24, 1, 12, 1, 31, 1, 12, 1, 30, 2], "くま": [82, 1], "く聞": [1, 1, 15, 1], "けだ": [81, 2], "けば": [77, 1], "げ要": [3, 1, 67, 1], "ご連": [109, 1], "さい": [16, 1, 9, 3, 1, 2, 1, 1, 1, 1, 6, 1, 6, 2, 26, 1, 2, 1, 1, 1, 18, 1, 5, 1, 17, 1], "して": [0, 2, 2, 1, 5, 1, 4, 1, 1, 2, 1, 1, 1, 1, 2, 2, 4, 1, 1, 1, 1, 2, 2, 5, 1, 3, 1, 1, 1, 2, 1, 3, 1, 1, 5, 3, 1, 1, 1, 2, 3, 1, 1, 3, 3, 1, 1, 1, 2, 1, 1, 1, 19, 1, 1, 2, 1, 2, 8, 1, 2, 4, 1, 3, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 3, 2, 2, 1, 1, 1, 1, 2, 1, 2, 2, 21, 1, 1, 1, 2, 1, 1, 1], "し制": [48, 1, 72, 1], "すと": [34, 1, 37, 3, 23, 1], "せず": [19, 1, 21, 1, 40, 1], "せな": [71, 1], "せ通": [22, 3], "それ": [1, 1, 6, 1, 9, 1, 2, 1, 2, 1, 1, 1, 1, 1, 10, 1, 1, 1, 7, 1, 36, 1, 2, 1], "たの": [0, 1, 4, 1, 3, 1, 10, 1, 7, 1, 1, 1, 2, 1, 2, 1, 8, 1, 39, 1, 12, 1, 3, 1], "たま": [41, 4], "だわ": [20, 1, 22, 1, 72, 1], "だ使": [66, 3], "ちば": [78, 1, 11, 1], "ち帰": [18, 1, 3, 1], "づい": [69, 1], "てフ": [14, 1], "で並": [1, 1], "で処": [88, 1], "で分": [68, 1], "で取": [66, 2], "で戦": [39, 1], "で状": [79, 1], "で競": [39, 1], "とし": [16, 2, 6, 2, 6, 1, 12, 1, 6, 1, 32, 4, 1, 1, 1, 1, 9, 1, 29, 1], "とで": [0, 1, 22, 1, 34, 1, 72, 1], "とデ": [42, 1, 72, 1], "と具": [28, 1, 45, 1], "と大": [14, 1], "と控": [66, 2], "と照": [86, 1], "など": [7, 2, 6, 1, 8, 1, 6, 1, 28, 1, 21, 2, 8, 1, 4, 3, 24, 1, 15, 1], "なら": [0, 1, 7, 1, 6, 1, 4, 3, 6, 3, 2, 1, 1, 1, 37, 1, 18, 3], "な役": [25, 1], "な方": [13, 1], "な点": [32, 1], "にお": [80, 1], "にな": [0, 4, 1, 1, 12, 1, 1, 2, 8, 1, 1, 1, 2, 1, 2, 1, 1, 1, 8, 1, 1, 2, 2, 2, 4, 1, 1, 2, 1, 1, 1, 1, 20, 2, 5, 1, 5, 1, 1, 1, 2, 1, 1, 1, 13, 1, 21, 1, 1, 1, 1, 4, 1, 3, 1, 3], "に優": [87, 1], "に出": [3, 1, 10, 1, 3, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 3, 1, 6, 1, 3, 1, 41, 1, 8, 1, 2, 2, 3, 1, 21, 1], "に基": [69, 1, 11, 1, 6, 1], "に届": [34, 1, 1, 1, 2, 1, 44, 1], "に発": [110, 1], "に確": [71, 1, 13, 1], "に示": [68, 1], "に自": [35, 1, 1, 1, 31, 1], "に通": [2, 3], "のキ": [72, 1], "のポ": [62, 1, 72, 1], "の中": [0, 2, 13, 3, 14, 3, 9, 1, 3, 1, 28, 1, 4, 1, 7, 1, 13, 1], "の依": [54, 1, 72, 1], "の保": [24, 1, 63, 1], "の初": [47, 1, 3, 1, 10, 1, 59, 1, 3, 1, 10, 1], "の前": [71, 1, 9, 1, 12, 1], "の名": [0, 1, 85, 1, 17, 1], "の国": [0, 1, 80, 1], "の好": [78, 1, 2, 1], "の施": [80, 1], "の業": [59, 1, 72, 1], "の積": [46, 1, 72, 1], "の維": [43, 1, 72, 1], "の製": [43, 1, 72, 1], "の設": [47, 1, 10, 1, 1, 1, 61, 1, 10, 1, 1, 1], "の認": [72, 1], "の読": [77, 1, 2, 3], "の都": [94, 1], "の重": [14, 1], "はま": [7, 2, 23, 1, 5, 1, 41, 2], "は収": [88, 1], "ば小": [51, 1, 72, 1], "ば良": [109, 3], "へ気": [27, 1], "ま設": [27, 1], "ま読": [36, 1, 31, 1], "ま重": [3, 1], "みの": [35, 1], "みま": [0, 1, 1, 1], "めぐ": [80, 1], "めば": [0, 1, 36, 1, 31, 1], "も十": [20, 1], "も失": [22, 1], "も持": [18, 1], "やc": [27, 1, 61, 1], "や申": [92, 1], "ょう": [13, 1, 4, 1, 4, 1, 87, 1], "らえ": [2, 1, 64, 1], "ら書": [86, 1], "りす": [6, 1, 14, 1, 4, 1], "り物": [28, 1], "るな": [13, 1, 10, 1, 3, 1], "る上": [80, 1], "る人": [0, 1, 1, 1, 2, 1, 63, 1, 13, 2, 6, 1, 8, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "る会": [28, 1, 1, 1], "る未": [0, 1, 22, 1], "る町": [28, 1], "る空": [19, 3], "れか": [35, 1, 37, 1], "れに": [1, 1, 15, 1, 2, 1, 2, 1, 59, 1, 7, 1], "れる": [0, 4, 1, 1, 1, 1, 1, 3, 1, 1, 3, 4, 1, 3, 3, 1, 3, 1, 1, 3, 6, 1, 1, 1, 1, 4, 1, 1, 1, 2, 2, 3, 1, 1, 6, 1, 1, 1, 2, 2, 20, 1, 19, 5, 7, 1, 5, 1, 41, 1], "ろが": [34, 1], "を1": [27, 1, 18, 1, 1, 1, 11, 1, 60, 1, 1, 1, 10, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "をa": [37, 1], "をめ": [80, 1], "を価": [48, 1, 72, 1], "を抑": [48, 1, 72, 1], "を持": [3, 1, 8, 1, 29, 1, 26, 1, 25, 1], "を条": [79, 1], "を渡": [66, 1], "を話": [35, 1], "を送": [25, 1, 3, 1], "イン": [28, 1, 15, 2, 4, 1, 3, 1, 12, 3, 4, 1, 14, 1, 35, 2, 4, 1, 3, 1, 12, 2], "ェブ": [95, 1], "クの": [91, 1], "クノ": [104, 1], "グク": [105, 1], "サイ": [0, 1, 1, 1, 1, 1, 2, 1, 3, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 10, 1, 4, 1, 7, 2, 2, 1, 13, 1, 5, 1, 10, 1, 3, 2, 4, 2, 2, 1, 1, 1, 1, 1, 8, 1, 1, 4, 1, 2, 1, 3, 1, 1, 1, 3, 1, 1, 1, 2, 1, 2, 3, 1, 2, 1, 12, 1, 4, 2, 9, 1, 5, 1, 10, 1], "ザ内": [88, 1], "ジで": [68, 1, 17, 1], "ジェ": [66, 3], "ジシ": [62, 1, 2, 2, 70, 1, 2, 1], "ジョ": [43, 3, 72, 5], "スト": [2, 3, 7, 1, 5, 2, 9, 1, 24, 1, 3, 1, 2, 1, 2, 1, 2, 2, 1, 1, 3, 2, 3, 1, 5, 4, 1, 1, 3, 3, 18, 1, 3, 1, 2, 1, 24, 1, 3, 1, 2, 1, 2, 1, 2, 1, 1, 1, 3, 2, 3, 1], "ズ等": [134, 1], "ソー": [80, 1], "タの": [42, 1, 46, 3, 3, 3, 23, 1], "タ収": [50, 1, 72, 1], "トで": [0, 1, 1, 1, 5, 1, 6, 1, 12, 1, 1, 1, 23, 1, 20, 3, 4, 1, 14, 1, 34, 1], "ト受": [51, 1, 72, 1], "ト率": [44, 1, 72, 1], "ト顧": [57, 1, 16, 1, 56, 3], "ピッ": [0, 1, 1, 1, 13, 1, 65, 1], "ブさ": [37, 1], "ブサ": [95, 1], "ホ株": [99, 1], "ボル": [111, 1], "ポレ": [107, 1], "ポー": [75, 1, 7, 1], "ム実": [50, 1, 72, 1], "モチ": [22, 1], "ャも": [72, 1], "リス": [2, 3, 7, 1, 5, 2, 9, 1, 25, 1, 1, 1, 1, 1, 10, 2, 8, 4, 1, 1, 3, 3, 18, 1, 3, 1, 2, 1, 25, 1, 1, 1, 1, 1, 10, 1], "ルな": [25, 2], "ル株": [104, 1], "ロー": [48, 1, 72, 1], "ンを": [25, 1, 68, 1], "ヴィ": [96, 1], "ーか": [24, 1, 62, 1], "ーに": [110, 1, 1, 11], "ーカ": [44, 1, 13, 2, 29, 1, 30, 1, 13, 2], "ーセ": [50, 1, 22, 1, 50, 1], "ーニ": [96, 1], "ーホ": [100, 1], "ール": [0, 1, 49, 1, 24, 1, 1, 3, 15, 1, 8, 2, 7, 1, 3, 1, 4, 3, 10, 1], "万円": [1, 1, 2, 3, 4, 2, 3, 2, 13, 1, 23, 1, 1, 2, 4, 1, 10, 5, 2, 10, 2, 9, 11, 2, 42, 1, 1, 2, 4, 1, 10, 5, 2, 16, 2, 10], "上等": [73, 1], "主な": [71, 3], "予算": [80, 2], "事な": [32, 1], "井澤": [107, 1], "井組": [100, 1], "人物": [42, 2, 72, 1], "仕組": [25, 1, 3, 1, 14, 1, 14, 1, 23, 2, 35, 1, 14, 1], "代2": [47, 1, 72, 1], "件サ": [55, 1, 72, 1], "件以": [45, 1, 72, 1], "住ま": [90, 1], "体を": [43, 1, 13, 1, 59, 1, 13, 1], "作る": [42, 1, 37, 1, 35, 1], "依頼": [13, 1], "促進": [0, 1, 3, 1, 4, 1, 3, 1, 58, 1, 1, 3, 6, 1, 1, 1, 4, 2, 5, 1, 1, 1], "保証": [87, 1, 5, 1], "保障": [80, 1], "個人": [71, 1, 17, 1], "値観": [42, 2, 1, 2, 71, 1, 1, 1], "値連": [116, 1, 1, 1, 1, 1], "備と": [14, 1], "備へ": [5, 1, 42, 1, 9, 1, 63, 1, 9, 1], "償の": [87, 1, 2, 1], "元も": [22, 1], "先し": [87, 1], "免責": [92, 3], "全性": [63, 1, 72, 1], "全文": [25, 1, 2, 1], "公開": [28, 1, 50, 1, 35, 1], "円以": [7, 4, 39, 1, 24, 1, 6, 4, 42, 1], "出す": [20, 1, 3, 1, 1, 1, 10, 1, 4, 1, 28, 1], "出ら": [0, 1, 1, 1, 6, 3, 4, 1, 3, 1, 1, 3, 8, 1, 4, 1, 49, 4], "利用": [19, 1, 2, 1, 3, 1, 1, 2, 2, 6, 45, 1, 16, 1, 4, 1], "力隊": [72, 1], "加わ": [14, 1], "加速": [72, 1], "務と": [42, 1, 72, 1], "務へ": [54, 1, 72, 1], "募の": [85, 1], "募回": [3, 1, 65, 3], "化サ": [58, 1, 72, 1], "化投": [2, 1, 21, 1, 25, 1, 20, 2, 10, 1, 2, 1, 40, 1], "北ブ": [111, 1], "卒採": [46, 1, 72, 1], "取引": [28, 1, 24, 1, 3, 1, 4, 1, 65, 1, 3, 1, 4, 1], "可の": [71, 3], "合し": [43, 1, 72, 1], "合プ": [62, 2, 72, 1], "合性": [56, 2, 72, 1], "合率": [53, 1, 72, 1], "合資": [101, 2, 7, 1], "品加": [28, 1], "員一": [2, 1, 78, 1], "営者": [0, 2, 7, 1, 4, 1, 2, 2, 1, 1, 7, 1, 5, 1, 1, 1, 8, 1, 41, 1, 2, 1, 1, 3, 1, 3, 2, 1, 3, 1, 1, 2, 3, 4, 1, 6, 1, 4, 1, 4, 5, 2, 12, 1], "四半": [48, 1, 72, 1], "図も": [86, 1], "図面": [57, 1, 1, 1, 71, 1, 1, 1], "固有": [116, 1, 1, 1, 1, 1, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "国が": [78, 1], "在し": [53, 1, 72, 1], "在率": [80, 1, 2, 1], "地域": [1, 1, 27, 2, 5, 1, 9, 1, 1, 4, 3, 3, 3, 3, 2, 1, 5, 2, 3, 2, 3, 2, 10, 2, 1, 1, 7, 1, 5, 1, 1, 1, 4, 2, 3, 4, 1, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 4, 1, 1, 1, 1, 4, 3, 3, 3, 3, 2, 1, 5, 2, 3, 2, 3, 2], "地政": [80, 1], "均取": [59, 1, 72, 1], "域の": [42, 1, 1, 1, 47, 1, 5, 1, 19, 1, 1, 1], "報源": [83, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 4, 1], "場3": [45, 1, 72, 1], "変え": [28, 2, 14, 1, 72, 1], "外工": [55, 1, 72, 1], "大分": [101, 1, 7, 1], "大学": [68, 1], "妥協": [42, 1, 1, 1, 71, 1, 1, 1], "子は": [20, 1], "存し": [36, 1, 31, 1], "存で": [24, 1], "存顧": [51, 2, 2, 1, 70, 2, 2, 1], "安全": [80, 1], "安永": [101, 1], "定す": [69, 1, 19, 1], "定権": [54, 1, 72, 1], "実現": [14, 1, 12, 1, 2, 1, 4, 1, 1, 4, 10, 1, 1, 1, 1, 2, 1, 1, 1, 1, 9, 1, 4, 3, 13, 1, 7, 1, 35, 1, 1, 1, 1, 2, 1, 1, 1, 1, 9, 1, 4, 4], "実績": [28, 1, 17, 1, 7, 1, 7, 1, 15, 1, 43, 1, 7, 1, 7, 1], "客1": [61, 1, 72, 1], "容と": [84, 1], "将来": [3, 1, 40, 2, 21, 1, 51, 1, 21, 1], "小松": [104, 1], "少子": [80, 1], "履歴": [86, 3], "山地": [100, 1], "山田": [105, 1, 2, 1], "川県": [97, 1, 1, 1, 2, 1, 5, 1, 2, 1], "工場": [28, 1, 14, 1, 1, 2, 1, 1, 1, 1, 2, 1, 3, 1, 1, 1, 4, 1, 4, 1, 3, 1, 19, 1, 15, 1, 5, 1, 13, 1, 1, 2, 1, 1, 1, 1, 2, 1, 3, 1, 1, 1, 4, 1, 4, 1, 3, 1], "工藤": [103, 1], "年3": [46, 1, 2, 1, 70, 1, 2, 1], "年代": [114, 1], "年連": [78, 1, 1, 1], "年間": [44, 1, 17, 3, 19, 1, 36, 1, 17, 3], "年頃": [80, 1], "広げ": [86, 1], "建物": [111, 1], "式の": [0, 1, 19, 1, 65, 2, 2, 1, 6, 1], "強化": [47, 1, 2, 1, 2, 1, 4, 1, 17, 1, 6, 1, 2, 2, 39, 1, 2, 1, 2, 1, 4, 1], "強度": [51, 3, 1, 3, 1, 1, 1, 3, 1, 3, 68, 3, 1, 3, 1, 2, 1, 3, 1, 3], "後に": [24, 1, 2, 1, 9, 1, 2, 1, 31, 1, 18, 1], "応に": [60, 1, 72, 1], "応力": [45, 1, 4, 1, 6, 1, 7, 1, 55, 1, 4, 1, 6, 1, 7, 1], "性化": [111, 1], "想を": [0, 3, 27, 1], "憶さ": [38, 1], "成功": [60, 6, 72, 7], "成可": [13, 1], "成支": [87, 1], "成調": [94, 1], "戦略": [80, 1], "戻り": [40, 1], "手な": [17, 3], "手確": [49, 1, 72, 1], "手続": [13, 1], "承の": [42, 1, 7, 1, 15, 1, 50, 1, 7, 1, 15, 1], "承マ": [49, 1, 10, 1, 62, 1, 10, 1], "摘で": [17, 1], "教え": [27, 1], "文化": [53, 1, 72, 1], "料と": [16, 1], "料高": [48, 1, 72, 1], "新潟": [95, 1, 2, 1], "新規": [28, 1, 3, 3, 14, 1, 6, 5, 2, 1, 1, 1, 9, 1, 2, 1, 13, 1, 1, 1, 38, 1, 6, 7, 2, 1, 1, 1, 9, 1, 2, 1], "方と": [92, 1], "方予": [0, 2, 3, 1, 5, 1, 60, 1, 4, 2], "最小": [20, 1, 108, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "有用": [25, 1], "期の": [49, 1, 72, 1], "期ま": [42, 1, 72, 1], "期対": [45, 1, 10, 1, 5, 1, 57, 1, 10, 1, 5, 1], "本開": [80, 1], "来歴": [24, 1, 13, 1, 2, 1], "査優": [0, 1], "査通": [2, 1, 66, 4], "格に": [32, 1], "格見": [48, 1, 72, 1], "検査": [42, 1, 8, 1, 8, 1, 1, 1, 55, 1, 8, 1, 8, 1, 1, 1], "業が": [2, 1, 5, 1, 21, 1, 48, 1], "業界": [43, 1, 3, 1, 10, 1, 3, 1, 7, 1, 49, 1, 3, 1, 10, 1, 3, 1], "極的": [46, 1, 72, 1], "概要": [24, 1, 51, 1], "正時": [57, 1, 72, 1], "歴代": [86, 1, 16, 3], "残り": [12, 1, 5, 1, 5, 1], "比較": [21, 1], "求め": [57, 2, 72, 1], "注で": [28, 1], "注プ": [51, 1, 72, 1], "注増": [42, 1, 72, 1], "注率": [55, 1, 72, 1], "海外": [55, 2, 72, 2], "消し": [56, 1, 72, 1], "減り": [28, 1], "港湾": [28, 1], "湾設": [28, 1], "満た": [3, 1, 68, 1, 8, 1], "準フ": [2, 1, 66, 2, 27, 1], "滝本": [96, 2], "点と": [14, 1, 25, 1, 41, 1], "特典": [2, 1, 7, 3, 59, 1, 1, 1, 3, 1, 3, 1, 2, 1, 9, 1], "率6": [63, 1, 72, 1], "率化": [42, 1, 72, 1], "現業": [28, 1, 1, 3], "理さ": [20, 1, 21, 1, 47, 1], "理念": [39, 1, 2, 1, 2, 7, 13, 1, 59, 5, 13, 1], "生の": [43, 1, 72, 1], "生ま": [0, 1, 7, 3, 69, 3], "用し": [20, 1, 1, 1, 26, 1, 41, 1, 31, 1], "用強": [49, 1, 72, 1], "界に": [42, 1, 72, 1], "番有": [25, 1], "発点": [79, 1], "皆さ": [21, 1], "盛り": [19, 3], "相性": [66, 1], "相談": [1, 1, 13, 1, 3, 3, 9, 1, 40, 1, 19, 1, 2, 1, 3, 1, 3, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "県に": [94, 1], "真の": [39, 1, 2, 1, 3, 3, 1, 3, 1, 3, 70, 3, 1, 3, 1, 3], "着実": [80, 1], "示す": [25, 1], "社中": [100, 1, 7, 1], "社勝": [104, 1], "社名": [2, 1, 11, 1, 22, 1, 33, 1, 27, 1], "社滝": [96, 1], "社羽": [90, 1, 7, 1], "等と": [68, 1], "簿の": [86, 1, 23, 1], "簿対": [47, 1, 72, 1], "組ん": [25, 1], "経費": [71, 1], "継予": [0, 2, 1, 1, 2, 1, 4, 1, 3, 1, 5, 1, 20, 1, 36, 1, 2, 1, 3, 1], "継計": [71, 1, 1, 1], "続点": [78, 1, 1, 1], "者や": [13, 1], "聞き": [24, 1], "興し": [28, 1], "般型": [2, 1, 66, 1], "薬事": [57, 1, 72, 1], "術を": [44, 1, 12, 2, 2, 1, 58, 1, 12, 2, 2, 1], "表で": [7, 1, 69, 1], "製作": [50, 1, 7, 3, 3, 1, 62, 1, 7, 3, 3, 1], "褒め": [0, 1], "要因": [47, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 64, 3, 1, 3, 1, 3, 1, 3, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2], "要最": [20, 1], "見出": [26, 1], "見通": [73, 1], "言わ": [17, 1], "計デ": [28, 1], "計算": [133, 1], "記し": [11, 1, 81, 1, 21, 1], "話だ": [81, 2], "認が": [68, 1], "認証": [51, 1, 72, 1], "責任": [92, 1], "費な": [23, 1], "費上": [48, 1, 22, 1, 50, 1], "貼る": [25, 1, 13, 1, 2, 1], "転嫁": [48, 2, 72, 2], "返っ": [0, 1], "述は": [78, 1], "迷う": [109, 1], "透明": [52, 1, 72, 1], "通ら": [22, 4], "速マ": [72, 1], "連関": [44, 2, 1, 2, 1, 2, 70, 2, 1, 2, 1, 2], "進め": [0, 1, 12, 1, 2, 1, 10, 1, 1, 1, 2, 2, 11, 3, 28, 1, 14, 1], "遇策": [3, 1], "違い": [32, 1], "適合": [56, 2, 72, 1], "適用": [68, 1, 4, 1], "部昇": [78, 1], "都府": [99, 1, 7, 1], "釈で": [79, 3, 3, 1], "重県": [98, 1, 7, 1], "量の": [52, 1, 72, 1], "金だ": [68, 1], "金繰": [48, 1, 72, 1], "銃砲": [99, 1], "開発": [2, 1, 26, 3, 16, 1, 9, 1, 7, 1, 5, 1, 3, 2, 48, 1, 9, 1, 7, 1, 5, 1], "開示": [80, 1], "間を": [20, 3, 5, 1, 1, 1], "関東": [61, 2, 34, 1, 2, 3, 7, 3, 7, 1, 22, 2], "隊利": [72, 1], "髙丸": [106, 2], "麦工": [101, 1]};
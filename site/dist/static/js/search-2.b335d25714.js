@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_2 = {"02": [0, 3, 2, 2, 1, 3, 5, 1, 3, 2, 1, 1, 2, 2, 4, 1, 10, 1, 14, 2, 5, 1, 21, 2, 1, 1, 5, 7, 1, 3, 3, 4, 1, 1, 1, 6, 2, 3, 3, 8, 1, 6, 16, 1, 7, 4, 4, 5, 1, 2, 5, 1], "0秒": [0, 1, 1, 1, 6, 3, 8, 1, 8, 1, 53, 3], "13": [74, 1], "24": [26, 1, 9, 1, 7, 1, 3, 1, 2, 1, 12, 1, 1, 1, 1, 1, 13, 1, 6, 1, 34, 1, 3, 1, 2, 1, 12, 1, 1, 1, 1, 1, 2, 1], "2つ": [66, 1], "2年": [48, 1, 72, 1], "35": [49, 1, 72, 1], "3以": [70, 1], "3日": [28, 1, 30, 1, 72, 1], "4ブ": [26, 1], "5g": [50, 1, 72, 1], "5万": [63, 1, 17, 1, 55, 2], "68": [109, 1], "6選": [1, 1], "9開": [74, 1], "ac": [63, 4, 27, 1, 19, 1, 26, 3], "ce": [39, 1, 11, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 35, 1, 19, 1, 14, 3, 1, 3, 1, 3, 1, 3, 1, 3], "cu": [27, 1], "df": [13, 1, 11, 2, 11, 1, 51, 1, 23, 1, 2, 1], "gy": [50, 3, 72, 3], "ik": [90, 1, 4, 1], "iか": [28, 1, 12, 1], "iに": [24, 1, 1, 1, 2, 2, 9, 1, 3, 1, 11, 1, 16, 1, 22, 1, 34, 1], "i事": [88, 1], "km": [53, 1, 72, 1], "m圏": [53, 1, 72, 1], "oa": [88, 1], "pr": [94, 1], "pを": [24, 1], "q3": [7, 1, 69, 1], "se": [94, 1], "su": [2, 1], "tv": [63, 4, 72, 3], "wi": [94, 1], "いう": [13, 1, 9, 1, 1, 1, 56, 1], "いて": [0, 3, 3, 1, 17, 1, 4, 1, 1, 1, 5, 1, 7, 2, 2, 1, 1, 1, 1, 1, 28, 1, 5, 1, 4, 2, 4, 1, 2, 1, 5, 3, 3, 1, 1, 2], "い状": [24, 1], "い理": [1, 2, 15, 5, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "い順": [80, 1], "うえ": [86, 1, 27, 1], "う予": [35, 1], "う合": [7, 1, 69, 1], "う書": [0, 1], "えず": [42, 1, 72, 1], "えな": [0, 1, 27, 1], "え区": [86, 1], "が対": [10, 1], "が導": [28, 1], "が目": [28, 1], "きた": [27, 1, 6, 1, 44, 1, 1, 4], "きは": [27, 1], "くa": [25, 1], "く無": [20, 1], "さで": [28, 1], "しす": [41, 1], "し効": [50, 1, 72, 1], "し方": [13, 1], "すか": [0, 3, 1, 3, 1, 3, 1, 3, 26, 1, 1, 1, 1, 2, 1, 1, 1, 1], "する": [0, 3, 1, 1, 1, 3, 1, 1, 3, 1, 2, 3, 3, 1, 2, 2, 3, 1, 3, 3, 1, 2, 2, 2, 1, 2, 1, 7, 1, 1, 2, 6, 9, 1, 5, 1, 2, 2, 13, 2, 2, 1, 11, 1, 2, 1, 2, 1, 6, 1, 1, 2, 5, 1, 3, 2, 3, 1, 1, 2, 17, 1, 6, 2, 13, 2, 2, 1], "すセ": [38, 1], "ずれ": [13, 1, 59, 1, 10, 1], "ず公": [92, 1], "たa": [27, 1], "たち": [0, 1, 17, 1, 2, 3], "ため": [0, 2, 13, 1, 5, 1, 1, 1, 5, 1, 11, 1, 7, 1, 22, 1, 7, 1, 8, 2, 9, 1, 26, 1, 22, 1, 1, 1], "た金": [28, 1], "だも": [79, 1], "つて": [24, 1, 13, 1], "てと": [7, 1], "てよ": [16, 1], "てエ": [14, 1, 10, 1, 15, 1], "て書": [24, 1, 10, 1, 45, 1, 2, 1], "て磨": [11, 1], "て表": [12, 1], "て記": [86, 1, 29, 1], "て骨": [25, 1], "です": [0, 4, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 6, 3, 1, 4, 3, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 3, 2, 2, 1, 2, 3, 5, 2, 2, 1, 1, 1, 1, 2, 2, 2, 2, 1, 1, 4, 1, 25, 1, 1, 2, 1, 2, 8, 1, 2, 1, 1, 6, 1, 1, 2, 1, 2, 1, 3, 1, 2, 1, 4, 1, 9, 1, 8, 1, 1, 1], "でス": [61, 1, 72, 1], "でラ": [47, 1, 72, 1], "で写": [40, 1], "で安": [44, 1, 72, 1], "で審": [0, 1], "で改": [78, 1, 1, 1], "で教": [49, 1, 72, 1], "で物": [26, 1], "とお": [3, 1, 24, 1, 8, 1, 43, 1], "とな": [13, 1, 5, 1, 24, 1, 72, 1], "と人": [64, 1, 72, 3], "と会": [20, 1], "と出": [85, 3, 7, 1], "と確": [84, 1], "と続": [14, 1], "と自": [3, 1, 25, 2, 1, 3, 52, 1, 7, 1], "なが": [14, 1, 13, 1, 39, 1, 12, 1], "なぜ": [42, 2, 2, 2, 1, 2, 1, 2, 10, 3, 3, 3, 55, 2, 2, 1, 1, 1, 1, 1, 10, 3, 3, 3], "にそ": [37, 1], "に中": [24, 1], "に伝": [23, 1], "に再": [68, 1], "に反": [40, 1], "に製": [57, 1, 72, 1], "に読": [36, 1], "に追": [111, 10], "のp": [13, 1], "のば": [57, 1, 72, 1], "のダ": [17, 1], "の一": [7, 1, 32, 1, 29, 2, 10, 1, 6, 1, 1, 1, 9, 1, 7, 1], "の加": [0, 2, 1, 1, 1, 1, 9, 1, 3, 4, 5, 1, 2, 1, 2, 1, 5, 1, 31, 1, 9, 2, 10, 1, 53, 1], "の台": [80, 1], "の地": [0, 1, 85, 1, 1, 1, 4, 1, 5, 1, 14, 1, 4, 1], "の子": [7, 1, 69, 1], "の往": [27, 1], "の恐": [80, 1], "の成": [10, 1, 63, 1, 5, 1, 14, 1], "の技": [43, 2, 1, 1, 2, 1, 10, 2, 8, 1, 51, 2, 1, 1, 2, 1, 10, 2, 8, 1], "の提": [54, 1, 17, 1, 40, 1, 15, 1], "の数": [24, 1, 2, 1, 11, 1, 2, 1, 27, 1], "の新": [46, 1, 5, 1, 67, 1, 5, 1], "の最": [52, 1, 72, 1], "の材": [30, 1], "の枠": [10, 3, 61, 1], "の激": [53, 2, 72, 1], "の章": [37, 1, 36, 3], "の締": [14, 1], "の言": [0, 1, 21, 1, 14, 1], "の限": [20, 1], "は1": [7, 3, 62, 1, 7, 3], "はa": [27, 1, 84, 1], "は十": [18, 1], "は省": [94, 1], "は要": [27, 1], "は話": [66, 1], "ば形": [13, 1], "べる": [79, 1], "まだ": [0, 1, 5, 1, 1, 1, 1, 1, 8, 3, 13, 1, 48, 1], "もい": [20, 1, 1, 3], "もや": [20, 1], "も協": [43, 1, 72, 1], "や忖": [17, 1], "より": [7, 1, 12, 1, 2, 1, 22, 1, 1, 1, 1, 1, 1, 1, 10, 1, 3, 1, 9, 1, 3, 1, 5, 1, 3, 2, 8, 1, 5, 1, 23, 1, 1, 1, 1, 1, 1, 1, 10, 1, 3, 1], "らせ": [0, 1], "らに": [37, 1], "ら下": [7, 1, 69, 1], "ら事": [24, 1], "ら始": [0, 2, 12, 4, 1, 3, 1, 3, 1, 3, 13, 1], "ら構": [27, 1], "ら見": [28, 1], "りが": [28, 1, 38, 1], "り公": [87, 1], "り補": [47, 1, 18, 1, 54, 1, 18, 1], "り証": [71, 1], "り込": [25, 1, 1, 1, 2, 1, 10, 1, 2, 4, 1, 1], "るき": [0, 1, 23, 1], "る中": [80, 1], "る前": [1, 1], "る国": [0, 1], "れの": [0, 1, 85, 1], "れま": [0, 2, 1, 1, 2, 1, 10, 1, 11, 1, 2, 1, 1, 3, 9, 1, 2, 1, 2, 1, 27, 1, 21, 3, 3, 1, 20, 1], "わけ": [0, 1], "をい": [16, 1], "をご": [69, 1, 23, 1], "をつ": [11, 1, 2, 1, 10, 1, 1, 2, 3, 1], "を年": [46, 1, 72, 1], "を整": [24, 1], "を返": [0, 1], "を達": [44, 1, 72, 1], "アイ": [58, 3, 72, 3], "アピ": [49, 1, 72, 1], "イブ": [86, 1], "オー": [105, 1], "カネ": [104, 1], "ケン": [105, 1], "サプ": [80, 1], "シス": [42, 1, 2, 1, 6, 2, 9, 1, 6, 2, 49, 1, 2, 1, 6, 2, 9, 1, 6, 2], "スか": [74, 1, 11, 1], "スに": [43, 1, 72, 1], "ス登": [72, 1], "セキ": [50, 1, 22, 1, 25, 1, 25, 1], "チャ": [25, 2, 47, 1], "チン": [72, 1], "デス": [27, 1], "トな": [23, 1], "トナ": [53, 1, 5, 1, 1, 1, 14, 1, 52, 1, 5, 1, 1, 1], "トペ": [85, 1], "トリ": [0, 5, 1, 1, 1, 2, 1, 1, 1, 2, 5, 1, 2, 2, 1, 2, 1, 3, 1, 7, 4, 1, 2, 1, 3, 2, 1, 7, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 7, 1, 3, 1, 2, 2, 1, 1, 2, 28, 1, 9, 1, 8, 2, 1, 4, 2, 1, 3, 1, 1, 1, 1, 1, 18, 1, 2, 1], "ト削": [50, 1, 4, 1, 68, 1, 4, 1], "ドホ": [111, 1], "ナガ": [101, 1], "ナー": [53, 1, 5, 1, 1, 1, 14, 1, 20, 1, 32, 1, 5, 1, 1, 1], "パン": [97, 1], "ビュ": [66, 1, 5, 1], "フェ": [13, 3], "ブと": [46, 1, 72, 1], "プラ": [47, 1, 4, 1, 20, 1, 9, 2, 39, 1, 4, 1], "ベル": [50, 1, 72, 1], "ペー": [1, 3, 1, 1, 11, 1, 1, 1, 10, 3, 2, 1, 1, 1, 13, 1, 28, 2, 4, 1, 2, 1, 10, 1, 1, 4, 1, 3, 2, 2, 3, 1, 1, 1, 21, 2], "ム2": [65, 1, 72, 1], "ムを": [37, 1], "メン": [0, 2, 1, 1, 1, 2, 7, 1, 5, 1, 3, 1, 1, 1, 3, 1, 13, 1], "ラル": [47, 2, 72, 2], "リが": [19, 1], "リー": [0, 5, 1, 1, 1, 2, 1, 1, 1, 2, 5, 1, 2, 2, 1, 2, 1, 3, 1, 7, 4, 1, 2, 1, 3, 2, 1, 7, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 7, 1, 3, 1, 2, 2, 1, 1, 2, 12, 1, 4, 2, 4, 1, 8, 1, 4, 1, 5, 1, 3, 1, 5, 3, 1, 4, 2, 1, 3, 1, 1, 1, 1, 1, 3, 1, 12, 1, 3, 1, 2, 1, 11, 1, 4, 1, 4, 1], "ルキ": [99, 1], "ルソ": [57, 2, 72, 1], "ル納": [58, 1, 72, 1], "ンサ": [50, 1, 72, 1], "ンフ": [43, 1, 37, 1, 20, 1, 11, 2, 4, 1], "ヶ月": [45, 1, 12, 1, 6, 1, 54, 1, 12, 1, 6, 1], "ーの": [24, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 21, 1, 16, 1, 12, 2, 1, 1, 43, 1], "ーマ": [11, 2, 3, 1, 10, 4, 9, 1, 2, 1, 1, 1, 4, 1, 46, 1, 14, 1], "ー導": [50, 1, 5, 1, 67, 1, 5, 1], "一緒": [17, 1, 19, 1, 2, 1, 28, 1, 1, 1], "上が": [14, 1, 5, 3, 7, 3], "不可": [71, 4], "不良": [43, 1, 1, 1, 16, 1, 55, 1, 1, 1, 16, 1], "中小": [0, 2, 2, 2, 5, 2, 12, 1, 49, 3, 4, 1, 4, 2, 2, 5, 2, 3, 2, 3, 3, 3, 5, 1, 3, 1, 18, 1, 2, 2], "中期": [47, 1, 1, 1, 1, 1, 1, 1, 69, 1, 1, 1, 1, 1, 1, 1], "中西": [97, 1], "了計": [71, 1], "予定": [0, 3, 1, 1, 1, 1, 1, 1, 4, 2, 1, 1, 2, 1, 5, 1, 13, 1, 7, 3, 12, 1, 22, 1, 2, 1, 1, 1, 1, 1, 3, 2, 43, 1], "争構": [39, 1, 11, 1], "事前": [71, 1], "事業": [0, 5, 2, 8, 1, 2, 4, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 3, 5, 1, 1, 1, 1, 1, 1, 4, 1, 3, 1, 1, 4, 1, 1, 1, 2, 3, 4, 1, 2, 1, 2, 2, 3, 1, 13, 1, 3, 1, 10, 11, 1, 7, 1, 1, 1, 1, 1, 3, 1, 3, 2, 2, 1, 1, 1, 1, 1, 2, 1, 1, 1, 10, 1, 3, 1, 2, 3, 1, 1, 2, 2, 1, 26, 1, 16, 3], "互協": [46, 1, 72, 1], "人が": [0, 1], "人応": [81, 1], "件8": [61, 1, 72, 1], "件と": [74, 1], "任命": [0, 1, 85, 3, 5, 1, 3, 1, 9, 2, 7, 2, 4, 1], "休廃": [80, 1], "伝わ": [29, 1, 48, 1, 2, 1, 2, 1], "伝承": [42, 1, 72, 1], "伴う": [88, 1], "体さ": [28, 1], "何で": [30, 1, 9, 1], "作の": [28, 1], "俊希": [98, 1], "健康": [72, 1], "働可": [45, 1, 72, 1], "億円": [7, 2, 21, 1, 33, 2, 15, 2, 57, 2], "入し": [28, 1], "入で": [47, 1, 3, 1, 69, 1, 3, 1], "全自": [50, 1, 72, 1], "典ペ": [68, 1, 4, 1, 41, 1], "内で": [34, 1, 24, 1, 72, 1], "写せ": [40, 1], "出れ": [82, 1], "分と": [20, 1], "初期": [47, 1, 3, 1, 10, 1, 5, 3, 54, 1, 3, 1, 10, 1, 5, 5], "別し": [86, 1], "制と": [80, 1], "創で": [56, 1, 72, 1], "力ネ": [59, 1, 72, 1], "助下": [70, 1], "効に": [25, 3], "動し": [94, 1], "動で": [28, 1], "動指": [43, 2, 72, 1], "動率": [52, 1, 72, 1], "務に": [25, 1], "募要": [0, 2, 3, 1, 5, 1, 60, 1, 1, 2, 6, 1, 3, 1, 4, 1, 2, 2, 1, 2, 1, 1, 1, 1, 5, 1], "化と": [42, 1, 36, 1, 2, 1, 34, 1], "化へ": [50, 1, 72, 1], "化計": [72, 1], "原価": [63, 2, 72, 2], "口動": [80, 2], "口工": [97, 1], "台市": [111, 1], "各制": [75, 1], "名は": [85, 1], "名簿": [85, 1, 1, 4, 16, 1, 7, 1], "告完": [71, 1], "周り": [13, 1, 4, 3], "員3": [7, 1, 64, 1, 5, 1], "員コ": [9, 1], "営と": [82, 1], "嘉手": [108, 1], "四国": [100, 3, 7, 3, 4, 1], "回だ": [38, 1], "回地": [109, 4], "国は": [78, 1], "型中": [2, 1, 66, 1], "域共": [43, 1, 72, 1], "基本": [3, 1, 4, 1, 63, 1, 6, 1, 6, 1], "声を": [109, 1], "外と": [18, 1], "外注": [57, 1, 4, 1, 68, 1, 4, 1], "外部": [39, 1, 7, 1, 25, 1], "好み": [19, 1], "子も": [22, 1], "子を": [13, 1, 11, 2, 1, 1], "子園": [0, 4, 3, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 4, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 31, 4, 1, 5, 1, 3, 1, 3, 1, 8, 1, 3, 1, 3, 1, 4, 1, 2, 1, 1, 1, 3, 1, 2, 1, 1, 2, 1, 3, 1, 1, 1, 3, 1, 1, 1, 3, 1, 20, 2], "学部": [42, 1, 72, 1], "安に": [28, 1], "安孫": [96, 1], "宏聡": [99, 1], "定経": [71, 1, 16, 1], "客側": [54, 1, 72, 1], "密部": [43, 1, 72, 1], "審査": [0, 7, 2, 6, 1, 2, 6, 1, 1, 1, 1, 1, 3, 3, 3, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 2, 3, 1, 7, 6, 34, 4, 5, 3, 13, 2], "小企": [0, 2, 2, 2, 5, 2, 12, 1, 49, 3, 4, 1, 4, 2, 2, 5, 2, 3, 2, 3, 3, 3, 5, 1, 3, 1, 18, 1, 2, 2], "尼崎": [101, 1], "属加": [28, 1], "山口": [100, 1, 7, 1], "川端": [99, 1], "市場": [26, 1, 13, 1, 12, 1, 10, 3, 5, 1, 7, 1, 50, 1, 10, 4], "年商": [28, 1, 1, 1], "年度": [28, 1, 33, 1, 48, 1, 24, 1], "度と": [28, 1], "度書": [79, 1], "引増": [55, 1, 72, 1], "当サ": [91, 1, 1, 2, 5, 1, 12, 1], "当日": [113, 1], "当者": [28, 1], "役に": [24, 1, 10, 1], "後の": [3, 1, 11, 4, 14, 1], "後回": [0, 1], "従来": [57, 1, 72, 1], "得ら": [23, 2], "応の": [47, 1, 72, 1], "性改": [60, 1, 72, 1], "性革": [78, 1, 2, 1, 2, 1], "恵大": [97, 1], "成を": [45, 1, 47, 1, 25, 1], "成時": [70, 1], "戦え": [39, 1], "戦と": [89, 1], "所を": [85, 1], "手不": [49, 1, 19, 1, 53, 1], "手納": [108, 1], "手製": [54, 1, 72, 1], "扱っ": [85, 3], "投資": [2, 1, 1, 2, 7, 1, 13, 1, 24, 1, 1, 1, 2, 1, 1, 1, 5, 1, 4, 1, 5, 3, 3, 2, 1, 1, 9, 1, 1, 2, 1, 1, 1, 1, 8, 1, 30, 1, 1, 1, 2, 1, 1, 1, 5, 1, 4, 1, 5, 5], "担増": [47, 1, 72, 1], "担大": [60, 1, 72, 1], "持っ": [3, 1, 8, 1, 29, 1], "指標": [51, 2, 1, 2, 1, 2, 1, 2, 1, 2, 23, 1, 45, 3, 1, 3, 1, 3, 1, 3, 1, 3], "掘り": [6, 1, 18, 1, 3, 1], "推定": [68, 1, 6, 1], "提を": [17, 1], "援策": [79, 1], "整う": [79, 1], "整理": [20, 1, 3, 3, 1, 1, 15, 1, 2, 1], "料か": [84, 1], "料費": [48, 1, 13, 1, 4, 1, 55, 1, 13, 1, 4, 1], "断は": [87, 1], "新を": [84, 1], "新卒": [46, 1, 72, 1], "方に": [66, 1], "日で": [28, 2], "書な": [23, 1], "替品": [55, 5, 72, 7], "最も": [69, 1], "最終": [85, 5], "月な": [63, 1], "月確": [109, 1], "期1": [57, 1, 72, 1], "期パ": [53, 1, 6, 1, 66, 1, 6, 1], "期契": [52, 1, 72, 1], "未経": [71, 1], "本城": [111, 1], "材育": [49, 1, 11, 1, 61, 1, 11, 1], "松田": [101, 1], "果の": [35, 1], "査設": [59, 1, 72, 1], "格の": [52, 1, 10, 1, 62, 1, 10, 1], "案会": [43, 1, 72, 1], "械を": [47, 1, 72, 1], "械市": [51, 1, 72, 1], "検討": [0, 1], "業は": [7, 3, 22, 1, 47, 3], "業承": [0, 3, 2, 2, 1, 2, 4, 1, 1, 1, 1, 2, 1, 1, 1, 1, 3, 2, 5, 1, 4, 2, 19, 1, 26, 4, 1, 7, 3, 2, 3, 2, 1, 1, 4, 7, 2, 1, 3, 1, 1, 2, 28, 1], "業機": [28, 1], "業生": [78, 1, 2, 1, 2, 1], "歳以": [0, 2, 1, 1, 6, 1, 8, 1, 20, 1, 14, 1, 27, 1, 45, 1], "歳超": [80, 1], "残業": [49, 2, 72, 2], "気候": [80, 1], "水準": [28, 1], "法で": [13, 1, 34, 1, 72, 1], "流コ": [52, 1, 72, 1], "渉力": [52, 4, 2, 3, 70, 5, 2, 4], "源を": [22, 1], "点か": [36, 1, 31, 1], "点事": [0, 1, 2, 1, 6, 1, 60, 1, 4, 3, 6, 2, 7, 1], "熊本": [0, 1, 101, 1, 7, 1, 3, 1], "物に": [28, 1], "特に": [109, 1], "特ホ": [107, 1], "率9": [44, 1, 72, 1], "環を": [80, 1], "用な": [25, 1], "画認": [72, 1], "界の": [66, 1, 14, 2], "略し": [94, 1], "県の": [94, 1], "短期": [47, 1, 1, 1, 1, 1, 1, 1, 69, 1, 1, 1, 1, 1, 1, 1], "研究": [2, 1, 66, 2], "社だ": [59, 3, 72, 3], "社ダ": [105, 1], "社佐": [100, 1], "社辰": [99, 1], "福岡": [101, 1, 7, 1], "積み": [43, 1, 72, 1], "竜城": [105, 1], "章を": [26, 3, 11, 1, 2, 3, 27, 1], "競合": [39, 1, 5, 1, 1, 1, 1, 2, 7, 5, 9, 6, 54, 3, 1, 3, 1, 4, 7, 7, 9, 7], "等に": [72, 1], "簡易": [23, 1], "粗利": [48, 2, 72, 2], "約6": [80, 1], "納期": [28, 2, 14, 1, 3, 2, 6, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 2, 1, 52, 1, 3, 2, 6, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 2, 1], "紹介": [90, 1, 19, 1], "経過": [71, 1], "継に": [14, 1], "縄ブ": [111, 1], "羅性": [25, 1], "羽生": [90, 2, 7, 2, 12, 1], "者7": [80, 1], "者で": [78, 1, 1, 3, 3, 1, 11, 1], "良品": [43, 1, 1, 1, 71, 1, 1, 1], "若林": [107, 2], "葉に": [39, 1], "藤商": [100, 1, 3, 1], "行の": [111, 1, 17, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "術投": [50, 1, 72, 1], "術者": [64, 2, 72, 2], "表未": [71, 1], "表示": [12, 1, 82, 1, 18, 1], "補修": [28, 1], "見積": [28, 4, 25, 1, 1, 1, 4, 1, 13, 1, 54, 1, 1, 1, 4, 1], "規模": [2, 1, 5, 1, 19, 1, 3, 1, 6, 1, 13, 1, 3, 1, 10, 3, 5, 1, 2, 2, 2, 1, 6, 1, 44, 1, 3, 1, 10, 4], "設問": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "認く": [69, 1, 23, 1], "認は": [1, 1], "説明": [71, 1, 15, 1, 26, 1, 1, 1], "読み": [11, 1, 2, 1, 22, 1, 1, 2, 31, 2, 10, 1, 2, 3, 2, 1, 1, 1], "請不": [71, 4], "論よ": [43, 1, 72, 1], "資す": [73, 1], "資料": [20, 1, 58, 1, 4, 1, 2, 1], "質検": [42, 1, 72, 1], "質第": [43, 1, 13, 1, 59, 1, 13, 1], "載せ": [77, 1, 3, 1], "込ま": [79, 1], "近道": [89, 1], "近隣": [45, 1, 72, 1], "造を": [28, 1], "週間": [45, 2, 12, 1, 1, 1, 59, 2, 12, 1, 1, 1], "部出": [42, 1, 72, 1], "金3": [7, 1, 69, 1], "金申": [14, 1, 23, 1, 10, 1, 72, 1], "錦戸": [108, 1], "長す": [22, 1], "開き": [34, 1, 4, 1], "開業": [71, 1], "間以": [45, 1, 12, 1, 60, 1, 12, 1], "間接": [80, 1], "阪府": [99, 1, 7, 1], "降生": [0, 1], "隆典": [101, 1], "障の": [80, 1], "順書": [42, 1, 72, 1], "領な": [84, 1], "題の": [19, 1, 16, 1], "類だ": [18, 1], "類提": [2, 1, 2, 1, 5, 1, 3, 1, 2, 1, 21, 1, 51, 1], "験者": [1, 1, 92, 1], "骨太": [78, 2, 2, 4], "﨑銃": [99, 1]};
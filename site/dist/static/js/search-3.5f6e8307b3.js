@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_3 = {"03": [85, 1, 28, 1], "0歳": [49, 1, 31, 1, 41, 1], "14": [74, 1, 11, 1, 1, 1], "1つ": [27, 1, 39, 1, 62, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "1億": [7, 1, 69, 1], "1年": [28, 1, 19, 1, 72, 1], "25": [0, 2, 1, 1, 3, 2, 7, 4, 1, 1, 1, 1, 1, 3, 10, 1, 11, 1, 12, 1, 18, 1, 13, 1, 2, 2, 2, 1, 3, 1, 17, 2, 7, 1, 2, 2, 8, 1, 18, 1], "2以": [70, 1], "2日": [13, 1, 15, 1], "36": [78, 1], "3件": [46, 1, 69, 1, 3, 1], "3制": [68, 1], "4万": [63, 2, 72, 2], "5軸": [28, 1], "ad": [28, 1], "at": [27, 1, 39, 2, 22, 2], "be": [100, 1], "bサ": [65, 1, 72, 1], "dg": [40, 1, 40, 1], "dプ": [50, 1, 5, 4, 16, 1, 51, 1, 5, 4], "ex": [65, 4, 72, 2], "eと": [66, 1], "g通": [50, 1, 72, 1], "h事": [2, 1, 66, 1], "iが": [26, 1, 1, 2, 7, 1, 4, 2, 2, 4], "i経": [27, 3], "i補": [40, 1], "kの": [109, 1], "lo": [50, 3, 44, 1, 17, 1, 11, 3], "na": [88, 1], "or": [27, 1, 12, 1, 1, 1, 10, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 61, 1, 1, 1, 1, 1, 5, 3, 1, 3, 1, 3, 1, 3, 1, 3], "q4": [7, 1, 69, 1], "re": [94, 2], "sv": [94, 1], "tg": [27, 1, 39, 2, 22, 1], "uh": [90, 1], "xに": [42, 1, 72, 1], "いし": [20, 1], "いで": [25, 1, 6, 1, 35, 2], "い資": [82, 1], "う変": [33, 1], "える": [5, 1, 15, 1, 4, 1, 4, 1, 6, 1, 2, 1, 3, 2, 1, 2, 3, 1, 23, 1, 1, 1, 1, 1, 4, 1, 4, 1, 2, 1, 1, 1, 10, 1, 26, 1], "おき": [13, 1, 11, 1, 3, 1], "かの": [1, 1, 6, 1, 7, 1, 54, 1, 4, 1, 4, 2, 4, 1], "がわ": [15, 1, 24, 1], "が使": [37, 1, 31, 1], "が可": [50, 1, 72, 1], "が実": [50, 1, 72, 1], "が承": [78, 1], "が挿": [25, 1], "が良": [25, 1], "が食": [84, 1], "くも": [84, 1], "ぐこ": [3, 1, 76, 1], "こう": [0, 1], "さと": [28, 1, 72, 1], "しな": [1, 2, 13, 1, 11, 1], "し出": [23, 1], "すが": [3, 1, 16, 1, 3, 2, 3, 2, 11, 1, 31, 1, 21, 1, 4, 1], "すれ": [14, 1, 6, 1, 7, 1, 53, 1, 29, 3], "せま": [28, 1, 12, 1, 37, 1, 9, 1], "そば": [67, 1], "たも": [24, 1, 3, 1, 52, 1, 1, 1], "た時": [22, 1, 1, 1, 13, 1, 31, 1], "だっ": [28, 1, 14, 1, 39, 1, 33, 1], "だん": [14, 1, 6, 1, 46, 1], "ちつ": [42, 1, 72, 1], "ち約": [80, 1], "って": [0, 3, 3, 2, 8, 1, 2, 1, 1, 2, 4, 1, 1, 3, 1, 2, 2, 1, 2, 3, 1, 1, 2, 1, 1, 1, 1, 1, 3, 1, 1, 1, 2, 2, 2, 2, 2, 1, 1, 1, 16, 1, 10, 1, 3, 1, 3, 3, 5, 2, 1, 4, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 3, 3, 1, 1, 1, 39, 1], "つで": [83, 1], "てす": [79, 1], "てど": [22, 1], "て利": [24, 1], "て継": [44, 1, 72, 1], "て載": [77, 1], "でお": [3, 1], "でな": [13, 1, 6, 1], "で人": [48, 1, 1, 1, 71, 1, 1, 1], "で会": [25, 1], "で優": [0, 2, 23, 1, 45, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "で半": [65, 1, 72, 1], "で固": [20, 1], "で確": [0, 1, 1, 1, 6, 3, 16, 1, 45, 1, 8, 4, 9, 2, 1, 1, 27, 1], "で緊": [45, 1, 72, 1], "で通": [45, 1, 72, 1], "とか": [18, 1, 3, 3], "とに": [2, 1, 4, 1, 14, 3, 17, 1, 30, 1, 1, 1, 6, 1], "とニ": [85, 1], "と下": [26, 1], "と例": [61, 2, 2, 2, 70, 1, 2, 1], "と運": [65, 1, 72, 3], "どが": [88, 1], "どれ": [35, 1], "な設": [45, 1, 72, 1], "な追": [64, 1, 72, 1], "にの": [88, 1], "にま": [69, 1], "にマ": [44, 1, 72, 1], "に対": [1, 1, 1, 1, 14, 1, 7, 1, 4, 1, 101, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "に明": [2, 1, 66, 1], "に現": [94, 1], "に聞": [0, 1, 24, 1], "の1": [23, 1, 22, 1, 72, 1], "のa": [13, 2, 12, 1, 2, 2, 7, 1, 2, 1, 30, 2, 22, 1], "のパ": [4, 1, 3, 1, 17, 1, 3, 1, 10, 1, 30, 1, 9, 1, 12, 1, 3, 1], "の両": [56, 1, 10, 1, 62, 1], "の価": [48, 1, 72, 1], "の信": [42, 1, 4, 1, 68, 1, 4, 1], "の共": [56, 1, 72, 1], "の向": [55, 1, 72, 1], "の品": [51, 1, 5, 1, 67, 1, 5, 1], "の扱": [88, 3, 3, 3], "の拡": [51, 1, 27, 1, 45, 1], "の挑": [0, 1, 28, 1, 50, 1, 11, 1], "の採": [48, 1, 72, 1], "の流": [24, 1, 29, 1, 32, 3, 1, 2, 39, 1], "の深": [54, 1, 72, 1], "の省": [68, 1], "の私": [77, 1], "の要": [42, 1, 26, 1, 46, 1], "の話": [0, 2, 11, 1, 2, 1, 6, 1, 2, 1, 2, 1, 56, 1, 2, 2], "の近": [89, 1], "の送": [13, 1], "の金": [68, 1, 17, 1], "は2": [3, 1, 63, 1], "はあ": [0, 3, 1, 3, 1, 3, 1, 3, 1, 2, 3, 2, 12, 1, 5, 3, 3, 2, 10, 2, 39, 2, 6, 1, 6, 2, 3, 1, 1, 1], "はも": [7, 1, 69, 1], "は参": [19, 1], "は時": [25, 1], "は求": [81, 1], "は関": [7, 1, 69, 1, 19, 1], "ばん": [78, 1, 11, 1], "ふと": [101, 1], "みを": [25, 1, 17, 1, 2, 1, 1, 1, 1, 1, 31, 1, 37, 1, 2, 3, 1, 3, 1, 3], "も情": [46, 1, 72, 1], "も評": [79, 1], "や大": [110, 1], "や海": [55, 1, 72, 1], "よる": [14, 1, 36, 1, 5, 1, 4, 1, 1, 1, 2, 2, 7, 1, 3, 2, 1, 1, 49, 1, 5, 1, 4, 1, 1, 1, 2, 2], "られ": [0, 1, 1, 2, 6, 3, 4, 1, 2, 1, 1, 1, 1, 3, 8, 4, 3, 1, 1, 3, 10, 1, 32, 1, 7, 4, 1, 4, 1, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 1, 28, 1], "ら作": [85, 1], "ら慌": [24, 1], "ら補": [0, 2, 3, 3], "りそ": [76, 1], "り前": [7, 1, 69, 1], "るの": [3, 2, 17, 1, 7, 1, 1, 1, 6, 1, 3, 1, 4, 1, 15, 3, 12, 1, 9, 1, 1, 1, 1, 1, 49, 3], "る現": [60, 1, 72, 1], "る精": [43, 1, 72, 1], "れた": [0, 1, 7, 2, 19, 1, 2, 1, 7, 1, 2, 1, 32, 1, 7, 2, 1, 4, 1, 3, 1, 4, 1, 3, 1, 3, 1, 3, 20, 1, 8, 1], "れは": [0, 1, 19, 1, 15, 1, 54, 1], "を5": [80, 1], "をさ": [25, 1, 55, 1], "をフ": [11, 1, 13, 1], "を仕": [24, 1], "を入": [66, 1], "を創": [42, 1, 72, 1], "を引": [85, 1], "を知": [88, 1], "を若": [44, 1, 12, 1, 60, 1, 12, 1], "んぶ": [40, 1], "ァイ": [2, 3, 7, 1, 5, 2, 9, 1, 11, 1, 2, 1, 4, 2, 26, 3, 1, 1, 1, 4, 1, 1, 3, 3, 18, 1, 3, 1, 2, 1], "アフ": [55, 1, 72, 1], "イデ": [58, 3, 72, 3], "ォー": [11, 2, 13, 6, 1, 1, 10, 2, 1, 1, 15, 1, 35, 1, 37, 1], "ク2": [78, 1], "クを": [13, 2, 43, 1, 30, 1, 42, 1], "クア": [1, 1], "シオ": [105, 1], "ジに": [26, 1, 58, 1, 8, 1], "ジ末": [85, 1], "タを": [28, 1, 10, 1, 12, 1, 41, 1, 31, 1], "テラ": [44, 1, 12, 1, 60, 1, 12, 1], "トに": [11, 1, 3, 2, 3, 1, 7, 1, 12, 1, 51, 3, 2, 3, 2, 1], "トカ": [94, 1], "ト見": [47, 1, 72, 1], "ト運": [97, 1], "ナ禍": [42, 1, 72, 1], "バッ": [23, 1], "バン": [78, 1, 4, 1], "フト": [45, 1, 3, 1, 69, 1, 3, 1], "ブラ": [24, 1, 12, 2, 31, 2, 21, 2], "プリ": [24, 1, 1, 1, 2, 3, 23, 1, 5, 4, 40, 1, 27, 1, 5, 4], "ベー": [22, 1], "ホの": [25, 1, 11, 1, 30, 1, 1, 1, 21, 1, 3, 1], "ボタ": [25, 1, 2, 1, 11, 1, 2, 1], "ミア": [45, 1, 72, 1], "ム監": [50, 1, 72, 1], "ルの": [25, 1, 110, 1], "ルギ": [80, 1], "レミ": [45, 1, 72, 1], "ロだ": [81, 1], "ログ": [42, 1, 49, 1, 23, 1], "ン試": [62, 1, 72, 1], "ーは": [0, 1, 3, 1, 10, 1, 5, 1, 17, 1, 31, 1, 23, 1, 20, 1], "ーク": [56, 1, 3, 1, 34, 1, 35, 1, 3, 1], "ータ": [28, 1, 8, 1, 2, 1, 4, 2, 3, 1, 5, 2, 17, 1, 1, 1, 7, 1, 3, 1, 4, 2, 3, 3, 3, 3, 3, 4, 5, 1, 18, 2, 3, 1, 5, 2], "ー募": [113, 1], "一元": [54, 1, 72, 1], "万人": [80, 2], "三和": [108, 1], "下の": [0, 1, 26, 1, 1, 1, 11, 1, 5, 1, 23, 1, 2, 1, 42, 1, 5, 1], "下ま": [7, 4, 69, 4], "並べ": [1, 1], "主の": [71, 1], "了す": [11, 1, 13, 1], "争が": [53, 1, 72, 1], "人前": [18, 4], "任の": [94, 2], "似た": [85, 1, 1, 1], "低価": [50, 1, 12, 1, 60, 1, 12, 1], "体制": [45, 1, 1, 2, 1, 1, 11, 1, 1, 1, 5, 2, 16, 1, 37, 1, 1, 2, 1, 1, 11, 1, 1, 1, 5, 2], "体化": [73, 1], "併用": [70, 1], "価値": [23, 1, 19, 2, 1, 2, 1, 2, 1, 2, 1, 2, 2, 2, 30, 2, 1, 2, 1, 1, 34, 1, 1, 1, 1, 2, 1, 2, 1, 2, 2, 2], "候補": [80, 1], "健全": [63, 1, 72, 1], "備が": [24, 1, 23, 1, 72, 1], "催は": [19, 1], "優勝": [24, 1, 13, 1], "元化": [54, 1, 72, 1], "充と": [78, 1], "先に": [24, 1, 3, 1], "入8": [65, 1, 72, 1], "入予": [47, 1, 72, 1], "入計": [72, 1], "公募": [0, 3, 3, 2, 5, 2, 3, 1, 3, 1, 54, 4, 1, 2, 2, 1, 1, 1, 2, 5, 1, 2, 3, 1, 4, 1, 2, 2, 1, 2, 1, 1, 1, 1, 5, 1], "公式": [0, 2, 2, 2, 1, 1, 6, 1, 2, 1, 1, 1, 1, 1, 6, 1, 5, 2, 11, 2, 33, 4, 4, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2, 3, 1, 5, 1, 5, 6, 1, 17, 1, 1, 4, 1, 3, 1, 3, 1, 5], "典に": [77, 1], "内部": [78, 1], "円安": [48, 1, 72, 1], "出前": [1, 1, 12, 1, 21, 1, 1, 3], "切り": [13, 1, 21, 1, 2, 1, 31, 1], "前提": [17, 1, 44, 2, 10, 1, 9, 1, 53, 2], "力の": [52, 2, 2, 3, 1, 1, 69, 1, 2, 2, 1, 1], "力低": [49, 1, 72, 1], "功時": [60, 3, 72, 4], "効果": [35, 1], "務作": [47, 1, 72, 1], "化す": [56, 1, 72, 1], "化ラ": [50, 1, 72, 1], "半額": [65, 1, 72, 1], "去の": [102, 1], "参入": [42, 1, 9, 6, 8, 3, 55, 1, 9, 8, 8, 4], "反映": [40, 1, 44, 1, 2, 1], "合に": [20, 1, 19, 1, 5, 1, 1, 1, 1, 1, 70, 3, 1, 3, 1, 3], "吉本": [107, 1], "同族": [78, 1], "品比": [48, 1, 72, 1], "商秩": [80, 1], "善し": [79, 1], "善大": [100, 1], "営す": [0, 1], "営革": [71, 1, 1, 1, 15, 1], "困っ": [26, 1], "在庫": [52, 1, 72, 1], "地図": [1, 1, 85, 2, 8, 5], "型の": [80, 1], "城山": [101, 1], "域ア": [1, 1, 84, 1, 1, 1, 4, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 4, 1], "場で": [0, 1, 17, 1, 11, 1, 2, 3, 13, 1, 8, 1, 64, 1, 8, 1], "多能": [45, 1, 72, 1], "大会": [0, 4, 2, 2, 7, 1, 2, 1, 3, 7, 4, 2, 1, 1, 3, 1, 11, 1, 35, 4, 11, 1, 6, 3, 1, 2, 3, 1, 1, 1, 5, 4, 14, 2, 1, 1, 1, 7, 1, 1, 1, 1], "大阪": [0, 1, 99, 1, 7, 1, 5, 1], "失い": [23, 1], "契約": [52, 1, 19, 1, 53, 1], "始ま": [28, 1, 40, 1], "姿勢": [46, 1, 72, 1], "子帳": [47, 2, 72, 2], "守る": [79, 2], "官任": [90, 1], "実を": [16, 1], "容が": [28, 1, 13, 1, 47, 1], "寧な": [6, 1], "対話": [13, 1, 1, 1, 48, 1, 72, 1], "対象": [0, 2, 1, 1, 2, 1, 7, 1, 1, 1, 3, 1, 8, 1, 36, 6, 3, 1, 10, 2, 5, 1, 54, 4, 3, 1], "小売": [7, 1, 69, 1], "届き": [0, 1, 14, 1, 20, 1, 47, 1, 5, 1], "島根": [100, 1], "工芸": [96, 1], "常に": [84, 1, 3, 1], "常態": [54, 1, 72, 1], "年7": [85, 2, 17, 1, 7, 1], "年で": [48, 1, 72, 1], "広島": [100, 1], "度9": [60, 1, 72, 1], "庫回": [52, 1, 72, 1], "建設": [7, 1, 69, 1, 23, 1, 1, 1], "引先": [28, 1], "引用": [85, 1], "弱い": [34, 1], "当て": [35, 1], "当然": [18, 1], "征純": [105, 1], "徳島": [100, 1, 7, 1], "必須": [20, 1], "応募": [7, 1, 4, 2, 2, 1, 2, 1, 9, 3, 8, 1, 3, 1, 2, 1, 39, 1, 3, 1, 2, 1, 4, 2, 7, 1, 19, 1], "念と": [43, 1, 72, 1], "急案": [45, 1, 72, 1], "性確": [71, 1], "想論": [43, 1, 72, 1], "態の": [80, 1], "成コ": [60, 1, 72, 1], "手の": [38, 3, 16, 1, 72, 3], "扱い": [88, 3, 3, 3], "技術": [32, 1, 10, 2, 1, 3, 1, 2, 2, 1, 4, 5, 3, 2, 2, 1, 1, 3, 2, 1, 1, 2, 3, 1, 2, 3, 16, 1, 34, 2, 1, 3, 1, 2, 2, 1, 4, 6, 3, 2, 2, 1, 1, 3, 2, 1, 1, 2, 3, 1, 2, 3], "持つ": [24, 1], "指定": [44, 1, 72, 1], "指示": [25, 3, 2, 1, 7, 3, 4, 1, 1, 1, 27, 4, 22, 1], "接書": [28, 1, 13, 1], "接記": [80, 1], "推移": [51, 1, 72, 1], "援で": [87, 1], "散件": [80, 1], "数3": [63, 1, 72, 1], "整し": [94, 1], "文ペ": [86, 1], "料が": [39, 1, 43, 1], "断材": [16, 1], "方が": [78, 1], "族関": [71, 1], "日と": [85, 1, 7, 1], "日付": [1, 1, 111, 1], "書か": [24, 1], "月任": [102, 1], "末尾": [85, 1], "果た": [25, 1], "査の": [0, 2, 11, 1, 10, 1, 1, 1, 51, 3, 13, 1], "根県": [100, 1], "格は": [79, 1], "梅木": [103, 1], "業数": [51, 1, 4, 1, 68, 1, 4, 1], "様に": [79, 1], "模や": [66, 1], "権が": [54, 1, 72, 1], "機関": [71, 1, 9, 1, 7, 1], "歩が": [7, 1], "比率": [48, 1, 72, 1], "気質": [42, 1, 72, 1], "決勝": [14, 3, 71, 1, 1, 1, 9, 1, 14, 1, 2, 1, 1, 1, 1, 1], "決断": [79, 1], "法と": [24, 1], "注か": [42, 1, 72, 1], "深い": [54, 1, 72, 1], "清書": [26, 1], "満足": [60, 1, 72, 1], "準備": [0, 1, 3, 1, 2, 4, 7, 1, 1, 1, 1, 1, 10, 1, 43, 1, 7, 1], "潮流": [80, 2], "点が": [14, 1, 5, 1, 49, 2, 10, 1, 1, 1], "無駄": [20, 1], "玉県": [97, 1], "玲弥": [105, 1], "環境": [39, 1, 7, 1, 1, 1, 72, 1], "用に": [55, 1, 37, 1, 35, 1], "用下": [25, 1], "画の": [71, 1, 1, 1, 1, 4], "界は": [68, 1], "界実": [59, 1, 72, 1], "的資": [80, 1], "監視": [50, 2, 72, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "直し": [28, 1, 13, 1, 7, 1, 34, 1, 38, 1], "相手": [17, 4, 11, 1, 38, 1, 27, 1], "相見": [53, 1, 1, 1, 71, 1, 1, 1], "県は": [94, 1], "確保": [49, 1, 24, 1, 48, 1], "確認": [0, 2, 1, 2, 1, 1, 1, 1, 4, 3, 1, 1, 2, 1, 4, 1, 1, 1, 8, 1, 1, 2, 3, 1, 8, 1, 33, 2, 1, 1, 2, 3, 1, 2, 4, 4, 1, 1, 1, 4, 2, 1, 2, 1, 2, 2, 1, 8, 1, 2, 6, 1, 17, 1, 4, 2], "社員": [0, 1, 17, 1], "社山": [103, 1, 4, 1], "社岡": [105, 1], "競争": [39, 1, 10, 1, 1, 1, 3, 3, 68, 1, 4, 2], "算出": [61, 1, 72, 3], "算悪": [48, 1, 72, 1], "簿も": [86, 1], "約で": [52, 1, 72, 1], "継完": [42, 1, 29, 1, 43, 1], "続き": [13, 1, 1, 1, 23, 1], "網羅": [20, 1, 5, 1], "義が": [19, 1, 37, 1, 72, 1], "者と": [0, 2, 7, 1, 4, 1, 2, 1, 1, 1, 7, 1, 5, 1, 1, 1, 49, 1, 4, 1, 6, 1, 3, 3, 1, 3, 1, 3, 1, 3, 5, 1], "者へ": [1, 1], "者全": [2, 1], "職リ": [49, 1, 72, 1], "職人": [42, 4, 1, 1, 1, 1, 1, 1, 11, 1, 58, 4, 1, 1, 1, 1, 1, 1, 11, 1], "背景": [42, 2, 1, 2, 13, 2, 25, 1, 33, 1, 1, 1, 13, 1], "能だ": [51, 1, 72, 1], "葉県": [97, 1], "行は": [87, 1], "行わ": [24, 1], "表か": [85, 2], "表に": [1, 1, 85, 1], "補は": [80, 1], "製造": [7, 1, 21, 1, 15, 1, 3, 1, 3, 2, 5, 1, 7, 2, 3, 1, 12, 1, 39, 1, 3, 1, 3, 2, 5, 1, 7, 2, 3, 1], "要年": [114, 1], "規参": [51, 5, 72, 7], "規獲": [63, 1, 72, 1], "覧ペ": [88, 1], "言っ": [0, 1], "計に": [79, 1], "計画": [14, 1, 7, 1, 50, 3, 1, 5, 1, 5, 4, 1, 2, 1, 2, 3], "試す": [24, 1, 9, 1], "試等": [68, 1], "誇り": [42, 1, 72, 1], "請の": [47, 1, 24, 1, 21, 2, 27, 1], "負っ": [0, 1], "貴大": [103, 1], "費の": [71, 1], "資会": [101, 2, 7, 1], "賞金": [3, 1], "質不": [62, 1, 72, 1], "質認": [51, 1, 72, 1], "赤字": [137, 1], "足度": [60, 1, 72, 1], "身の": [13, 1], "載が": [84, 1], "込は": [113, 1], "込み": [35, 1, 12, 1, 14, 1, 7, 1, 51, 1, 14, 1], "近い": [80, 1], "返し": [0, 1, 38, 3, 5, 1, 72, 1], "追加": [47, 1, 17, 1, 22, 2, 25, 11, 8, 1, 17, 1], "進展": [55, 1, 72, 1], "遇措": [2, 3, 66, 3], "選含": [0, 1, 3, 1, 65, 1, 4, 1], "部に": [71, 1], "重加": [2, 1, 7, 1, 5, 1, 54, 1, 1, 1, 3, 1], "金年": [48, 1, 72, 1], "間試": [61, 2, 72, 2], "陽子": [101, 1], "陽祐": [101, 1], "際の": [24, 1, 62, 2], "際潮": [80, 1], "雄大": [97, 2], "領に": [0, 1], "題は": [19, 1, 59, 1], "高辻": [107, 1]};
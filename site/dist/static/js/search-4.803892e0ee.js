@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_4 = {"0億": [61, 2, 72, 2], "0年": [28, 1, 14, 3, 2, 1, 12, 1, 3, 1, 55, 3, 2, 1, 12, 1, 3, 1], "15": [0, 1, 3, 1, 5, 1, 2, 1, 35, 1, 1, 1, 2, 1, 12, 1, 8, 1, 1, 1, 5, 3, 1, 1, 7, 1, 3, 4, 1, 3, 23, 1, 4, 2, 4, 1, 1, 1, 2, 1, 12, 1], "26": [0, 2, 2, 1, 1, 2, 5, 1, 4, 1, 2, 1, 54, 1, 1, 1, 5, 6, 1, 3, 3, 3, 1, 1, 1, 5, 2, 2, 3, 7, 1, 6, 23, 3, 2, 1, 2, 4], "2ヶ": [63, 1, 72, 1], "2兆": [80, 1], "3万": [61, 1, 72, 1], "48": [58, 1, 72, 1], "4月": [0, 1, 7, 1, 69, 1], "6確": [0, 1, 2, 1, 6, 1, 2, 1, 68, 1], "7開": [74, 1], "au": [27, 1, 39, 3, 22, 1], "dx": [42, 1, 1, 1, 6, 1, 7, 1, 58, 1, 1, 1, 6, 1, 7, 1], "ko": [40, 1], "kは": [25, 1], "oc": [49, 3, 72, 3], "os": [40, 1], "o体": [80, 1], "pd": [13, 1, 11, 2, 11, 1, 51, 1, 23, 1, 2, 1], "pt": [27, 1, 39, 2, 22, 1], "p約": [80, 1], "sg": [80, 1], "th": [88, 1], "tと": [66, 1], "xが": [43, 1, 72, 1], "あて": [7, 2, 69, 2], "いと": [21, 1, 6, 1, 7, 1, 2, 1], "いよ": [25, 1], "い風": [39, 2], "うな": [33, 1, 2, 1, 31, 1, 13, 1], "う人": [25, 1], "えが": [27, 1, 1, 1], "かみ": [105, 1], "が一": [30, 1], "が加": [14, 1], "が成": [78, 1], "が提": [34, 1], "が新": [79, 1], "が最": [26, 1, 43, 1], "が激": [53, 1, 72, 1], "が異": [68, 1], "が言": [39, 1], "が限": [42, 1, 72, 1], "き価": [42, 2, 72, 1], "くこ": [16, 1, 4, 1, 54, 1], "け入": [43, 1, 11, 1, 61, 1, 11, 1], "げて": [24, 1, 54, 1, 2, 1], "こし": [72, 1], "こで": [18, 1, 6, 1, 1, 1, 12, 1, 2, 1, 38, 1, 1, 1], "ごと": [2, 1, 4, 1, 7, 3, 1, 1, 17, 1, 3, 2, 3, 1, 1, 1, 10, 1, 19, 1, 1, 1, 12, 3, 40, 1], "ご相": [26, 1, 61, 1], "さら": [37, 1], "しか": [18, 1, 12, 1], "しに": [0, 1, 35, 1, 1, 1], "せた": [0, 1], "たc": [28, 1], "たこ": [0, 3, 1, 3, 1, 3, 1, 3, 23, 1, 52, 3], "たっ": [69, 1], "たコ": [40, 3], "だ答": [28, 1], "てお": [13, 1, 7, 1, 4, 1, 3, 1, 9, 1, 30, 1, 1, 1, 7, 1, 3, 1], "て上": [78, 1], "て出": [66, 1], "て区": [85, 1], "でか": [18, 1], "でに": [1, 1, 3, 1, 7, 1, 24, 1, 5, 1, 40, 1], "で下": [78, 1], "で事": [14, 1, 7, 1, 26, 1, 72, 1], "で任": [102, 1], "で医": [42, 1, 72, 1], "で構": [14, 1], "で残": [49, 1, 72, 1], "で治": [50, 1, 72, 1], "で盛": [19, 3], "で立": [39, 1], "で見": [0, 3, 1, 3, 1, 3, 1, 3, 25, 1, 6, 3, 24, 1, 54, 3, 18, 1], "で運": [82, 1], "で開": [0, 1, 28, 1], "で電": [47, 1, 72, 1], "とが": [26, 1, 10, 1, 31, 1, 5, 1], "と公": [80, 1, 4, 1, 26, 3, 1, 3, 1, 3, 1, 3], "と呼": [78, 1], "と応": [11, 1, 2, 1, 11, 1], "と検": [59, 1, 7, 1, 65, 1], "と経": [42, 1, 38, 1, 5, 1, 29, 1], "と背": [81, 1], "と補": [11, 1, 68, 1], "なぎ": [81, 1], "なの": [3, 1, 10, 1, 6, 1, 1, 1, 2, 1, 22, 2, 1, 2, 1, 2, 20, 1, 18, 1, 32, 1, 1, 1, 1, 1], "な対": [57, 1, 5, 1, 67, 1, 5, 1], "にく": [0, 1, 17, 1, 62, 1], "には": [0, 1, 7, 1, 10, 1, 3, 1, 48, 1, 8, 1, 4, 2, 12, 2], "にわ": [34, 1], "に使": [7, 1, 7, 1, 11, 3, 10, 1, 4, 1, 1, 1, 36, 1], "に実": [80, 1], "に承": [3, 1, 7, 1], "に生": [7, 2, 10, 1, 59, 2], "に響": [79, 1], "の2": [23, 1, 46, 1], "のあ": [13, 1, 67, 1], "のひ": [19, 1], "のも": [20, 1, 8, 1, 13, 2, 30, 3, 39, 1], "のを": [20, 1, 8, 1], "のア": [91, 1, 3, 2, 1, 3, 7, 3, 7, 2], "のモ": [25, 1, 18, 1, 72, 1], "の割": [78, 1], "の参": [80, 1], "の形": [20, 1, 3, 1, 55, 1, 1, 1, 7, 1], "の掲": [2, 1], "の時": [7, 1, 7, 1, 62, 1, 2, 1, 6, 1], "の獲": [53, 1, 72, 1], "の終": [38, 1], "の該": [85, 1], "の課": [60, 2, 18, 2, 2, 1, 52, 1], "の転": [35, 1], "の進": [4, 1, 38, 1, 13, 1, 59, 1, 13, 1], "の関": [51, 1, 1, 1, 71, 1, 1, 1], "は3": [1, 1, 22, 1, 5, 1, 28, 1, 72, 1], "はc": [88, 1], "はこ": [24, 1, 12, 1, 35, 1, 1, 3], "は厳": [51, 1, 72, 1], "は当": [113, 1], "は従": [7, 1, 69, 1], "は産": [28, 1], "は申": [2, 1, 69, 1, 21, 1], "は難": [55, 1, 72, 1], "ばい": [27, 1, 82, 1], "べき": [42, 2, 29, 1, 43, 1], "みん": [72, 1], "むご": [2, 1], "もう": [7, 1, 69, 1], "やエ": [88, 1], "やト": [93, 1], "や周": [13, 1], "ら再": [36, 1, 1, 1, 30, 1], "ら反": [84, 1], "ら納": [42, 1, 72, 1], "ら読": [35, 1], "りの": [13, 1, 15, 1, 8, 1, 42, 1], "りま": [0, 7, 1, 3, 1, 3, 1, 4, 1, 1, 3, 3, 6, 1, 1, 2, 1, 1, 2, 2, 1, 2, 1, 3, 1, 2, 2, 1, 2, 1, 2, 1, 1, 3, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 2, 1, 2, 3, 1, 1, 1, 25, 2, 1, 2, 7, 1, 2, 2, 1, 1, 1, 2, 1, 1, 2, 2, 5, 1, 2, 2, 3, 1, 1, 3, 1, 1], "り現": [43, 1, 72, 1], "るた": [0, 1, 24, 1, 18, 1, 29, 1, 8, 1, 9, 1, 26, 1], "るは": [25, 1], "るみ": [72, 1], "る可": [2, 1], "る姿": [46, 1, 72, 1], "る実": [43, 1, 72, 1], "る意": [19, 1], "る期": [83, 1], "る機": [21, 1], "る生": [73, 1], "る速": [28, 1], "れだ": [2, 1], "れば": [13, 1, 1, 1, 5, 1, 1, 2, 2, 1, 4, 1, 1, 2, 24, 1, 29, 1, 2, 1, 27, 4, 14, 1], "わっ": [20, 1, 9, 1, 49, 1, 6, 1], "を6": [1, 1], "を分": [44, 1, 1, 1, 1, 1, 31, 1, 39, 3, 1, 3, 1, 3], "を取": [28, 1, 10, 1, 1, 1, 1, 3, 4, 1, 72, 1], "を外": [61, 1, 72, 1], "んで": [18, 1, 17, 1, 4, 3, 39, 1, 34, 1], "ん店": [101, 1], "イエ": [98, 1], "イト": [0, 1, 1, 1, 1, 1, 2, 1, 3, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 10, 1, 4, 1, 7, 2, 2, 1, 28, 1, 3, 2, 4, 1, 2, 1, 1, 1, 1, 1, 8, 1, 1, 4, 1, 2, 1, 3, 1, 1, 1, 3, 1, 1, 1, 2, 1, 2, 3, 1, 2, 1, 12, 1, 4, 2, 24, 1], "エー": [66, 2, 32, 1], "カミ": [100, 1], "カワ": [100, 1], "ギ甲": [0, 4, 3, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 4, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 31, 4, 1, 5, 1, 3, 1, 3, 1, 8, 1, 3, 1, 3, 1, 4, 1, 2, 1, 1, 1, 2, 4, 1, 3, 1, 1, 1, 3, 1, 1, 1, 3, 1, 20, 2], "ジが": [24, 1, 64, 1], "スロ": [91, 1], "ス業": [7, 1, 69, 1], "ス製": [104, 1], "ズの": [51, 1, 4, 1, 68, 1, 4, 1], "セミ": [93, 1], "タビ": [66, 1], "タン": [25, 1, 2, 1, 11, 1, 2, 1], "ダイ": [98, 1, 7, 1], "ッシ": [43, 3, 5, 1, 45, 1, 22, 5, 5, 1], "ッデ": [100, 1], "ップ": [1, 1, 26, 2, 1, 1, 12, 1, 3, 1, 1, 1, 9, 1, 6, 1, 5, 2, 51, 1, 1, 1, 9, 1, 6, 1, 5, 1], "デル": [25, 2, 18, 1, 20, 3, 34, 1, 18, 1, 20, 4], "トが": [0, 1, 2, 1, 9, 1, 3, 1, 4, 1, 6, 2, 1, 1, 32, 1, 29, 1, 43, 1], "トー": [56, 2, 37, 1, 35, 1], "ト経": [63, 3, 72, 4], "ドロ": [40, 1], "バイ": [2, 1], "ビデ": [116, 1, 1, 1, 1, 1], "フォ": [11, 2, 13, 6, 1, 1, 10, 2, 1, 1, 15, 1, 35, 1, 37, 1], "フラ": [43, 1, 72, 1], "ブズ": [134, 1], "プル": [25, 1, 32, 1, 1, 1, 71, 1, 1, 1], "プ手": [27, 1], "プ構": [53, 1, 72, 1], "ペの": [27, 1], "ホク": [96, 1], "ミッ": [43, 3, 72, 5], "ミン": [105, 1], "ャプ": [72, 1], "ョニ": [62, 1, 72, 1], "リの": [36, 1], "ルタ": [50, 1, 61, 1, 11, 1], "ル政": [47, 1, 72, 1], "ンで": [22, 1, 5, 1, 11, 1, 2, 1], "ンシ": [43, 1, 72, 1], "ンプ": [24, 1, 1, 5, 22, 1, 10, 1, 1, 1, 37, 1, 24, 1, 10, 1, 1, 1], "ン受": [28, 1], "ン職": [44, 1, 72, 1], "ーバ": [88, 1, 3, 1], "ーム": [24, 3, 1, 1, 10, 1, 2, 1, 14, 1, 13, 4, 36, 1, 23, 1, 13, 6], "ー技": [55, 1, 72, 1], "ー枠": [80, 1], "ー締": [0, 1, 4, 1, 8, 1, 2, 1, 97, 1], "一つ": [16, 1], "一致": [56, 1, 72, 1], "三重": [98, 1, 7, 1], "上の": [40, 1, 14, 1, 11, 1, 7, 1, 54, 1, 11, 1], "上回": [78, 1], "下は": [7, 1, 62, 1, 7, 1], "下支": [43, 1, 72, 1], "両者": [78, 1], "中村": [98, 1], "乗せ": [70, 1], "予行": [34, 4, 52, 1], "事実": [16, 1, 31, 2, 1, 2, 1, 2, 1, 2, 27, 1, 42, 2, 1, 2, 1, 2, 1, 2], "事承": [57, 1, 72, 1], "人の": [7, 1, 35, 2, 3, 1, 31, 1, 38, 2, 3, 1], "人目": [2, 1], "今の": [74, 1, 4, 1], "今回": [28, 1], "今野": [96, 1], "他人": [0, 1, 23, 1, 58, 1], "付が": [68, 1], "代で": [78, 1], "任意": [7, 2, 35, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 21, 2], "休日": [45, 1, 72, 1], "会の": [14, 2, 32, 1, 40, 1, 9, 2, 14, 1, 4, 2, 5, 1], "会社": [0, 1, 2, 2, 5, 1, 6, 1, 7, 1, 4, 1, 4, 4, 1, 2, 4, 1, 2, 1, 2, 1, 2, 2, 23, 1, 6, 1, 3, 1, 5, 1, 2, 1, 12, 2, 5, 1, 1, 6, 1, 10, 1, 4, 1, 6, 1, 8, 1, 5, 2, 2, 1, 3, 1, 4, 1, 3, 1, 6, 1, 7, 26, 1], "佐藤": [97, 1, 3, 2], "佑弥": [99, 1], "体で": [3, 1], "作成": [13, 1, 11, 3, 61, 1, 2, 1, 1, 1, 4, 1], "使っ": [13, 1, 1, 1, 6, 1, 2, 1, 2, 2, 1, 1, 7, 1, 3, 1, 2, 1, 29, 1, 22, 1], "価さ": [79, 1], "保ち": [42, 1, 72, 1], "保持": [56, 1, 72, 1], "信さ": [4, 1, 3, 1, 17, 1, 3, 1, 10, 1, 39, 1, 12, 2], "値と": [44, 2, 1, 2, 1, 2, 32, 1, 1, 1, 37, 1, 1, 1, 1, 1], "備配": [45, 1, 72, 1], "元気": [104, 1], "先が": [28, 1], "共創": [43, 1, 13, 1, 59, 1, 13, 1], "典が": [69, 1], "内容": [28, 1, 7, 1, 6, 1, 17, 3, 8, 1, 18, 3, 2, 1, 2, 3, 3, 1, 1, 1, 38, 4], "出ま": [24, 1, 8, 1, 54, 1], "分ず": [37, 1], "初め": [0, 1, 71, 1, 7, 1], "制優": [47, 1, 72, 1], "前チ": [13, 1, 22, 3], "力は": [4, 1, 3, 1, 17, 1, 12, 1, 1, 1, 30, 1, 9, 1, 12, 1], "勝ち": [14, 1, 8, 1], "勝山": [104, 1], "募申": [0, 1, 8, 1, 63, 1, 1, 1], "厳し": [51, 1, 72, 1], "取り": [20, 1, 5, 2, 1, 1, 2, 2, 10, 1, 1, 1, 1, 4, 1, 1, 1, 2, 4, 1, 10, 1, 10, 1, 18, 1, 30, 1, 4, 1, 10, 3], "名採": [49, 1, 72, 1], "呼称": [80, 1], "品づ": [43, 1, 72, 1], "商会": [100, 1], "営優": [72, 1], "回ア": [0, 1, 4, 1, 8, 1, 64, 1, 10, 1], "回転": [52, 1, 72, 1], "固ま": [20, 1, 8, 1], "圧力": [48, 1, 1, 1, 5, 1, 26, 1, 40, 1, 1, 1, 5, 1], "域平": [49, 1, 72, 1], "域連": [49, 1, 10, 1, 3, 1, 59, 1, 10, 1, 3, 1], "場と": [28, 1, 15, 1, 12, 1, 23, 1, 37, 1, 12, 1], "場合": [0, 1, 12, 1, 3, 3, 5, 1, 2, 1, 3, 1, 2, 1, 7, 1, 37, 2, 17, 1, 21, 1, 26, 1], "場記": [86, 1], "大事": [32, 1], "大型": [46, 1, 72, 1], "大手": [44, 1, 10, 1, 8, 1, 54, 1, 10, 1, 8, 1], "太の": [78, 2], "太郎": [98, 1, 2, 1, 1, 1, 3, 1, 3, 1], "子ご": [34, 1], "完成": [20, 1, 29, 1, 72, 1], "定の": [3, 1, 7, 1, 44, 1, 72, 1], "定ま": [7, 1, 69, 1], "実3": [119, 1, 1, 1, 1, 1, 1, 1], "寧に": [26, 1, 11, 1], "将太": [98, 1], "小3": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "屋総": [96, 1], "山ふ": [101, 1], "山内": [108, 2], "巻く": [39, 1], "平均": [28, 1, 21, 1, 2, 1, 4, 1, 4, 1, 2, 4, 2, 1, 58, 1, 2, 1, 4, 1, 4, 1, 2, 4, 2, 1], "年8": [3, 1, 66, 1, 13, 1, 27, 1], "年月": [7, 1, 69, 1], "年表": [42, 2, 72, 1], "度な": [34, 3], "引継": [72, 1, 8, 1], "当性": [73, 2], "当箇": [85, 1], "征工": [98, 1], "得る": [91, 1], "心で": [78, 1], "念点": [80, 1], "急務": [42, 1, 72, 1, 23, 1], "想で": [0, 1], "意味": [74, 1], "我々": [56, 1, 72, 1], "手は": [17, 1, 11, 1], "択肢": [55, 1, 72, 1], "拡充": [78, 1, 2, 1], "措置": [2, 5, 66, 5, 4, 1, 8, 2], "数値": [116, 1, 1, 1, 1, 1, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "文か": [35, 1, 50, 1], "文に": [39, 1], "文セ": [66, 3], "新協": [97, 1], "新的": [35, 1], "方名": [86, 1], "方針": [0, 1, 26, 1, 1, 1, 51, 2, 2, 2, 2, 1, 4, 1, 3, 3, 1, 3, 1, 3, 1, 3, 5, 1], "早川": [108, 2], "明を": [86, 1], "書作": [24, 1], "有名": [116, 1, 1, 1, 1, 1, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "期コ": [47, 1, 72, 1], "期間": [49, 1, 72, 1], "未回": [7, 1], "本地": [94, 1], "本新": [96, 1], "条項": [68, 1], "枠組": [80, 1], "架空": [28, 2], "査は": [24, 1], "格着": [42, 1, 72, 1], "梨県": [97, 1], "業1": [39, 1, 16, 1], "業企": [61, 1, 72, 1], "業向": [78, 1], "業員": [7, 1, 21, 1, 48, 1, 4, 1], "業庁": [0, 2, 19, 1, 59, 2, 2, 1, 2, 2, 3, 3, 5, 1, 3, 1, 20, 2], "業省": [2, 1, 66, 1, 17, 2, 28, 2], "模工": [51, 1, 72, 1], "次以": [68, 1], "正し": [84, 1], "正で": [68, 1], "歴と": [39, 1], "気に": [19, 1, 3, 1], "決ま": [3, 1, 75, 1], "特設": [2, 1], "生産": [42, 1, 31, 1, 5, 2, 2, 2, 1, 1, 1, 1, 32, 1], "産性": [42, 1, 31, 1, 5, 1, 2, 1, 2, 1, 32, 1], "用が": [7, 1, 69, 1], "用レ": [50, 1, 72, 1], "田鉄": [90, 1, 7, 1], "画期": [35, 1], "番の": [30, 1, 48, 1, 2, 1], "的よ": [68, 1], "益の": [26, 1], "目を": [35, 1], "省略": [94, 1], "真剣": [0, 1], "知ら": [0, 1, 19, 3], "示の": [80, 1], "社2": [53, 1, 72, 1], "社b": [100, 1], "社あ": [106, 1], "社を": [39, 1], "社モ": [97, 1], "社育": [108, 1], "社酒": [101, 1], "程は": [14, 1, 96, 1], "稼ぐ": [3, 1, 75, 2, 1, 1, 1, 2], "空の": [28, 2], "章ご": [6, 1, 32, 1], "第一": [43, 1, 13, 1, 59, 1, 13, 1], "答え": [5, 1, 15, 1, 4, 2, 3, 2, 1, 1, 38, 1, 10, 1, 5, 1], "策定": [72, 1], "算事": [80, 2], "算例": [133, 1], "約書": [71, 1], "納品": [45, 1, 13, 2, 59, 1, 13, 2], "細欄": [75, 1], "終了": [74, 1], "維持": [43, 1, 9, 2, 27, 1, 36, 1, 9, 2], "者等": [70, 1], "育て": [78, 2], "背負": [0, 1], "脈が": [66, 1], "脱フ": [80, 1], "自の": [44, 1, 1, 1, 1, 1, 70, 3, 1, 3, 1, 3], "自社": [3, 1, 39, 3, 14, 6, 3, 5, 14, 1, 41, 3, 14, 7, 3, 4], "藤様": [86, 2], "術で": [42, 1, 1, 1, 71, 1, 1, 1], "製パ": [97, 1], "製品": [48, 2, 72, 2], "要項": [92, 1], "覧か": [86, 1], "覧に": [94, 1], "解で": [68, 1], "言い": [17, 1], "計検": [57, 1, 72, 1], "証拠": [44, 2, 1, 2, 1, 2, 70, 1, 1, 1, 1, 1], "詞を": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "話さ": [0, 1], "読め": [36, 1, 21, 1, 10, 1, 62, 1], "談に": [90, 1], "請は": [35, 1], "請期": [71, 1], "負い": [92, 1], "資に": [56, 1, 72, 1], "質の": [57, 1, 72, 1], "足率": [49, 1, 72, 1], "較し": [21, 1], "込む": [25, 1, 1, 1, 2, 1, 8, 1, 2, 1, 2, 4, 1, 1, 26, 1], "通の": [27, 1], "通過": [2, 4, 12, 1, 54, 4], "過時": [68, 1], "道具": [0, 1, 23, 1], "達醸": [101, 1], "遠藤": [100, 1], "配信": [91, 1], "里子": [101, 1], "重要": [87, 1], "量産": [58, 1, 72, 1], "金サ": [85, 1], "鋼材": [48, 1, 72, 1], "録制": [80, 1], "長型": [2, 1, 66, 1], "門や": [28, 1], "間で": [45, 1, 13, 2, 22, 1, 37, 1, 13, 2], "離島": [94, 1], "難し": [55, 1, 72, 1], "革命": [78, 1, 2, 1, 2, 1], "領が": [84, 1], "領後": [58, 1, 72, 1], "類を": [0, 1, 11, 1, 7, 1, 6, 2, 10, 1, 40, 1], "類止": [18, 1], "風が": [39, 1], "香川": [100, 1, 7, 1], "骨格": [13, 1], "齢化": [49, 1, 31, 2, 41, 1]};
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_5 = {"0日": [28, 1, 57, 1], "16": [65, 1, 9, 1, 1, 1, 10, 1, 52, 1], "1ヶ": [45, 1, 12, 1, 60, 1, 12, 1], "27": [0, 1, 2, 1, 1, 1, 1, 1, 7, 3, 1, 1, 1, 1, 1, 3, 4, 1, 6, 1, 4, 1, 7, 2, 33, 1, 6, 1, 4, 1, 1, 1, 1, 1, 31, 1, 2, 1], "2万": [63, 1, 72, 2], "6に": [80, 1], "8名": [28, 1, 81, 1], "av": [40, 1], "ch": [0, 1, 2, 2, 7, 1, 14, 1, 4, 1, 23, 3, 16, 2, 2, 1, 20, 1, 34, 3], "di": [94, 1], "eな": [88, 2], "gl": [88, 1, 23, 1], "in": [25, 1, 2, 1], "iの": [40, 1, 26, 2], "la": [27, 1, 39, 3, 22, 1], "nc": [42, 1, 5, 1, 67, 1, 5, 1], "ns": [100, 1, 9, 1], "od": [27, 1, 39, 1], "ot": [50, 2, 72, 2], "pe": [39, 1, 7, 1, 1, 3, 1, 3, 1, 3, 1, 3, 15, 4, 23, 1, 6, 1, 25, 3, 1, 3, 1, 3, 1, 3, 15, 2], "pu": [63, 3, 72, 2], "sh": [2, 1, 38, 1], "ti": [47, 3, 72, 3], "ty": [49, 3, 72, 3], "々な": [13, 1], "あし": [106, 1], "あシ": [111, 1], "い審": [0, 1, 17, 1, 17, 1], "い方": [25, 1, 2, 1, 39, 3, 18, 1, 18, 1], "うか": [7, 1, 10, 1, 2, 1, 3, 1, 54, 2], "うせ": [22, 3], "うに": [27, 1, 54, 1, 2, 1], "うる": [23, 1], "えそ": [7, 1, 69, 1], "え追": [113, 1], "おく": [20, 1, 16, 1, 30, 1, 1, 1, 7, 1, 3, 1], "お住": [90, 1], "お使": [27, 1, 83, 1], "かだ": [23, 1], "が1": [28, 1, 38, 1], "がa": [40, 1], "がち": [0, 1], "が丁": [37, 1], "が流": [28, 1], "が送": [88, 1], "きを": [80, 1], "き掲": [86, 1], "くい": [0, 1, 17, 1, 10, 1, 52, 1], "くつ": [16, 1, 60, 1], "けて": [25, 1, 1, 2, 51, 1, 33, 1], "け取": [88, 1], "げで": [10, 1], "げ圧": [80, 1], "こと": [0, 5, 1, 4, 1, 3, 1, 5, 1, 2, 3, 1, 1, 1, 8, 1, 1, 1, 1, 1, 1, 1, 1, 4, 2, 1, 2, 1, 2, 1, 1, 2, 3, 1, 6, 1, 1, 1, 19, 1, 11, 1, 5, 2, 1, 1, 1, 1, 2, 1, 2, 4, 1, 1, 8, 3, 1, 3, 1, 1, 20, 1, 19, 1], "ご利": [25, 1], "さな": [0, 1, 43, 1, 72, 1], "しが": [0, 1], "しれ": [0, 1], "すの": [16, 1, 2, 4, 4, 1, 12, 1, 75, 1], "せば": [3, 1, 63, 1], "ぜ1": [114, 1], "たい": [13, 1, 1, 1, 8, 1, 5, 1, 1, 3, 3, 4, 2, 5, 24, 2, 9, 1, 63, 2], "たイ": [110, 1], "た各": [93, 1], "た場": [12, 1], "ださ": [16, 1, 9, 2, 1, 2, 1, 1, 1, 1, 6, 1, 6, 2, 26, 1, 2, 1, 1, 1, 18, 1, 5, 1, 17, 1], "だ内": [28, 1, 13, 1], "っと": [26, 1], "つ教": [27, 1], "てか": [24, 2, 50, 1, 10, 1], "てに": [7, 1, 69, 1], "てほ": [90, 1], "てる": [19, 3, 59, 2], "て事": [11, 1], "て手": [41, 1], "て構": [28, 1], "で作": [24, 1, 3, 1], "で公": [19, 1], "で後": [93, 1], "で応": [24, 1], "で検": [50, 1, 72, 1], "で行": [13, 1, 11, 1, 11, 1], "とき": [27, 1, 9, 1, 1, 1], "とそ": [3, 1, 31, 1, 34, 1, 12, 1], "と中": [85, 1], "と伝": [29, 1], "と思": [21, 1, 1, 2, 3, 2], "と納": [28, 2], "と融": [56, 1, 72, 1], "どの": [68, 1, 16, 1, 4, 2], "なく": [0, 1, 2, 1, 20, 1, 4, 1, 2, 1, 50, 1, 1, 1], "なた": [0, 2, 4, 1, 3, 1, 10, 2, 7, 2, 3, 1, 2, 2, 1, 1, 3, 1, 4, 1, 39, 1, 12, 2, 3, 1], "な使": [25, 1], "にだ": [4, 1, 3, 1, 17, 1, 3, 1, 10, 1, 39, 1, 15, 1], "に加": [3, 2], "に困": [26, 1], "に声": [109, 1], "の3": [23, 1, 15, 3, 30, 1, 3, 1], "のこ": [42, 1, 72, 1], "のコ": [2, 1, 15, 1, 4, 1, 6, 1, 7, 1, 6, 4, 33, 1], "の代": [0, 1, 7, 1, 1, 1, 34, 1, 30, 1, 4, 1, 38, 1], "の体": [42, 1, 22, 1, 50, 1, 22, 1], "の元": [36, 1], "の想": [43, 1, 72, 1], "の申": [0, 1, 2, 1, 12, 1, 10, 1, 44, 1, 45, 1], "の解": [43, 2, 36, 3, 3, 1, 33, 1], "の詳": [1, 1, 2, 1], "の連": [44, 2, 1, 3, 1, 2, 70, 1, 1, 2, 1, 1], "の道": [0, 2, 1, 1, 10, 3, 12, 1], "の音": [66, 1], "はい": [27, 1], "は各": [68, 2, 17, 1, 10, 1, 18, 1], "は赤": [137, 1], "べま": [1, 1], "まこ": [24, 1], "まっ": [28, 1, 13, 3, 37, 1], "み直": [13, 1], "めて": [0, 2, 5, 1, 1, 1, 7, 1, 1, 1, 1, 3, 5, 1, 1, 2, 6, 1, 10, 1, 29, 2, 3, 1, 2, 1, 7, 1, 6, 1, 27, 1], "もし": [0, 1, 26, 1, 58, 1], "もで": [18, 1, 91, 1], "も増": [25, 1], "も強": [69, 1], "やす": [49, 1, 30, 1, 2, 1, 40, 1], "やス": [4, 1, 3, 1, 17, 1, 4, 1, 9, 1, 30, 1, 9, 1, 12, 1, 3, 1], "らの": [2, 1, 26, 1, 4, 1, 22, 1, 2, 1, 21, 1, 2, 3, 47, 1, 2, 1], "ら毎": [46, 1, 72, 1], "ら現": [42, 1, 72, 3], "りた": [28, 3, 3, 3], "りは": [42, 1, 72, 1], "り替": [34, 1], "り生": [92, 1], "るだ": [5, 1, 15, 1, 56, 1], "る一": [58, 1, 72, 1], "る成": [69, 1], "る技": [62, 1, 72, 1], "る材": [39, 1, 1, 1], "る章": [39, 1], "ろを": [17, 1], "を7": [48, 1, 72, 1], "をし": [0, 1, 29, 1], "を受": [68, 1, 20, 1], "を指": [17, 1], "を照": [85, 1], "んと": [18, 1], "アプ": [24, 1, 1, 1, 2, 3], "イス": [2, 1], "イベ": [85, 3, 25, 1], "ェー": [13, 3, 67, 1], "エネ": [47, 2, 33, 1, 39, 2], "カム": [98, 1], "ギャ": [64, 2, 72, 1], "クご": [14, 1], "クや": [88, 1], "グサ": [72, 1], "グ以": [91, 1], "グ工": [96, 1], "グ担": [64, 1, 72, 1], "ケテ": [64, 1, 72, 1], "ザに": [36, 1, 31, 1], "シー": [97, 1, 3, 1], "ジネ": [22, 1, 41, 3, 72, 3], "スの": [55, 1, 18, 2, 54, 1], "スマ": [4, 1, 3, 1, 17, 1, 1, 1, 11, 1, 1, 1, 13, 1, 16, 1, 1, 2, 9, 1, 12, 1, 3, 1, 31, 1], "タイ": [50, 1, 2, 1, 8, 1, 62, 1, 2, 1, 8, 1], "ット": [11, 2, 13, 4, 1, 2, 2, 1, 1, 1, 7, 1, 1, 1, 11, 1, 4, 3, 5, 1, 1, 1, 2, 1, 4, 3, 3, 3, 7, 1, 13, 1, 33, 1, 4, 3, 5, 1, 1, 3, 2, 1, 4, 4], "デー": [28, 1, 8, 1, 2, 1, 4, 2, 8, 2, 17, 1, 11, 1, 4, 1, 3, 3, 3, 3, 3, 4, 23, 2, 8, 2], "バサ": [0, 1, 1, 1, 12, 1, 67, 1, 5, 2, 1, 2, 4, 2, 3, 3, 1, 5, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 6, 4, 1], "ビジ": [22, 1, 21, 3, 20, 3, 52, 5, 20, 3], "プレ": [45, 1, 17, 2, 10, 1, 13, 1, 32, 1, 17, 1], "マッ": [11, 2, 13, 4, 11, 1, 1, 1, 36, 1, 14, 1], "ム5": [60, 1, 72, 1], "モデ": [25, 2, 18, 1, 20, 3, 34, 1, 18, 1, 20, 4], "ヤス": [101, 1], "ュリ": [50, 1, 22, 1, 50, 1], "ユニ": [63, 3, 72, 4], "ル技": [42, 1, 72, 1], "ロを": [44, 1, 72, 1], "ント": [0, 7, 1, 2, 1, 4, 1, 1, 1, 2, 5, 2, 2, 2, 1, 2, 1, 3, 1, 8, 3, 1, 1, 2, 2, 1, 1, 1, 2, 2, 1, 7, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 5, 1, 7, 1, 3, 1, 2, 2, 1, 1, 2, 22, 2, 4, 2, 2, 1, 9, 1, 8, 5, 1, 4, 2, 1, 3, 1, 1, 1, 1, 1, 17, 1, 1, 1, 2, 1, 21, 1], "ーケ": [64, 1, 72, 1], "ーチ": [66, 2], "ー向": [111, 1], "三郎": [107, 1], "下地": [37, 1], "下枠": [7, 1, 69, 1], "下限": [70, 1], "争の": [53, 2, 72, 1], "交渉": [52, 4, 2, 3, 70, 5, 2, 4], "人た": [17, 1, 2, 3], "人は": [0, 1, 66, 1], "仕上": [24, 1, 2, 3, 11, 1, 2, 1, 1, 1], "付き": [26, 1, 60, 1], "付中": [0, 1, 4, 1], "代表": [0, 1, 1, 1, 6, 2, 1, 1, 34, 1, 22, 1, 7, 1, 1, 1, 4, 2, 38, 1, 22, 1], "以上": [35, 1, 10, 1, 1, 1, 3, 1, 8, 1, 2, 1, 11, 1, 2, 1, 13, 1, 32, 1, 1, 1, 3, 1, 7, 1, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "件に": [45, 1, 34, 1, 5, 1, 33, 1], "件程": [61, 1, 72, 1], "件費": [48, 2, 17, 1, 55, 2, 17, 1], "会は": [0, 1], "会規": [80, 1], "低賃": [48, 1, 72, 1], "作1": [61, 1, 72, 1], "作品": [57, 1, 1, 2, 71, 1, 1, 2], "使い": [14, 1, 11, 1, 2, 1, 39, 3, 44, 1], "係強": [51, 1, 72, 1], "修正": [57, 1, 1, 1, 71, 1, 1, 1], "備の": [28, 1, 25, 1, 14, 1, 58, 1], "備導": [47, 1, 18, 1, 54, 1, 18, 1], "償却": [65, 1, 72, 1], "優良": [72, 1], "元様": [86, 1], "入り": [1, 1, 25, 1, 2, 2, 6, 1, 2, 1, 31, 1, 44, 1], "全保": [80, 1], "全国": [0, 2, 14, 2, 68, 1], "内リ": [50, 1, 25, 1, 47, 1], "出た": [16, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 66, 1], "出は": [12, 1], "分に": [25, 1], "制に": [46, 1, 72, 1], "前を": [0, 1], "割で": [25, 1], "加さ": [22, 1], "加工": [28, 4, 16, 1, 7, 1, 4, 1, 3, 2, 1, 1, 57, 1, 7, 1, 4, 1, 3, 2, 1, 1], "助対": [71, 1], "動揺": [80, 1], "動車": [57, 1, 72, 1], "化に": [45, 1, 14, 1, 58, 1, 14, 1], "化セ": [111, 1], "北鋼": [99, 1], "十分": [18, 1, 2, 1, 5, 1], "半期": [48, 1, 72, 1], "参照": [80, 1, 8, 1], "参職": [42, 1, 72, 1], "取る": [28, 1, 38, 1, 22, 1], "史康": [100, 1], "名を": [86, 1, 27, 1], "含む": [0, 3, 1, 1, 2, 1, 5, 2, 60, 1, 4, 3], "告承": [71, 1], "問い": [0, 1, 5, 1, 19, 2], "善継": [43, 1, 72, 1], "営力": [72, 1], "営費": [65, 4, 72, 5], "図と": [86, 1], "国関": [72, 1, 8, 1], "園で": [68, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "場す": [8, 3], "声入": [66, 1], "外に": [91, 1], "多く": [109, 1], "大が": [63, 1, 72, 1, 2, 1], "大喜": [103, 1], "失う": [22, 1], "奈川": [97, 1], "子入": [34, 1], "字が": [35, 1], "孫子": [96, 1], "定は": [7, 1, 20, 1, 41, 1, 8, 1], "定支": [72, 1], "定期": [84, 1], "実的": [12, 1], "害と": [21, 1], "家に": [87, 1], "富山": [98, 1], "届く": [11, 1, 7, 1, 6, 2, 4, 1, 7, 1, 2, 1], "工株": [108, 1], "常設": [66, 1], "年継": [46, 1, 72, 1], "底上": [46, 1, 72, 1], "度か": [80, 1], "度に": [3, 1, 17, 1], "康経": [72, 1], "式イ": [85, 1], "弘前": [96, 1], "役の": [27, 1], "必ず": [13, 1, 56, 1, 23, 1], "性が": [2, 1, 64, 1], "想へ": [0, 1], "手技": [64, 1, 72, 1], "抑制": [48, 1, 72, 1], "抜け": [24, 1], "拓弘": [106, 1], "挑戦": [0, 2, 28, 1, 50, 1, 11, 1], "接続": [27, 1, 51, 1, 1, 1], "揃え": [74, 1], "援す": [92, 1], "支援": [2, 1, 45, 1, 21, 4, 3, 1, 1, 2, 5, 3, 1, 3, 1, 5, 1, 6, 1, 3, 1, 3, 5, 2, 5, 1, 27, 1], "数日": [23, 1], "整備": [47, 1, 72, 1], "文が": [66, 1, 2, 1, 19, 1], "料の": [20, 1, 32, 1, 72, 1], "新履": [86, 3], "方の": [28, 1, 58, 1, 16, 1], "日確": [3, 1, 79, 1], "昇格": [78, 1], "書き": [28, 2, 8, 1, 4, 1, 1, 1, 26, 1, 19, 1, 2, 1], "期ご": [48, 1, 72, 1], "期や": [84, 1], "期的": [35, 1, 49, 1], "本金": [7, 1, 69, 1], "条件": [2, 1, 59, 2, 18, 1, 54, 2], "東ブ": [95, 1, 16, 1], "枠内": [94, 1], "株式": [90, 1, 6, 5, 1, 8, 1, 4, 1, 6, 1, 7, 1, 2, 2, 2, 1, 2, 1, 4, 1, 2, 1, 4, 1, 5], "業2": [61, 1, 72, 1], "業を": [20, 1, 7, 1, 16, 1, 72, 1], "業時": [49, 1, 7, 1, 65, 1, 7, 1], "構成": [94, 1], "構造": [39, 1, 11, 1, 13, 1, 17, 2, 55, 3], "次世": [42, 1, 1, 1, 71, 1, 1, 1], "法人": [7, 1, 64, 1, 1, 1, 4, 1], "滋賀": [99, 1], "点の": [1, 1, 68, 1], "点対": [0, 2, 11, 1, 3, 1], "然に": [13, 1], "熟練": [49, 2, 72, 2], "物の": [34, 1], "状態": [24, 1], "獲得": [44, 1, 9, 1, 10, 1, 53, 1, 9, 1, 10, 1], "現代": [42, 1, 1, 1, 71, 1, 1, 1], "田渕": [100, 2], "由6": [1, 1], "発支": [2, 1, 66, 1], "発生": [57, 1, 72, 1], "発速": [60, 1, 72, 1], "益式": [63, 2, 72, 1], "直す": [13, 1], "直ど": [21, 3], "確実": [36, 1, 31, 1], "磨き": [13, 2], "示は": [25, 1], "社3": [52, 1, 72, 1], "秋田": [96, 1], "秒で": [0, 1, 1, 1, 6, 3, 16, 1, 53, 3], "積も": [28, 3], "究開": [2, 1, 66, 2], "第1": [39, 1, 35, 2, 11, 1, 1, 1, 23, 1], "等の": [68, 2, 5, 1, 38, 1], "等導": [72, 1], "算が": [79, 1], "管理": [42, 1, 2, 1, 6, 2, 9, 1, 5, 2, 1, 1, 49, 1, 2, 1, 6, 2, 9, 1, 5, 2, 1, 1], "細内": [58, 2, 72, 1], "経由": [24, 1, 3, 3, 61, 1], "継ぎ": [72, 1, 8, 1], "継の": [0, 2, 7, 2, 4, 1, 2, 1, 8, 1, 2, 1, 48, 1, 5, 2, 2, 3, 1, 1], "継税": [80, 1], "継類": [80, 1], "続規": [27, 1], "考え": [20, 1, 59, 1, 10, 1], "者未": [79, 1, 1, 1], "者自": [89, 1], "良い": [0, 2, 21, 1, 4, 1, 84, 3], "苦手": [18, 3], "薬品": [101, 1], "術と": [43, 1, 16, 1, 56, 1, 16, 1], "表そ": [110, 1], "要件": [3, 2, 7, 1, 10, 1, 48, 2, 2, 1, 1, 4, 3, 1, 5, 1, 4, 1, 1, 1, 1, 2], "規範": [80, 1], "親は": [0, 1], "親族": [1, 1, 70, 2], "解消": [56, 1, 72, 1], "解釈": [43, 2, 36, 3, 3, 1, 33, 1], "計業": [58, 1, 72, 1], "証憑": [71, 1, 1, 3], "調整": [94, 1], "調達": [52, 1, 2, 1, 1, 1, 3, 1, 66, 1, 2, 1, 1, 1, 3, 1], "象外": [58, 1, 72, 1], "負担": [47, 1, 3, 1, 10, 1, 59, 1, 3, 1, 10, 1], "資が": [10, 1], "資本": [7, 1, 69, 1, 4, 1], "資格": [0, 1, 15, 1, 17, 1, 3, 1, 44, 1], "資補": [2, 1, 66, 1], "質問": [20, 1, 4, 1, 3, 1, 49, 1], "転率": [52, 1, 72, 1], "載の": [84, 3, 18, 1], "輸業": [7, 1, 69, 1], "辰弥": [99, 1], "込め": [36, 1, 31, 1], "速い": [24, 1], "進プ": [80, 1], "進捗": [42, 1, 72, 1], "遇が": [68, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "都市": [112, 1], "配色": [94, 1], "針2": [78, 2, 4, 1], "録で": [102, 1, 8, 2], "長後": [97, 1], "間案": [61, 1, 2, 1, 70, 1, 2, 1], "間軸": [47, 2, 1, 2, 1, 2, 1, 2, 69, 2, 1, 2, 1, 2, 1, 2], "閲覧": [88, 1], "障壁": [59, 3, 72, 4], "集開": [50, 1, 72, 1], "電子": [47, 4, 50, 1, 22, 4], "面で": [3, 1, 1, 1], "面受": [58, 1, 72, 1], "革の": [82, 1], "頃と": [74, 1], "順に": [37, 1, 43, 1], "頼め": [28, 1], "額を": [80, 1], "食い": [84, 1]};
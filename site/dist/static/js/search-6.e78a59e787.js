@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_6 = {"06": [0, 1, 2, 1, 6, 1, 66, 2, 1, 2, 3, 1, 7, 1, 1, 2], "0件": [28, 1, 17, 1, 16, 3, 2, 1, 54, 1, 16, 3, 2, 1], "0円": [70, 4], "0分": [12, 1, 8, 1, 3, 1, 1, 2, 13, 1, 1, 1], "17": [68, 1, 11, 1, 1, 1], "28": [0, 1, 111, 1], "2月": [0, 1, 14, 1], "39": [0, 2, 1, 1, 6, 1, 8, 1, 20, 1, 41, 1], "3点": [114, 1], "5個": [57, 1, 72, 1], "6が": [80, 1], "ci": [49, 3, 72, 3], "ek": [113, 1], "eカ": [111, 1], "hn": [50, 3, 40, 1, 32, 3], "io": [50, 2, 72, 2], "ka": [40, 1], "mc": [24, 1, 1, 1, 2, 5, 61, 1], "nd": [90, 1], "nt": [71, 1, 17, 2], "ou": [88, 1, 23, 1], "uk": [40, 1], "yo": [2, 1], "あと": [4, 1], "いず": [13, 1, 59, 1, 10, 1], "いな": [0, 2, 7, 2, 8, 3, 13, 1, 2, 1, 5, 1, 41, 2, 2, 1, 16, 1], "い人": [0, 1, 19, 3], "い会": [78, 1], "い未": [14, 1, 14, 1, 5, 4], "い発": [113, 1], "い空": [0, 1], "うが": [25, 1], "う補": [14, 1], "えま": [2, 1, 17, 1, 8, 1, 1, 1, 8, 1, 30, 2, 13, 2], "かけ": [0, 2, 20, 3, 2, 1, 1, 2, 3, 1, 53, 1, 9, 1, 21, 1], "かめ": [1, 1, 10, 1, 4, 3, 68, 1, 1, 1], "が2": [48, 1, 72, 1], "があ": [7, 2, 10, 1, 2, 2, 7, 1, 3, 1, 7, 1, 3, 1, 13, 1, 15, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 2, 1, 1, 47, 1], "がも": [2, 1], "がア": [89, 1], "が売": [54, 1, 72, 1], "が終": [37, 1], "が網": [20, 1], "きっ": [0, 2, 23, 1, 56, 1], "くフ": [24, 1, 11, 1], "く情": [83, 1], "く知": [0, 1], "けで": [2, 1, 3, 1, 2, 1, 11, 1, 2, 1, 2, 1, 46, 1, 8, 2, 35, 1], "ご確": [69, 1, 23, 1], "ご自": [13, 1], "さか": [80, 1], "させ": [25, 1, 18, 1, 13, 1, 10, 1, 49, 1, 13, 1], "さに": [28, 1], "しろ": [21, 1], "し業": [46, 1, 72, 1], "じま": [90, 1], "すく": [81, 1], "ず最": [69, 1], "そこ": [18, 1, 7, 1, 3, 1, 49, 1], "そん": [20, 3], "たさ": [28, 2], "たフ": [37, 1, 3, 1], "た内": [88, 1, 3, 1], "た投": [89, 1], "ちで": [17, 1], "つず": [27, 1], "つな": [27, 1, 39, 1, 12, 1, 3, 1], "てが": [15, 1], "て作": [37, 1, 51, 1, 1, 1], "て行": [0, 1, 2, 1, 66, 1], "て貼": [25, 1], "でき": [0, 2, 1, 1, 2, 2, 4, 1, 6, 1, 4, 1, 1, 1, 2, 1, 4, 1, 3, 2, 6, 1, 3, 1, 1, 1, 2, 1, 3, 1, 15, 1, 10, 1, 1, 1, 4, 2, 4, 2, 1, 1, 1, 3, 7, 1, 2, 4, 6, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 1, 4, 1, 15, 1], "でロ": [24, 1], "で働": [49, 1, 72, 1], "で再": [57, 1, 3, 1, 69, 1, 3, 1], "で初": [58, 1, 72, 1], "で名": [86, 1], "で業": [56, 1, 72, 1], "で納": [45, 1, 72, 1], "で製": [57, 1, 72, 1], "で設": [57, 1, 21, 1, 51, 1], "で重": [68, 1], "で降": [18, 1], "との": [13, 4, 1, 2, 13, 2, 5, 1, 6, 1, 5, 1, 1, 2, 1, 3, 1, 2, 2, 1, 3, 1, 1, 2, 1, 1, 2, 1, 1, 3, 3, 2, 3, 1, 18, 3, 35, 1, 1, 1, 1, 2, 1, 1, 2, 1, 3, 1, 1, 2, 1, 1, 2, 1, 1, 2, 3, 2, 3, 1], "とノ": [59, 1, 72, 1], "と差": [62, 1, 72, 3], "どは": [7, 1, 69, 1], "なぐ": [27, 1], "な困": [31, 1], "な数": [81, 1], "に1": [38, 1, 7, 1, 72, 1], "にa": [38, 2], "にチ": [13, 1], "に深": [6, 1, 31, 1], "に渡": [25, 1, 14, 1, 49, 1], "に要": [74, 1], "に送": [4, 1, 3, 1, 17, 1, 13, 1, 39, 1, 12, 1], "の4": [65, 1, 8, 3, 64, 1], "のd": [42, 1, 48, 1, 19, 1, 5, 1], "のい": [36, 1, 36, 1], "のイ": [43, 1, 42, 2, 30, 1], "のツ": [89, 1], "のピ": [0, 1, 14, 1, 65, 1], "の五": [0, 1], "の交": [52, 1, 2, 1, 70, 3, 2, 3], "の判": [16, 1], "の協": [59, 1, 72, 1], "の場": [71, 1, 64, 1], "の整": [23, 3], "の更": [84, 1], "の欄": [25, 1, 1, 1, 2, 3, 10, 1, 2, 1], "の歴": [42, 1, 44, 1, 28, 3], "の直": [55, 1, 7, 1, 65, 1, 7, 1], "の答": [81, 1], "の約": [80, 1], "は5": [7, 3, 69, 3, 2, 1], "はサ": [91, 1], "はフ": [72, 1], "は何": [0, 2, 29, 1, 1, 1], "は入": [28, 1], "は内": [84, 1], "は別": [13, 1, 6, 1], "は必": [92, 1], "は段": [9, 3], "ば分": [39, 1], "ひと": [19, 1, 16, 1, 44, 2, 2, 1], "への": [0, 1, 1, 1, 1, 2, 17, 1, 16, 1, 7, 1, 1, 2, 3, 1, 1, 1, 1, 1, 2, 1, 4, 2, 2, 1, 22, 1, 2, 1, 4, 1, 2, 1, 3, 1, 25, 1, 1, 2, 3, 1, 1, 1, 1, 1, 2, 1, 4, 2, 2, 1], "まい": [90, 1], "みさ": [100, 1], "む理": [56, 1, 72, 3], "めで": [79, 1], "め受": [137, 1], "もと": [83, 1], "も全": [19, 1], "やり": [20, 1, 8, 1, 3, 3], "や発": [72, 1], "ら実": [24, 1, 4, 1], "りだ": [42, 1, 72, 1], "りむ": [21, 1], "るa": [14, 1, 6, 1, 4, 1], "る丁": [6, 1], "る価": [23, 1], "る品": [50, 1, 72, 1], "る失": [55, 1, 72, 1], "る影": [72, 1], "る無": [89, 1], "る私": [79, 3, 3, 1], "る話": [13, 1, 66, 2], "れも": [82, 1], "れを": [24, 1, 8, 1, 8, 1, 38, 1], "をよ": [0, 1], "を予": [35, 1, 34, 1], "を付": [92, 1, 18, 1], "を先": [27, 1], "を守": [79, 1], "を掘": [27, 1], "を推": [42, 1, 72, 1], "を書": [37, 1, 40, 1, 7, 1], "を用": [24, 1, 1, 1, 12, 1], "を記": [85, 1], "を選": [38, 1, 1, 3], "を高": [57, 1, 72, 1], "んど": [13, 1], "アト": [0, 4, 3, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 1, 3, 1, 4, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 31, 4, 1, 6, 1, 3, 1, 3, 1, 8, 1, 3, 1, 3, 1, 4, 1, 2, 1, 4, 1, 5, 1, 3, 1, 3, 1, 3, 1, 4, 3, 1, 1, 1, 3, 2, 1, 1, 3, 1, 20, 3], "イズ": [55, 1, 72, 1], "イナ": [2, 3, 7, 1, 5, 2, 9, 1, 45, 4, 1, 1, 3, 3, 18, 1, 3, 1, 2, 1], "キャ": [48, 1, 24, 1, 48, 1], "キン": [99, 1], "ク工": [108, 1], "コス": [47, 1, 3, 1, 2, 1, 2, 1, 3, 1, 3, 2, 3, 1, 56, 1, 3, 1, 2, 1, 2, 1, 3, 1, 3, 2, 3, 1], "ジの": [72, 1, 13, 1, 1, 1, 2, 1, 25, 1], "スは": [22, 1], "スク": [27, 1, 21, 1, 1, 1, 1, 1, 10, 2, 60, 1, 1, 1, 1, 1, 10, 1], "スタ": [28, 1, 14, 1, 19, 1, 53, 1, 19, 1], "ソコ": [4, 1, 3, 1, 17, 1, 3, 1, 9, 1, 1, 1, 30, 2, 9, 1, 12, 1, 3, 1], "チで": [14, 1], "チェ": [13, 2, 22, 3, 15, 1, 30, 1, 8, 1, 3, 1, 31, 1], "チ大": [0, 1, 79, 1], "ヅホ": [99, 1], "テー": [14, 1, 19, 1, 7, 1, 28, 1], "トの": [14, 1, 21, 1, 17, 1, 16, 1, 4, 1, 2, 1, 11, 1, 7, 1, 17, 1, 15, 1], "ドタ": [52, 1, 8, 1, 64, 1, 8, 1], "ネッ": [51, 1, 5, 1, 3, 1, 64, 1, 5, 1, 3, 1], "ノツ": [104, 1], "ビス": [7, 1, 48, 1, 3, 1, 4, 1, 10, 1, 1, 1, 3, 1, 51, 1, 3, 1, 4, 1], "ピペ": [25, 1, 2, 1], "フカ": [6, 4, 18, 1, 2, 1, 10, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 47, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "プロ": [13, 1, 11, 1, 1, 4, 17, 1, 24, 1, 7, 1, 41, 1, 20, 1], "ミヅ": [99, 1], "メデ": [108, 1], "ルケ": [43, 1, 72, 1], "ロッ": [0, 2, 14, 1, 12, 1, 2, 1, 12, 1, 11, 1, 44, 2, 13, 1, 3, 6, 12, 1], "ロン": [24, 1, 1, 4], "ンス": [47, 1, 64, 2, 5, 1, 1, 1, 1, 1, 1, 1], "ンド": [111, 1], "ンラ": [28, 1, 34, 1, 72, 1], "ー2": [44, 1, 72, 1], "ーを": [27, 4, 64, 1, 18, 1], "ーゲ": [57, 1, 16, 1, 56, 3], "一度": [0, 1, 79, 1], "丁寧": [6, 1, 20, 1, 11, 1], "上限": [1, 1, 2, 1, 7, 1, 13, 1, 47, 2], "不足": [49, 1, 15, 2, 4, 1, 53, 1, 15, 1], "世界": [80, 2], "中心": [28, 1, 34, 1, 16, 1, 15, 1, 41, 1], "主要": [54, 1, 60, 1, 12, 1], "事由": [0, 1, 2, 1, 6, 1, 60, 1, 4, 3, 6, 2, 7, 1], "人技": [43, 1, 13, 1, 59, 1, 13, 1], "人数": [29, 1], "人材": [49, 2, 11, 1, 4, 2, 57, 2, 11, 1, 4, 4], "以下": [0, 2, 1, 1, 6, 9, 8, 1, 9, 1, 11, 1, 8, 1, 26, 1, 7, 9, 39, 1], "件が": [20, 1, 8, 2, 55, 1], "任1": [64, 1, 72, 1], "会議": [43, 1, 72, 1], "低い": [52, 1, 72, 1], "何に": [83, 1], "作を": [61, 1, 72, 1], "作専": [28, 1, 34, 1, 72, 1], "価し": [0, 1], "価で": [0, 1], "価率": [63, 1, 72, 1], "信し": [27, 1], "信で": [50, 1, 72, 1], "備償": [65, 1, 72, 1], "催を": [113, 2], "催概": [75, 1], "先の": [15, 1, 22, 1, 39, 1, 35, 3], "児島": [94, 1, 7, 1, 7, 1], "入例": [42, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "入力": [4, 1, 3, 1, 17, 1, 12, 1, 1, 1, 29, 1, 1, 1, 9, 1, 12, 2, 3, 5], "兵庫": [99, 1, 7, 1], "具製": [50, 1, 72, 1], "典の": [80, 1, 5, 1], "内に": [3, 1, 7, 1, 43, 1, 4, 1, 12, 1, 19, 1, 6, 1, 31, 1, 4, 1], "出締": [111, 1], "分が": [35, 1, 4, 1], "分県": [101, 1, 7, 1], "切前": [35, 1], "判定": [71, 1], "割合": [78, 1], "力向": [72, 1], "効く": [69, 1], "動態": [80, 2], "化が": [42, 2, 72, 2], "化補": [2, 1, 12, 1, 9, 1, 45, 1], "千葉": [97, 1], "半数": [80, 1], "協な": [42, 1, 72, 1], "協定": [80, 1], "去1": [28, 1], "取れ": [35, 1], "取県": [100, 1, 7, 1], "各ペ": [84, 1, 1, 1, 28, 1], "各出": [113, 1], "合の": [0, 2, 12, 1, 41, 1, 72, 3], "名体": [64, 1, 72, 1], "向性": [24, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "品し": [45, 1, 72, 1], "品で": [44, 1, 72, 1], "品率": [43, 1, 72, 1], "問5": [20, 1], "善博": [97, 1], "器の": [50, 1, 72, 1], "回ご": [68, 1], "回答": [7, 2, 33, 1, 18, 1, 33, 1, 39, 1], "圏内": [53, 1, 72, 1], "園と": [79, 1], "園へ": [89, 1], "園エ": [24, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "在の": [25, 1, 39, 1, 72, 1], "在ま": [42, 1, 72, 3], "域内": [51, 1, 72, 1], "域工": [43, 1, 3, 1, 13, 1, 3, 1, 53, 1, 3, 1, 13, 1, 3, 1], "報で": [89, 1], "変わ": [7, 1, 26, 1, 38, 1, 7, 1, 1, 1, 5, 1, 2, 1, 6, 1], "大き": [35, 1, 45, 1, 1, 1], "大輝": [96, 1], "始め": [0, 4, 5, 1, 1, 1, 5, 1, 1, 5, 1, 4, 1, 3, 1, 3, 6, 1, 2, 1, 8, 1, 43, 1], "嫁で": [48, 1, 72, 1], "子化": [47, 2, 72, 2], "実装": [50, 1, 72, 1], "実践": [43, 1, 72, 1], "客と": [51, 1, 2, 1, 6, 1, 3, 1, 61, 1, 2, 1, 6, 1, 3, 1], "客へ": [54, 1, 72, 1], "客単": [135, 1], "容は": [84, 1], "小さ": [43, 1, 72, 1], "展に": [73, 1], "島県": [94, 1, 6, 2, 1, 1, 6, 1, 1, 1], "工に": [51, 1, 4, 1, 68, 1, 4, 1], "工事": [104, 1], "工夫": [43, 1, 72, 1], "平三": [107, 1], "庁長": [90, 1], "度が": [17, 1], "式サ": [0, 1, 2, 1, 7, 1, 2, 1, 1, 1, 1, 1, 22, 2, 33, 2, 7, 1, 9, 1, 1, 3, 1, 1, 27, 2], "式フ": [24, 2], "復は": [27, 1], "循環": [78, 1, 2, 1], "忙期": [49, 1, 72, 1], "恭平": [100, 1], "慮や": [17, 1], "成否": [92, 1], "成度": [20, 1], "手メ": [44, 1, 72, 1], "手持": [37, 1], "手採": [49, 1, 72, 1], "拓等": [68, 1], "拡大": [51, 1, 12, 1, 60, 1, 12, 1, 2, 1], "指針": [43, 2, 29, 1, 43, 1], "挿入": [25, 1], "採算": [48, 1, 72, 1], "損害": [92, 1], "摘の": [66, 1], "数分": [27, 1], "数制": [3, 1], "数化": [28, 1], "数商": [52, 1, 72, 1], "斎藤": [97, 1], "料は": [37, 1], "料使": [52, 1, 72, 1], "料調": [58, 1, 72, 1], "方は": [25, 1, 2, 1], "既存": [51, 2, 2, 5, 70, 2, 2, 7], "日か": [0, 1, 1, 1, 11, 4, 1, 3, 1, 3, 1, 3, 12, 1, 44, 2], "日ホ": [111, 1], "日程": [14, 4, 71, 1, 1, 1, 24, 4, 1, 8, 1, 3, 1, 3], "早く": [89, 1], "春に": [28, 1], "更な": [80, 1], "書の": [5, 4, 7, 1, 1, 4, 29, 1, 25, 1, 4, 1, 43, 1], "書類": [0, 1, 2, 3, 2, 1, 5, 1, 2, 2, 1, 1, 1, 1, 1, 3, 4, 4, 6, 5, 10, 1, 1, 1, 1, 1, 1, 1, 31, 4, 6, 1, 12, 1, 6, 1, 19, 1], "月の": [45, 1, 72, 1, 18, 1], "期待": [79, 1], "期投": [65, 3, 72, 5], "期日": [71, 1, 12, 1, 2, 1, 7, 1, 18, 1], "本を": [28, 1], "来に": [20, 1], "来事": [30, 1], "東北": [96, 3, 7, 3, 8, 1], "査員": [24, 1, 3, 1, 7, 2], "格転": [48, 2, 72, 2], "桐島": [106, 1], "検索": [66, 1], "業3": [47, 1, 7, 1, 7, 1, 58, 1, 7, 1, 7, 1], "業コ": [63, 1, 72, 1], "業観": [80, 1], "標は": [78, 1], "次資": [84, 1], "殊材": [51, 1, 72, 1], "毎年": [46, 1, 72, 1], "気軽": [26, 1, 1, 1, 82, 1], "況で": [79, 1], "済の": [73, 1, 7, 2], "済ま": [13, 1], "減少": [78, 1, 2, 1], "渡し": [34, 1, 2, 1, 52, 1], "澤建": [100, 1], "激化": [49, 1, 4, 1, 68, 1, 4, 1], "点は": [14, 1, 64, 1, 1, 1], "熊田": [105, 1], "父が": [28, 2, 14, 1, 72, 1], "現場": [28, 1, 2, 5, 13, 1, 17, 1, 21, 2, 34, 1, 17, 1], "用の": [34, 1], "由し": [24, 1], "由で": [27, 3, 1, 1, 13, 1], "的な": [12, 1, 11, 1, 8, 1, 15, 1, 25, 1, 47, 1], "目的": [43, 2, 25, 1, 5, 1, 42, 1], "県ア": [109, 1], "知る": [0, 1, 88, 1], "短3": [28, 1], "社い": [107, 1], "社ヤ": [101, 1], "社藤": [100, 1, 1, 1], "福井": [99, 1], "秩序": [80, 1], "第2": [39, 1, 41, 1, 29, 1], "等支": [71, 1, 16, 1], "答な": [7, 1], "約半": [80, 1], "終え": [40, 1], "継は": [28, 1, 51, 1], "継承": [42, 3, 2, 1, 5, 2, 7, 1, 3, 1, 5, 1, 50, 2, 2, 1, 5, 2, 7, 1, 3, 1, 5, 1], "練り": [23, 1], "翔太": [101, 1], "者に": [73, 1], "聞い": [0, 1, 37, 1], "職業": [80, 1], "自技": [53, 1, 72, 1], "良法": [72, 1], "若手": [28, 1, 14, 1, 2, 1, 2, 1, 3, 3, 7, 1, 8, 1, 50, 1, 2, 1, 2, 1, 3, 3, 7, 1, 8, 1], "茨城": [97, 1], "術変": [50, 1, 72, 1], "術継": [59, 1, 5, 1, 67, 1, 5, 1], "表の": [85, 1, 28, 3], "表明": [72, 1], "表現": [22, 1, 46, 1, 4, 1], "要性": [73, 1], "要資": [65, 3, 72, 3], "要顧": [54, 1, 72, 1], "視が": [50, 1, 72, 1], "観点": [3, 1, 7, 1, 63, 3, 13, 1], "触れ": [0, 1, 2, 1], "計の": [81, 1], "試作": [4, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 17, 5, 9, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 5, 1, 3, 1, 4, 1, 6, 1, 5, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 62, 1, 1, 2, 2, 1, 1, 3, 1, 2], "話し": [35, 1], "話で": [13, 1, 6, 1], "認申": [71, 1], "読ん": [35, 1], "販路": [68, 1], "質バ": [62, 1, 72, 1], "起業": [28, 1, 4, 1], "転記": [11, 1, 24, 1, 1, 1], "返り": [28, 1, 12, 1], "速さ": [28, 2], "達な": [55, 1, 72, 1], "達リ": [52, 1, 72, 1], "選択": [38, 1, 17, 1, 24, 1, 1, 1, 47, 1], "都道": [94, 1, 1, 3], "金で": [47, 2, 18, 1, 54, 2, 18, 1], "鋳物": [96, 1], "門家": [87, 1], "階層": [69, 1], "須の": [20, 1], "領の": [2, 1, 66, 2, 10, 1, 7, 1, 1, 1], "頼関": [46, 1, 13, 1, 59, 1, 13, 1], "額3": [70, 1], "高ま": [60, 1, 72, 1], "高松": [0, 1, 111, 1], "高精": [44, 1, 9, 1, 3, 1, 1, 1, 1, 1, 4, 1, 54, 1, 9, 1, 3, 1, 1, 1, 1, 1, 4, 1]};
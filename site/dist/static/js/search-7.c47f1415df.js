@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_7 = {"07": [74, 1, 39, 2], "0万": [1, 1, 2, 2, 4, 2, 3, 2, 13, 2, 23, 1, 1, 2, 4, 1, 10, 2, 2, 4, 2, 9, 11, 2, 4, 1, 38, 1, 1, 2, 4, 1, 10, 2, 2, 8, 2, 10], "18": [0, 1, 4, 1, 7, 1, 1, 1, 1, 1, 1, 1, 10, 1, 4, 1, 7, 1, 76, 1], "1月": [0, 2, 12, 1, 2, 2, 4, 1, 50, 1], "29": [86, 1], "7回": [0, 2, 4, 1, 8, 1, 56, 1, 8, 1, 3, 1, 6, 4, 1, 2, 9, 3, 7, 1, 7, 1, 1, 3, 1, 3, 1, 3, 1, 6], "90": [109, 2], "bi": [71, 1], "b等": [80, 1], "dに": [66, 1], "ip": [94, 1], "ja": [94, 1], "md": [34, 1, 32, 1], "ne": [94, 1], "ri": [40, 2, 50, 1], "tセ": [50, 1, 72, 1], "x政": [80, 1], "いか": [0, 2, 27, 1, 6, 1, 76, 4], "いに": [5, 1, 12, 1, 7, 1], "いる": [7, 1, 7, 1, 3, 3, 3, 1, 4, 1, 1, 1, 3, 1, 1, 1, 1, 4, 5, 1, 4, 1, 27, 1, 2, 2, 4, 3, 4, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 2, 3, 3, 1, 6, 1], "いル": [24, 1], "い事": [37, 1, 2, 1], "い手": [54, 4, 72, 6], "えは": [36, 1, 31, 1], "おけ": [80, 1], "お近": [109, 1], "お金": [3, 1, 75, 1], "かも": [0, 1, 33, 1], "かを": [11, 1, 14, 1, 63, 1], "が3": [35, 1], "がこ": [28, 1, 4, 1], "がっ": [14, 1, 5, 3, 7, 3, 52, 1], "が廃": [28, 1], "が当": [35, 1], "が正": [68, 1, 16, 1], "きや": [49, 1, 32, 1, 40, 1], "くて": [28, 1], "け済": [13, 1], "され": [0, 4, 3, 4, 1, 2, 3, 2, 1, 3, 12, 2, 2, 1, 2, 2, 1, 1, 2, 2, 1, 3, 6, 1, 2, 1, 1, 3, 1, 1, 2, 1, 1, 1, 26, 1, 1, 1, 8, 2, 2, 1, 1, 2, 9, 4, 3, 1, 11, 1, 8, 1], "しの": [43, 1, 30, 1, 42, 1], "しま": [0, 1, 1, 1, 1, 1, 19, 1, 3, 1, 1, 1, 3, 1, 3, 1, 1, 1, 24, 1, 26, 1, 4, 4, 1, 1, 4, 1, 3, 1, 19, 1, 15, 1], "じた": [92, 1], "すだ": [66, 1], "ぜん": [40, 1], "た理": [69, 1, 8, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "た試": [28, 1], "つか": [16, 1, 60, 1], "つに": [19, 1, 1, 1], "てき": [3, 1, 25, 1, 49, 1, 1, 1], "てそ": [78, 1], "て初": [0, 1], "て業": [43, 1, 72, 1], "て読": [35, 1], "て追": [40, 1, 71, 1], "での": [1, 1, 1, 1, 2, 1, 7, 3, 13, 1, 18, 2, 11, 1, 1, 1, 14, 1, 5, 1, 13, 1, 28, 4, 11, 1, 1, 1], "で収": [60, 1, 72, 1], "で回": [28, 1, 15, 1, 72, 1], "で対": [58, 2, 72, 2], "で属": [42, 1, 72, 1], "で差": [51, 1, 72, 1], "とは": [0, 3, 1, 3, 1, 3, 1, 4, 1, 1, 3, 1, 10, 1, 2, 1, 1, 1, 4, 1, 3, 1, 3, 1, 7, 1, 39, 1, 12, 2], "と意": [18, 1], "と感": [30, 1], "と承": [11, 1, 10, 1], "と期": [110, 1], "なけ": [19, 1], "な流": [80, 1], "な要": [71, 3], "にあ": [0, 2, 3, 1, 4, 1, 15, 1, 5, 1, 3, 1, 24, 1, 15, 1, 7, 1, 16, 1, 34, 1], "にも": [19, 1, 13, 1, 4, 1, 41, 2, 6, 1, 7, 1], "に参": [42, 1, 72, 1], "に時": [20, 3], "に転": [11, 1, 25, 1], "に進": [18, 1, 9, 1], "に関": [84, 1, 1, 1], "の5": [26, 1, 14, 1], "のu": [88, 1], "のづ": [43, 1, 4, 1, 18, 1, 50, 1, 4, 1, 18, 1], "のサ": [1, 1, 13, 1, 60, 1, 13, 3, 1, 1, 1, 3, 2, 1], "のフ": [24, 2, 42, 1], "の仕": [28, 1, 51, 2], "の何": [32, 1], "の充": [51, 1, 4, 1, 68, 1, 4, 1], "の入": [88, 1], "の内": [86, 1, 2, 1, 4, 1], "の動": [80, 3], "の妥": [73, 2], "の工": [81, 1], "の底": [46, 1, 72, 1], "の待": [28, 1], "の投": [3, 1, 53, 1, 23, 1, 2, 1, 47, 1], "の接": [27, 1, 51, 1, 1, 1], "の日": [14, 3, 71, 1, 1, 1, 24, 3, 1, 7, 1, 4, 1, 3], "の来": [24, 1, 13, 1, 2, 1], "の段": [24, 1, 44, 2], "の清": [26, 1], "の脅": [51, 2, 2, 1, 2, 2, 68, 4, 2, 3, 2, 4], "の評": [0, 1], "の超": [45, 1, 72, 1], "の迅": [57, 1, 72, 1], "の遅": [48, 1, 72, 1], "の違": [32, 1], "の項": [35, 1], "は取": [92, 1], "は家": [79, 1], "ばg": [80, 1], "ば気": [19, 1], "ぼっ": [80, 1], "み取": [35, 1], "むし": [21, 1], "もら": [0, 3, 1, 3, 1, 4, 1, 3, 21, 1, 3, 1, 7, 3, 32, 1], "やる": [1, 1, 3, 1, 22, 1, 1, 1, 29, 3, 72, 3], "や事": [77, 1], "よく": [0, 1, 1, 1, 15, 1, 3, 3], "ら提": [24, 1], "ら数": [23, 1], "ら新": [37, 1, 42, 1], "ら締": [74, 1], "り品": [59, 1, 72, 1], "る2": [59, 1, 72, 1], "るも": [18, 1, 3, 1, 2, 3, 57, 1, 12, 2], "るア": [0, 1], "る形": [0, 1], "る時": [13, 1, 10, 1], "る課": [28, 1, 2, 3], "をす": [3, 1, 10, 1, 14, 1], "をど": [22, 1], "をス": [50, 1, 72, 1], "を利": [27, 3, 61, 1], "を審": [24, 1], "を挙": [78, 1, 2, 1], "を改": [21, 1], "を有": [25, 3], "を標": [56, 1, 3, 1, 69, 1, 3, 1], "を特": [88, 1], "を紹": [90, 1, 19, 1], "んな": [20, 3, 5, 1, 6, 1, 26, 3, 72, 3], "アド": [2, 1], "ィお": [72, 1], "ィリ": [50, 1, 72, 1], "イル": [34, 1, 2, 1, 4, 2, 26, 3, 1, 1], "グし": [34, 1], "ケジ": [73, 1, 1, 3], "サー": [7, 1, 43, 1, 5, 1, 3, 1, 4, 1, 4, 2, 6, 1, 1, 1, 3, 1, 12, 1, 3, 1, 31, 1, 5, 1, 3, 1, 4, 1], "ジは": [14, 1], "ジタ": [42, 3, 38, 1, 34, 3], "タウ": [100, 1], "タ化": [42, 1, 72, 1], "トは": [34, 1, 38, 2, 19, 1, 1, 1], "トワ": [56, 1, 3, 1, 69, 1, 3, 1], "ト機": [66, 1], "ドバ": [2, 1, 21, 1], "ハウ": [28, 1, 31, 1, 72, 1], "ハブ": [46, 1, 72, 1], "フレ": [24, 1, 13, 1, 43, 1], "ブロ": [0, 2, 14, 1, 12, 1, 69, 2, 13, 1, 3, 6], "プの": [28, 1, 16, 1, 72, 1], "ボン": [47, 2, 72, 2], "ポイ": [62, 2, 72, 1], "ムで": [24, 1, 21, 1, 72, 1], "ュー": [43, 3, 4, 2, 19, 1, 5, 1, 2, 1, 1, 3, 11, 1, 26, 1, 4, 5, 4, 2], "ラム": [42, 1, 72, 1], "リ共": [27, 1], "ルを": [36, 1, 21, 1, 9, 2, 1, 1, 62, 1], "レビ": [71, 1], "レン": [110, 1, 1, 14, 1, 3], "ン株": [97, 1], "ン自": [47, 1, 72, 1], "ービ": [7, 1, 48, 1, 3, 1, 4, 1, 10, 1, 1, 1, 3, 1, 51, 1, 3, 1, 4, 1], "ーン": [43, 1, 28, 1, 9, 1, 35, 1], "ー連": [58, 1, 72, 1], "一切": [91, 1], "一斗": [101, 1], "一覧": [68, 2, 7, 2, 10, 2, 1, 1, 8, 1, 15, 1], "万社": [61, 2, 17, 1, 1, 1, 1, 1, 53, 2], "上1": [48, 1, 72, 1], "下げ": [27, 1], "中古": [51, 1, 72, 1], "中澤": [100, 2], "争激": [49, 1, 72, 1], "井県": [99, 1], "人員": [73, 1], "付は": [112, 1], "仙台": [0, 1, 111, 1], "代町": [43, 1, 72, 1], "任を": [92, 1], "会員": [13, 1], "会話": [25, 1, 2, 1, 61, 1], "何が": [2, 3, 42, 2, 1, 2, 1, 2, 22, 1, 48, 1, 1, 1, 1, 1], "作っ": [11, 1, 13, 1, 65, 1], "作コ": [50, 1, 10, 1, 62, 1, 10, 1], "使う": [7, 1, 7, 1, 11, 4, 51, 1, 12, 1], "例を": [42, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "価8": [61, 2, 72, 2], "信用": [32, 1], "値に": [23, 1], "側に": [4, 1, 3, 1, 17, 1, 13, 1, 17, 1, 22, 1, 12, 1, 38, 1], "先は": [26, 1], "先端": [72, 1], "入れ": [35, 1, 8, 1, 11, 1, 12, 1, 45, 1, 4, 1, 11, 1], "入障": [59, 3, 72, 4], "全く": [19, 1, 1, 1], "全域": [80, 1], "具の": [44, 1, 72, 1], "具現": [43, 2, 72, 1], "典は": [2, 1, 7, 3], "切ま": [1, 1, 73, 1], "初年": [28, 1, 33, 1, 72, 1], "前判": [71, 1], "力を": [52, 1, 72, 1], "加し": [1, 3, 85, 2], "加で": [42, 1, 72, 1], "務局": [24, 1, 62, 1, 23, 1], "務負": [47, 1, 72, 1], "募集": [84, 1, 8, 1, 21, 1], "化ポ": [62, 2, 72, 1], "医療": [42, 1, 2, 1, 13, 1, 57, 1, 2, 1, 13, 1], "協力": [43, 1, 2, 1, 1, 2, 13, 1, 13, 1, 43, 1, 2, 1, 1, 2, 13, 1], "協電": [97, 1], "又は": [68, 1], "受賞": [95, 1, 18, 1], "古屋": [0, 1], "可視": [42, 1, 72, 1], "右上": [40, 1], "合は": [22, 1, 3, 1, 9, 1, 37, 1, 7, 1, 31, 1], "合わ": [11, 1, 55, 1, 20, 1, 9, 1], "合意": [7, 2, 69, 2], "同姓": [85, 1, 1, 1], "名古": [0, 1], "呼ん": [78, 1], "和コ": [108, 1], "品へ": [48, 1, 72, 1], "品部": [28, 1], "員用": [34, 1], "啓人": [108, 1], "喪失": [80, 1], "営業": [63, 1, 1, 1, 71, 1, 1, 1], "営能": [78, 2, 2, 1], "回サ": [58, 1, 72, 1], "図り": [80, 1], "固め": [24, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "圏集": [61, 1, 72, 1], "報よ": [87, 1], "場か": [0, 1], "場に": [19, 1, 11, 1, 41, 1], "声で": [66, 1], "夜間": [45, 1, 72, 1], "大森": [97, 1, 8, 1], "夫を": [43, 1, 72, 1], "失注": [55, 1, 72, 1], "奈良": [99, 1], "字の": [137, 1], "字ま": [24, 1, 13, 1], "家業": [7, 4, 15, 1, 6, 1, 1, 1, 3, 4, 3, 1, 41, 4, 3, 1, 1, 1], "容だ": [35, 1], "専務": [90, 1], "導入": [28, 1, 14, 2, 5, 2, 1, 1, 2, 1, 5, 1, 10, 1, 7, 1, 42, 2, 5, 2, 1, 1, 2, 1, 5, 1, 10, 1], "屋青": [97, 1], "山梨": [95, 1, 2, 1], "工が": [28, 1], "差別": [51, 1, 2, 1, 1, 1, 8, 3, 61, 1, 2, 1, 1, 1, 8, 4], "年か": [47, 1, 72, 1], "年に": [28, 2, 51, 1], "年末": [3, 1, 65, 1], "年秋": [74, 1], "式f": [2, 1, 66, 1], "形容": [35, 1], "得の": [23, 3], "応体": [59, 1, 72, 1], "思い": [21, 1, 1, 2, 3, 2], "性の": [19, 1], "性ま": [26, 1], "悩む": [68, 1], "想定": [14, 1], "意外": [18, 1], "態を": [24, 1], "成プ": [42, 1, 72, 1], "成長": [2, 1, 8, 1, 12, 1, 46, 1, 1, 1, 3, 1, 1, 1, 6, 1], "手2": [123, 1, 1, 1, 1, 1, 1, 1, 1, 1], "手育": [42, 1, 4, 1, 68, 1, 4, 1], "把握": [73, 1], "採用": [46, 1, 3, 2, 6, 1, 63, 1, 3, 2, 6, 1], "探す": [1, 1], "掲載": [2, 1, 7, 1, 75, 4, 2, 1, 1, 1, 5, 1], "援セ": [72, 1, 8, 1], "援事": [2, 1, 66, 1], "支給": [70, 1, 8, 1], "政学": [80, 1], "政策": [47, 1, 32, 1, 1, 1, 39, 1], "数字": [24, 1, 2, 1, 3, 1, 1, 1, 5, 1, 2, 1, 2, 1, 27, 2, 15, 1, 14, 1], "文の": [0, 1, 13, 1, 7, 1, 3, 1, 1, 1, 1, 1, 12, 1, 3, 2, 45, 1, 1, 1, 2, 1, 3, 1], "料加": [51, 1, 72, 1], "新し": [31, 1, 6, 1, 2, 1, 40, 1, 3, 1, 31, 1], "族外": [1, 1], "日本": [61, 1, 33, 1, 39, 1], "早紀": [105, 1], "映し": [40, 1, 44, 1, 2, 1], "時点": [0, 1, 8, 1, 6, 1, 22, 1, 31, 1, 5, 1], "晃太": [98, 1], "普段": [24, 1], "書く": [24, 1, 13, 1, 30, 1, 14, 1], "最大": [3, 1, 7, 1, 37, 1, 72, 1], "有限": [96, 1, 1, 2, 3, 1, 1, 1, 3, 1, 2, 1, 1, 2, 1, 1], "期分": [71, 1], "本当": [39, 1], "材シ": [49, 1, 72, 1], "枠で": [71, 1, 41, 1], "査を": [18, 1], "査時": [50, 1, 72, 1], "根拠": [35, 2, 9, 2, 1, 2, 1, 2, 70, 1, 1, 1, 1, 1, 5, 1, 1, 1, 1, 1, 1, 1, 1, 1], "格3": [78, 1], "森清": [107, 1], "業や": [7, 1, 69, 1], "模案": [48, 1, 72, 1], "欄に": [25, 2, 1, 1, 12, 1, 2, 1], "正確": [27, 1, 62, 1], "歴か": [24, 1, 13, 1], "気の": [0, 1], "決め": [7, 1, 28, 1, 41, 1], "注は": [57, 1, 72, 1], "浩一": [97, 1], "深掘": [6, 1, 18, 1, 13, 1], "済み": [1, 1], "減を": [47, 1, 72, 1], "湿度": [44, 1, 72, 1], "激し": [53, 2, 72, 1], "然そ": [18, 1], "状維": [79, 1], "率の": [56, 1, 72, 1], "率低": [48, 1, 72, 1], "甘く": [0, 1], "用意": [24, 3, 1, 1], "用量": [52, 1, 72, 1], "田大": [90, 1, 19, 1], "由8": [0, 1, 8, 1, 70, 2], "由と": [1, 1, 15, 1], "申告": [71, 2], "画を": [21, 1], "画面": [4, 1, 30, 1], "畿ブ": [111, 1], "発1": [65, 1, 72, 1], "登録": [13, 2, 59, 1, 8, 1, 30, 1], "的に": [0, 1, 3, 3, 23, 1, 58, 1], "的ホ": [91, 1], "的事": [47, 2, 1, 2, 1, 2, 1, 2, 69, 1, 1, 1, 1, 1, 1, 1], "省エ": [47, 2, 72, 2], "県境": [86, 1], "知県": [98, 1, 7, 1], "確信": [7, 1, 69, 1], "磨く": [11, 1], "社サ": [86, 1, 4, 1], "社濵": [99, 1], "社若": [107, 1], "程を": [111, 1], "立を": [56, 1, 72, 1], "第3": [39, 1, 47, 1, 4, 1, 19, 2], "答に": [7, 1], "算の": [40, 1, 26, 1], "算ま": [40, 1], "経産": [80, 1, 5, 1], "経験": [1, 1, 41, 2, 29, 2, 18, 1, 4, 1, 21, 2], "絡先": [26, 1, 1, 1], "給業": [52, 4, 72, 6], "統計": [81, 1], "継ぐ": [78, 1, 1, 1], "続け": [27, 1], "締切": [0, 1, 1, 1, 3, 1, 8, 1, 2, 2, 13, 1, 8, 2, 39, 1, 10, 1, 26, 1, 1, 2, 1, 1, 1, 1], "者が": [37, 1, 41, 1, 7, 1, 1, 1, 5, 1], "育葉": [108, 1], "自己": [87, 1], "自由": [28, 1, 13, 1], "表は": [113, 1], "要領": [0, 2, 1, 1, 1, 1, 1, 1, 5, 1, 2, 1, 9, 1, 49, 3, 1, 2, 3, 1, 3, 1, 3, 1, 4, 1, 2, 2, 1, 2, 1, 1, 1, 1, 5, 1], "規制": [47, 1, 72, 1], "覧の": [68, 1, 7, 1], "解決": [31, 1], "請を": [14, 1], "請時": [0, 1, 8, 1, 60, 1, 4, 1], "負荷": [60, 1, 72, 1], "費2": [63, 1, 2, 1, 70, 1, 2, 1], "貼っ": [27, 1], "賃上": [3, 1, 7, 1, 60, 1, 2, 1, 6, 1, 2, 2], "資の": [3, 1, 47, 1, 10, 1, 18, 1, 44, 1, 10, 1], "資ま": [89, 1], "賞者": [113, 1], "質チ": [50, 1, 72, 1], "質管": [50, 2, 9, 1, 5, 1, 1, 1, 57, 2, 9, 1, 5, 1, 1, 1], "質要": [51, 1, 72, 1], "超が": [80, 1], "足り": [26, 1, 2, 1], "身も": [36, 1, 31, 1], "身を": [24, 3, 3, 1, 44, 1], "込ん": [28, 1, 13, 1], "返る": [27, 1], "追い": [39, 1, 40, 1], "退職": [49, 1, 72, 1], "通信": [50, 1, 72, 1], "通条": [2, 1], "速度": [60, 1, 72, 1], "連携": [45, 1, 4, 1, 9, 1, 1, 1, 3, 1, 6, 1, 49, 1, 4, 1, 9, 1, 1, 1, 3, 1], "連続": [78, 1, 1, 1], "遅れ": [48, 1, 2, 1, 7, 1, 63, 1, 2, 1, 7, 1], "金と": [1, 1, 68, 1], "金へ": [11, 1], "長崎": [101, 1, 7, 1], "長野": [90, 1, 5, 1, 2, 1, 12, 1], "間削": [49, 1, 72, 1], "間半": [50, 1, 72, 1], "関す": [85, 1], "関根": [97, 1], "限で": [49, 1, 72, 1], "集中": [55, 1, 6, 1, 66, 1, 6, 1], "革新": [35, 1, 36, 1, 1, 1, 15, 1], "領原": [1, 1, 18, 1, 49, 1, 1, 1, 18, 1], "類フ": [11, 1, 25, 1], "駄に": [20, 1]};
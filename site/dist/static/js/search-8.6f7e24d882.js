@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_8 = {"08": [0, 1, 2, 1, 6, 1, 67, 3, 3, 1, 7, 6, 1, 6, 27, 1], "0月": [11, 1], "19": [0, 2, 7, 1, 4, 1, 3, 1, 14, 1, 14, 1, 32, 2, 2, 1, 35, 1, 3, 1], "3手": [38, 3], "5名": [64, 1, 38, 1, 7, 1, 27, 1], "6の": [78, 1], "6回": [85, 3, 1, 3, 10, 3, 1, 6, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 3, 1, 4, 1, 3, 1, 6, 1, 7, 1, 3, 4, 1], "80": [3, 1, 7, 1, 13, 1, 42, 1, 70, 1, 2, 1], "ai": [6, 1, 7, 2, 1, 1, 6, 1, 4, 4, 1, 10, 1, 3, 1, 10, 1, 1, 6, 2, 2, 1, 1, 1, 1, 3, 1, 1, 1, 7, 10, 3, 16, 5, 14, 1, 8, 5, 34, 3], "aラ": [44, 1, 72, 1], "em": [25, 1, 2, 1], "go": [0, 1, 2, 1, 7, 1, 14, 1, 45, 1, 20, 2, 23, 1], "ia": [94, 2], "iチ": [25, 1], "i品": [50, 2, 72, 2], "lt": [63, 4, 72, 3], "og": [50, 3, 38, 1, 23, 1, 11, 3], "tl": [111, 1], "あな": [0, 2, 4, 1, 3, 1, 10, 2, 7, 2, 3, 1, 2, 2, 1, 1, 3, 1, 4, 1, 39, 1, 12, 2, 3, 1], "あり": [0, 4, 1, 3, 1, 3, 1, 4, 1, 1, 3, 3, 10, 1, 1, 1, 1, 2, 5, 1, 3, 1, 1, 1, 8, 1, 1, 1, 15, 1, 11, 1, 4, 1, 1, 1, 6, 1, 2, 3, 1, 1, 1, 1, 1, 1, 9, 2, 3, 1, 1, 2, 32, 1, 11, 1], "いが": [32, 1], "いれ": [20, 1], "い本": [39, 1], "い独": [44, 2, 1, 1, 1, 1, 70, 4, 1, 3, 1, 3], "い県": [94, 1], "い込": [79, 1], "うぞ": [27, 1, 63, 1], "うの": [0, 1], "うま": [21, 1, 6, 1], "えだ": [81, 1], "えば": [3, 1, 36, 1, 42, 1], "かっ": [22, 1], "がd": [56, 1, 72, 1], "がい": [89, 1, 5, 2], "がつ": [66, 1, 3, 1, 8, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 27, 1], "がや": [56, 3, 72, 3], "が年": [45, 1, 16, 1, 56, 1, 16, 1], "が整": [39, 1, 40, 1], "が約": [80, 1], "が返": [0, 1, 27, 1, 1, 1], "きさ": [35, 1], "き項": [71, 1], "くプ": [13, 1], "ぐと": [27, 1], "けら": [27, 1], "け継": [43, 1, 36, 1, 36, 1], "こか": [7, 2, 13, 1, 7, 1, 49, 1, 1, 1, 2, 3], "こに": [26, 3, 2, 1, 4, 1, 9, 1, 31, 3, 11, 1, 26, 1], "こる": [2, 3], "しく": [31, 1], "した": [0, 1, 1, 2, 1, 1, 12, 2, 3, 1, 1, 1, 6, 1, 1, 1, 2, 1, 1, 6, 5, 4, 1, 1, 1, 2, 1, 1, 4, 4, 3, 1, 2, 1, 3, 1, 9, 2, 1, 1, 9, 1, 1, 1, 10, 1, 1, 2, 1, 1, 6, 8, 2, 1, 1, 1, 2, 1, 2, 1, 22, 1, 2, 1, 3, 1, 9, 2, 1, 1], "せん": [0, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 2, 7, 1, 3, 1, 2, 1, 1, 1, 4, 1, 3, 2, 1, 2, 9, 1, 37, 1, 2, 2, 5, 1, 6, 2, 1, 3, 3, 2, 1, 2], "たし": [25, 1, 54, 1], "たで": [24, 1], "たプ": [24, 1], "た文": [26, 3], "だと": [81, 2, 8, 1], "ちら": [7, 1, 69, 1], "っか": [0, 2, 23, 1, 56, 1], "づき": [79, 1, 7, 1], "ての": [24, 1, 13, 1, 9, 1, 72, 1], "てま": [13, 1, 8, 1], "て普": [24, 1], "て聞": [37, 1], "では": [0, 1, 2, 1, 5, 1, 15, 1, 2, 1, 4, 1, 2, 1, 4, 1, 21, 1, 16, 1, 3, 1, 2, 1, 1, 1, 1, 1, 1, 1, 13, 1, 35, 1, 10, 1], "でみ": [35, 1], "で使": [14, 1, 13, 1], "で実": [43, 1, 72, 1], "で感": [28, 1, 2, 3], "で支": [89, 1], "で良": [21, 1], "と一": [17, 1, 21, 1, 48, 1, 8, 1], "と加": [1, 1, 7, 3], "と地": [33, 1, 10, 1, 13, 1, 17, 1, 42, 1, 13, 1], "と提": [1, 1], "と章": [6, 1], "と詰": [26, 1], "どち": [7, 1, 69, 1], "な形": [35, 1], "な進": [12, 1], "に3": [58, 1, 72, 1], "にこ": [20, 1, 46, 1], "にコ": [18, 1], "に広": [25, 1], "に正": [27, 1], "に申": [68, 1], "の6": [45, 1, 4, 1, 5, 1, 63, 1, 4, 1, 5, 1], "のう": [68, 1, 6, 1, 12, 1, 16, 1, 11, 1], "のウ": [95, 1], "のブ": [14, 1, 10, 1, 12, 1, 31, 1, 21, 1], "の他": [65, 1, 5, 1, 67, 1], "の分": [47, 1, 1, 1, 1, 1, 1, 1, 69, 3, 1, 3, 1, 3, 1, 3], "の制": [78, 1, 2, 1], "の取": [28, 1, 24, 1, 16, 1, 3, 1, 2, 1, 51, 1], "の外": [57, 1, 72, 1], "の家": [29, 1], "の準": [3, 1, 2, 4, 7, 1, 1, 1, 54, 1], "の状": [78, 2], "の競": [49, 1, 72, 1], "の給": [72, 1], "の試": [28, 1, 33, 1, 18, 1, 54, 1], "の集": [92, 1], "は7": [28, 1, 51, 1], "はで": [3, 1, 17, 1, 67, 1], "はシ": [25, 1], "はプ": [25, 1], "は受": [28, 1], "は大": [95, 1], "は指": [34, 1], "は気": [22, 1], "は職": [42, 1, 72, 1], "は資": [7, 1, 69, 1], "みで": [19, 1, 9, 1, 18, 1, 72, 1], "み具": [4, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "むと": [11, 1, 15, 1], "むよ": [24, 1], "めら": [1, 1, 12, 1, 13, 1, 57, 1], "め方": [12, 1, 26, 3, 54, 1], "もな": [7, 1, 7, 1, 8, 1, 54, 1], "もり": [19, 1, 9, 3], "も今": [81, 1], "も多": [79, 1], "も確": [83, 1], "も続": [37, 1], "も自": [28, 1, 13, 1], "ら1": [1, 1, 22, 1], "ら持": [21, 1, 2, 1], "ら近": [80, 1], "りも": [27, 1], "りを": [28, 2], "るこ": [0, 1, 1, 1, 2, 1, 1, 2, 3, 1, 1, 1, 10, 1, 1, 1, 5, 1, 3, 2, 3, 1, 6, 1, 1, 1, 19, 1, 11, 1, 5, 2, 1, 1, 3, 1, 2, 1, 10, 2, 21, 1, 19, 1], "るコ": [1, 1], "る口": [0, 1, 21, 1], "る連": [27, 1], "る道": [12, 3, 1, 3, 1, 3, 1, 3], "れ年": [7, 1, 69, 1], "れ整": [20, 1], "をオ": [66, 1], "を上": [25, 1, 17, 1, 37, 1, 35, 1], "を出": [0, 1, 18, 1, 6, 1, 10, 1], "を削": [60, 1, 72, 1], "を固": [24, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "を定": [84, 1], "を決": [35, 1], "を発": [43, 1, 13, 1, 57, 3, 2, 1, 13, 1], "を確": [11, 1, 13, 1, 3, 1, 57, 1, 29, 1], "を示": [25, 1], "を自": [13, 1, 12, 1, 86, 1], "を通": [18, 1, 60, 1], "んか": [0, 1], "アリ": [49, 1, 72, 1], "ア株": [96, 1], "ェク": [66, 1], "カッ": [47, 1, 72, 1], "カン": [111, 2], "キュ": [50, 1, 22, 1, 39, 1, 11, 1], "クで": [0, 1, 26, 1, 24, 1, 72, 1], "クシ": [96, 1, 9, 1], "ザの": [36, 1, 31, 1, 21, 1], "スケ": [73, 1, 1, 3], "セッ": [27, 1, 39, 3, 27, 1], "セン": [50, 1, 22, 1, 8, 1, 31, 1, 11, 1], "チベ": [22, 1], "ツー": [0, 1, 89, 1, 15, 1], "デク": [105, 1], "ト一": [85, 1], "ニッ": [63, 3, 42, 1, 30, 4], "ニン": [62, 1, 34, 1, 38, 1], "ノウ": [28, 1, 31, 1, 72, 1], "ピー": [25, 1, 2, 1, 13, 1, 4, 1, 1, 1, 4, 1, 67, 1, 1, 1, 4, 1], "フロ": [48, 1, 72, 1], "ムと": [59, 1, 72, 1], "ム編": [64, 1, 72, 3], "ヤー": [62, 2, 72, 1], "リア": [50, 1, 72, 1], "レイ": [62, 2, 72, 1], "ロ動": [80, 1], "ンか": [105, 1], "ンに": [66, 1, 5, 1], "ンセ": [27, 4, 46, 1, 15, 1, 1, 1], "ンニ": [47, 2, 72, 2], "ー4": [113, 1], "ーや": [55, 1, 37, 1, 1, 1, 34, 1], "ーツ": [26, 1, 13, 1, 2, 1, 1, 3, 72, 3], "一部": [94, 1], "上げ": [3, 1, 7, 1, 3, 2, 10, 1, 1, 1, 1, 1, 12, 1, 2, 1, 1, 1, 2, 1, 4, 1, 24, 1, 2, 1, 6, 1, 1, 1, 1, 2, 34, 1, 4, 1], "上を": [85, 1], "両方": [66, 1, 13, 1], "中堅": [80, 1], "中日": [111, 1], "久保": [96, 1], "人2": [42, 1, 2, 1, 70, 1, 2, 1], "人も": [25, 1], "人を": [1, 1, 87, 1], "他社": [43, 1, 1, 1, 2, 1, 7, 1, 3, 1, 6, 1, 53, 1, 1, 1, 2, 1, 7, 1, 3, 1, 6, 3], "付加": [48, 2, 30, 2, 1, 1, 1, 1, 40, 2], "代か": [43, 1, 72, 1], "代に": [42, 1, 72, 1], "以降": [0, 1, 7, 1, 61, 1, 8, 1, 35, 1], "件の": [48, 1, 5, 1, 67, 1, 5, 1], "件ま": [68, 1], "会2": [119, 1, 1, 1, 1, 1, 1, 1], "会を": [43, 1, 3, 1, 69, 1, 3, 1], "体に": [88, 1], "体系": [42, 1, 72, 1], "例3": [115, 1], "信す": [91, 1], "元に": [22, 1], "先だ": [28, 1], "共有": [46, 1, 72, 1], "内製": [55, 1, 72, 1], "円の": [47, 1, 72, 1], "分の": [0, 1, 2, 2, 19, 1, 50, 1, 8, 1, 2, 1, 5, 1, 25, 1], "切は": [12, 1, 15, 1], "前日": [35, 1], "剣に": [0, 1], "創業": [42, 3, 14, 1, 58, 5, 14, 1], "力体": [46, 2, 72, 2], "助け": [72, 1], "助金": [0, 6, 1, 1, 1, 4, 1, 3, 4, 1, 1, 1, 3, 2, 3, 6, 1, 1, 4, 1, 2, 1, 2, 2, 14, 1, 10, 4, 18, 1, 3, 9, 1, 8, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 3, 2, 1, 1, 33, 4, 18, 1], "動き": [80, 2], "動保": [36, 1, 31, 1], "務1": [64, 1, 72, 1], "務め": [46, 1, 72, 1], "勝者": [24, 1, 13, 1], "募で": [14, 1], "募資": [15, 1, 17, 1, 3, 1, 44, 1], "化の": [48, 1, 7, 1, 65, 1, 7, 1], "化ま": [73, 1], "化対": [47, 2, 72, 2], "原則": [84, 3], "原文": [1, 1, 18, 1, 49, 1, 1, 1, 16, 3, 2, 1, 26, 1], "収集": [50, 1, 38, 1, 34, 1], "各公": [68, 2], "各行": [111, 1], "各補": [68, 1], "命さ": [102, 1], "品特": [58, 1, 72, 1], "員役": [24, 1, 3, 1, 7, 1], "商社": [52, 2, 72, 2], "図か": [1, 1, 93, 3], "図る": [46, 1, 72, 1], "園自": [79, 1], "域で": [28, 1, 65, 1], "場が": [3, 1], "売り": [28, 1], "売上": [48, 1, 6, 1, 9, 2, 2, 1, 8, 1, 47, 1, 6, 1, 9, 2, 2, 2], "大西": [99, 3], "大量": [49, 1, 72, 1], "太2": [80, 4], "嫌い": [19, 3], "子高": [80, 1], "字は": [66, 2, 29, 1], "定2": [68, 1], "定を": [0, 1, 8, 1, 19, 1, 8, 1, 9, 1, 28, 1, 44, 1], "宝来": [108, 1], "実で": [36, 1, 31, 1], "宮島": [104, 1], "害に": [92, 1], "富澤": [101, 1], "小林": [99, 1], "山ス": [103, 1], "岸田": [107, 1], "工業": [43, 1, 3, 2, 51, 2, 1, 1, 8, 1, 2, 2, 7, 1, 3, 2], "年公": [11, 1], "年後": [28, 1], "年経": [71, 1], "度の": [0, 1, 2, 1, 42, 1, 7, 1, 4, 1, 4, 1, 1, 1, 1, 1, 7, 2, 7, 1, 5, 1, 9, 1, 3, 1, 17, 1, 7, 1, 7, 1, 4, 1, 4, 1, 1, 1, 1, 1], "度導": [48, 1, 72, 1], "度目": [61, 1, 72, 1], "弱点": [39, 1], "強く": [31, 1, 38, 1], "強み": [26, 1, 13, 2, 2, 1, 3, 6, 1, 6, 1, 6, 13, 2, 57, 7, 1, 7, 1, 7, 13, 1], "役員": [71, 2], "後4": [58, 1, 72, 1], "心に": [93, 1], "想に": [2, 1, 21, 1], "意し": [7, 1, 17, 2, 1, 1, 51, 1], "意で": [7, 1, 69, 1], "成と": [64, 1, 72, 3], "成へ": [24, 1, 22, 1, 72, 1], "手3": [49, 1, 72, 1], "手元": [22, 1, 14, 1], "承で": [42, 1, 72, 1], "捗可": [42, 1, 72, 1], "提案": [43, 1, 11, 1, 8, 1, 53, 1, 11, 1, 8, 1], "援が": [77, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "改め": [21, 1], "数え": [78, 1], "新計": [72, 1], "方向": [24, 3, 1, 4, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3], "族で": [71, 1], "最高": [44, 1, 72, 1], "期で": [53, 1, 1, 1, 71, 1, 1, 1], "期プ": [45, 1, 72, 1], "来牽": [72, 1], "査観": [3, 1, 7, 1, 76, 1], "格交": [52, 1, 72, 1], "業者": [2, 2, 11, 1, 22, 1, 7, 1, 4, 1, 6, 4, 16, 3, 2, 1, 18, 1, 26, 1, 4, 1, 6, 6], "構想": [0, 9, 1, 3, 1, 4, 1, 3, 14, 1, 6, 2, 4, 1], "気は": [20, 3], "気感": [19, 3], "求人": [81, 1], "泰幸": [106, 1], "済む": [24, 1], "減っ": [78, 1, 3, 1], "渡す": [25, 1, 9, 1, 5, 1], "準ま": [28, 1], "点条": [68, 1], "父の": [42, 1, 72, 1], "物価": [80, 1], "物流": [52, 1, 72, 1], "牽引": [72, 1], "状の": [35, 1], "現化": [43, 2, 72, 1], "現状": [35, 1, 44, 1], "用負": [50, 1, 72, 1], "申請": [0, 4, 2, 2, 1, 1, 2, 4, 3, 2, 4, 1, 1, 4, 1, 2, 9, 1, 1, 2, 11, 1, 2, 1, 10, 1, 20, 1, 1, 3, 1, 1, 2, 7, 1, 2, 15, 1, 5, 3, 27, 1], "発を": [28, 1], "益モ": [135, 1], "監査": [44, 1, 72, 1], "社ウ": [100, 1], "社武": [96, 1], "社艶": [98, 1], "秋頃": [74, 1], "移っ": [79, 1], "税制": [47, 1, 33, 1, 39, 1], "積極": [46, 1, 72, 1], "穴が": [24, 1], "章と": [66, 1], "第4": [39, 1, 70, 2], "策の": [79, 1, 1, 1], "算は": [66, 1], "精密": [43, 1, 12, 1, 3, 1, 57, 1, 12, 1, 3, 1], "精度": [28, 1, 16, 2, 9, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 54, 2, 9, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1], "精麦": [101, 1], "終確": [85, 5], "組が": [73, 1], "経歴": [71, 1], "絡す": [109, 3], "給与": [70, 1, 2, 1, 6, 1], "編成": [45, 1, 19, 1, 53, 1, 19, 3], "縄県": [94, 1, 14, 1], "繁忙": [49, 1, 72, 1], "群馬": [97, 1, 7, 1], "者不": [80, 1, 2, 1], "者名": [2, 1, 11, 1, 22, 1, 33, 1], "能工": [45, 1, 72, 1], "良率": [60, 1, 72, 1], "薦の": [85, 2], "行い": [87, 1], "表だ": [7, 1, 69, 1], "見当": [80, 1], "規顧": [45, 1, 9, 1, 63, 1, 9, 1], "覧は": [85, 1], "親も": [17, 1], "言え": [0, 1], "記述": [78, 1, 2, 2], "話す": [18, 4, 20, 1, 1, 3, 27, 1], "認日": [84, 1], "語化": [0, 1], "誰と": [39, 1], "談く": [26, 1, 61, 1], "請代": [87, 1], "貫体": [58, 1, 72, 1], "資は": [79, 1, 2, 1], "資支": [47, 1, 72, 1], "質を": [42, 1, 14, 1, 3, 1, 55, 1, 14, 1, 3, 1], "超短": [45, 1, 72, 1], "足に": [68, 1], "軸加": [28, 1], "造と": [63, 1, 72, 3], "道筋": [0, 1, 1, 1, 3, 1, 7, 3, 1, 3, 1, 3, 1, 3, 1, 3], "郎商": [107, 1], "部環": [39, 1, 7, 1], "部門": [28, 1, 29, 1, 72, 1], "醸造": [101, 1], "金審": [0, 2, 11, 1, 10, 1], "長期": [47, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 6, 1, 60, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 6, 1], "開拓": [54, 1, 14, 1, 58, 1], "間に": [0, 1, 74, 1], "限8": [10, 1, 13, 1], "集の": [84, 1], "静岡": [95, 1, 2, 1, 7, 1], "順の": [27, 2], "験か": [89, 1], "骨子": [13, 1, 7, 1, 4, 2, 1, 1, 3, 3, 6, 3, 6, 1, 48, 1, 3, 1], "高騰": [48, 1, 72, 1], "齢人": [78, 1, 2, 1, 1, 1]};
@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_9 = {"1番": [80, 1], "3行": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "5ま": [1, 1, 3, 1, 7, 3], "5回": [109, 2], "5社": [46, 1, 13, 1, 59, 1, 13, 1], "6は": [80, 1], "70": [48, 1, 13, 1, 19, 1, 40, 1, 13, 1], "cl": [27, 2, 39, 3, 22, 1], "dm": [90, 1, 19, 1], "en": [40, 1, 48, 1], "eの": [27, 1, 39, 1], "fo": [39, 1, 11, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 68, 3, 1, 3, 1, 3, 1, 3, 1, 3], "gp": [27, 1, 39, 2, 22, 1], "ha": [27, 1, 39, 2, 22, 1], "iを": [13, 1, 7, 1, 4, 1, 1, 4, 9, 1, 4, 1, 28, 1, 22, 2], "iア": [25, 1, 2, 2], "iモ": [25, 1], "js": [40, 1], "le": [88, 1, 23, 2], "pi": [88, 1], "un": [88, 1], "ある": [0, 4, 7, 1, 1, 1, 5, 1, 6, 1, 3, 1, 3, 1, 2, 1, 2, 1, 10, 1, 1, 1, 14, 1, 14, 3, 1, 3, 1, 3, 1, 3, 1, 5, 1, 3, 1, 3, 1, 3, 1, 1, 2, 1, 1, 3, 1, 1, 2, 1, 44, 1], "いき": [0, 1, 28, 1, 9, 1], "い設": [79, 1], "い配": [17, 1], "うた": [13, 1, 22, 1], "う使": [22, 1], "おこ": [72, 1], "かい": [39, 1], "かつ": [24, 1, 13, 1], "がサ": [88, 1], "が入": [28, 1, 14, 1, 72, 1], "が必": [2, 1, 11, 1, 34, 1, 16, 1, 5, 2, 51, 1, 16, 1], "が急": [42, 1, 72, 1, 23, 1], "が遅": [57, 1, 72, 1], "きて": [17, 1, 51, 1], "くと": [37, 1, 29, 1, 11, 1, 4, 1], "けな": [66, 1], "け隊": [72, 1], "げる": [23, 1, 2, 1, 12, 1, 5, 1, 37, 1, 35, 1], "こが": [28, 1], "これ": [0, 1, 2, 1, 17, 1, 15, 1, 52, 1, 2, 1], "さの": [28, 1], "しだ": [106, 1], "しば": [0, 1], "し最": [128, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "すも": [23, 1], "そう": [7, 2, 69, 3], "たと": [3, 1, 14, 1, 5, 1, 59, 1], "た全": [0, 1, 14, 1, 4, 1], "た書": [36, 1], "た甘": [17, 1], "た相": [90, 1], "た記": [80, 1], "ちな": [0, 1], "ち上": [14, 1], "ち出": [36, 3, 30, 1, 1, 3], "つき": [1, 1, 56, 1, 9, 1, 43, 1, 20, 1], "てく": [0, 4, 3, 1, 13, 1, 9, 3, 1, 2, 1, 3, 1, 1, 6, 1, 6, 2, 26, 1, 2, 1], "てた": [41, 1], "ては": [7, 2, 28, 1, 34, 1, 7, 2], "てみ": [0, 1, 13, 1, 5, 1, 3, 1, 1, 1], "て使": [94, 1], "で加": [68, 2], "で地": [46, 1, 72, 1], "で提": [13, 1, 11, 2, 62, 1], "で最": [44, 1, 3, 1, 24, 1, 45, 1, 3, 1], "で詰": [28, 1], "と1": [37, 1, 31, 1], "とめ": [4, 1, 9, 1, 7, 1, 1, 1, 4, 1, 41, 1, 3, 1, 42, 1], "と信": [59, 1, 72, 1], "と向": [39, 1], "と品": [42, 1, 72, 1], "と持": [36, 3, 31, 3], "と次": [7, 1, 32, 1, 21, 3, 72, 3], "と渡": [34, 1], "と話": [0, 1], "ども": [13, 1], "なこ": [20, 3], "なっ": [3, 1, 20, 1, 3, 1, 7, 1, 9, 1, 35, 1, 2, 1, 1, 1, 34, 1], "なん": [13, 1, 5, 1], "なビ": [22, 1], "な申": [23, 1], "にい": [0, 1, 3, 3, 14, 3, 13, 1], "にご": [26, 1, 61, 1, 22, 1], "につ": [20, 1, 5, 1, 57, 1, 7, 3, 3, 1], "にや": [1, 1, 3, 1, 22, 1, 1, 1], "に伴": [88, 1], "に整": [41, 1], "に穴": [24, 1], "に答": [5, 1, 15, 1, 4, 1, 3, 1, 49, 1], "の7": [61, 1, 72, 1], "のg": [111, 1], "のw": [66, 1], "ので": [0, 1, 3, 2, 10, 1, 3, 1, 3, 1, 1, 2, 2, 2, 3, 1, 2, 1, 7, 2, 3, 1, 29, 1, 14, 1, 4, 1, 4, 1, 4, 2, 17, 1], "のシ": [48, 1, 72, 1], "のデ": [27, 1, 9, 1, 6, 1, 25, 1, 47, 1], "のプ": [66, 1, 19, 1], "の具": [43, 2, 15, 1, 57, 1, 13, 1, 1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "の受": [54, 1, 59, 1, 13, 1], "の執": [43, 1, 72, 1], "の大": [35, 1, 14, 1, 31, 1, 41, 1], "の強": [39, 2, 2, 1, 3, 4, 1, 4, 1, 4, 5, 2, 1, 2, 2, 2, 1, 3, 23, 1, 2, 1, 36, 6, 1, 6, 1, 6, 5, 1, 1, 1, 2, 1, 1, 2], "の指": [27, 1, 7, 1, 4, 1, 28, 1], "の算": [61, 1, 72, 3], "の誇": [42, 1, 72, 1], "の買": [36, 1, 31, 1], "の資": [59, 2, 72, 1], "の起": [28, 1, 4, 1], "の長": [53, 1, 6, 1, 50, 1, 16, 1, 6, 1], "はエ": [85, 1], "は予": [34, 1], "は書": [14, 1, 4, 1, 49, 1, 1, 1], "は月": [28, 1], "は甘": [0, 1], "は記": [38, 1], "ばら": [57, 1, 72, 1], "へ送": [27, 1], "まし": [1, 1, 12, 1, 8, 1, 4, 1, 3, 3, 50, 1, 8, 8], "まで": [0, 2, 1, 2, 3, 2, 7, 5, 13, 2, 2, 1, 2, 1, 2, 1, 5, 1, 2, 1, 3, 1, 2, 2, 6, 1, 20, 1, 5, 1, 1, 1, 4, 1, 2, 1, 2, 1, 4, 2, 3, 1, 25, 4, 6, 1], "みと": [56, 1, 72, 1], "み合": [11, 1], "めな": [57, 1, 72, 1], "もに": [80, 2], "も友": [17, 1], "も含": [1, 1], "も見": [28, 1], "やそ": [7, 1, 69, 1], "や業": [66, 1], "ゆみ": [108, 1], "ら2": [3, 1, 71, 1], "るい": [0, 1], "るご": [37, 1], "るつ": [19, 1], "る場": [0, 1, 3, 1, 17, 1, 2, 1, 3, 1, 46, 1, 7, 2, 10, 1], "る柔": [62, 1, 72, 1], "る欄": [40, 1], "れ以": [22, 1], "れ必": [13, 1], "をか": [20, 3, 6, 1, 83, 1], "を下": [43, 1, 72, 1], "を主": [43, 1, 72, 1], "を任": [24, 1, 4, 1, 85, 1], "を含": [0, 2, 8, 2, 64, 2], "を始": [0, 2, 11, 1, 1, 1, 9, 1, 2, 1, 51, 1], "を構": [46, 1, 12, 1, 60, 1, 12, 1], "を残": [36, 1, 31, 1], "を活": [20, 1, 27, 1, 9, 1, 2, 1, 61, 1, 9, 1, 2, 1], "を添": [80, 1], "を見": [23, 1, 2, 1, 3, 2, 14, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "を運": [78, 1], "を開": [93, 1, 20, 1], "アル": [44, 1, 5, 2, 1, 1, 6, 1, 3, 1, 57, 1, 5, 2, 1, 1, 6, 1, 3, 1], "ィー": [23, 1, 73, 1, 4, 1], "ウハ": [28, 1, 31, 1, 72, 1], "オン": [28, 1, 34, 1, 4, 1, 68, 1], "カイ": [86, 1], "ギw": [113, 1], "クと": [84, 1], "クト": [27, 1, 39, 1], "グス": [107, 1], "グラ": [42, 1, 53, 1, 16, 2, 3, 1], "コー": [38, 1, 2, 6, 18, 2, 49, 1, 23, 1], "スを": [13, 1], "スモ": [63, 3, 72, 3], "セイ": [27, 4, 61, 1, 1, 1], "タと": [85, 3], "ツキ": [62, 1, 72, 1], "テク": [104, 1], "ト1": [47, 1, 72, 1], "トa": [66, 2], "ドも": [40, 2], "ドを": [38, 1, 2, 3], "ドモ": [97, 1], "バラ": [62, 1, 72, 1], "パリ": [80, 1], "マシ": [100, 1], "ムラ": [98, 1], "メな": [17, 1], "メ出": [0, 1, 39, 1], "ャー": [99, 1], "ラを": [43, 1, 72, 1], "リン": [49, 1, 1, 1, 5, 4, 20, 1, 9, 1, 2, 1, 9, 1, 4, 1, 11, 1, 11, 1, 1, 1, 5, 4], "ンボ": [111, 1], "ーサ": [55, 1, 72, 1], "ーフ": [35, 1], "一歩": [7, 1], "事や": [30, 1], "人口": [78, 1, 2, 3, 1, 1], "人当": [80, 1], "付け": [25, 1, 1, 1, 84, 1], "代行": [87, 1], "件は": [68, 1], "体が": [79, 1], "作サ": [62, 1, 72, 1], "作担": [28, 1], "使え": [7, 1, 12, 1, 8, 1, 9, 1, 3, 1, 1, 1, 28, 1, 8, 1, 3, 1], "使用": [52, 1, 42, 1, 30, 1], "値製": [48, 2, 72, 2], "値額": [78, 1, 2, 1], "備を": [3, 1, 9, 1, 62, 1], "催日": [85, 1, 28, 1], "入の": [51, 1, 72, 3], "入社": [28, 1, 14, 1, 72, 1], "全員": [0, 1, 2, 1, 12, 1, 4, 1, 67, 1, 1, 2], "共通": [2, 1, 25, 1], "内の": [7, 1, 38, 1, 6, 1, 20, 1, 5, 1, 41, 1, 6, 1], "分は": [27, 1, 68, 1], "判断": [16, 1, 71, 1], "別の": [13, 1, 6, 1, 48, 1], "別対": [62, 1, 72, 1], "加す": [19, 2], "加点": [0, 3, 1, 2, 1, 3, 1, 3, 5, 4, 1, 2, 1, 1, 1, 2, 3, 5, 5, 1, 2, 1, 2, 1, 45, 6, 1, 1, 3, 6, 6, 2, 1, 1, 6, 2], "労働": [78, 1, 2, 3], "募書": [11, 2, 2, 1, 11, 3, 13, 1, 74, 1], "化問": [49, 1, 72, 1], "単価": [44, 1, 1, 1, 6, 1, 9, 1, 1, 2, 2, 1, 53, 1, 1, 1, 6, 1, 9, 1, 1, 2, 2, 2], "単品": [28, 3], "原典": [94, 1], "友達": [17, 1], "口が": [81, 1], "口県": [100, 1, 7, 1], "各国": [80, 1], "名分": [86, 1], "向上": [48, 2, 2, 1, 2, 1, 3, 1, 5, 2, 12, 1, 1, 1, 7, 1, 40, 2, 2, 1, 2, 1, 3, 1, 5, 2], "味が": [74, 1], "品質": [42, 4, 1, 2, 1, 2, 6, 3, 1, 2, 3, 1, 2, 3, 1, 1, 2, 2, 3, 2, 2, 1, 1, 1, 49, 4, 1, 2, 1, 2, 6, 3, 1, 2, 3, 1, 2, 3, 1, 1, 2, 2, 3, 2, 2, 1, 1, 1], "器メ": [57, 1, 72, 1], "回し": [0, 1], "回で": [102, 1], "回大": [90, 1], "国6": [0, 1], "国ブ": [111, 1], "園か": [21, 1], "園に": [3, 1, 10, 1, 3, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 2, 1, 43, 1, 8, 1, 1, 1], "地方": [0, 5, 2, 2, 1, 1, 5, 1, 1, 1, 2, 1, 3, 3, 4, 1, 1, 1, 49, 5, 4, 2, 13, 2, 1, 2, 9, 2, 14, 5, 2, 6, 1, 1], "域と": [56, 1, 72, 1], "域へ": [43, 1, 37, 1, 35, 1], "場認": [44, 1, 72, 1], "境界": [68, 1], "増加": [42, 1, 5, 1, 8, 2, 59, 1, 5, 1, 8, 2], "増田": [99, 1], "外は": [22, 1], "外調": [55, 1, 72, 1], "孝将": [107, 1], "実と": [77, 1], "実用": [28, 1, 22, 1, 72, 1], "客開": [54, 1, 72, 1], "家族": [78, 1, 2, 1], "容を": [35, 1, 31, 1, 18, 1, 2, 1, 2, 1], "対し": [2, 1, 126, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], "専任": [64, 1, 72, 1], "川ザ": [111, 1], "工の": [28, 1, 21, 2, 72, 2], "差し": [23, 1], "常1": [45, 1, 72, 1], "年頭": [3, 1, 71, 1], "庁な": [19, 1], "度は": [28, 1], "度使": [79, 1], "式と": [61, 2, 2, 2, 70, 1, 2, 1], "形に": [0, 1, 13, 1, 73, 1], "役を": [24, 1], "役割": [25, 2, 39, 2, 72, 1], "往復": [27, 1], "応遅": [50, 1, 72, 1], "念の": [43, 4, 72, 2], "意と": [24, 1], "感じ": [28, 1, 2, 4], "慮し": [17, 1], "成す": [24, 2, 64, 1], "手直": [28, 1, 13, 1], "拠点": [49, 1, 72, 1], "持続": [0, 1, 2, 1, 7, 1, 5, 1, 9, 1, 45, 1], "挙げ": [16, 1, 62, 1, 2, 1], "接対": [62, 1, 72, 1], "携体": [45, 1, 72, 1], "支え": [28, 1, 15, 2, 46, 1, 26, 2], "教育": [49, 1, 72, 1], "文章": [26, 3], "料を": [11, 1], "新等": [71, 1, 16, 1], "方を": [12, 1, 67, 1], "施策": [80, 3], "旋盤": [42, 1, 72, 1], "日の": [112, 1], "日対": [45, 1, 72, 1], "明性": [52, 1, 72, 1], "時か": [56, 1, 72, 1], "時に": [13, 1], "書け": [77, 1, 2, 1], "替え": [34, 1, 2, 1, 31, 1], "最適": [52, 1, 72, 1], "月1": [43, 1, 3, 1, 39, 1, 24, 1, 6, 1, 3, 1], "月次": [63, 1, 2, 1, 70, 1, 2, 1], "期案": [56, 1, 72, 1], "本法": [7, 1, 69, 1], "材料": [11, 1, 5, 1, 14, 1, 7, 1, 2, 1, 1, 1, 8, 2, 3, 1, 1, 4, 6, 1, 3, 1, 4, 1, 55, 2, 3, 1, 1, 4, 6, 1, 3, 1, 4, 1], "来の": [0, 2, 3, 1, 54, 1, 7, 1, 65, 1, 7, 1], "松シ": [111, 1], "査委": [0, 2, 2, 1, 7, 1, 5, 1, 3, 1, 4, 1, 13, 1], "栗田": [108, 1], "棚元": [86, 1, 12, 1], "業他": [43, 1, 10, 1, 62, 1, 10, 1], "業制": [49, 1, 72, 1], "業化": [68, 1], "業理": [43, 3, 72, 3], "構い": [14, 1, 14, 1], "機と": [28, 1], "機器": [42, 1, 2, 1, 6, 1, 7, 1, 57, 1, 2, 1, 6, 1, 7, 1], "段の": [3, 1, 52, 1, 72, 1], "段階": [9, 3, 5, 1, 10, 1, 30, 1, 14, 2, 7, 1, 51, 1], "治的": [47, 3, 72, 4], "注拡": [63, 1, 72, 1, 2, 1], "流会": [43, 1, 3, 1, 69, 1, 3, 1], "流出": [53, 1, 72, 1], "済財": [82, 1], "渡辺": [108, 2], "点も": [23, 1, 63, 1], "点を": [3, 1, 8, 1, 3, 1], "物を": [25, 1], "率0": [43, 1, 17, 1, 55, 1, 17, 1], "率最": [10, 1], "現し": [14, 1, 14, 1, 4, 1, 1, 4, 23, 1, 72, 1], "現性": [26, 1], "生じ": [92, 1], "用契": [71, 1], "申込": [113, 1], "目で": [28, 1], "省発": [85, 1], "砲火": [99, 1], "社で": [3, 1, 25, 1, 1, 1], "社シ": [61, 1, 72, 1], "社大": [103, 1], "秀樹": [100, 1], "空想": [0, 1], "立つ": [39, 1], "立場": [7, 1, 10, 1, 12, 1, 47, 1], "第5": [109, 2], "策は": [3, 1], "箇所": [85, 1], "納ブ": [108, 1], "給総": [70, 1, 8, 1], "継を": [7, 1, 62, 1, 7, 1, 3, 3, 1, 2, 9, 1], "緒に": [17, 1, 19, 1, 2, 1, 28, 1, 1, 1], "締役": [90, 1], "縮で": [60, 1, 72, 1], "績で": [74, 1], "者の": [0, 2, 8, 1, 2, 1, 14, 1, 28, 1, 16, 2, 3, 1, 1, 1, 6, 4, 2, 2, 44, 3], "自体": [3, 1, 76, 1, 9, 1], "航平": [99, 1], "葉を": [35, 1], "蓄積": [56, 1, 72, 1], "行動": [42, 2, 1, 2, 71, 1, 1, 1], "表1": [64, 1, 72, 1], "製化": [55, 1, 72, 1], "製茶": [101, 1, 3, 1], "複数": [0, 1, 3, 1, 10, 1, 39, 2, 72, 2], "要な": [13, 1, 51, 1, 23, 1, 49, 1], "要り": [27, 1], "見直": [48, 1, 34, 1, 38, 1], "規案": [53, 1, 72, 1], "覧p": [109, 1], "言葉": [0, 1, 21, 1, 14, 1, 4, 1], "計1": [65, 1, 72, 1], "計要": [72, 1], "討で": [0, 1], "設試": [68, 1], "象会": [71, 1], "資源": [7, 1, 15, 1, 6, 1, 4, 3, 3, 1, 41, 1, 3, 1], "質監": [44, 1, 72, 1], "質賃": [80, 1], "足が": [0, 1], "途中": [37, 1], "通っ": [18, 1], "造変": [80, 1], "造船": [108, 1], "進事": [78, 1, 2, 1, 2, 1], "道府": [94, 1, 1, 3], "部品": [28, 3, 14, 1, 1, 1, 1, 1, 13, 1, 57, 1, 1, 1, 1, 1, 13, 1], "重視": [43, 1, 72, 1], "金ペ": [14, 1], "長加": [72, 1], "開い": [34, 1, 7, 1, 33, 1, 19, 1], "間稼": [45, 1, 72, 1], "関登": [80, 1], "階で": [14, 1, 10, 1, 44, 1], "雄輝": [108, 1], "電研": [106, 1], "面に": [34, 1], "項目": [35, 1, 36, 1, 39, 1, 4, 1], "類で": [24, 1], "験が": [42, 1, 72, 1], "高価": [62, 1, 72, 1], "高品": [44, 1, 72, 1], "高校": [43, 1, 3, 1, 69, 1, 3, 1], "鶴製": [101, 1], "齋藤": [86, 1, 11, 1]};
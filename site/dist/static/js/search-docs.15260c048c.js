@@ -0,0 +1 @@
+(window.SHINSEIDER_DATA = window.SHINSEIDER_DATA || {}).search_docs = {"n": 138, "avglen": 169.6, "docs": [{"t": "その構想、誰かに本気で見てもらったことはありますか。", "u": "index.html", "x": "第7回アトツギ甲子園 エントリー受付中 親は何も言ってくれないか、ダメ出しばかり。 社員は何も言えないか、忖度をしてくれる。 自分をよく知る人ほど評価は甘くなり、知らない人は真剣に聞いてくれない。 あなたの描く事業構想は、まだ一度も 本気の批評 に触れていないのかもしれません。 アトツギ甲子園は、中小企業庁主催・39歳以下の後継予定者のピッチ大会です。あなたに利害のない審査委員たちが、申請された事業の構想を客観的に評価し、コメントを返します。自分の中にある未来の構想を、出来の良い空想で終わらせたくないなら、この挑戦を足がかりにしてみませんか。 中小企業庁が任命するアトツギ甲子園アンバサダーが運営する、非公式の申請準備ツールです — 運営者と方針 忖度のない評価が返ってくる 書類を出した全員に、審査委員からコメントが届きます。褒めるための言葉ではなく、構想への評価です。 構想を言語化できる 頭の中にある構想は、書いて初めて他人が検討できる形になります。エントリー文の五つの問いは、そのための道具です。 承継の話を始めるきっかけになる エントリーは会社の名前を背負って行うので、現経営者と話さないわけにいきません。これは都合の良いことで、後回しにしがちな、あるいはきっかけを作りにくい承継の話を始める口実になります。 補助金の審査で優遇される 出場(地方予選含む)まで進めば、複数の国の補助金", "len": 775}, {"t": "その構想、誰かに本気で見てもらったことはありますか。 › ページ案内", "u": "index.html", "x": "エントリー文づくりと提出前の確認は、このサイトで済みます。 出られるかの確認 対象は39歳以下・代表になる前の後継予定者(親族外も含む)。30秒で確かめられます → 締切までの道筋 今日から11/25までにやることを、日付入りで並べます → 相談できる人を探す 各地の経験者(地域アンバサダー)を地図から → 補助金と加点の詳細 上限1,000万円・出場者への加点。要領原文つき → 参加しない理由6選 よく聞く、参加しない・参加したくない理由と、それに対するコメントを6つピックアップしました →", "len": 188}, {"t": "その構想、誰かに本気で見てもらったことはありますか。 › 審査に通過すると何が起こるか", "u": "index.html", "x": "特典は申請者全員一律ではなく、書類審査、地方大会・ファイナリストと進むごとに増えて行きます。 エントリー 公式サイト特設ページへの掲載 これだけで、自分の会社、事業が人目に触れる可能性が増します。 書類提出 審査委員からのコメント・アドバイス 自分の事業構想に対して忖度のないコメントがもらえます。 地方大会出場(書類審査通過) 事業承継・M&A補助金 — 優遇措置(要領の加点事由に明記) 中小企業省力化投資補助金(一般型) — 優遇措置 Go-Tech事業(成長型中小企業等研究開発支援事業) — 優遇措置 ファイナリスト・準ファイナリスト 小規模事業者持続化補助金 — 加点措置 事業承継・M&A補助金 — 重加点措置 SusHi Tech Tokyo 2027への出展機会(予定) 共通条件: エントリーした会社名・事業者名での申請が必要( 公式FAQ ・2026-08-06確認)。", "len": 280}, {"t": "その構想、誰かに本気で見てもらったことはありますか。 › 具体的にいくら補助されるか", "u": "index.html", "x": "賞金がないので、出ること自体でお金を稼ぐことはできません。効いてくるのは、自社で「投資」をする場面です。優遇策は上段のとおり複数制度にありますが、対象が「5年以内に承継予定の後継者」と、アトツギ甲子園に出る人とそのまま重なってきます。たとえば、 事業承継・M&A補助金〈事業承継促進枠〉 補助上限 1,000 万円 基本800万円・賃上げ要件を満たせば1,000万円/補助率 最大2/3 (15次公募要領・2026年8月6日確認) この補助金の審査で、出場者(地方予選含む)は公式に加点されます。出場が決まるのは2026年末から2027年頭なので、その後の公募回に加点を持って申請できます。 いまのエントリーは、将来の投資の準備を兼ねます。 この補助金の詳細(要件・加点・審査観点)→", "len": 255}, {"t": "進み具合試作版", "u": "workspace.html", "x": "第7回アトツギ甲子園 エントリー受付中 | エントリー締切 11/25 18:00(あと — 日) | 書類提出 11/27 12:00 | 道筋 → ここまでの進み具合と、11/25までにやることをまとめた画面です。入力はあなたのパソコンやスマホにだけ保存され、サイト側に送信されることはありません。", "len": 100}, {"t": "進み具合試作版 › 申請書の準備", "u": "workspace.html#ws-entry", "x": "まだ始めていません。5つの問いに答えるだけです。 申請書の準備へ →", "len": 26}, {"t": "進み具合試作版 › フカボリ(じっくり版)", "u": "workspace.html#ws-fukabori", "x": "まだ始めていません。AIと章ごとに深掘りする丁寧なルートです。 フカボリへ →", "len": 31}, {"t": "進み具合試作版 › 出られるか、30秒で確認", "u": "workspace.html#ws-check", "x": "未回答ならここから。回答に応じて、見立てと次の一歩が変わります。 Q1. 生まれ年月 1987年4月以降に生まれた(39歳以下枠) それより前に生まれた Q2. 立場 家業があり、代表ではない 家業と別法人の代表だが、家業の承継予定または経営資源の活用がある どちらでもない Q3. 家業の規模 中小企業にあてはまる わからない・確信がない あてはまらない(大企業やその子会社など) 目安(中小企業基本法): 製造業・建設業・運輸業などは資本金3億円以下または従業員300人以下、卸売業は1億円以下または100人以下、サービス業は5,000万円以下または100人以下、小売業は5,000万円以下または50人以下。 ここから下は 任意 です。事業承継・M&A補助金〈促進枠〉を使えそうかの見立てに使うだけで、アトツギ甲子園の応募には関係ありません。 Q4. 承継の時期感(任意) 5年以内の承継を現経営者と合意できそう(またはもう合意している) まだ話せていない・決めきれていない 承継の予定はない 入力はあなたのパソコンやスマホにだけ保存され、サイト側に送信されることはありません。", "len": 376}, {"t": "進み具合試作版 › 出場すると加点される", "u": "workspace.html", "x": "「公募申請時点で、申請者の代表者(予定を含む。)が『アトツギ甲子園』の出場者(地方予選を含む。)であること」 事業承継・M&A補助金 15次公募要領・加点事由8(2026-08-06確認)", "len": 58}, {"t": "進み具合試作版 › 特典は段階式", "u": "workspace.html", "x": "エントリー 公式サイト掲載 書類提出 審査委員コメント 地方大会出場 事業承継・M&A/省力化/Go-Tech 優遇 ファイナリスト 持続化 加点/事業承継・M&A 重加点", "len": 49}, {"t": "進み具合試作版 › 本命の枠", "u": "workspace.html", "x": "事業承継促進枠:上限800万円(賃上げで1,000万円)・補助率最大2/3。5年以内に承継予定の後継者の成長投資が対象。 (15次要領・8/6確認) 要件・加点・審査観点 →", "len": 56}, {"t": "進み具合試作版 › 11/25までの道筋", "u": "workspace.html", "x": "いま — 出られるかを確かめ、現経営者と承継の話を始める 〜10月 — エントリー文をつくり、読み合わせて磨く 〜11/25 18:00 — エントリー( 公式サイト )。完了すると応募書類フォーマットが届く 〜11/27 12:00 — ここまでに作った材料をフォーマットに転記して、応募書類を提出 2027/1/19–2/8 — 地方大会。ここまで進むと補助金審査の加点対象 2027年公募〜 — 加点を持って事業承継・M&A補助金へ", "len": 141}, {"t": "今日から始める道筋", "u": "schedule.html", "x": "第7回アトツギ甲子園のエントリー締切は 2026年11月25日 18:00(書類提出は 11/27 12:00)。今日から始めた場合の現実的な進め方を、残り日数から逆算して表示しています。 申請書の準備を始める(30分〜) 公式サイトでエントリー", "len": 92}, {"t": "今日から始める道筋 › フェーズごとの中身", "u": "schedule.html", "x": "現経営者との対話 エントリーは会社名・事業者名で行うため、いずれ必ず通る話です。「アトツギ甲子園に出てみたい」という切り出し方なら、承継の話を自然に始められます。 エントリー文の骨子をつくる 「申請書の準備」ページ から、骨格となる部分を作成可能です。ご自身のAIを使ってまとめていくプロセスを提供しています。1〜2日あれば形になります。 申請書の磨き上げ 自分でなんども読み直す、現経営者や周りの人に見せる。 複数のAIで提出前チェックをする 。 アンバサダー にチェックを依頼するなど、様々な方法で申請書の磨き上げができます。 申請書の送信 公式サイト から。 会員登録 が必要なので時間のある時に登録だけ済ませておきましょう。エントリー(〜11/25 18:00)と応募書類のPDF提出(〜11/27 12:00)は別の手続きです。", "len": 282}, {"t": "今日から始める道筋 › エントリー後の日程", "u": "schedule.html", "x": "11月25日は最初の締切です。日程は書類審査、地方大会、決勝へと続き、補助金の加点はその後の公募で使います。 いま 〜 11/25 準備とエントリー 出られるかの確認、現経営者との対話、 エントリー文づくり 、と進めてエントリーへ。ふだん使っているAIと相談しながらで構いません。 エントリー締切 11/25 18:00・書類提出 11/27 12:00 12月 〜 1月 書類審査 提出した全員に、審査委員からコメントが届きます。通過すれば地方大会へ。この時点で事業承継・M&A補助金の加点対象になります。 2027 1/19–2/8 地方大会 全国のブロックごとのピッチです。勝ち上がってファイナリストになると、持続化補助金の加点と、事業承継・M&A補助金の重加点が加わります。 2027 2/26 決勝大会 ファイナリストによる全国決勝です。大会テーマは「実現したい未来を語れ」。 その先 大会の後 書いた事業計画と大会の加点を、承継にともなう補助金申請に使う段階です。このサイトの補助金ページは、その申請を想定しています。", "len": 337}, {"t": "今日から始める道筋 › まだ出られるか確かめていない場合", "u": "schedule.html", "x": "30秒の確認 で、応募資格(39歳以下・後継予定者)と、その先の補助金の見立てがわかります。", "len": 32}, {"t": "アトツギ甲子園に出たくない理由", "u": "cool.html", "x": "出ない理由・出たくない理由としてよく聞くことと、それに対する事実をいくつか挙げますので、一つの判断材料としてください。", "len": 51}, {"t": "アトツギ甲子園に出たくない理由 › 「相談相手なら、周りにいる」", "u": "cool.html", "x": "その相手は、あなたの構想のダメなところを指摘できる立場でしょうか。親も社員も友達も、この先あなたと一緒に生きていく人たちです。言いにくいことは、言われないまま残ります。利害のない審査委員のコメントには前提を考慮した甘い配慮や忖度がありません。", "len": 107}, {"t": "アトツギ甲子園に出たくない理由 › 「人前で話すのが苦手」", "u": "cool.html", "x": "エントリーは書類だけです。人前で話すのは、書類審査を通って地方大会(2027年1月)に進んでから。当然そこで降りることもできます。しかし書類を出した全員にコメントが届くため、書類止まりでも持ち帰るものは十分あります。それに、実際に大会に出てみると意外となんとかなります。", "len": 115}, {"t": "アトツギ甲子園に出たくない理由 › 「知らない人たちがよくわからないノリで盛り上がってる空気感が嫌い」", "u": "cool.html", "x": "正直わかります。ですが、これは参加する意義があるかどうかとは別の話です。主催は中小企業庁なので話題のひとつにも使えますし、地方大会への出場により事業承継・M&A補助金の審査で公式の加点があります( 要領原文 )。空気やノリが好みでなければ気にせずに、経済合理性のために利用するつもりで参加することも全く問題はありません。", "len": 137}, {"t": "アトツギ甲子園に出たくない理由 › 「忙しい。そんなことに時間をかける気はない」", "u": "cool.html", "x": "エントリー文の骨子は、質問5つに答えるだけで固まります。ふだん使っているAIを活用して30分もやり取りすれば最初の形はできます( ここから )。その後、時間の限り資料の完成度にこだわってもいいし、要件が網羅され整理されていれば、必要最小限のものを提出するのでも十分です。それに、自分と会社の未来について考えをまとめておくことは、事業を承継する場合に必須の機会なので、全く無駄にはなりません。", "len": 168}, {"t": "アトツギ甲子園に出たくない理由 › 「賞とか、正直どうでもいい」", "u": "cool.html", "x": "それで良いと思います。アトツギ甲子園から持ち帰れるものは、賞よりむしろ、補助金審査の加点、審査委員のコメント、自分の言葉で事業計画を改めてまとめてみる機会、現経営者と承継の話を始める口実などです。皆さんの利害と比較して、うまく利用しましょう。", "len": 103}, {"t": "アトツギ甲子園に出たくない理由 › 「うちの事業じゃ、どうせ通らない」", "u": "cool.html", "x": "大会としてみれば、不利なビジネスは確かにあると思いますので、「勝ちたい」というモチベーションで参加される場合は気になると思います。 ですが、審査の対象は事業の派手さ、流行りかどうかではなく、家業の経営資源をどう使ってどう成長する未来を描き表現するかなので、元も子もないことですが、通らなかったとしても失うものはかけた時間だけです。それ以外は手元に残ります。", "len": 154}, {"t": "アトツギ甲子園に出たくない理由 › 損得の整理", "u": "cool.html", "x": "差し出すもの エントリー文をつくる時間(最初の形は30分、簡易的な申請書なら1、2時間、練り上げるなら数日)。参加費なし 得られるもの1 事業承継の話を始めるきっかけ/他人に伝えられる価値になった事業構想/構想に対するフィードバック 得られるもの2 国の3つの補助金の審査で優遇(事業承継・M&A=上限800万〜1,000万円、省力化投資、Go-Tech)。ファイナリストなら持続化補助金の加点も 失いうるもの かけた時間のみ 出られるかだけ、30秒で確認する エントリー文の道具を見る", "len": 186}, {"t": "アトツギ甲子園エントリーの方向性を固める", "u": "entry.html", "x": "ここでは、申請書を作成するための骨子を明確にし、概要の段階でロジックに穴がない状態を整理してから実際の申請書作成へ進める準備ができます。以下、用意したプロンプトを使って普段使っているAI(LLM)のブラウザアプリで作成する方法と、 MCPを経由して利用する方法 を用意しています。 入力はあなたのパソコンやスマホにだけ保存され、サイト側に送信されることはありません。 エントリーから提出までの流れを確認する アトツギ甲子園は、公式フォームの質問に答えてエントリーし、その後に事務局から届くフォーマットで応募書類を作ってPDFで提出します。書類審査はこの応募書類で行われます。フォーマットが届いてから慌てて書かずに済むよう、先に中身を仕上げておきます。書くのはあなたです。このページが受け持つのは、問いの用意と、抜けの確認と、書いたものの保存です。 中身をつくる 5つの問いに、AIと答える(このページ) 試す AIを審査員役にして、指摘をもらう(このページ) エントリーする 公式フォームから(〜11/25 18:00)。完了すると応募書類のフォーマットが届く 書類を出す 中身をフォーマットに移して、PDFで提出(〜11/27 12:00) 30分〜 速いルート いまここ AIに聞き役を任せて、エントリー文の骨子をつくる。 30〜60分 フカボリ — じっくり版 かつての優勝者のフレームで、会社", "len": 494}, {"t": "アトツギ甲子園エントリーの方向性を固める › AIを有効に使う", "u": "entry.html#ai-help", "x": "MCPから利用する → 最近は業務に広くAIを使う人も増えていると思いますが、一番有用な使い方は「時短」と「網羅性を上げる」方向性であると思います。アトツギ甲子園についても、忙しいみなさんは時間を「浪費」しないよう取り組んだほうが良い。そこで、AI(LLM)を使って骨子をまとめる仕組みを用意しましたのでご利用下さい。 指示はシンプルなプロンプト(どんな役割で何をさせるかを示す文)ですが、現在のモデルならこのくらいでも、十分に役割を果たしてくれるはずです。 AIモデルのボタンを押す AIチャット欄にプロンプトが挿入される* プロンプトを送信 チャットで会話 成果物をコピー 下フォームの欄に貼る 「取り込む」 * Gemini・Grokはプロンプト(指示文)を自分でコピペしてください スマホのAIアプリや、上にないAIで進める場合は して貼り付けてください。 AIに渡す指示文の全文を見る", "len": 318}, {"t": "アトツギ甲子園エントリーの方向性を固める › 仕上がった文章をここに戻す", "u": "entry.html#ai-help", "x": "AIが最後に出してくれた「## 見出し」付きの清書を、そのまま貼り付けてください。取り込むと下の5つの欄に入ります。 もっと時間をかけて丁寧にやるなら、 フカボリ(じっくり版) へ。ルーツ・強み・市場規模・収益の数字・実現性まで、24ブロックでAIと詰められます。 もしも、AIで物足りなくなったり、具体的に困ったことがあればお気軽にご相談ください(連絡先は 運営者と方針 のページに)。", "len": 144}, {"t": "アトツギ甲子園エントリーの方向性を固める › MCPから利用する — AI経由でシンセイダーを利用する", "u": "entry.html#ai-mcp", "x": "MCP(AIアプリ共通の接続規格)でシンセイダーをつなぐと、いつものAIとの会話の中で「締切はいつ?」「自分は出られる?」「今日から何をすればいい?」に正確な答えが返るようになり、質問に答えながら構想を掘り下げたり、書いたものに審査員役の指摘をもらったりも、そのまま続けられます。このページとのコピペの往復は要りません。記録はあなたのパソコンの中にだけ保存され、どこかへ送信されることはありません。 設定はAIに任せられます。下のボタンで指示文をコピーして、お使いのAIに貼って送信してください。AIがそのまま設定を進めてくれます。AIが自分で作業を完了できない場合も、「次にやること」を1つずつ教えてくれるので、そのとおりに進めれば数分で終わります。 ChatGPTやClaudeのデスクトップアプリ、Cursor・VS Code・Gemini CLIなど、MCPに対応したAIアプリで使えます。手順の中身を先に見ておきたい方は、 セットアップ手順の全文 を確認できます。うまくいかないときは、 運営者と方針 にある連絡先へ気軽にどうぞ。", "len": 390}, {"t": "アトツギ甲子園エントリーの方向性を固める › 骨子 — 5つの欄", "u": "entry.html", "x": "AIから取り込んだ内容がここに入ります。手直しも、直接書き込むのも自由です。まだ答えが固まっていなくて構いません。 書き方の見本を見る(架空の会社の例) 現業と自分 — 祖父が1974年に興した金属加工の会社で、製造を見ています。港湾設備の補修部品から始まり、いまは産業機械向けの単品加工が中心。従業員18名、年商2.4億円。私は入社8年目で、2011年に父が導入したCAD/CAMの運用を任されてきました。承継は3年後の予定です。 現場で感じている課題 — 昨年、長年の取引先だった試作専門の同業が廃業しました。地域で単品・小ロットを頼める先が減り、見積もりを取ると納期は7〜10日。試作で待たされた開発案件が流れるのを、何度も見ています。 やりたい新規事業 — 単品部品のオンライン受注です。設計データを送ると自動で見積もりが返り、最短3日で部品が届く。相手は、開発部門やスタートアップの試作担当者。「試作の待ち時間」を、売り物になる速さに変えます。 家業の経営資源の活用 — 過去10年の加工実績から見積もりを関数化してあり、誤差は±20%から実用水準まで詰めました。5軸加工機と、平均3.2日で回す段取りのノウハウ。ゼロからの起業では、この見積精度と納期は出せません。足りないのは受注側の仕組みで、そこが今回の挑戦です。 実現したい未来 — 「試作で待たされない地域」を作りたい。2027年春", "len": 556}, {"t": "アトツギ甲子園エントリーの方向性を固める › 現業と自分", "u": "entry.html#sections-area", "x": "いまの家業は何をしている会社で、あなたはどう関わっていますか? 会社の事業・規模感・あなたの立場や担当。数字(年商・人数・年数)があると伝わります", "len": 53}, {"t": "アトツギ甲子園エントリーの方向性を固める › 現場で感じている課題", "u": "entry.html#sections-area", "x": "現場にいて「このままではまずい」と感じていることは何ですか? 実際にあった出来事や数字で。あなたにしか見えていない現場の実感が一番の材料です", "len": 60}, {"t": "アトツギ甲子園エントリーの方向性を固める › やりたい新規事業", "u": "entry.html#sections-area", "x": "何を新しく始めたいですか?誰の、どんな困りごとを解決しますか? 「誰の」が具体的なほど強くなります", "len": 38}, {"t": "アトツギ甲子園エントリーの方向性を固める › 家業の経営資源の活用", "u": "entry.html#sections-area", "x": "家業の何(技術・設備・顧客・信用・人)を使って、それを実現しますか? 応募資格にも関わる大事な点です。ゼロからの起業との違いがここに出ます", "len": 49}, {"t": "アトツギ甲子園エントリーの方向性を固める › 実現したい未来", "u": "entry.html#sections-area", "x": "それができたら、会社と地域はどう変わりますか? 大会テーマは「実現したい未来を語れ」。あなた自身がどうなっていたいかも 試す", "len": 49}, {"t": "アトツギ甲子園エントリーの方向性を固める › 予行審査 — 忖度なしで見てもらう", "u": "entry.html#rehearsal", "x": "AIを、身内ではない審査員役に切り替える指示文です。骨子ごと渡すので、弱いところが提出前にわかります。 押すと審査員用の指示文(骨子入り)ごとそのAIが開きます。骨子が長い場合は指示文ファイル(.md)が保存されるので、開いた画面にドラッグして渡してください。 これは予行です。本物の審査委員のコメントは、エントリーして書類を出した人に届きます。 出す", "len": 143}, {"t": "アトツギ甲子園エントリーの方向性を固める › 提出前チェック", "u": "entry.html", "x": "公式サイトのエントリーフォームの項目をひととおり確認した エントリー文を声に出して読んでみた 現経営者(親)に内容を話した ※申請は会社名・事業者名で行うため 送信は締切前日(11/24)までに行う予定を決めた エントリー後に届くフォーマットへの転記と、PDF提出(11/27 12:00)を予定に入れた 数字が3つ以上入っている(現状の規模・課題の大きさ・効果の見込みのどれか) 「革新的」「画期的」のような形容だけの言葉を、根拠なしに使っていない 応募資格(39歳以下・後継予定・家業の経営資源の活用)に自分が当てはまる根拠が本文から読み取れる エントリーは 公式サイト から。締切 11/25 18:00・書類提出 11/27 12:00。", "len": 231}, {"t": "アトツギ甲子園エントリーの方向性を固める › 保存と持ち出し", "u": "entry.html", "x": "入力はこのブラウザに自動保存されますが、ブラウザのデータ削除や、パソコン・スマホの買い替えで消えることがあります。 区切りのいいところで「控えを保存」を押して、ファイルを残しておくのが確実です。 控えを読み込む 控えは、そのまま読める下書きです。届いた書類フォーマットに転記するときの元原稿になり、手元のAIに読ませる受け渡しにも使えます。読み込めば保存した時点から再開できます(フカボリの中身も一緒に入ります)。", "len": 174}, {"t": "フカボリ試作版", "u": "fukabori.html", "x": "アトツギ甲子園のかつての優勝者が使っていたフレームを用いて作られた「時間はかかるが丁寧に仕上げるルート」です。会社の来歴から新しい事業の数字まで、順に深掘って聞いていきます。 4つの章をAIと10〜20分ずつ。章が終わるごとにセーブされるので、途中でやめても続きから再開できます。 入力はあなたのパソコンやスマホにだけ保存され、サイト側に送信されることはありません。 ここで掘った材料は、エントリー文の下地になり、エントリー後に届く応募書類——さらにその先の補助金申請——を書くときの手持ちになります。 つくる", "len": 216}, {"t": "フカボリ試作版 › 進め方 — この3手のくり返し", "u": "fukabori.html#fk-ai", "x": "AIを選ぶ 最初に1回だけ。選択は記憶されます 章のボタンで話す 章ごとの指示文と一緒にAIが開きます(1章10〜20分) コードを取り込む 章の終わりにAIが出すセーブデータを、下の欄に貼る", "len": 76}, {"t": "フカボリ試作版 › 2 章を選んで話す", "u": "fukabori.html#fk-ai", "x": "第1章 足元 — ルーツ・理念・真の強み 会社の来歴と、競合にない本当の強みが言葉になる 第2章 外部環境 — PEST 会社を取り巻く追い風と向かい風が整理できる 第3章 競争構造 — 5FORCES 誰と何で競っていて、どこで戦えば分があるかが見える 第4章 新事業10問 新しい事業の中身が、市場・収益・資金の数字で立つ 仕上げ 検算・ダメ出し 弱点と次の一手、そしてエントリー文に使える材料がわかる AIに渡す指示文(いま見ている章)", "len": 157}, {"t": "フカボリ試作版 › 3 AIが出したコードを取り込む", "u": "fukabori.html#fk-ai", "x": "章のコードも検算のコードも、ぜんぶここ。AIの回答のコード(右上のコピーボタンで写せます)を貼るか、AIが出したファイル(fukabori_save.json)を この欄にドロップ してください。すでに書いてある欄は上書きせず、[AI補強]として追記されます。 ファイルから取り込む 仕上げの検算まで終えると、エントリー文の5テーマに使える材料(KOSHIEN_BRIDGE)がAIから返ります。それを持って エントリー文のページ に戻り、骨子に反映してください。", "len": 180}, {"t": "フカボリ試作版 › たまった中身", "u": "fukabori.html", "x": "取り込んだ内容が、ここに整理されてたまります。開いて手直しするのも、直接書き込むのも自由です。 足元 — ルーツ・理念・真の強み", "len": 46}, {"t": "フカボリ試作版 › 自社のルーツ", "u": "fukabori.html#fk-roots", "x": "創業から現在までの歴史 記入例を見る いつ(年表) — 例)1985年:父が町工場を創業。旋盤1台からスタート / 2010年:息子が入社、CNC機械導入 / 2020年:コロナ禍で医療機器部品に参入 / 2024年:事業承継完了、DXに本格着手 誰が(人物) — 例)創業者(父):職人気質で品質に妥協なし、地域の信頼が厚い / 現代表(息子):工学部出身、効率化とデジタル化を推進 / 古参職人2名:30年の経験、技術伝承の要 なぜ(動機・背景) — 例)父の代は職人の勘と経験が頼りだったが、受注増加で属人化が限界に。品質を保ちつつ生産性を上げるため、データ化・標準化が急務となった 何を(行動・取り組み) — 例)作業手順書のデジタル化 / 品質検査データのDB管理 / 受注から納期までの進捗可視化システム導入 / 若手育成プログラムの体系化 継承すべき価値観 — 例)職人の誇りと品質へのこだわりは変えずに、デジタル技術で次世代に継承できる仕組みを作る いつ(年表) 誰が(人物) なぜ(動機・背景) 何を(行動・取り組み) 継承すべき価値観 (任意)", "len": 319}, {"t": "フカボリ試作版 › 企業理念", "u": "fukabori.html#fk-philosophy", "x": "ミッション・ビジョン・バリュー 記入例を見る ミッション(使命・目的) — 例)地域の製造業を支える精密部品づくりで、社会インフラを下支えする ビジョン(将来像・目標) — 例)職人技術とDXが融合した、次世代町工場のモデルケースになる バリュー(行動指針・価値観) — 例)品質第一 - 妥協のないものづくり / 改善継続 - 小さな工夫を積み重ねる / 地域共創 - 同業他社とも協力して業界全体を発展させる 理念の具現化(事例) — 例)不良品率0.01%以下の維持 / 月1回の改善提案会議 / 地域工場との技術交流会を主催 / 工業高校生のインターンシップ受け入れ 理念の解釈・背景 — 例)先代から受け継いだ品質への執念と地域への恩返しの想いを、現代の技術で実現する。理想論より現場で回る実践を重視 ミッション(使命・目的) ビジョン(将来像・目標) バリュー(行動指針・価値観) 理念の具現化(事例) (任意) 理念の解釈・背景 (任意)", "len": 277}, {"t": "フカボリ試作版 › 真の強み #1", "u": "fukabori.html#fk-strength_1", "x": "競合にない独自の強みを分析 記入例を見る 何が強みか — 例)0.01mm精度の高精度加工技術 証拠・根拠 — 例)医療機器部品で3年間不良品ゼロを達成。大手メーカー2社から指定工場認定を取得。品質監査で最高評価AAランク継続 なぜ独自なのか — 例)30年のベテラン職人2名の技術を若手にマニュアル化して継承。他社にない独自治具の開発と温度・湿度管理システム 価値との連関 — 例)高品質により単価20%アップの案件を獲得。リピート率95%で安定受注を実現 何が強みか 証拠・根拠 なぜ独自なのか 価値との連関 (任意)", "len": 194}, {"t": "フカボリ試作版 › 真の強み #2", "u": "fukabori.html#fk-strength_2", "x": "競合にない独自の強みを分析 記入例を見る 何が強みか — 例)1週間以内の超短納期対応力 証拠・根拠 — 例)通常1ヶ月の案件を1週間で納品した実績が年10件以上。夜間・休日対応で緊急案件に100%対応 なぜ独自なのか — 例)24時間稼働可能な設備配置と、職人の多能工化により柔軟なシフト編成を実現。近隣協力工場3社との連携体制 価値との連関 — 例)短納期プレミアムで通常単価の150%を実現。新規顧客の60%がリピーター化 何が強みか 証拠・根拠 なぜ独自なのか 価値との連関 (任意)", "len": 179}, {"t": "フカボリ試作版 › 真の強み #3", "u": "fukabori.html#fk-strength_3", "x": "競合にない独自の強みを分析 記入例を見る 何が強みか — 例)地域製造業のハブとしての信頼関係 証拠・根拠 — 例)同業者5社と相互協力体制を構築。月1回の技術交流会を15年継続。地域工業会の副会長を3期務める なぜ独自なのか — 例)競合他社とも情報共有し業界全体の底上げを図る姿勢。若手育成への積極的な取り組みで地域から評価 価値との連関 — 例)協力体制により大型案件(1000万円以上)を年3件受注。工業高校から毎年2名の新卒採用を実現 何が強みか 証拠・根拠 なぜ独自なのか 価値との連関 (任意) 外部環境 — PEST", "len": 197}, {"t": "フカボリ試作版 › PEST: Politics", "u": "fukabori.html#fk-pest_p", "x": "政治的要因の分析 記入例を見る 政治的事実 — 例)ものづくり補助金で最大1,250万円の設備投資支援 / 電子帳簿保存法で2024年から義務化 / カーボンニュートラル政策で省エネ設備への税制優遇 機会 — 例)補助金を活用してCNC機械を追加導入予定 / 電子化対応で事務作業30%削減を目標 / 省エネ設備導入で電気代20%カット見込み 脅威 — 例)補助金申請の事務負担増加 / 電子化対応の初期コスト100万円 / 環境規制強化でコンプライアンス体制整備が必要 時間軸 — 例)短期(1年以内):電子帳簿対応完了 / 中期(3年):補助金でライン自動化 / 長期(5年):カーボンニュートラル工場実現 政治的事実 機会 脅威 時間軸 (任意)", "len": 226}, {"t": "フカボリ試作版 › PEST: Economy", "u": "fukabori.html#fk-pest_e", "x": "経済的要因の分析 記入例を見る 経済的事実 — 例)鋼材価格が2年で40%上昇 / 円安で輸入材料費が高騰 / 人件費上昇圧力(最低賃金年3%上昇) 機会 — 例)材料高を価格転嫁で売上15%増 / 高付加価値製品へのシフトで粗利率向上 / 自動化投資で人件費率を抑制 脅威 — 例)価格転嫁の遅れで粗利率低下 / 小規模案件の採算悪化 / 資金繰り悪化のリスク 時間軸 — 例)短期:四半期ごとの価格見直し制度導入 / 中期:高付加価値製品比率を70%まで向上 / 長期:安定したキャッシュフロー確立 経済的事実 機会 脅威 時間軸 (任意)", "len": 176}, {"t": "フカボリ試作版 › PEST: Society", "u": "fukabori.html#fk-pest_s", "x": "社会的要因の分析 記入例を見る 社会的事実 — 例)製造業の人手不足率35%(地域平均) / 働き方改革で残業時間削減圧力 / 技能継承の高齢化問題(熟練工の65%が60歳以上) 機会 — 例)DXで働きやすさアピールし若手採用強化 / 技能のマニュアル化で教育期間短縮 / 地域連携で人材シェアリング 脅威 — 例)熟練工の大量退職リスク / 若手確保の競争激化 / 残業制限で繁忙期の対応力低下 時間軸 — 例)短期:技能継承マニュアル完成 / 中期:若手3名採用・育成 / 長期:地域製造業の人材育成拠点化 社会的事実 機会 脅威 時間軸 (任意)", "len": 181}, {"t": "フカボリ試作版 › PEST: Technology", "u": "fukabori.html#fk-pest_t", "x": "技術的要因の分析 記入例を見る 技術的事実 — 例)IoT機器の低価格化進行 / 5G通信で工場内リアルタイム監視が可能 / AIによる品質管理システムが実用レベルに 機会 — 例)機械稼働データをスマホで監視し効率向上 / AI品質チェックで検査時間半減 / 3Dプリンターで治具製作コスト削減 脅威 — 例)技術投資の初期費用負担 / サイバーセキュリティリスク / 技術変化への対応遅れ 時間軸 — 例)短期:IoTセンサー導入でデータ収集開始 / 中期:AI品質管理システム実装 / 長期:完全自動化ラインの構築 技術的事実 機会 脅威 時間軸 (任意) 競争構造 — 5FORCES", "len": 205}, {"t": "フカボリ試作版 › 5Forces: 新規参入", "u": "fukabori.html#fk-ff_new", "x": "新規参入の脅威 記入例を見る 脅威の強度(1-5) — 例)強度:3(中程度の脅威) - 設備投資300万円あれば小規模工場でも参入可能だが、顧客の品質要求は厳しい 要因・ドライバー — 例)中古機械市場の充実 / 小ロット・短納期ニーズの拡大 / ネット受注プラットフォームの普及 対応策 — 例)特殊材料加工に特化 / 既存顧客との関係強化 / 品質認証取得で差別化 測定指標 — 例)地域内の新規参入企業数 / 平均受注単価の推移 / 既存顧客の発注継続率 脅威の強度(1-5) 要因・ドライバー 対応策 測定指標 (任意)", "len": 167}, {"t": "フカボリ試作版 › 5Forces: 供給業者", "u": "fukabori.html#fk-ff_sup", "x": "供給業者の交渉力 記入例を見る 交渉力の強度(1-5) — 例)強度:2(低い脅威) - 材料商社3社との取引実績があり、価格交渉力を維持 要因・ドライバー — 例)材料の標準化・汎用化 / 複数供給元の存在 / 物流コストの透明性向上 対応策 — 例)長期契約で価格安定化 / 複数商社との関係維持 / 材料使用量の最適化 測定指標 — 例)材料仕入価格の変動率 / 調達リードタイム / 在庫回転率 交渉力の強度(1-5) 要因・ドライバー 対応策 測定指標 (任意)", "len": 138}, {"t": "フカボリ試作版 › 5Forces: 既存競合", "u": "fukabori.html#fk-ff_riv", "x": "既存競合の脅威 記入例を見る 競争の激しさ(1-5) — 例)強度:4(高い脅威) - 同業他社20社が半径10km圏内に存在し、価格競争が激化 要因・ドライバー — 例)技術の標準化 / 設備の汎用化 / 顧客の相見積文化 対応策 — 例)高精度・短納期での差別化 / 顧客との長期パートナーシップ構築 / 独自技術の開発 測定指標 — 例)受注競合率 / 既存顧客の流出率 / 新規案件の獲得率 競争の激しさ(1-5) 要因・ドライバー 対応策 測定指標 (任意)", "len": 136}, {"t": "フカボリ試作版 › 5Forces: 買い手", "u": "fukabori.html#fk-ff_buy", "x": "買い手の交渉力 記入例を見る 交渉力の強度(1-5) — 例)強度:4(高い脅威) - 大手製造業3社が売上の60%を占め、価格決定権が顧客側にある 要因・ドライバー — 例)顧客の調達一元化 / 相見積の常態化 / コスト削減圧力の継続 対応策 — 例)顧客業務への深い関与 / 設計段階からの提案参加 / 品質・納期での差別化 測定指標 — 例)主要顧客への依存度 / 価格改定の受け入れ率 / 新規顧客開拓数 交渉力の強度(1-5) 要因・ドライバー 対応策 測定指標 (任意)", "len": 142}, {"t": "フカボリ試作版 › 5Forces: 代替品", "u": "fukabori.html#fk-ff_sub", "x": "代替品の脅威 記入例を見る 脅威の強度(1-5) — 例)強度:3(中程度の脅威) - 3Dプリンターや海外調達など代替手段の選択肢が増加 要因・ドライバー — 例)3Dプリンター技術の向上 / 海外工場との直接取引増加 / 内製化の進展 対応策 — 例)3Dプリンターでは難しい精密加工に集中 / アフターサービスの充実 / 短納期対応力の強化 測定指標 — 例)代替品採用による失注率 / 3Dプリンター導入企業数 / 平均案件サイズの変化 脅威の強度(1-5) 要因・ドライバー 対応策 測定指標 (任意) 新事業10問", "len": 167}, {"t": "フカボリ試作版 › 1. なぜ自社がやるのか", "u": "fukabori.html#fk-q1_whyus", "x": "自社が取り組む理由 記入例を見る ストーリー・背景 — 例)我々は30年の技術蓄積と地域ネットワークを活かし、他社が諦める高精度・短納期案件を実現します。ベテランの技術を若手に継承する仕組みと、最新設備への投資により、品質と効率の両立を図っています 自社との適合性 — 例)創業時からの品質第一主義がDXと融合。職人技術を標準化・マニュアル化することで、属人化を解消しつつ品質を保持。地域との共創で業界全体を発展させる理念も一致 ストーリー・背景 自社との適合性", "len": 186}, {"t": "フカボリ試作版 › 2. 誰のどんなニーズか", "u": "fukabori.html#fk-q2_whose", "x": "ターゲット顧客のニーズ 記入例を見る ペルソナ(誰が) — 例)自動車部品メーカーの設計部門:試作品を1-5個、2週間以内に製作したい企業 / 医療機器メーカー:薬事承認用サンプルを高精度で製作したい企業 ニーズ(何を求める) — 例)従来の外注は納期1ヶ月以上で設計検証が遅れる / 品質のばらつきで再製作が発生 / 図面修正時の迅速な対応ができない / コストが読めない ペルソナ(誰が) ニーズ(何を求める)", "len": 148}, {"t": "フカボリ試作版 › 3. 具体的アイデア", "u": "fukabori.html#fk-q3_idea", "x": "事業の具体的内容 記入例を見る 詳細内容 — 例)高精度加工技術を活かした「試作品特化サービス」:図面受領後48時間で見積回答→1週間で初回サンプル納品→修正要望に3日以内で対応する一貫体制を構築 スコープ(対象・非対象) — 例)対象:精密試作品(1-10個)の設計~加工~検査~納品。対象外:量産品・材料調達・設計業務(パートナー連携で対応) 詳細内容 スコープ(対象・非対象)", "len": 124}, {"t": "フカボリ試作版 › 4. なぜ自社だけ可能", "u": "fukabori.html#fk-q4_onlyus", "x": "独自性と参入障壁 記入例を見る 自社の資産・強み — 例)0.01mm精度の加工技術とノウハウ / 30年の業界実績と信頼関係 / 地域工場5社との協力ネットワーク / 品質管理システムと検査設備 参入障壁・堀 — 例)技術継承マニュアル化により品質を標準化 / 地域連携による24時間対応体制 / 顧客との長期パートナーシップ(平均取引5年以上) 自社の資産・強み 参入障壁・堀", "len": 134}, {"t": "フカボリ試作版 › 5. 成功後と次課題", "u": "fukabori.html#fk-q5_success", "x": "成功時の実現と課題 記入例を見る 成功時の実現 — 例)試作リードタイム50%短縮で顧客の開発速度向上 / 不良率0.01%で再製作コストを削減 / 24時間対応で顧客満足度95%達成 / 単価15%向上で収益性改善 次の課題・リスク — 例)設備投資の初期負担大 / 人材育成コストと時間 / 短納期対応による現場負荷 / 顧客依存度の高まり 成功時の実現 次の課題・リスク", "len": 127}, {"t": "フカボリ試作版 › 6. 市場規模", "u": "fukabori.html#fk-q6_market", "x": "TAM・SAM・SOMの算出 記入例を見る TAM・SAM・SOM(式と例) — 例)TAM(日本全体)= 製造業企業20万社 × 年間試作案件10件 × 平均単価8万円 = 1,600億円 SAM(関東圏)= 対象企業3万社 × 年間試作10件 × 平均8万円 = 240億円 SOM(初年度目標)= 顧客100社 × 年間案件8件 × 平均8万円 = 6,400万円 前提条件 — 例)製造業の70%が年10件程度の試作を外注 / 平均単価8万円(材料費込み) / 当社シェア0.4%を目標 / 関東圏集中でスタート TAM・SAM・SOM(式と例) 前提条件", "len": 158}, {"t": "フカボリ試作版 › 7. 競合", "u": "fukabori.html#fk-q7_comp", "x": "競合他社と差別化 記入例を見る 競合プレイヤー — 例)大手試作専門会社:高価格・標準品中心 / 地域工場:個別対応・品質バラツキ / オンライン試作サービス:低価格・品質不安 差別化ポイント — 例)高精度×短納期×適正価格のポジショニング / 顧客との直接対話による技術提案 / 地域連携による柔軟な対応力 競合プレイヤー 差別化ポイント", "len": 116}, {"t": "フカボリ試作版 › 8. ビジネスモデル", "u": "fukabori.html#fk-q8_bm", "x": "収益構造とユニット経済 記入例を見る 収益式と例 — 例)売上 = 月間案件数 × 平均単価(50件/月 × 8万円 = 400万円/月) 利益 = 売上 - 原価 - 固定費(原価率60%、固定費200万円/月なら △40万円/月 → 受注拡大が必要) ユニット経済(ARPU・LTV・CAC) — 例)月次ARPU = 8万円 × 6件/年 ÷ 12ヶ月 = 4万円/月 LTV = 4万円 × 継続年数3年 = 12万円/顧客 CAC = 営業コスト月50万円 ÷ 新規獲得10社 = 5万円/顧客 LTV/CAC = 2.4(健全性あり) 収益式と例 ユニット経済(ARPU・LTV・CAC)", "len": 144}, {"t": "フカボリ試作版 › 9. チーム", "u": "fukabori.html#fk-q9_team", "x": "チーム編成と人材 記入例を見る 役割・ポジション — 例)現在の体制:代表1名(営業・管理) / 製造技術者3名 / 事務1名(パート)= 合計5名体制 不足・ギャップ — 例)必要な追加人材:Webマーケティング担当1名 / 品質管理専任1名 / 若手技術者2名(将来の技術継承のため) 役割・ポジション 不足・ギャップ", "len": 96}, {"t": "フカボリ試作版 › 10. 必要資金", "u": "fukabori.html#fk-q10_budget", "x": "初期投資と運営費 記入例を見る 初期投資(CAPEX) — 例)新規設備導入800万円(ものづくり補助金で半額) / 品質管理システム200万円 / Webサイト・システム開発100万円 = 合計1,100万円 運営費(OPEX) — 例)月次運営費:人件費250万円 / 設備償却・保守60万円 / 材料費(売上の40%)160万円 / その他30万円 = 合計500万円/月 初期投資(CAPEX) 運営費(OPEX)", "len": 130}, {"t": "フカボリ試作版 › 進んだ使い方", "u": "fukabori.html", "x": "指示文セットを持ち出す — 下の「指示文セットを保存」で、全4章と検算の指示文が1つの.mdになります。ふだんのAIのプロジェクト機能(Claude・ChatGPTとも)にこのファイルと控えファイルを入れておくと、章をまたいで文脈がつながる常設の相談相手になります。 声で答える — インタビューは話すだけなので、スマホの音声入力と相性がよいです。 数字はリサーチ機能で取る — 市場規模や業界の数字は、AIのWeb検索(リサーチ機能)をオンにして出典つきで取り、出典も一緒に控えてください。 検算は2つのAIで — 同じ内容をClaudeとChatGPTの両方に検算させて突き合わせると、指摘の偏りが消えます。 エージェントAIに任せる — Claude CodeのようなエージェントAIを使っている人は、指示文セットと控えファイルを渡せば、まとめて進めてもらえます。", "len": 315}, {"t": "フカボリ試作版 › 保存と持ち出し", "u": "fukabori.html", "x": "入力は書くそばからこのブラウザに自動保存されますが、ブラウザのデータ削除や、パソコン・スマホの買い替えで消えることがあります。 章の区切りごとに「控えを保存」を押して、ファイルを残しておくのが確実です。 控えを読み込む 控えは、そのまま読める下書きです。別のパソコンやスマホでも、読み込めば保存した時点から再開できます(申請書の準備の中身も一緒に入ります)。", "len": 148}, {"t": "アトツギ甲子園で優遇がある補助金", "u": "subsidy.html", "x": "出場の段階に応じて、申請時の優遇・加点が公式に示されている制度の一覧です。 制度 優遇(どの段階で何が) 事業承継・M&A補助金〈事業承継促進枠〉 — このページで詳述 地方大会出場(書類審査通過)で優遇措置(要領の加点事由に明記) ファイナリスト・準ファイナリストで重加点措置 中小企業省力化投資補助金(一般型) 人手不足に悩む中小企業等の省力化投資を支援(公式サイトの事業目的より) 地方大会出場(書類審査通過)で優遇措置 Go-Tech事業(成長型中小企業等研究開発支援事業) 大学・公設試等と連携して行う研究開発とその事業化を支援 地方大会出場(書類審査通過)で優遇措置 小規模事業者持続化補助金 小規模事業者の販路開拓等の取組を支援 ファイナリスト・準ファイナリストで加点措置 各補助金の優遇を受けるには、アトツギ甲子園にエントリーした会社名又は事業者名での申請が必要(公式FAQ) 特典ページ(優遇=地方大会出場者)と15次公募要領の加点条項(出場者=地方予選含む)で表現が異なる。適用境界は各公募回の要領原文が正であり、公募回ごとに再確認が必要 第7回出場者のステータス確定は書類審査通過時(推定2026年末〜2027年1月)。その後に申請受付が始まる公募回(事業承継・M&A補助金17次以降相当)で加点が使える見込み この一覧のうち、要件まで分解できているのは下の事業承継・M&A補助", "len": 500}, {"t": "アトツギ甲子園で優遇がある補助金 › 詳細 — 事業承継・M&A補助金〈事業承継促進枠〉", "u": "subsidy.html#shokei-detail", "x": "5年以内に事業承継を予定する後継者(=アトツギ本人)による成長投資。アトツギ甲子園の特典が最も強く効く補助金(唯一、出場=優遇・ファイナリスト=重加点の2階層)。 この補助金とアトツギ甲子園がつくられた理由は、 国の狙い にまとめています。 以下は15次公募要領(2026年8月6日取得)に基づいています。申請にあたっては、必ず最新の公募要領原文をご確認ください。", "len": 143}, {"t": "アトツギ甲子園で優遇がある補助金 › 金額・補助率", "u": "subsidy.html", "x": "補助下限 1,000,000円 補助上限(基本) 8,000,000円 補助上限(賃上げ要件達成時) 10,000,000円 (給与支給総額3%以上上昇) 廃業費上乗せ(併用時) 3,000,000円以内 補助率 小規模事業者等 2/3以内 / その他 1/2以内", "len": 70}, {"t": "アトツギ甲子園で優遇がある補助金 › 主な要件(落とすと申請不可のもの)", "u": "subsidy.html", "x": "gBizIDプライムの取得(jGrants申請の前提) 認定経営革新等支援機関の確認書(承継の蓋然性確認) — 承継計画の中身を初めて外部に説明する場になるため、実質的な計画レビュー 対象会社の3期分の決算・申告完了(法人) — 満たせない場合はこの枠では申請不可。事前判定で最初に確認すべき項目 個人事業主の場合:開業届・青色申告承認申請書の提出日から5年経過 公募申請期日から5年以内の承継完了計画 承継予定者の経験要件(役員3年/雇用3年/通算3年/親族で代表未経験) — 該当パターンにより証憑(役員経歴・雇用契約書・親族関係図)が変わる 補助対象経費の見積書(設備等)", "len": 225}, {"t": "アトツギ甲子園で優遇がある補助金 › 加点事由(アトツギ甲子園はここに載っている)", "u": "subsidy.html", "x": "アトツギ甲子園加点 「公募申請時点で、申請者の代表者(予定を含む。)が『アトツギ甲子園』の出場者(地方予選を含む。)であること」 証憑: 出場(地方予選含む)が確認できる証憑。プレスリリースや発表サイトのキャプチャも可。ファイナリストはファイナリストであることが確認できる証憑 / ファイナリストは重加点(公式特典ページの表現) 中小企業会計要領/指針の適用 経営力向上計画・経営革新計画・先端設備等導入計画のいずれかの認定 地域おこし協力隊 地域未来牽引企業 健康経営優良法人 サイバーセキュリティお助け隊利用 事業継続力強化計画認定 えるぼし/くるみん認定 賃上げ加点(2%以上の給与上昇率表明) 成長加速マッチングサービス登録 事業承継・引継ぎ支援センター等による事業承継計画策定支援 米国関税措置による影響", "len": 277}, {"t": "アトツギ甲子園で優遇がある補助金 › 審査の4観点(=事業計画の章立て)", "u": "subsidy.html", "x": "取組の目的・必要性 — 承継予定者による生産性向上等の取組が自社の成長と地域経済の発展に資すること 取組の実現可能性 — 商品・サービスのコンセプトと具体化までの手法・プロセスの明確さ、人員・パートナーの確保 取組の収益性 — ターゲット顧客・市場の明確さ、ニーズ把握、収益見通しの妥当性・信頼性 取組の継続性 — 計画変更時の対応、スケジュール、売上・利益計画の妥当性", "len": 138}, {"t": "アトツギ甲子園で優遇がある補助金 › 公募スケジュール", "u": "subsidy.html", "x": "第15次: 受付終了(2026-06-19〜2026-07-24) 第16次: 未発表 — 未発表。13次(2026年頭)→14次(2026-02-27開始)→15次(2026-06-19開始)のペースから2026年秋頃と推定 15次実績では公募開始から締切まで約1か月。 公募が開いてから準備を始めると間に合いません。 今のうちに要件と書類を揃えておくことに、このサイトの意味があります。", "len": 134}, {"t": "アトツギ甲子園で優遇がある補助金 › 出典", "u": "subsidy.html", "x": "アトツギ甲子園 開催概要(特典) (取得: 2026-08-06)— 一覧の優遇段階 各制度の公式サイト(一覧内リンク、取得: 2026-08-16) 事業承継促進枠 公募要領(15次公募) (取得: 2026-08-06)— 詳細欄 事業承継・M&A補助金 公式ポータル", "len": 73}, {"t": "出られるか、30秒で確認", "u": "check.html", "x": "第7回アトツギ甲子園に出られるか、その先の補助金の対象になりそうか。いくつかの質問に答えるだけで確認できます。 Q1. 生まれ年月 1987年4月以降に生まれた(39歳以下枠) それより前に生まれた Q2. 立場 家業があり、代表ではない 家業と別法人の代表だが、家業の承継予定または経営資源の活用がある どちらでもない Q3. 家業の規模 中小企業にあてはまる わからない・確信がない あてはまらない(大企業やその子会社など) 目安(中小企業基本法): 製造業・建設業・運輸業などは資本金3億円以下または従業員300人以下、卸売業は1億円以下または100人以下、サービス業は5,000万円以下または100人以下、小売業は5,000万円以下または50人以下。 ここから下は 任意 です。事業承継・M&A補助金〈促進枠〉を使えそうかの見立てに使うだけで、アトツギ甲子園の応募には関係ありません。 Q4. 承継の時期感(任意) 5年以内の承継を現経営者と合意できそう(またはもう合意している) まだ話せていない・決めきれていない 承継の予定はない 入力はあなたのパソコンやスマホにだけ保存され、サイト側に送信されることはありません。", "len": 399}, {"t": "国の狙い — アトツギ支援がつくられた理由", "u": "policy.html", "x": "アトツギ甲子園にも、その特典になっている補助金にも、つくられた理由があります。理由をたどっておくと、エントリー文や事業計画で何を書けば伝わるのかが見えてきます。ここでは、確認できた事実と、そこからの私の読みを分けて載せます。", "len": 96}, {"t": "国の狙い — アトツギ支援がつくられた理由 › 確認できたこと", "u": "policy.html", "x": "働き手が減っている 生産年齢人口の減少は続いていて、国は今の状況を「労働供給制約社会」と呼んでいます。 (骨太の方針2026・2026-08-06確認) 承継の状況は変わってきた 後継者が決まっていない会社の割合は50.1%まで下がり、7年連続で改善。承継の形も、内部昇格36.1%が同族承継32.3%を初めて上回りました。「家族だから継ぐ」だけの時代ではなくなりつつあります。 (帝国データバンク2025年調査・約27万社) 国の力点は「稼ぐ力」へ 骨太の方針2026の中小企業まわりの記述は、省力化投資の拡充と「『稼ぐ力』の強化と賃上げの好循環」が中心です。 いちばんの課題は「後継者の経営能力」 中小企業庁は、現経営者・後継者の双方が承継の一番の課題として「後継者の経営能力」を挙げているとし、新規事業への挑戦を通じてそれを育てる場としてアトツギ甲子園を運営しています。 (中小企業庁公式) 国が成果として数えるのは、付加価値と賃金 中小企業向け補助金の成果指標は「付加価値額」と「給与支給総額」で設計されています。 (中小企業生産性革命推進事業・公開資料) 両者の接続点が、加点事由8 公募要領の加点事由8「アトツギ甲子園の出場者であること」。育てる場(甲子園)とお金の制度(補助金)は、ここでつながっています。", "len": 423}, {"t": "国の狙い — アトツギ支援がつくられた理由 › ここからの読み(運営者である私の解釈です)", "u": "policy.html", "x": "期待されているのは「守る人」より「受け継いだものから新しい価値を作る人」。 甲子園自体が新規事業のピッチ大会で、第7回の応募資格は家業の経営資源の活用を条件にしています。 甲子園と補助金は、ひとつづきの仕組み。 加点はその接続点です。両方をひとつの計画で考えると、一度書いたものが二度使えます。 伝わりやすいのは「承継をきっかけにした成長投資」の話。 現状維持のための投資は、要件を満たしても評価されにくい設計に見えます。 2026年に響くのは「承継を守る」より「承継を機に付加価値と賃金を上げる」。 政策の力点が「稼ぐ力」に移っているためです。 承継は「追い込まれてする話」から「選べる話」へ変わりつつあります。 約127万社が後継者未定という2017年の試算が、いまの支援策群の出発点でした。その後、支援の仕組みが整うなかで状況は7年連続で改善し、承継の形も多様になっています。いま継ぐことを、迫られた決断ではなく自分の選択として書ける状況です。", "len": 344}, {"t": "国の狙い — アトツギ支援がつくられた理由 › 制度ごとの系譜", "u": "policy.html", "x": "制度から近い順に、その制度の前提になっている予算事業・施策・国の方針・世界の動きをさかのぼったものです。未確認の候補は載せず、出典のあるものには出典を添えています。 事業承継・M&A補助金〈事業承継促進枠〉 予算事業 中小企業生産性革命推進事業の全体目標「従業員一人当たり付加価値額を5年間で5%向上」。 出典 省庁の施策 中小企業庁「現経営者、後継者ともに、事業承継を進める上で、1番の課題・懸念点として『後継者の経営能力』を挙げている」。 出典 施策群=事業承継税制・事業承継・引継ぎ支援センター・M&A支援機関登録制度・後継者育成(甲子園・アンバサダー・コンソーシアム) 国の方針 2025年までに経営者70歳超が約245万人・うち約半数の約127万社が後継者未定、放置すればGDP約22兆円・雇用約650万人喪失の恐れ(2017年頃・経産省系試算)。 出典 骨太2026「『省力化投資促進プラン』を着実に実行するとともに、更なる充実・拡充を図り、『稼ぐ力』の強化と賃上げの好循環を実現する」(第2章(3)強い地域経済の構築) 出典 骨太2026は「労働供給制約社会における中堅・中小企業の『稼ぐ力』強化戦略」に基づく支援を明記 骨太2026には事業承継・M&Aに特化した記述が見当たらない(間接記述のみ) 事業承継をめぐる状況 後継者不在率 出典 承継類型の構造変化(脱ファミリー化) 経営者", "len": 652}, {"t": "国の狙い — アトツギ支援がつくられた理由 › 事業計画に活かすなら", "u": "policy.html", "x": "統計の話だけだと他人事に見え、現場の話だけだと背景が伝わりません。たとえば「生産年齢人口が減っている。実際、うちの工場も今年は求人応募がゼロだった。この投資はその答えだ」のように、大きな数字と自分の現場をひとつなぎにして書くと、読み手に届きやすくなります。", "len": 108}, {"t": "国の狙い — アトツギ支援がつくられた理由 › 出典", "u": "policy.html", "x": "経済財政運営と改革の基本方針2026(閣議決定) 帝国データバンク 全国「後継者不在率」動向調査(2025年) 中小企業庁 アトツギ甲子園・後継者育成 中小企業生産性革命推進事業について(中小企業庁) 事業承継・M&A補助金 公式ポータル(15次公募要領) いずれも2026年8月6日確認。「読み」はあくまで運営者である私の解釈です。新しい資料が出れば見直します。", "len": 135}, {"t": "情報源", "u": "trust.html", "x": "ここに載っている期日・金額・要件が「いつの、何にもとづく情報か」を、いつでも確かめられるようにしています。", "len": 39}, {"t": "情報源 › 掲載の原則", "u": "trust.html", "x": "情報は公式サイト・公募要領などの一次資料から取り、各ページに出典へのリンクと確認日を書いています もし掲載内容と公式の記載が食い違っていたら、常に公式の公募要領が正しい方です 募集の時期や内容は変わっていくものなので、取得元の更新を定期的に確認し、締切・金額・要件に関わる変更は内容を確かめてから反映しています", "len": 136}, {"t": "情報源 › 扱っているデータと出典", "u": "trust.html", "x": "アトツギ甲子園の日程・応募の流れ 公式サイトと経済産業省の発表から取得。応募方法はエントリー・推薦の流れのページで確認。 最終確認 2026-08-16 公式サイト(エントリー・推薦の流れ) / 経産省発表(第7回) 事業承継・M&A補助金〈促進枠〉の金額・要件・加点 15次公募要領の原文から取得。金額・要件・加点事由は原文の該当箇所を引用。 最終確認 2026-08-06 公募要領(中小企業庁 補助金サイト) 地域アンバサダーの名簿(第7回・第6回) 任命発表のプレスリリースから作成。同姓・似た氏名は運営者が本人確認して区別。 最終確認 2026-08-14 第7回任命(2026年7月15日) / 第6回任命(2025年7月30日) アンバサダーの出場歴 第1回〜第6回の地方大会・決勝大会に関する公式発表と全員を照合。地方大会出場以上を記載。 最終確認 2026-08-15 出典の一覧は「相談できる人」ページ末尾に記載 第7回のイベント・期日とニュース 公式サイトのイベントページと中小企業庁・経済産業省の発表から取得。開催日時・会場は各ページの原文で確認。 最終確認 2026-08-15 公式イベント一覧 / 中小企業庁 発表(2026-08-03)", "len": 369}, {"t": "情報源 › 更新履歴", "u": "trust.html", "x": "2026-08-15 出場歴を地方大会出場まで広げました(第3回〜第6回の地方名簿・計293名分の公式発表と全員を氏名で照合。これで名簿の全員に出場記録が付きました)。地図も実際の県境の形に変わりました。 2026-08-15 アンバサダー名簿に出場歴(第1〜6回の決勝大会の公式発表と照合)と各社サイトへのリンクを追加しました。同姓・似た氏名の方(棚元様ご兄弟、齊藤様/齋藤様)は運営者が本人確認のうえ区別して記載しています。 2026-08-14 地域アンバサダーのページを新設しました(第7回・42名を地図と一覧から。第6回の歴代名簿もアーカイブ)。運営者と方針のページ、エントリー文の書き方の見本、予行審査の審査観点も追加しています。 2026-08-12 エントリーから書類提出までの公式の流れ(エントリー後に事務局からフォーマットが届き、PDFで提出)を公式サイトで確認し、エントリー文ページの説明を実際の流れに合わせました。 2026-08-06 第7回アトツギ甲子園の日程・特典情報を公式発表に基づき掲載しました 2026-08-06 事業承継・M&A補助金(事業承継促進枠)15次公募要領の内容を反映しました", "len": 402}, {"t": "情報源 › このサイトにできないこと", "u": "trust.html", "x": "採択の保証・確約はできません 申請代行は行いません(無償の自己作成支援です) 掲載情報より公募要領原文が常に優先します 重要な判断は認定経営革新等支援機関・専門家にご相談ください", "len": 75}, {"t": "情報源 › データの扱い", "u": "trust.html", "x": "チェックやエントリー文の入力は、あなたのパソコンやスマホのブラウザ内にのみ保存されます。入力内容がサイト側に送信されることはありません。 AIを使って作成する場合、AIに渡した内容(指示文・書きかけの骨子・MCP経由の会話)は、あなたが選んだAI事業者(OpenAI・Anthropic・Googleなど)のサーバーで処理されます。これはChatGPTやClaudeなどのAIを使うこと自体に伴うもので、シンセイダーがその内容を受け取ることはありません。 どのページが読まれているかを知るため、アクセス解析に GoatCounter を利用しています。閲覧ページのURL・参照元・ブラウザの種類などが送信されますが、Cookieは使わず、個人を特定する情報は収集していません。", "len": 286}, {"t": "運営者と方針 › このサイトについて", "u": "about.html", "x": "シンセイダーは、アトツギ甲子園への挑戦と、承継を機にした投資までを、正確な情報で支える無償のツールです。運営者自身がアトツギとして大会に出た経験から、「忖度のない評価に早く出会うこと」がいちばんの近道だと考えて作っています。", "len": 97}, {"t": "運営者と方針 › 運営者", "u": "about.html", "x": "羽生田大陸(株式会社羽生田鉄工所 専務取締役) アトツギ甲子園 第3回大会ファイナリスト/長野県 地域アンバサダー(中小企業庁長官任命) 連絡は X(@rikuhnd) か Facebook のDM、または 会社サイト からどうぞ。お住まいの地域の アンバサダー を紹介してほしい、といった相談にも応じます。", "len": 108}, {"t": "運営者と方針 › 入力データの扱い", "u": "about.html", "x": "このサイトに入力した内容(チェックの回答・エントリー文の骨子・メモ)は、 あなたのパソコンやスマホの中にだけ保存されます 。当サイトはサーバーを持たず、入力データを一切送信・取得しません。ページを配信する静的ホスティングのアクセスログ以外に、運営者が得る情報はありません。", "len": 112}, {"t": "運営者と方針 › 免責", "u": "about.html", "x": "当サイトは申請書類の作成を支援するもので、エントリーや申請の成否を保証するものではありません。制度の内容・期日は変わります。掲載情報には取得日と出典を付記していますが、応募・申請の前には必ず公式の公募要領・募集要項をご確認ください。当サイトの利用により生じた損害について、運営者は責任を負いません。 情報の集め方と更新の記録は 情報源 のページにあります。", "len": 151}, {"t": "相談できる人 — 地域アンバサダー", "u": "ambassadors.html", "x": "アトツギ甲子園の過去ファイナリストを中心に、中小企業庁が任命した各地の経験者です。地域で後継者向けのセミナーやトークセッションを開いていて、エントリー前の相談相手になります。", "len": 79}, {"t": "相談できる人 — 地域アンバサダー › 地図から", "u": "ambassadors.html", "x": "朱色の都道府県に現任のアンバサダーがいます。押すと一覧に移動します。 現任のアンバサダーがいる県 いない県 地図: Geolonia japanese-prefectures (原典: Wikipedia 日本地図.svg)を配色・構成調整して使用。沖縄県は枠内に表示、鹿児島県の一部離島(トカラ・奄美)は省略しています。", "len": 119}, {"t": "相談できる人 — 地域アンバサダー › 第7回のアンバサダー(42名・都道府県順)", "u": "ambassadors.html", "x": "地域の区分は、大会の地方大会ブロック(例: 新潟・山梨・長野・静岡は関東ブロック)に合わせています。 グランプリ 受賞 決勝出場 準ファイナリスト 地方大会出場 数字は大会の回。会社名のリンクは各社のウェブサイト。", "len": 75}, {"t": "相談できる人 — 地域アンバサダー › 北海道・東北", "u": "ambassadors.html", "x": "北海道 滝本 壮 株式会社滝本新作商店 6 村本 賢亮 株式会社壺屋総本店 ↗ 4 青森県 久保 栄一郎 株式会社弘前ドライクリーニング工場 ↗ 3 宮城県 今野 雅生 株式会社カーネ・ラ・ヴィータ ↗ 5 第6回から 秋田県 武藤 元貴 有限会社武藤工芸鋳物 3 第6回から 山形県 安孫子 大輝 ホクシア株式会社 ↗ 4 第6回から", "len": 93}, {"t": "相談できる人 — 地域アンバサダー › 関東", "u": "ambassadors.html", "x": "茨城県 藤田 浩一 株式会社常陸風月堂 ↗ 3 第6回から 群馬県 井口 善博 井口工業株式会社 ↗ 6 埼玉県 関根 俊直 セキネシール工業株式会社 ↗ 4 第6回から 千葉県 高澤 恵大 大森屋青果有限会社 4 5 第6回から 東京都 中西 雄大 新協電子株式会社 ↗ 6 神奈川県 齋藤 孝曉 長後製パン株式会社 ↗ 6 新潟県 栗林 礼奈 株式会社マスヤ 5 第6回から 山梨県 佐藤 賢 有限会社モールドモデル ↗ 5 6 第6回から 長野県 羽生田 大陸 株式会社羽生田鉄工所 ↗ 3 4 第6回から 当サイト運営者 — 運営者と方針 静岡県 齊藤 雄大 株式会社斎藤鐵工所 ↗ 5", "len": 158}, {"t": "相談できる人 — 地域アンバサダー › 中部", "u": "ambassadors.html", "x": "富山県 棚元 将太郎 大征工業株式会社 ↗ 5 6 第6回から 石川県 白榮 洋和 ダイエー株式会社 ↗ 5 岐阜県 墨 俊希 株式会社艶金 ↗ 5 愛知県 中村 慎吾 株式会社ナカムラ ↗ 5 6 三重県 川野 晃太 川野真珠養殖 5", "len": 55}, {"t": "相談できる人 — 地域アンバサダー › 近畿", "u": "ambassadors.html", "x": "福井県 増田 悠二 北鋼シャーリング株式会社 ↗ 4 滋賀県 濵﨑 航平 株式会社濵﨑銃砲火薬店 ↗ 5 第6回から 京都府 大西 達也 大西建設株式会社 ↗ 5 大阪府 川端 佑弥 株式会社辰弥 ↗ 6 兵庫県 小林 宏聡 株式会社マルキン ↗ 6 奈良県 大西 佑亮 ミヅホ株式会社 ↗ 5 第6回から", "len": 78}, {"t": "相談できる人 — 地域アンバサダー › 中国・四国", "u": "ambassadors.html", "x": "鳥取県 遠藤 みさと 株式会社BEANS ↗ 4 島根県 中澤 太輔 株式会社中澤建設 ↗ 4 5 第6回から 岡山県 川上 善大 株式会社カワカミ ↗ 6 広島県 林 秀樹 株式会社ウッディーホーム山崎 ↗ 5 第6回から 山口県 佐藤 史康 株式会社佐藤商会 ↗ 6 徳島県 山地 正城 有限会社タウンファーマシー ↗ 6 香川県 田渕 恭平 田渕石材株式会社 ↗ 6 愛媛県 藤井 遼太郎 株式会社藤井組 ↗ 6", "len": 108}, {"t": "相談できる人 — 地域アンバサダー › 九州・沖縄", "u": "ambassadors.html", "x": "福岡県 安永 翔太 株式会社ヤスナガ ↗ 5 6 佐賀県 靏 健寿 鶴製茶 ↗ 4 第6回から 長崎県 池野 辰太郎 有限会社酒の一斗 ↗ 4 熊本県 谷山 陽祐 株式会社尼崎薬品 ↗ 6 大分県 藤澤 隆典 合資会社藤澤精麦工場 6 宮崎県 松田 陽子 城山ふとん店 ↗ 1 鹿児島県 富澤 英里子 合資会社伊達醸造 ↗ 4 6", "len": 78}, {"t": "相談できる人 — 地域アンバサダー › 歴代のアンバサダー", "u": "ambassadors.html", "x": "過去の回で任命された方の記録です。 第6回(2025年7月任命・40名)のうち、第7回の名簿に記載のない方(25名):", "len": 43}, {"t": "相談できる人 — 地域アンバサダー › 北海道・東北", "u": "ambassadors.html", "x": "北海道 梅木 悠太 株式会社山ス伊藤商店 ↗ 1 第6回 工藤 貴大 株式会社大喜館 ↗ 5 第6回", "len": 25}, {"t": "相談できる人 — 地域アンバサダー › 関東", "u": "ambassadors.html", "x": "群馬県 宮島 茜 有限会社勝山電気工事 ↗ 5 第6回 東京都 島田 真太郎 テクノツール株式会社 ↗ 2 3 第6回 静岡県 小松 元気 株式会社カネス製茶 ↗ 4 第6回", "len": 44}, {"t": "相談できる人 — 地域アンバサダー › 中部", "u": "ambassadors.html", "x": "石川県 山田 美早紀 デクシオーラ株式会社 ↗ 5 第6回 岐阜県 熊田 征純 ニッケンかみそり株式会社 ↗ 5 第6回 愛知県 大森 玲弥 株式会社岡崎竜城スイミングクラブ ↗ 5 第6回 三重県 西塚 卓郎 株式会社ダイマル ↗ 3 第6回", "len": 67}, {"t": "相談できる人 — 地域アンバサダー › 近畿", "u": "ambassadors.html", "x": "京都府 芦田 拓弘 株式会社あしだ ↗ 4 5 第6回 大阪府 桐島 豊 有限会社電研 ↗ 5 第6回 兵庫県 髙丸 泰幸 髙丸工業株式会社 ↗ 4 第6回", "len": 35}, {"t": "相談できる人 — 地域アンバサダー › 中国・四国", "u": "ambassadors.html", "x": "鳥取県 岸田 将志 有限会社岸コーポレーション 5 第6回 岡山県 若林 美樹 株式会社若林平三郎商店 ↗ 4 第6回 山口県 吉本 龍太郎 株式会社中特ホールディングス ↗ 3 第6回 徳島県 井澤 優 株式会社いさわ ↗ 4 第6回 香川県 山添 勢 有限会社森清掃社 ↗ 4 第6回 愛媛県 高辻 孝将 株式会社山田屋 ↗ 5 第6回", "len": 89}, {"t": "相談できる人 — 地域アンバサダー › 九州・沖縄", "u": "ambassadors.html", "x": "福岡県 渡辺 雄輝 渡辺鉄工株式会社 ↗ 4 第6回 長崎県 山内 怜 山内造船株式会社 ↗ 5 第6回 熊本県 錦戸 啓人 三和コンクリート工業株式会社 ↗ 4 第6回 大分県 栗田 貴宏 有限会社育葉産業 ↗ 5 第6回 宮崎県 早川 薫 早川しょうゆみそ株式会社 ↗ 2 第6回 鹿児島県 平松 佑麻 宝来メデック株式会社 ↗ 4 第6回 沖縄県 新城 力 合資会社嘉手納ブロック工業 ↗ 5 第6回", "len": 106}, {"t": "相談できる人 — 地域アンバサダー › どう連絡すれば良いか", "u": "ambassadors.html", "x": "多くのアンバサダーは、SNS(特にFacebookのDM)で連絡がつきます。どこに声をかければいいか迷う場合は、 当サイトの運営者(2026年度の長野県アンバサダー 羽生田大陸) から、お近くのアンバサダーを紹介することもできますので、お気軽にご連絡ください。 名簿の出典: 第7回任命(2026年7月15日・42名) / 第6回任命(2025年・40名) 出場歴の出典: 第1回(事務局発表) / 第2回 / 第3回(出場者一覧PDF) / 第4回 / 第5回 / 第6回 / 第3回地方(45名) / 第4回地方(68名) / 第5回地方(90名) / 第6回地方(90名) (各回の地方大会・決勝大会の公式発表。2026年8月確認)", "len": 209}, {"t": "第7回の日程と公式発表", "u": "news.html", "x": "公式に発表されたイベントと期日、発表そのものの記録です。各項目に出典を付けています。締切や大会日程は、下のリンクからお使いのカレンダーに登録できます。", "len": 65}, {"t": "第7回の日程と公式発表 › この先の日程", "u": "news.html", "x": "各行の「カレンダーに追加」で、その日程を自分のGoogleカレンダーに入れられます。 まとめて追加(.ics) はApple・Outlook等のカレンダー向けです(今日以降の全日程入り)。 11/25(水) エントリー締切 18:00 カレンダーに追加 ・ 出典 11/27(金) 応募書類の提出締切(PDF) 12:00 カレンダーに追加 ・ 出典 1/19(火) 地方大会 北海道・東北ブロック 仙台市中小企業活性化センター カレンダーに追加 ・ 出典 1/25(月) 地方大会 関東ブロック 品川ザ・グランドホール カレンダーに追加 ・ 出典 1/28(木) 地方大会 中部ブロック 中日ホール&カンファレンス カレンダーに追加 ・ 出典 2/1(月) 地方大会 近畿ブロック グランキューブ大阪 カレンダーに追加 ・ 出典 2/4(木) 地方大会 中国・四国ブロック 高松シンボルタワー カレンダーに追加 ・ 出典 2/8(月) 地方大会 九州・沖縄ブロック 熊本城ホール カレンダーに追加 ・ 出典 2/26(金) 決勝大会 東京建物ぴあシアター&カンファレンス カレンダーに追加 ・ 出典", "len": 294}, {"t": "第7回の日程と公式発表 › カレンダーで見る", "u": "news.html", "x": "締切 / 地方大会(都市名) / 決勝 / 説明会など 。今日の日付は枠で囲んで表示。", "len": 23}, {"t": "第7回の日程と公式発表 › 発表の記録", "u": "news.html", "x": "2026.08.03 第7回「アトツギ甲子園」のエントリー募集を開始、「アトツギWeek」の開催を発表(中小企業庁) 出典 ↗ 2026.07.15 第7回「アトツギ甲子園」の開催を発表、公式サイトを公開(経済産業省) 出典 ↗ 2026.07.15 第7回の地域アンバサダー42名を任命 出典 ↗ 2026.02.27 第6回決勝大会の受賞者を発表 出典 ↗ 開催日時は各出典ページの原文で確認。説明会の申込は当日10:00締切(各ページ記載)。新しい発表は、公式サイト・中小企業庁/経済産業省の発表を確認のうえ追記します。", "len": 177}, {"t": "フカボリ › 自社のルーツ（創業から現在までの歴史）", "u": "fukabori.html#fk-roots", "x": "主要年代3点+各項目になぜ1行 いつ(年表): 例)1985年:父が町工場を創業。旋盤1台からスタート / 2010年:息子が入社、CNC機械導入 / 2020年:コロナ禍で医療機器部品に参入 / 2024年:事業承継完了、DXに本格着手 誰が(人物): 例)創業者(父):職人気質で品質に妥協なし、地域の信頼が厚い / 現代表(息子):工学部出身、効率化とデジタル化を推進 / 古参職人2名:30年の経験、技術伝承の要 なぜ(動機・背景): 例)父の代は職人の勘と経験が頼りだったが、受注増加で属人化が限界に。品質を保ちつつ生産性を上げるため、データ化・標準化が急務となった 何を(行動・取り組み): 例)作業手順書のデジタル化 / 品質検査データのDB管理 / 受注から納期までの進捗可視化システム導入 / 若手育成プログラムの体系化 継承すべき価値観: 例)職人の誇りと品質へのこだわりは変えずに、デジタル技術で次世代に継承できる仕組みを作る", "len": 296}, {"t": "フカボリ › 企業理念（ミッション・ビジョン・バリュー）", "u": "fukabori.html#fk-philosophy", "x": "ミッション・ビジョン・バリューすべて記入+事例3件 ミッション(使命・目的): 例)地域の製造業を支える精密部品づくりで、社会インフラを下支えする ビジョン(将来像・目標): 例)職人技術とDXが融合した、次世代町工場のモデルケースになる バリュー(行動指針・価値観): 例)品質第一 - 妥協のないものづくり / 改善継続 - 小さな工夫を積み重ねる / 地域共創 - 同業他社とも協力して業界全体を発展させる 理念の具現化(事例): 例)不良品率0.01%以下の維持 / 月1回の改善提案会議 / 地域工場との技術交流会を主催 / 工業高校生のインターンシップ受け入れ 理念の解釈・背景: 例)先代から受け継いだ品質への執念と地域への恩返しの想いを、現代の技術で実現する。理想論より現場で回る実践を重視", "len": 247}, {"t": "フカボリ › 真の強み #1（競合にない独自の強みを分析）", "u": "fukabori.html#fk-strength_1", "x": "主張+エビデンス(固有名詞or数値)+独自性+価値連関 何が強みか: 例)0.01mm精度の高精度加工技術 証拠・根拠: 例)医療機器部品で3年間不良品ゼロを達成。大手メーカー2社から指定工場認定を取得。品質監査で最高評価AAランク継続 なぜ独自なのか: 例)30年のベテラン職人2名の技術を若手にマニュアル化して継承。他社にない独自治具の開発と温度・湿度管理システム 価値との連関: 例)高品質により単価20%アップの案件を獲得。リピート率95%で安定受注を実現", "len": 176}, {"t": "フカボリ › 真の強み #2（競合にない独自の強みを分析）", "u": "fukabori.html#fk-strength_2", "x": "主張+エビデンス(固有名詞or数値)+独自性+価値連関 何が強みか: 例)1週間以内の超短納期対応力 証拠・根拠: 例)通常1ヶ月の案件を1週間で納品した実績が年10件以上。夜間・休日対応で緊急案件に100%対応 なぜ独自なのか: 例)24時間稼働可能な設備配置と、職人の多能工化により柔軟なシフト編成を実現。近隣協力工場3社との連携体制 価値との連関: 例)短納期プレミアムで通常単価の150%を実現。新規顧客の60%がリピーター化", "len": 161}, {"t": "フカボリ › 真の強み #3（競合にない独自の強みを分析）", "u": "fukabori.html#fk-strength_3", "x": "主張+エビデンス(固有名詞or数値)+独自性+価値連関 何が強みか: 例)地域製造業のハブとしての信頼関係 証拠・根拠: 例)同業者5社と相互協力体制を構築。月1回の技術交流会を15年継続。地域工業会の副会長を3期務める なぜ独自なのか: 例)競合他社とも情報共有し業界全体の底上げを図る姿勢。若手育成への積極的な取り組みで地域から評価 価値との連関: 例)協力体制により大型案件(1000万円以上)を年3件受注。工業高校から毎年2名の新卒採用を実現", "len": 173}, {"t": "フカボリ › PEST: Politics（政治的要因の分析）", "u": "fukabori.html#fk-pest_p", "x": "事実3・機会2・脅威2・時間軸 政治的事実: 例)ものづくり補助金で最大1,250万円の設備投資支援 / 電子帳簿保存法で2024年から義務化 / カーボンニュートラル政策で省エネ設備への税制優遇 機会: 例)補助金を活用してCNC機械を追加導入予定 / 電子化対応で事務作業30%削減を目標 / 省エネ設備導入で電気代20%カット見込み 脅威: 例)補助金申請の事務負担増加 / 電子化対応の初期コスト100万円 / 環境規制強化でコンプライアンス体制整備が必要 時間軸: 例)短期(1年以内):電子帳簿対応完了 / 中期(3年):補助金でライン自動化 / 長期(5年):カーボンニュートラル工場実現", "len": 213}, {"t": "フカボリ › PEST: Economy（経済的要因の分析）", "u": "fukabori.html#fk-pest_e", "x": "事実3・機会2・脅威2・時間軸 経済的事実: 例)鋼材価格が2年で40%上昇 / 円安で輸入材料費が高騰 / 人件費上昇圧力(最低賃金年3%上昇) 機会: 例)材料高を価格転嫁で売上15%増 / 高付加価値製品へのシフトで粗利率向上 / 自動化投資で人件費率を抑制 脅威: 例)価格転嫁の遅れで粗利率低下 / 小規模案件の採算悪化 / 資金繰り悪化のリスク 時間軸: 例)短期:四半期ごとの価格見直し制度導入 / 中期:高付加価値製品比率を70%まで向上 / 長期:安定したキャッシュフロー確立", "len": 163}, {"t": "フカボリ › PEST: Society（社会的要因の分析）", "u": "fukabori.html#fk-pest_s", "x": "事実3・機会2・脅威2・時間軸 社会的事実: 例)製造業の人手不足率35%(地域平均) / 働き方改革で残業時間削減圧力 / 技能継承の高齢化問題(熟練工の65%が60歳以上) 機会: 例)DXで働きやすさアピールし若手採用強化 / 技能のマニュアル化で教育期間短縮 / 地域連携で人材シェアリング 脅威: 例)熟練工の大量退職リスク / 若手確保の競争激化 / 残業制限で繁忙期の対応力低下 時間軸: 例)短期:技能継承マニュアル完成 / 中期:若手3名採用・育成 / 長期:地域製造業の人材育成拠点化", "len": 168}, {"t": "フカボリ › PEST: Technology（技術的要因の分析）", "u": "fukabori.html#fk-pest_t", "x": "事実3・機会2・脅威2・時間軸 技術的事実: 例)IoT機器の低価格化進行 / 5G通信で工場内リアルタイム監視が可能 / AIによる品質管理システムが実用レベルに 機会: 例)機械稼働データをスマホで監視し効率向上 / AI品質チェックで検査時間半減 / 3Dプリンターで治具製作コスト削減 脅威: 例)技術投資の初期費用負担 / サイバーセキュリティリスク / 技術変化への対応遅れ 時間軸: 例)短期:IoTセンサー導入でデータ収集開始 / 中期:AI品質管理システム実装 / 長期:完全自動化ラインの構築", "len": 183}, {"t": "フカボリ › 5Forces: 新規参入（新規参入の脅威）", "u": "fukabori.html#fk-ff_new", "x": "強度(1-5)+根拠+打ち手2+指標 脅威の強度(1-5): 例)強度:3(中程度の脅威) - 設備投資300万円あれば小規模工場でも参入可能だが、顧客の品質要求は厳しい 要因・ドライバー: 例)要因:中古機械市場の充実 / 小ロット・短納期ニーズの拡大 / ネット受注プラットフォームの普及 対応策: 例)対応策:特殊材料加工に特化 / 既存顧客との関係強化 / 品質認証取得で差別化 測定指標: 例)監視指標:地域内の新規参入企業数 / 平均受注単価の推移 / 既存顧客の発注継続率", "len": 153}, {"t": "フカボリ › 5Forces: 供給業者（供給業者の交渉力）", "u": "fukabori.html#fk-ff_sup", "x": "強度(1-5)+根拠+打ち手2+指標 交渉力の強度(1-5): 例)強度:2(低い脅威) - 材料商社3社との取引実績があり、価格交渉力を維持 要因・ドライバー: 例)要因:材料の標準化・汎用化 / 複数供給元の存在 / 物流コストの透明性向上 対応策: 例)対応策:長期契約で価格安定化 / 複数商社との関係維持 / 材料使用量の最適化 測定指標: 例)監視指標:材料仕入価格の変動率 / 調達リードタイム / 在庫回転率", "len": 122}, {"t": "フカボリ › 5Forces: 既存競合（既存競合の脅威）", "u": "fukabori.html#fk-ff_riv", "x": "強度(1-5)+根拠+打ち手2+指標 競争の激しさ(1-5): 例)強度:4(高い脅威) - 同業他社20社が半径10km圏内に存在し、価格競争が激化 要因・ドライバー: 例)要因:技術の標準化 / 設備の汎用化 / 顧客の相見積文化 対応策: 例)対応策:高精度・短納期での差別化 / 顧客との長期パートナーシップ構築 / 独自技術の開発 測定指標: 例)監視指標:受注競合率 / 既存顧客の流出率 / 新規案件の獲得率", "len": 121}, {"t": "フカボリ › 5Forces: 買い手（買い手の交渉力）", "u": "fukabori.html#fk-ff_buy", "x": "強度(1-5)+根拠+打ち手2+指標 交渉力の強度(1-5): 例)強度:4(高い脅威) - 大手製造業3社が売上の60%を占め、価格決定権が顧客側にある 要因・ドライバー: 例)要因:顧客の調達一元化 / 相見積の常態化 / コスト削減圧力の継続 対応策: 例)対応策:顧客業務への深い関与 / 設計段階からの提案参加 / 品質・納期での差別化 測定指標: 例)監視指標:主要顧客への依存度 / 価格改定の受け入れ率 / 新規顧客開拓数", "len": 127}, {"t": "フカボリ › 5Forces: 代替品（代替品の脅威）", "u": "fukabori.html#fk-ff_sub", "x": "強度(1-5)+根拠+打ち手2+指標 脅威の強度(1-5): 例)強度:3(中程度の脅威) - 3Dプリンターや海外調達など代替手段の選択肢が増加 要因・ドライバー: 例)要因:3Dプリンター技術の向上 / 海外工場との直接取引増加 / 内製化の進展 対応策: 例)対応策:3Dプリンターでは難しい精密加工に集中 / アフターサービスの充実 / 短納期対応力の強化 測定指標: 例)監視指標:代替品採用による失注率 / 3Dプリンター導入企業数 / 平均案件サイズの変化", "len": 149}, {"t": "フカボリ › 1. なぜ自社がやるのか（自社が取り組む理由）", "u": "fukabori.html#fk-q1_whyus", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) ストーリー・背景: 例)我々は30年の技術蓄積と地域ネットワークを活かし、他社が諦める高精度・短納期案件を実現します。ベテランの技術を若手に継承する仕組みと、最新設備への投資により、品質と効率の両立を図っています 自社との適合性: 例)創業時からの品質第一主義がDXと融合。職人技術を標準化・マニュアル化することで、属人化を解消しつつ品質を保持。地域との共創で業界全体を発展させる理念も一致", "len": 186}, {"t": "フカボリ › 2. 誰のどんなニーズか（ターゲット顧客のニーズ）", "u": "fukabori.html#fk-q2_whose", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) ペルソナ(誰が): 例)自動車部品メーカーの設計部門:試作品を1-5個、2週間以内に製作したい企業 / 医療機器メーカー:薬事承認用サンプルを高精度で製作したい企業 ニーズ(何を求める): 例)従来の外注は納期1ヶ月以上で設計検証が遅れる / 品質のばらつきで再製作が発生 / 図面修正時の迅速な対応ができない / コストが読めない", "len": 147}, {"t": "フカボリ › 3. 具体的アイデア（事業の具体的内容）", "u": "fukabori.html#fk-q3_idea", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 詳細内容: 例)高精度加工技術を活かした「試作品特化サービス」:図面受領後48時間で見積回答→1週間で初回サンプル納品→修正要望に3日以内で対応する一貫体制を構築 スコープ(対象・非対象): 例)対象:精密試作品(1-10個)の設計~加工~検査~納品。対象外:量産品・材料調達・設計業務(パートナー連携で対応)", "len": 127}, {"t": "フカボリ › 4. なぜ自社だけ可能（独自性と参入障壁）", "u": "fukabori.html#fk-q4_onlyus", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 自社の資産・強み: 例)0.01mm精度の加工技術とノウハウ / 30年の業界実績と信頼関係 / 地域工場5社との協力ネットワーク / 品質管理システムと検査設備 参入障壁・堀: 例)技術継承マニュアル化により品質を標準化 / 地域連携による24時間対応体制 / 顧客との長期パートナーシップ(平均取引5年以上)", "len": 138}, {"t": "フカボリ › 5. 成功後と次課題（成功時の実現と課題）", "u": "fukabori.html#fk-q5_success", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 成功時の実現: 例)試作リードタイム50%短縮で顧客の開発速度向上 / 不良率0.01%で再製作コストを削減 / 24時間対応で顧客満足度95%達成 / 単価15%向上で収益性改善 次の課題・リスク: 例)設備投資の初期負担大 / 人材育成コストと時間 / 短納期対応による現場負荷 / 顧客依存度の高まり", "len": 128}, {"t": "フカボリ › 6. 市場規模（TAM・SAM・SOMの算出）", "u": "fukabori.html#fk-q6_market", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) TAM・SAM・SOM(式と例): 市場規模の計算例) TAM(日本全体)= 製造業企業20万社 × 年間試作案件10件 × 平均単価8万円 = 1,600億円 SAM(関東圏)= 対象企業3万社 × 年間試作10件 × 平均8万円 = 240億円 SOM(初年度目標)= 顧客100社 × 年間案件8件 × 平均8万円 = 6,400万円 前提条件: 前提条件:製造業の70%が年10件程度の試作を外注 / 平均単価8万円(材料費込み) / 当社シェア0.4%を目標 / 関東圏集中でスタート", "len": 167}, {"t": "フカボリ › 7. 競合（競合他社と差別化）", "u": "fukabori.html#fk-q7_comp", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 競合プレイヤー: 例)大手試作専門会社(プロトラブズ等):高価格・標準品中心 / 地域工場:個別対応・品質バラツキ / オンライン試作サービス:低価格・品質不安 差別化ポイント: 例)高精度×短納期×適正価格のポジショニング / 顧客との直接対話による技術提案 / 地域連携による柔軟な対応力", "len": 122}, {"t": "フカボリ › 8. ビジネスモデル（収益構造とユニット経済）", "u": "fukabori.html#fk-q8_bm", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 収益式と例: 収益モデルの例) 売上 = 月間案件数 × 平均単価 50件/月 × 8万円 = 400万円/月(4,800万円/年) 利益 = 売上 - 原価 - 固定費 原価率60%、固定費200万円/月の場合 利益 = 400万円 - 240万円 - 200万円 = △40万円/月(受注拡大が必要) ユニット経済(ARPU・LTV・CAC): 顧客単価の例) 月次ARPU = 8万円 × 6件/年 ÷ 12ヶ月 = 4万円/月 LTV = 4万円 × 継続年数3年 = 12万円/顧客 CAC = 営業コスト月50万円 ÷ 新規獲得10社 = 5万円/顧客 LTV/CAC = 12万円 ÷ 5万円 = 2.4(健全性あり)", "len": 171}, {"t": "フカボリ › 9. チーム（チーム編成と人材）", "u": "fukabori.html#fk-q9_team", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 役割・ポジション: 例)現在の体制:代表1名(営業・管理) / 製造技術者3名 / 事務1名(パート)= 合計5名体制 不足・ギャップ: 例)必要な追加人材:Webマーケティング担当1名 / 品質管理専任1名 / 若手技術者2名(将来の技術継承のため)", "len": 99}, {"t": "フカボリ › 10. 必要資金（初期投資と運営費）", "u": "fukabori.html#fk-q10_budget", "x": "設問に対し最小3行の具体(数値または固有名詞を1つ以上) 初期投資(CAPEX): 例)初期投資:新規設備導入800万円(ものづくり補助金で半額) / 品質管理システム200万円 / Webサイト・システム開発100万円 = 合計1,100万円 運営費(OPEX): 例)月次運営費:人件費250万円 / 設備償却・保守60万円 / 材料費(売上の40%)160万円 / その他30万円 = 合計500万円/月(売上400万円では赤字のため受注拡大が急務)", "len": 153}]};
@@ -0,0 +1,118 @@
+// サイト内検索（search.html）。索引は build.py が作る: 文書一覧 search-docs.js と、bigramの分片 search-<n>.js。
+// 読むのは文書一覧と、問い合わせに出るbigramの分片だけ（分け方・正規化は build.py の search_shard/_norm と同じ）
+(function(){
+  var root = document.getElementById('search');
+  var form = root.querySelector('form');
+  var input = form.querySelector('input[name="q"]');
+  var stat = document.getElementById('search-stat');
+  var list = document.getElementById('search-results');
+  var docsSrc = root.getAttribute('data-docs-src');
+  var shardSrc = root.getAttribute('data-shard-src').split(' ');
+  var SD = function(){ return window.SHINSEIDER_DATA || {}; };
+  var WORD = /[\p{L}\p{N}]/u;
+
+  function norm(s){ return s.normalize('NFKC').toLowerCase().split(/\s+/).filter(Boolean).join(' '); }
+  function bigrams(t){
+    var out = [], run = [];
+    Array.from(t + ' ').forEach(function(ch){
+      if (WORD.test(ch)) { run.push(ch); return; }
+      for (var i = 0; i + 1 < run.length; i++) out.push(run[i] + run[i + 1]);
+      run = [];
+    });
+    return out.filter(function(b, i){ return out.indexOf(b) === i; });
+  }
+  function shardOf(bg){
+    var cs = Array.from(bg);
+    return (cs[0].codePointAt(0) * 31 + cs[1].codePointAt(0)) % shardSrc.length;
+  }
+
+  // BM25（k1=1.2, b=0.75）。全bigramを含む文書を先に出し、1件もなければ一部一致を出す
+  function rank(qb){
+    var D = SD().search_docs, score = {}, hit = {};
+    qb.forEach(function(bg){
+      var post = (SD()['search_' + shardOf(bg)] || {})[bg];
+      if (!post) return;
+      var df = post.length / 2, idf = Math.log(1 + (D.n - df + 0.5) / (df + 0.5));
+      for (var i = 0, d = 0; i < post.length; i += 2) {
+        d += post[i];
+        var tf = post[i + 1], k = 1.2 * (0.25 + 0.75 * D.docs[d].len / D.avglen);
+        score[d] = (score[d] || 0) + idf * tf * 2.2 / (tf + k);
+        hit[d] = (hit[d] || 0) + 1;
+      }
+    });
+    var ids = Object.keys(score).map(Number);
+    var full = ids.filter(function(d){ return hit[d] === qb.length; });
+    var pool = full.length ? full : ids;
+    pool.sort(function(a, b){ return score[b] - score[a]; });
+    return {ids: pool, partial: !full.length};
+  }
+
+  function esc(s){ return s.replace(/[&<>"]/g, function(c){ return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]; }); }
+  // 問い合わせの語（なければbigram）に当たる所を<mark>で囲む
+  function highlight(text, needles){
+    var low = text.toLowerCase(), marks = [];
+    needles.forEach(function(n){
+      for (var i = low.indexOf(n); i !== -1; i = low.indexOf(n, i + 1)) marks.push([i, i + n.length]);
+    });
+    marks.sort(function(a, b){ return a[0] - b[0]; });
+    var html = '', at = 0;
+    marks.forEach(function(m){
+      if (m[1] <= at) return;
+      var s = Math.max(m[0], at);
+      html += esc(text.slice(at, s)) + '<mark>' + esc(text.slice(s, m[1])) + '</mark>';
+      at = m[1];
+    });
+    return html + esc(text.slice(at));
+  }
+  function snippet(text, needles){
+    var low = text.toLowerCase(), pos = -1;
+    needles.some(function(n){ pos = low.indexOf(n); return pos !== -1; });
+    var start = Math.max(0, pos - 30);
+    var piece = text.slice(start, start + 120);
+    return (start > 0 ? '…' : '') + highlight(piece, needles) + (start + 120 < text.length ? '…' : '');
+  }
+
+  var seq = 0;
+  function run(q){
+    var my = ++seq, t0 = performance.now();
+    var nq = norm(q), qb = bigrams(nq);
+    list.innerHTML = '';
+    if (!nq) { stat.textContent = ''; return; }
+    if (!qb.length) { stat.textContent = '2文字以上で探してください。'; return; }
+    var need = qb.map(shardOf).filter(function(s, i, a){ return a.indexOf(s) === i; });
+    Promise.all([loadDataScript(docsSrc)].concat(need.map(function(s){ return loadDataScript(shardSrc[s]); }))).then(function(){
+      if (my !== seq) return;  // 打ち続けている間の古い問い合わせは捨てる
+      var r = rank(qb), D = SD().search_docs;
+      var words = nq.split(' ').filter(function(w){ return w.length >= 2; });
+      var needles = words.concat(qb);
+      r.ids.slice(0, 30).forEach(function(d){
+        var doc = D.docs[d], li = document.createElement('li');
+        li.innerHTML = '<a href="' + esc(doc.u) + '">' + highlight(doc.t, needles) + '</a>' +
+          '<p class="muted">' + snippet(doc.x, needles) + '</p>';
+        list.appendChild(li);
+      });
+      var ms = Math.max(1, Math.round(performance.now() - t0));
+      stat.textContent = r.ids.length
+        ? r.ids.length + '件' + (r.partial ? '（一部だけ一致）' : '') + ' ・ ' + ms + 'ms'
+        : '見つかりませんでした。言い換えるか、語を短くしてみてください。';
+    }).catch(function(){
+      stat.textContent = '索引を読み込めませんでした。通信を確認して、もう一度お試しください。';
+    });
+  }
+
+  var timer = null;
+  input.addEventListener('input', function(){
+    clearTimeout(timer);
+    timer = setTimeout(function(){ run(input.value); }, 120);
+  });
+  // 入力欄に触れた時点で文書一覧を読み始める（最初の1文字目から待たせない）
+  input.addEventListener('focus', function(){ loadDataScript(docsSrc).catch(function(){}); });
+  form.addEventListener('submit', function(e){
+    e.preventDefault();
+    clearTimeout(timer);
+    try { history.replaceState(null, '', '?q=' + encodeURIComponent(input.value)); } catch(_) {}
+    run(input.value);
+  });
+  var q0 = new URLSearchParams(location.search).get('q');
+  if (q0) { input.value = q0; run(q0); }
+})();
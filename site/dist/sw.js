@@ -0,0 +1,122 @@
+var PRECACHE = {
+ "about.html": "a81565200e",
+ "ambassadors.html": "97212ad3bf",
+ "check.html": "fc10496462",
+ "cool.html": "537ad1bf89",
+ "entry.html": "987cf7a4ee",
+ "favicon.ico": "ac1b27283b",
+ "fukabori.html": "5afc5d1507",
+ "index.html": "7353fb5d2f",
+ "news.html": "08f1a5adcb",
+ "policy.html": "34afd728d8",
+ "schedule.html": "526b615c19",
+ "search.html": "4642582bba",
+ "static/favicon.png": "ac1b27283b",
+ "static/japan-blocks.svg": "48667b3af0",
+ "static/js/cal-2026-08.2c3f3976ff.js": "2c3f3976ff",
+ "static/js/cal-2026-09.15531e58d4.js": "15531e58d4",
+ "static/js/cal-2026-10.5c64ae3785.js": "5c64ae3785",
+ "static/js/cal-2026-11.550114088c.js": "550114088c",
+ "static/js/cal-2026-12.e7d09e4ca9.js": "e7d09e4ca9",
+ "static/js/cal-2027-01.de4bae8bde.js": "de4bae8bde",
+ "static/js/cal-2027-02.cc53fd1647.js": "cc53fd1647",
+ "static/js/calendar.7f8319e851.js": "7f8319e851",
+ "static/js/check-data.52fb393f25.js": "52fb393f25",
+ "static/js/checkform.8f543f9c5f.js": "8f543f9c5f",
+ "static/js/common.665411b54a.js": "665411b54a",
+ "static/js/entry-data.2114d2ae8a.js": "2114d2ae8a",
+ "static/js/entry.11546086b7.js": "11546086b7",
+ "static/js/fukabori-ch1.6ffe42f759.js": "6ffe42f759",
+ "static/js/fukabori-ch2.c84f45df63.js": "c84f45df63",
+ "static/js/fukabori-ch3.f825d87a4f.js": "f825d87a4f",
+ "static/js/fukabori-ch4.f5ef89e420.js": "f5ef89e420",
+ "static/js/fukabori-critique.9e7c7a4043.js": "9e7c7a4043",
+ "static/js/fukabori.41f8ffd3f8.js": "41f8ffd3f8",
+ "static/js/pace-data.42a25f0aab.js": "42a25f0aab",
+ "static/js/pace.bd9872cfd7.js": "bd9872cfd7",
+ "static/js/project.fbdd0b4878.js": "fbdd0b4878",
+ "static/js/search-0.0af8dcefc9.js": "0af8dcefc9",
+ "static/js/search-1.d3ceb2f395.js": "d3ceb2f395",
+ "static/js/search-10.67aa8791ff.js": "67aa8791ff",
+ "static/js/search-11.7482de7e2d.js": "7482de7e2d",
+ "static/js/search-12.b558372bc8.js": "b558372bc8",
+ "static/js/search-13.2fc526c410.js": "2fc526c410",
+ "static/js/search-14.524906465c.js": "524906465c",
+ "static/js/search-15.b16c7a9827.js": "b16c7a9827",
+ "static/js/search-2.b335d25714.js": "b335d25714",
+ "static/js/search-3.5f6e8307b3.js": "5f6e8307b3",
+ "static/js/search-4.803892e0ee.js": "803892e0ee",
+ "static/js/search-5.b990bb2ff8.js": "b990bb2ff8",
+ "static/js/search-6.e78a59e787.js": "e78a59e787",
+ "static/js/search-7.c47f1415df.js": "c47f1415df",
+ "static/js/search-8.6f7e24d882.js": "6f7e24d882",
+ "static/js/search-9.8c339e2e1d.js": "8c339e2e1d",
+ "static/js/search-docs.15260c048c.js": "15260c048c",
+ "static/js/search.9fc3e9b191.js": "9fc3e9b191",
+ "static/logo.png": "e6d407961e",
+ "static/style.css": "932f9f1fcc",
+ "subsidy.html": "c898a2608e",
+ "trust.html": "f8e3ef13c7",
+ "workspace.html": "faa127e29e"
+};
+// service worker。build.py が先頭に PRECACHE（distの相対パス → 中身のハッシュ）を差し込んで dist/sw.js に書く。
+// - 事前キャッシュ: ハッシュが変わったもの・まだ持っていないものだけ取り直す。一覧から消えたものは捨てる
+// - ページ: キャッシュから即返し、裏で取り直して次に備える（電波の弱い場所でも即表示、圏外でも開ける）
+// - 指紋付きの static/js/: 名前が同じなら中身も同じなので、持っていればそのまま返す
+var CACHE = 'shinseider';
+var BASE = self.registration.scope;  // 相対パスはここから解決する（サブパス配信でも動くように）
+var MANIFEST_KEY = BASE + '__precache-manifest';
+
+function abs(path){ return new URL(path, BASE).href; }
+
+self.addEventListener('install', function(e){
+  e.waitUntil(caches.open(CACHE).then(function(cache){
+    return cache.match(MANIFEST_KEY).then(function(r){ return r ? r.json() : {}; }).then(function(old){
+      var next = {};
+      return Promise.all(Object.keys(PRECACHE).map(function(path){
+        var url = abs(path);
+        return cache.match(url).then(function(hit){
+          if (hit && old[path] === PRECACHE[path]) { next[path] = PRECACHE[path]; return; }
+          return fetch(url, {cache: 'reload'}).then(function(res){
+            if (!res.ok) return;
+            next[path] = PRECACHE[path];
+            return cache.put(url, res);
+          }).catch(function(){});  // 取れなかったものは次の更新で取り直す（インストール自体は止めない）
+        });
+      })).then(function(){
+        return cache.put(MANIFEST_KEY, new Response(JSON.stringify(next)));
+      });
+    });
+  }).then(function(){ return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function(e){
+  var keep = {};
+  Object.keys(PRECACHE).forEach(function(path){ keep[abs(path)] = true; });
+  keep[MANIFEST_KEY] = true;
+  e.waitUntil(caches.open(CACHE).then(function(cache){
+    return cache.keys().then(function(reqs){
+      return Promise.all(reqs.filter(function(r){ return !keep[r.url]; }).map(function(r){ return cache.delete(r); }));
+    });
+  }).then(function(){ return self.clients.claim(); }));
+});
+
+self.addEventListener('fetch', function(e){
+  var req = e.request;
+  if (req.method !== 'GET' || req.url.indexOf(BASE) !== 0) return;
+  var url = req.url.split('#')[0].split('?')[0];
+  if (url === BASE) url = abs('index.html');
+  if (!(url.slice(BASE.length) in PRECACHE)) return;  // 一覧にないもの（ics・外部計測など）は素通し
+  e.respondWith(caches.open(CACHE).then(function(cache){
+    return cache.match(url).then(function(hit){
+      if (hit && url.indexOf(abs('static/js/')) === 0) return hit;
+      var update = fetch(req).then(function(res){
+        if (res.ok) return cache.put(url, res.clone()).then(function(){ return res; });
+        return res;
+      });
+      if (!hit) return update;
+      e.waitUntil(update.catch(function(){}));
+      return hit;
+    });
+  }));
+});
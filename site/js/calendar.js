@@ -0,0 +1,55 @@
+// 「動き」ページの月グリッド（news.html）。月ごとの断片 cal-YYYY-MM.js は build.py が作る。
+// ページに入っているのはビルド日の月だけ。ほかの月は、めくったとき（と初期表示の今日の月）に読み込む
+(function(){
+  var wrap = document.getElementById('calwrap');
+  if (!wrap) return;
+  var box = document.getElementById('cal-months');
+  var title = document.getElementById('cal-title');
+  var prev = document.getElementById('cal-prev'), next = document.getElementById('cal-next');
+  var months = wrap.getAttribute('data-months').split(' ').map(function(pair){
+    var i = pair.indexOf('=');
+    return {ym: pair.slice(0, i), src: pair.slice(i + 1)};
+  });
+  if (!months.length) return;
+
+  var today = new Date();
+  var ym = today.getFullYear() + '-' + String(today.getMonth() + 1).padStart(2, '0');
+  var iso = ym + '-' + String(today.getDate()).padStart(2, '0');
+
+  function grid(m){ return box.querySelector('.calgrid[data-ym="' + m.ym + '"]'); }
+  function data(m){ return (window.SHINSEIDER_DATA || {})['cal_' + m.ym.replace('-', '_')]; }
+  // 断片を読んで差し込む（差し込み済み・読み込み済みならそのまま）
+  function ensure(m){
+    if (grid(m)) return Promise.resolve(grid(m));
+    return (data(m) ? Promise.resolve() : loadDataScript(m.src)).then(function(){
+      if (!grid(m)) box.insertAdjacentHTML('beforeend', data(m));
+      var cell = grid(m).querySelector('td[data-iso="' + iso + '"]');
+      if (cell) cell.classList.add('today');
+      return grid(m);
+    });
+  }
+
+  var idx = months.findIndex(function(m){ return m.ym === ym; });
+  if (idx === -1) idx = (ym < months[0].ym) ? 0 : months.length - 1;
+  var seq = 0;
+  function show(i){
+    var my = ++seq;
+    idx = Math.max(0, Math.min(months.length - 1, i));
+    var m = months[idx];
+    title.textContent = m.ym.slice(0, 4) + '年' + (+m.ym.slice(5)) + '月';
+    prev.disabled = (idx === 0);
+    next.disabled = (idx === months.length - 1);
+    ensure(m).then(function(g){
+      if (my !== seq) return;  // 連打したときは最後にめくった月だけ出す
+      box.querySelectorAll('.calgrid').forEach(function(t){ t.hidden = (t !== g); });
+      // 隣の月は先に読んでおく（めくった瞬間に出るように）
+      [idx - 1, idx + 1].forEach(function(j){ if (months[j]) ensure(months[j]).catch(function(){}); });
+    }).catch(function(){
+      if (my === seq) title.textContent += '（読み込めませんでした。通信を確認してください）';
+    });
+  }
+  prev.addEventListener('click', function(){ show(idx - 1); });
+  next.addEventListener('click', function(){ show(idx + 1); });
+  box.querySelectorAll('td[data-iso="' + iso + '"]').forEach(function(td){ td.classList.add('today'); });
+  show(idx);
+})();
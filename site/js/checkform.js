@@ -0,0 +1,47 @@
+// 適合チェックのフォーム（_checkform.html）。判定に使う締切・要件は check-data.js（YAML由来）から読む。回答の保存先は project.js の CHECK_KEY
+document.getElementById('check-form').addEventListener('submit', function(e){
+  e.preventDefault();
+  var f = new FormData(e.target);
+  var age = f.get('q_age'), pos = f.get('q_pos'), sme = f.get('q_sme'), succ = f.get('q_succ');
+  var data = window.SHINSEIDER_DATA.check;
+  // JSTの暦日で数える（プレビュー等、base外で動く場合に備えて自前定義）
+  var jd = function(x){ return new Date(new Date(x).toLocaleDateString('en-US', {timeZone: 'Asia/Tokyo'})); };
+  var days = Math.max(0, Math.round((jd(data.entry_deadline) - jd(Date.now())) / 86400000));
+  // 締切時刻（18:00）を過ぎたら「間に合う」系の文言を一切出さない
+  var closed = Date.now() > new Date(data.entry_deadline).getTime();
+  var html = '';
+  var koshienOK = (age === 'yes') && (pos === 'yes' || pos === 'alt') && (sme !== 'no');
+  if (koshienOK) {
+    if (sme === 'yes') {
+      html += '<h2>アトツギ甲子園：エントリー資格を満たしています</h2>';
+    } else {
+      html += '<h2>アトツギ甲子園：エントリー資格に適合の見込み</h2>' +
+        '<p>年齢と立場は要件に合っています。残る確認は、家業が中小企業の定義にあてはまるかどうかです。「アトツギ甲子園の出場を検討している」と切り出せば、現在の代表に会社のことを聞く良い機会になります。</p>' +
+        '<p class="muted">目安（中小企業基本法）: 製造業・建設業・運輸業などは資本金3億円以下または従業員300人以下、卸売業は1億円以下または100人以下、サービス業は5,000万円以下または100人以下、小売業は5,000万円以下または50人以下。</p>';
+    }
+    if (closed) {
+      var docsOpen = data.docs_deadline && Date.now() <= new Date(data.docs_deadline).getTime();
+      html += '<p>' + (docsOpen ? data.closed_message_docs : data.closed_message) + '</p>';
+    } else {
+      var pb = (data.pace_buckets || []).find(function(x){ return days >= x.min_days; });
+      html += '<p>エントリー締切（' + mdhm(data.entry_deadline) + '）まで<strong>' + (days > 0 ? 'あと' + days + '日' : '本日' + data.entry_deadline.slice(11, 16) + 'まで') + '</strong>。' + (pb ? pb.message : '') + '</p>' +
+        '<p>次の一歩は: <a href="entry.html">申請書の準備を始める</a>（30分〜）</p>';
+    }
+  } else {
+    html += '<h2>アトツギ甲子園：資格要件に合わない可能性</h2><p>年齢・立場・企業規模の要件は公式のエントリー要領で必ず確認してください（例外や詳細条件があります）。</p>';
+  }
+  if (succ === 'yes') {
+    html += '<h3>補助金の見立て：主要な入口要件を満たしそうです</h3><p>次の一歩は、認定支援機関（顧問税理士→金融機関→商工会議所の順で相談）と投資内容の具体化。<a href="subsidy.html">要件の全リスト→</a></p>';
+  } else if (succ === 'maybe') {
+    html += '<h3>いちばん重い一歩は、書類ではなく対話かもしれません</h3><p>この補助金は「5年以内の承継」を決めないと使えません。アトツギ甲子園への挑戦は、現経営者とその話を始めるきっかけと締切になってくれます。</p>';
+  } else if (succ === 'no') {
+    html += '<h3>補助金の見立て：この枠は対象外の見込み</h3><p>承継予定があることが前提の制度のためです。甲子園への挑戦や、他の制度の検討とは別の話です。</p>';
+  } else {
+    html += '<p class="muted">補助金の見立て（任意のQ3）は、未回答のままで大丈夫です。気になったときに準備室でいつでも確認できます。</p>';
+  }
+  html += '<p>結果はあなたのブラウザ上に保存済みです。<a href="workspace.html">進み具合のページで全体を見る →</a></p>';
+  html += '<p class="muted">※この判定は簡易チェックです。適用可否は各制度の公募要領原文が常に優先します。</p>';
+  var r = document.getElementById('result');
+  r.innerHTML = html; r.hidden = false; r.scrollIntoView({behavior:'smooth'});
+  try { localStorage.setItem(CHECK_KEY, JSON.stringify({age:age,pos:pos,sme:sme,succ:succ,ts:new Date().toISOString()})); } catch(_) {}
+});
@@ -0,0 +1,45 @@
+// 全ページ共通（base.html）: ヘッダーの締切チップとservice workerの登録。daysLeftJst/entryClosed はページ側のスクリプトからも使う
+// 残り日数はJSTの暦日で数える（時刻での切り上げだと1日多く出る）
+function daysLeftJst(v){
+  var f = function(x){ return new Date(new Date(x).toLocaleDateString('en-US', {timeZone: 'Asia/Tokyo'})); };
+  return Math.round((f(v) - f(Date.now())) / 86400000);
+}
+// 締切時刻（ISOに+09:00と18:00を含む）を過ぎたかの厳密判定
+function entryClosed(v){ return Date.now() > new Date(v).getTime(); }
+// 締切の表記（ISOの "2026-11-25T18:00:00+09:00" → "11/25 18:00"）。日時は元データの時差のまま読む
+function mdhm(v){ return +v.slice(5, 7) + '/' + +v.slice(8, 10) + ' ' + v.slice(11, 16); }
+document.querySelectorAll('.days-left').forEach(function(el){
+  var v = el.getAttribute('data-deadline');
+  if (entryClosed(v)) {
+    var wrap = el.closest('.days-chip, .deadline-line');
+    var docs = el.getAttribute('data-docs-deadline');
+    if (wrap) {
+      wrap.textContent = (docs && !entryClosed(docs)) ? '書類提出は' + mdhm(docs) + 'まで' : el.getAttribute('data-season') + 'の受付は終了しました';
+    } else { el.textContent = '0'; }
+  } else {
+    el.textContent = Math.max(0, daysLeftJst(v));
+  }
+});
+// 必要になってから読むデータスクリプト（フカボリの章の指示文・検索の索引）。同じsrcは1回だけ読む。
+// fetchでなく<script>にしているのは、file://（test_site.py）でも動かすため
+var _dataScripts = {};
+function loadDataScript(src){
+  // 1ファイルのプレビュー（preview.py）は後から読むデータを圧縮して埋めて持つ（検索の索引はその場で作る）。
+  // そのsrcは読みに行かずに展開を待つ
+  var embedded = (window.SHINSEIDER_EMBEDDED || {})[src];
+  if (embedded) return embedded;
+  if (!_dataScripts[src]) {
+    _dataScripts[src] = new Promise(function(resolve, reject){
+      var sc = document.createElement('script');
+      sc.src = src;
+      sc.onload = resolve;
+      sc.onerror = function(){ delete _dataScripts[src]; sc.remove(); reject(new Error('load failed: ' + src)); };
+      document.head.appendChild(sc);
+    });
+  }
+  return _dataScripts[src];
+}
+// オフライン・再訪の即表示（sw.js）。https配信のときだけ登録する（file://のテストやlocalhostの開発サーバーでは古い版を掴まないように）
+if ('serviceWorker' in navigator && location.protocol === 'https:') {
+  window.addEventListener('load', function(){ navigator.serviceWorker.register('sw.js').catch(function(){}); });
+}
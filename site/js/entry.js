@@ -0,0 +1,216 @@
+// 申請書の準備（entry.html）。指示文・検証条件は entry-data.js、保存は project.js
+(function(){
+  var DATA = window.SHINSEIDER_DATA.entry;
+  var project = loadProject();
+  function save(p){ saveProject(p, 'save-msg'); }
+
+  // ---- 骨子セクションの描画・検証 ----
+  function validateSection(text){
+    var msgs = [];
+    var t = (text || '').trim();
+    if (!t) return {status: '未入力', msgs: []};
+    if (t.length < DATA.validation.min_chars) msgs.push('少し短いかもしれません（' + t.length + '字）');
+    if (DATA.validation.want_numbers && !/[0-9０-９]/.test(t)) msgs.push('数字がひとつ入ると具体的になります');
+    return {status: msgs.length ? '要確認' : 'OK', msgs: msgs};
+  }
+  function refresh(){
+    var filled = 0;
+    document.querySelectorAll('.entry-section').forEach(function(box){
+      var id = box.getAttribute('data-id');
+      var ta = box.querySelector('.sec-text');
+      var text = project.entry.sections[id] || '';
+      if (ta.value !== text) ta.value = text;
+      var v = validateSection(text);
+      if (v.status !== '未入力') filled++;
+      box.querySelector('.sec-status').textContent = '— ' + v.status;
+      box.querySelector('.sec-hints').textContent = v.msgs.join(' ／ ');
+    });
+    document.querySelectorAll('#entry-checklist input').forEach(function(cb){
+      cb.checked = !!project.entry.checklist[cb.getAttribute('data-i')];
+    });
+    return filled;
+  }
+
+  document.querySelectorAll('.entry-section .sec-text').forEach(function(ta){
+    ta.addEventListener('input', function(){
+      var id = ta.closest('.entry-section').getAttribute('data-id');
+      project.entry.sections[id] = ta.value;
+      save(project); refresh();
+    });
+  });
+  document.querySelectorAll('#entry-checklist input').forEach(function(cb){
+    cb.addEventListener('change', function(){
+      project.entry.checklist[cb.getAttribute('data-i')] = cb.checked;
+      save(project);
+    });
+  });
+
+  // ---- プロンプトコピー ----
+  document.getElementById('copy-prompt').addEventListener('click', function(){
+    navigator.clipboard.writeText(DATA.prompt).then(function(){
+      document.getElementById('copy-prompt').textContent = 'コピーしました';
+      setTimeout(function(){ document.getElementById('copy-prompt').textContent = '指示文をコピー'; }, 1800);
+    });
+  });
+  // MCPセットアップ指示文: 指示書(md)はAIが取得して読む。実行/案内のモード判定は指示書側に書いてある
+  var mcpBtn = document.getElementById('mcp-setup-copy');
+  if (mcpBtn) mcpBtn.addEventListener('click', function(){
+    var text = 'シンセイダーMCPのセットアップをお願いします。まず https://shinseider.onrender.com/mcp-setup.md を取得して、その指示書に従ってください。あなたがシェルコマンドを実行できる環境なら実行モードで、できないなら案内モード（1コマンドずつ提示して、私の貼る出力を確認しながら）で進めてください。';
+    navigator.clipboard.writeText(text).then(function(){
+      mcpBtn.textContent = 'コピーしました — AIに貼り付けてください';
+      setTimeout(function(){ mcpBtn.textContent = 'AI用セットアップ指示文をコピー'; }, 2400);
+    });
+  });
+  // AIを開く: prefill = 指示文入りURL（?q=）で開く / copy_open = コピーして開き貼り付けてもらう
+  // どちらもクリップボードには入れておく（prefillはAI側の仕様変更に備えた保険）
+  // 注意: window.openはクリック処理の同期部分で呼ぶこと（非同期後はポップアップブロックされる）
+  document.querySelectorAll('.ai-card[data-open]').forEach(function(btn){
+    btn.addEventListener('click', function(){
+      var url = btn.getAttribute('data-open');
+      var prefill = btn.getAttribute('data-mode') === 'prefill';
+      var note = btn.querySelector('.ai-note');
+      var orig = note ? note.textContent : '';
+      // コピーはwindow.openより先に開始する（開いた後だとフォーカスが移って失敗する）
+      var copied = navigator.clipboard.writeText(DATA.prompt);
+      window.open(url, '_blank', 'noopener');
+      copied.then(function(){
+        if (note) {
+          note.textContent = prefill ? '開きました — そのまま送信できます' : 'コピーしました — 開いた画面に貼り付けて送信';
+          setTimeout(function(){ note.textContent = orig; }, 5000);
+        }
+      }).catch(function(){
+        if (prefill) return;
+        if (note) note.textContent = 'コピーできませんでした — 下の「指示文の全文」からコピーしてください';
+        var d = document.getElementById('prompt-view');
+        if (d) d.open = true;
+      });
+    });
+  });
+
+  // ---- 予行審査: 骨子を審査員プロンプトに差し込んでコピー ----
+  function buildReviewPrompt(msgEl){
+    var draft = '';
+    DATA.sections.forEach(function(s){
+      var t = (project.entry.sections[s.id] || '').trim();
+      if (t) draft += '## ' + s.title + '\n' + t + '\n\n';
+    });
+    if (!draft) {
+      msgEl.textContent = '骨子がまだ空です。まず上の「つくる」で骨子を作ってから戻ってきてください。';
+      return null;
+    }
+    return DATA.review_prompt.replace('{draft}', draft);
+  }
+  document.querySelectorAll('.review-panel .ai-chip[data-home]').forEach(function(btn){
+    btn.addEventListener('click', function(){
+      var msgEl = document.getElementById('review-msg');
+      var prompt = buildReviewPrompt(msgEl);
+      if (!prompt) return;
+      var qbase = btn.getAttribute('data-qbase');
+      var url = qbase ? qbase + encodeURIComponent(prompt) : null;
+      // コピーはwindow.openより先に開始する（開いた後だとフォーカスが移って失敗する）
+      var copied = navigator.clipboard.writeText(prompt);
+      // 長すぎるURLはAI側で受け取れないことがあるので、その場合はコピー方式に切り替える
+      if (url && url.length <= 8000) {
+        window.open(url, '_blank', 'noopener');
+        copied.catch(function(){});
+        msgEl.textContent = btn.getAttribute('data-name') + 'が骨子入りの指示文が入力された状態で開きます。そのまま送信してください。';
+        return;
+      }
+      // 長い骨子はmdファイルで渡す（フカボリと同じ方式。コピーも保険で済み）
+      copied.catch(function(){});
+      var fname = 'yokoshinsa_' + fileStamp() + '.md';
+      var file = new File([prompt], fname, {type: 'text/markdown'});
+      if (navigator.canShare && navigator.canShare({files: [file]})) {
+        navigator.share({files: [file], title: '予行審査の指示文'}).then(function(){
+          msgEl.textContent = '共有先でAIのアプリを選ぶと、骨子入りの指示文ファイルごと渡せます。';
+        }).catch(function(){
+          msgEl.textContent = '共有を中止しました。もう一度押すか、「コピーだけ」を試してください。';
+        });
+        return;
+      }
+      downloadText(fname, prompt, 'text/markdown');
+      var helper = '※案内: 骨子入りの審査指示文ファイル「' + fname + '」がいまダウンロードされました。この案内文を消して、ファイルを添付（この画面にドラッグ）して送信してください。コピーもされているので、貼り付け（Cmd+V）でも構いません。もしこの案内文のまま送信された場合は「指示文ファイルを添付するか、コピーされている指示文を貼り付けてください」とだけ返答してください。';
+      window.open(qbase ? qbase + encodeURIComponent(helper) : btn.getAttribute('data-home'), '_blank', 'noopener');
+      msgEl.textContent = '指示文ファイル（' + fname + '）を保存し、コピーもしました。開いた' + btn.getAttribute('data-name') + 'にファイルをドラッグするか、貼り付けて送信してください。';
+    });
+  });
+  document.getElementById('copy-review').addEventListener('click', function(){
+    var msgEl = document.getElementById('review-msg');
+    var prompt = buildReviewPrompt(msgEl);
+    if (!prompt) return;
+    navigator.clipboard.writeText(prompt).then(function(){
+      msgEl.textContent = 'コピーしました。AIに貼り付けてください（新しい会話がおすすめです）。';
+    }).catch(function(){
+      msgEl.textContent = 'コピーできませんでした。';
+    });
+  });
+  var rn = document.getElementById('review-notes');
+  rn.value = project.entry.review_notes || '';
+  rn.addEventListener('input', function(){
+    project.entry.review_notes = rn.value;
+    save(project);
+  });
+
+  // ---- 貼り戻しパーサ（## 見出しベース） ----
+  document.getElementById('import-btn').addEventListener('click', function(){
+    var raw = document.getElementById('paste-area').value;
+    var msg = document.getElementById('import-msg');
+    if (!raw.trim()) { msg.textContent = '貼り付け欄が空です。'; return; }
+    var parts = raw.split(/^##\s*/m).filter(function(x){ return x.trim(); });
+    var got = 0, unknown = [];
+    parts.forEach(function(part){
+      var nl = part.indexOf('\n');
+      var head = (nl === -1 ? part : part.slice(0, nl)).trim();
+      var body = (nl === -1 ? '' : part.slice(nl + 1)).trim();
+      var hit = DATA.sections.find(function(s){
+        return head === s.title || head.indexOf(s.title) !== -1 || s.title.indexOf(head) !== -1;
+      });
+      if (hit && body) { project.entry.sections[hit.id] = body; got++; }
+      else if (head) { unknown.push(head); }
+    });
+    save(project);
+    var filled = refresh();
+    var missing = DATA.sections.length - filled;
+    msg.textContent = got + '件の見出しを取り込みました。'
+      + (missing > 0 ? ' 未入力が' + missing + '件あります。' : ' 5つそろいました。')
+      + (unknown.length ? ' 対応しない見出し: ' + unknown.join('、') : '');
+    if (got > 0) {
+      var next = document.createElement('a');
+      next.href = '#rehearsal';
+      next.textContent = '次は、予行審査で指摘をもらう →';
+      msg.appendChild(document.createTextNode(' '));
+      msg.appendChild(next);
+    }
+  });
+
+  // ---- 出力（控え = 読める下書き + 末尾にセーブデータ） ----
+  document.getElementById('dl-md').addEventListener('click', function(){
+    var md = '# アトツギ甲子園 申請書の準備 控え\n\n';
+    DATA.sections.forEach(function(s){
+      md += '## ' + s.title + '\n\n' + (project.entry.sections[s.id] || '（未入力）') + '\n\n';
+    });
+    md += '---\n作成: シンセイダー（下書き支援）／エントリーは公式サイトから。公募要領・エントリー要領の原文が常に優先します。\n';
+    md += hikaeSaveData(project);
+    downloadText('shinseider_hikae_' + fileStamp() + '.md', md, 'text/markdown');
+  });
+  document.getElementById('up-project').addEventListener('change', function(e){
+    var file = e.target.files[0]; if (!file) return;
+    var reader = new FileReader();
+    reader.onload = function(){
+      var d = null;
+      try { d = JSON.parse(reader.result); } catch(_) {
+        var m = String(reader.result).match(/```json\s*([\s\S]*?)```/);
+        if (m) { try { d = JSON.parse(m[1].trim()); } catch(_) {} }
+      }
+      var msg = document.getElementById('save-msg');
+      if (!restoreHikae(project, d)) { msg.textContent = '読み込めませんでした。「控えを保存」で作ったファイルを選んでください。'; return; }
+      save(project); refresh();
+      var rn2 = document.getElementById('review-notes');
+      if (rn2) rn2.value = project.entry.review_notes || '';
+      msg.textContent = '控えを読み込みました。';
+    };
+    reader.readAsText(file);
+  });
+
+  refresh();
+})();
@@ -0,0 +1,57 @@
+// 逆算プラン（_pace.html）。締切と文言は pace-data.js（YAML由来）から読む
+(function(){
+  /* 同一ページ内・プレビュー結合時に複数の.paceが並んでも、
+     各スクリプトは自分の属する.paceブロックだけを描画する（IDの一意性に依存しない） */
+  var self = document.currentScript;
+  var root = self && self.closest ? self.closest('.pace') : null;
+  if (!root || root.getAttribute('data-pace-done')) return;
+  root.setAttribute('data-pace-done', '1');
+  var D = window.SHINSEIDER_DATA.pace;
+  var now = new Date();
+  // JSTの暦日で数える（プレビュー等、base外で動く場合に備えて自前定義）
+  var jd = function(x){ return new Date(new Date(x).toLocaleDateString('en-US', {timeZone: 'Asia/Tokyo'})); };
+  var days = Math.round((jd(D.entry_deadline) - jd(now)) / 86400000);
+  var msgEl = root.querySelector('.pace-message');
+  if (!msgEl) return;
+  if (days < 0 || Date.now() > new Date(D.entry_deadline).getTime()) {
+    var docsOpen = D.docs_deadline && Date.now() <= new Date(D.docs_deadline).getTime();
+    msgEl.textContent = docsOpen ? D.closed_message_docs : D.closed_message;
+    return;
+  }
+  var b = D.buckets.find(function(x){ return days >= x.min_days; });
+  msgEl.textContent = b ? b.message : '';
+
+  var wrap = root.querySelector('.pace-plan-wrap');
+  if (!wrap) return;
+  var target = new Date(D.submit_target + 'T23:59:00+09:00');
+  var dT = Math.max(1, Math.round((jd(target) - jd(now)) / 86400000));
+  function fmt(d){ return (d.getMonth() + 1) + '/' + d.getDate(); }
+  function plus(n){ var x = new Date(now); x.setDate(x.getDate() + n); return x; }
+  var entryLink = '<a href="entry.html">申請書の準備</a>';
+  var steps;
+  if (dT <= 3) {
+    steps = [
+      ['今日', 'AIとインタビューして骨子を作る（' + entryLink + '）'],
+      ['明日', '声に出して読み合わせ、現経営者に話す'],
+      [fmt(target) + 'まで', '公式サイトから送信（締切は' + mdhm(D.entry_deadline) + '）']
+    ];
+  } else {
+    var c1 = plus(Math.max(1, Math.round(dT * 0.15)));
+    var c2 = plus(Math.round(dT * 0.5));
+    var c3 = plus(Math.round(dT * 0.8));
+    steps = [
+      [fmt(c1) + 'まで', '現経営者と、承継の話を始める（いちばん重い一歩）'],
+      [fmt(c2) + 'まで', 'AIとインタビューして骨子を作る（' + entryLink + '）'],
+      [fmt(c3) + 'まで', '読み合わせて磨く。会社名でエントリーすることに合意をとる'],
+      [fmt(target) + 'まで', '公式サイトからエントリー（締切前日推奨）。書類は届くフォーマットで' + mdhm(D.docs_deadline) + 'までにPDF提出']
+    ];
+  }
+  var ol = root.querySelector('.pace-plan');
+  ol.innerHTML = '';
+  steps.forEach(function(s){
+    var li = document.createElement('li');
+    li.innerHTML = '<strong>' + s[0] + '</strong> ' + s[1];
+    ol.appendChild(li);
+  });
+  wrap.hidden = false;
+})();
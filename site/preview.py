@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 """全ページを1枚に束ねた自己完結プレビューHTMLを生成する（チャット/レビュー共有用）。
 本番のdistとは別物。ホスティング決定までの「URLの代わり」。
-各ページは実物のヘッダー込みで映す（プレビュー固有の部品は上部の黒い目次と赤いラベルだけ）。"""
+各ページは実物のヘッダー込みで映す（プレビュー固有の部品は上部の黒い目次と赤いラベルだけ）。
+
+チャットツールに添付して回すため、共有部品は1回だけ持つ:
+- ロゴはCSS変数のdata URI 1個（ヘッダー側は背景で参照）
+- ヘッダーは<template>1個を各節の小スクリプトが複製（現在地の.onだけ付け替え）
+- 複数ページに同じ形で出るスクリプトは1回だけ登録し、各所からは番号で実行
+- 後から読むデータ（月めくり・章の指示文）は gzip して埋め、要ったときに展開する
+- サイト内検索の索引は埋めない。初めて検索したときに、プレビュー自身のページから build.py と同じ分け方で作る
+最後に空白・コメントを詰め、サイズを予算（BUDGET_KB）と並べて表示する。超えたら止める。"""
 import base64
 import datetime as dt
+import gzip
+import json
 import re
+import struct
 import subprocess
 import sys
 from pathlib import Path
@@ -12,10 +23,16 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 DIST = ROOT / "site" / "dist"
 OUT = ROOT / "site" / "preview"
+BUDGET_KB = 360  # チャットツールに添付できる大きさの目安。超えたら共有部品の持ち方を見直す
+
+sys.path.insert(0, str(ROOT / "mcp"))
+sys.path.insert(0, str(ROOT / "site"))
+import build  # noqa: E402
+import model  # noqa: E402
 
 subprocess.run([sys.executable, str(ROOT / "site" / "build.py")], check=True, capture_output=True)
 
-deadline = dt.datetime(2026, 11, 25, 18, 0, tzinfo=dt.timezone(dt.timedelta(hours=9)))
+deadline = model.load(ROOT / "data").schedule.entry_end  # 今の回のエントリー締切（build.py と同じデータ）
 days = max(0, (deadline - dt.datetime.now(dt.timezone(dt.timedelta(hours=9)))).days + 1)
 
 sections = [
@@ -29,7 +46,9 @@ sections = [
     ("進み具合（試作）", "workspace.html"),
     ("イベント（日程と公式発表）", "news.html"),
     ("補助金詳細", "subsidy.html"),
+    ("国の狙い", "policy.html"),
     ("情報源", "trust.html"),
+    ("サイト内検索", "search.html"),
     ("運営者と方針", "about.html"),
 ]
 
@@ -41,7 +60,11 @@ if _missing:
     raise SystemExit(f"プレビュー未収載のページがある: {sorted(_missing)} — sectionsに追加すること")
 
 css = (DIST / "static" / "style.css").read_text(encoding="utf-8")
-logo64 = base64.b64encode((DIST / "static" / "logo.png").read_bytes()).decode()
+logo_png = (DIST / "static" / "logo.png").read_bytes()
+logo64 = base64.b64encode(logo_png).decode()
+_lw, _lh = struct.unpack(">II", logo_png[16:24])  # PNGのIHDR（幅・高さ）
+LOGO_TAG = '<span class="brand-logo pv-logo" role="img" aria-label="シンセイダー"></span>'
+NAV_ON = 'class="on" aria-current="page"'
 
 
 def to_anchors(s: str) -> str:
@@ -51,16 +74,99 @@ def to_anchors(s: str) -> str:
     return s
 
 
+def minify(s: str) -> str:
+    """空白とコメントを詰める。pre/textareaの中身とJSONは触らない。
+    JSは行頭の字下げと行コメントだけ落とす（文字列を壊す書き換えはしない）"""
+    keep = []
+
+    def stash(m):
+        keep.append(m.group(0))
+        return f"\0{len(keep) - 1}\0"
+
+    def js(m):
+        open_tag, body = m.group(1), m.group(2)
+        if "json" in open_tag:
+            return stash(m)
+        lines = [ln.strip() for ln in body.splitlines()]
+        body = "\n".join(ln for ln in lines if ln and not ln.startswith("//"))
+        keep.append(f"{open_tag}{body}</script>")
+        return f"\0{len(keep) - 1}\0"
+
+    def css(m):
+        body = re.sub(r"/\*.*?\*/", "", m.group(2), flags=re.S)
+        body = re.sub(r"\s*([{};:,>])\s*", r"\1", re.sub(r"\s+", " ", body)).replace(";}", "}")
+        keep.append(f"{m.group(1)}{body.strip()}</style>")
+        return f"\0{len(keep) - 1}\0"
+
+    s = re.sub(r"<(pre|textarea)\b.*?</\1>", stash, s, flags=re.S)
+    s = re.sub(r"(<script\b[^>]*>)(.*?)</script>", js, s, flags=re.S)
+    s = re.sub(r"(<style\b[^>]*>)(.*?)</style>", css, s, flags=re.S)
+    s = re.sub(r"<!--.*?-->", "", s, flags=re.S)
+    s = re.sub(r"\s*\n\s*", "\n", s)
+    s = re.sub(r"[ \t]{2,}", " ", s)
+    return re.sub(r"\0(\d+)\0", lambda m: keep[int(m.group(1))], s)
+
+
+def page_head(html: str) -> str:
+    """実物のヘッダー（ナビ・締切チップ込み）。ロゴはCSS参照に、リンクはアンカーに替える"""
+    head = re.search(r'<div class="site-head-wrap">.*?</header>\s*</div>', html, re.S).group(0)
+    head = re.sub(r'<img class="brand-logo"[^>]*>', LOGO_TAG, head)
+    head = re.sub(r'(class="days-left"[^>]*>)—</', rf"\g<1>{days}</", head)
+    return to_anchors(head)
+
+
+def inline_assets(html: str) -> str:
+    """共有スクリプト（dist/static/js の指紋付きファイル）を<script>に戻す。重複は下でまとめて1回にする"""
+    return re.sub(r'<script src="(static/js/[^"]+)"></script>',
+                  lambda m: "<script>" + (DIST / m.group(1)).read_text(encoding="utf-8") + "</script>", html)
+
+
+def packed(text: str, srcs: list, then: str = "") -> str:
+    """text を gzip + base64 の1本で埋め、srcs を window.SHINSEIDER_EMBEDDED に載せる（pvPack）。
+    common.js の loadDataScript はそこにある src を読みに行かず、初めて要ったときに展開した結果を待つ。
+    then は展開した文字列を受け取る関数名（省略時はデータスクリプトとして大域evalする）"""
+    b64 = base64.b64encode(gzip.compress(text.encode(), 9, mtime=0)).decode()
+    return f"<script>pvPack('{b64}',{json.dumps(srcs)}{',' + then if then else ''})</script>"
+
+
+def lazy_data(html: str) -> str:
+    """後から読むデータ（動きページの月めくり data-months、フカボリの章の指示文 data-prompt-src）も埋める。
+    プレビューは1ファイルなので読みに行けない。埋めておけば各ページのJSは読み込み済みとして扱う"""
+    m = re.search(r'data-months="([^"]*)"', html)
+    srcs = [pair.split("=", 1)[1] for pair in m.group(1).split()] if m else []
+    srcs += re.findall(r'data-prompt-src="([^"]+)"', html)
+    out = packed("\n".join((DIST / src).read_text(encoding="utf-8") for src in srcs), srcs) if srcs else ""
+    return out + search_index(html)
+
+
+def search_index(html: str) -> str:
+    """サイト内検索の索引（文書一覧 data-docs-src と bigram の分片 data-shard-src）は埋めると120KBを超える。
+    ページの本文はプレビューに全部あるので、初めて検索したときに pvIndex がそこから build.py と同じ
+    分け方・数え方で作る。ページにない質問バンクの文書だけを埋める（リンクはプレビュー内のアンカーに替える）"""
+    docs = re.search(r'data-docs-src="([^"]+)"', html)
+    if not docs:
+        return ""
+    srcs = [docs.group(1), *re.search(r'data-shard-src="([^"]+)"', html).group(1).split()]
+    extra = [{**d, "u": "#" + d["u"].split("#", 1)[1]}
+             for d in build.question_bank_docs(build.load("question_bank.yaml"))]
+    return packed(json.dumps(extra, ensure_ascii=False), srcs, "pvIndex")
+
+
+pages = {fn: inline_assets((DIST / fn).read_text(encoding="utf-8")) for _, fn in sections}
+# ヘッダーはページごとに現在地（.on）が違うだけ。外した形が全ページで一致すれば1個の<template>にする。
+# 一致しないページ（テンプレートが個別に変わった等）は、そのページだけ実物をそのまま埋める
+head_tpl = page_head(pages["index.html"]).replace(NAV_ON, "")
+
 parts = []
 for label, fn in sections:
-    html = (DIST / fn).read_text(encoding="utf-8")
-    # 実物のヘッダー（ナビ・現在地・締切チップ込み）をそのまま映す
-    head = re.search(r'<div class="site-head-wrap">.*?</header>\s*</div>', html, re.S).group(0)
-    head = head.replace('src="static/logo.png"', f'src="data:image/png;base64,{logo64}"')
-    m = re.search(r"<main>(.*?)</main>", html, re.S).group(1)
-    # エントリー文と準備室は、実物と同じ動作にするため末尾のスクリプトも取り込む
+    html = pages[fn]
+    head = page_head(html)
+    if head.replace(NAV_ON, "") == head_tpl:
+        head = f"<script>pvHead('{fn[:-5]}')</script>"
+    m = re.search(r"<main>(.*?)</main>", html, re.S).group(1) + lazy_data(html)
+    # エントリー文・フカボリ・検索と準備室は、実物と同じ動作にするため末尾のスクリプトも取り込む
     # （これを怠るとプレビューでGeminiボタン等が無反応になる＝実地で検出された問題）
-    if fn in ("entry.html", "workspace.html", "news.html"):
+    if fn in ("entry.html", "fukabori.html", "workspace.html", "news.html", "search.html"):
         tail = html.split("</main>", 1)[1]
         for sc in re.findall(r"<script>.*?</script>", tail, re.S):
             m += sc
@@ -73,6 +179,65 @@ for label, fn in sections:
         f'<div class="pv-label">{label}</div>{body}</section>'
     )
 
+# 2ページ以上に同じ形で出る実行スクリプト（base・_pace・_checkformの部品）は1回だけ持つ。
+# 各所のスタブから大域evalで実行するので、document.currentScriptは元の位置（スタブ）を指したまま
+_seen = {}
+for p in parts:
+    for sc in re.findall(r"<script>(.*?)</script>", p, re.S):
+        _seen[sc] = _seen.get(sc, 0) + 1
+shared_js = [sc for sc, n in _seen.items() if n > 1]
+for i, sc in enumerate(shared_js):
+    parts = [p.replace(f"<script>{sc}</script>", f"<script>pvRun({i})</script>") for p in parts]
+runtime = (
+    "var PV_JS=" + json.dumps(shared_js, ensure_ascii=False).replace("<", "\\u003c") + ";"
+    "function pvRun(i){(0,eval)(PV_JS[i]);}"
+    # 展開は初めて読まれたときに1回だけ（getterで遅らせる）
+    "function pvPack(b,srcs,f){var p,e=window.SHINSEIDER_EMBEDDED=window.SHINSEIDER_EMBEDDED||{};"
+    "function get(){if(!p){var s=atob(b),u=new Uint8Array(s.length);"
+    "for(var i=0;i<s.length;i++)u[i]=s.charCodeAt(i);"
+    "p=new Response(new Blob([u]).stream().pipeThrough(new DecompressionStream('gzip'))).text()"
+    ".then(f?function(t){f(JSON.parse(t),srcs);}:function(t){(0,eval)(t);});}return p;}"
+    "srcs.forEach(function(s){Object.defineProperty(e,s,{get:get,enumerable:true,configurable:true});});}"
+    # build.py の _Sections・page_docs・build_search_index と同じ: <main>を h2/h3 で節に分け、
+    # 見出しの bigram は3倍に数え、分片は bigram の2文字から決める（search.js の shardOf と同じ式）
+    "function pvIndex(extra,srcs){"
+    "var SKIP=/^(SCRIPT|STYLE|TEMPLATE|TEXTAREA|PRE|SVG|BUTTON|SELECT)$/,W=/[\\p{L}\\p{N}]/u,"
+    "docs=[],n=srcs.length-1,shards=[],lens=0,i;"
+    "function norm(s){return s.normalize('NFKC').split(/\\s+/).filter(Boolean).join(' ');}"
+    "function bg(t){var out=[],run=[];Array.from(t.toLowerCase()+' ').forEach(function(ch){"
+    "if(W.test(ch)){run.push(ch);return;}for(var j=0;j+1<run.length;j++)out.push(run[j]+run[j+1]);run=[];});"
+    "return out;}"
+    "document.querySelectorAll('.pv-section').forEach(function(sec){"
+    "var main=sec.querySelector('main'),pg=sec.id.slice(4),h1=[],secs=[['',[],[]]];"
+    "if(!main||pg==='search')return;"
+    "(function walk(el,head){for(var c=el.firstChild;c;c=c.nextSibling){"
+    "if(c.nodeType===3){(head||secs[secs.length-1][2]).push(c.data);continue;}"
+    "if(c.nodeType!==1||SKIP.test(c.nodeName.toUpperCase())||c.hasAttribute('hidden'))continue;"
+    "if(!head&&c.nodeName==='H1'){walk(c,h1);continue;}"
+    "if(!head&&(c.nodeName==='H2'||c.nodeName==='H3')){var a=c.parentNode.closest('[id]'),s=["
+    "c.id||(a&&main.contains(a)?a.id:''),[],[]];secs.push(s);walk(c,s[1]);continue;}"
+    "walk(c,head);}})(main,null);"
+    "var page=norm(h1.join(''))||pg+'.html';"
+    "secs.forEach(function(s){var x=norm(s[2].join(' ')),h=norm(s[1].join(''));"
+    "if(x.length>=20)docs.push({t:page+(h?' › '+h:''),u:'#'+(s[0]||'sec-'+pg),x:x});});});"
+    "docs=docs.concat(extra);"
+    "for(i=0;i<n;i++)shards.push({});"
+    "docs.forEach(function(doc,d){var c={},body=bg(doc.x);"
+    "bg(doc.t).forEach(function(b){c[b]=(c[b]||0)+3;});body.forEach(function(b){c[b]=(c[b]||0)+1;});"
+    "doc.len=body.length;doc.x=doc.x.slice(0,600);lens+=body.length;"
+    "Object.keys(c).forEach(function(b){var cs=Array.from(b),s=shards[(cs[0].codePointAt(0)*31+cs[1].codePointAt(0))%n];"
+    "(s[b]=s[b]||[]).push(d,c[b]);});});"
+    "shards.forEach(function(s){Object.keys(s).forEach(function(b){"
+    "for(var p=s[b],k=p.length-2;k>=2;k-=2)p[k]-=p[k-2];});});"
+    "var D=window.SHINSEIDER_DATA=window.SHINSEIDER_DATA||{};"
+    "D.search_docs={n:docs.length,avglen:Math.round(lens/Math.max(1,docs.length)*10)/10,docs:docs};"
+    "shards.forEach(function(s,j){D['search_'+j]=s;});}"
+    "function pvHead(p){var s=document.currentScript,"
+    "n=document.getElementById('pv-head').content.cloneNode(true),"
+    "a=n.querySelector('nav a[href=\"#sec-'+p+'\"]');"
+    "if(a){a.className='on';a.setAttribute('aria-current','page');}s.replaceWith(n);}"
+)
+
 nav = "".join(
     f'<a href="#sec-{fn[:-5]}">{label.split("—")[0].strip()}</a>' for label, fn in sections
 )
@@ -91,13 +256,20 @@ doc = f"""<!DOCTYPE html>
 .pv-label {{ background: var(--accent); color: #fff; display: inline-block; font-size: .78rem;
   font-weight: 700; padding: .3em .9em; margin: 0 0 0 1rem; letter-spacing: .08em; }}
 .pv-section main {{ padding-bottom: 3rem; }}
-</style></head><body>
+:root {{ --pv-logo: url(data:image/png;base64,{logo64}); }}
+.pv-logo {{ width: {24 * _lw / _lh:.1f}px; background: var(--pv-logo) left center / contain no-repeat; }}
+</style>
+<script>{runtime}</script></head><body>
 <div class="pv-topbar"><strong>プレビュー</strong>{nav}</div>
+<template id="pv-head">{head_tpl}</template>
 {"".join(f'{p}' for p in parts)}
 <footer class="site-footer"><p>プレビュー（{dt.date.today()}生成）。各ページを実物のヘッダー込みで縦に並べています。実物ではヘッダーは画面上部に追従します。ページ間リンクはページ内アンカーに変換済み。</p></footer>
 </body></html>"""
 
 OUT.mkdir(exist_ok=True)
 out_file = OUT / "shinseider_preview.html"
-out_file.write_text(doc, encoding="utf-8")
-print("→", out_file, f"({out_file.stat().st_size // 1024}KB)")
+out_file.write_text(minify(doc), encoding="utf-8")
+size_kb = out_file.stat().st_size / 1024
+print("→", out_file, f"({size_kb:.0f}KB / 予算 {BUDGET_KB}KB)")
+if size_kb > BUDGET_KB:
+    raise SystemExit(f"プレビューが予算超過（{size_kb:.0f}KB > {BUDGET_KB}KB）— 重複して埋まっている部品がないか確認すること")
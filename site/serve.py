@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""編集用の開発サーバー（本番のRenderでは使わない）。
+site/dist を http://localhost:8000/ で配信し、data/・site/templates/・site/static/・site/js/ を監視する。
+変更があれば影響する出力だけを作り直し（build.main(changed=...)）、開いているブラウザを
+SSE（/__reload）で再読み込みさせる。保存が続けて来たときは、静かになってから1回だけビルドする。
+`python3 site/serve.py [--port 8000]`"""
+import argparse
+import hashlib
+import http.server
+import json
+import queue
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import build  # noqa: E402
+
+WATCH = [build.ROOT / "data", build.SITE / "templates", build.SITE / "static", build.SITE / "js"]
+POLL = 0.1       # 監視の間隔（秒）
+DEBOUNCE = 0.15  # 最後の変更からこの時間だけ静かになったらビルドする（連続保存を1回にまとめる）
+
+# 配信時だけHTMLに差し込む（distのファイルには書かない）。自分のページか静的ファイルが変わったら再読み込み
+RELOAD_SNIPPET = b"""<script>(function(){
+  var es = new EventSource('/__reload');
+  es.onmessage = function(e){
+    var written = JSON.parse(e.data), here = location.pathname.split('/').pop() || 'index.html';
+    if (written.some(function(o){ return o === here || o.indexOf('static/') === 0; })) location.reload();
+  };
+})();</script>
+"""
+
+_clients = []
+_clients_lock = threading.Lock()
+
+
+def broadcast(written):
+    data = json.dumps(written, ensure_ascii=False)
+    with _clients_lock:
+        for q in _clients:
+            q.put(data)
+
+
+def snapshot():
+    """監視対象の {パス: 更新時刻}。エディタの一時ファイル（.swp・~）は数えない"""
+    return {
+        p: p.stat().st_mtime_ns
+        for d in WATCH for p in d.rglob("*")
+        if p.is_file() and not p.name.startswith(".") and not p.name.endswith("~")
+    }
+
+
+def rebuild(changed):
+    t0 = time.perf_counter()
+    try:
+        written = build.main(changed=changed)
+    except Exception:
+        # YAMLの書きかけ・assert違反などはここで表示して監視を続ける（次の保存で直れば通る）
+        traceback.print_exc()
+        print("！ ビルド失敗 — 直して保存し直してください", flush=True)
+        return
+    names = ", ".join(sorted(p.name for p in changed))
+    print(f"↻ {names} → {len(written)}件 {(time.perf_counter() - t0) * 1000:.0f}ms", flush=True)
+    if written:
+        broadcast(written)
+
+
+def watch():
+    prev = snapshot()
+    pending, last_change = set(), 0.0
+    while True:
+        time.sleep(POLL)
+        cur = snapshot()
+        diff = {p for p in cur.keys() | prev.keys() if cur.get(p) != prev.get(p)}
+        prev = cur
+        if diff:
+            pending |= diff
+            last_change = time.monotonic()
+        elif pending and time.monotonic() - last_change >= DEBOUNCE:
+            rebuild(pending)
+            pending = set()
+
+
+class Handler(http.server.SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(build.DIST), **kwargs)
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/__reload":
+            return self.serve_events()
+        if path == "/" or path.endswith(".html"):
+            return self.serve_html(path)
+        if path.endswith(".ics"):
+            return self.serve_revalidated(path, "text/calendar; charset=utf-8")
+        if path in ("/sitemap.xml", "/changes.json"):
+            return self.serve_revalidated(path, "application/xml" if path.endswith(".xml") else "application/json")
+        return super().do_GET()
+
+    def serve_html(self, path):
+        f = build.DIST / ("index.html" if path == "/" else path.lstrip("/"))
+        if not f.is_file():
+            return self.send_error(404)
+        body = f.read_bytes().replace(b"</body>", RELOAD_SNIPPET + b"</body>", 1)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def serve_revalidated(self, path, content_type):
+        """カレンダー購読・sitemap・変更一覧は中身のハッシュをETagにし、変わっていなければ304
+        （本番の配信と同じ振る舞いを確かめる用）。更新日の台帳に載っていればそのハッシュ（ビルド日時を
+        除いた中身。日時しか違わない再ビルドでは変わらないので弱いETag）"""
+        f = build.DIST / path.lstrip("/")
+        if not f.is_file():
+            return self.send_error(404)
+        body = f.read_bytes()
+        lastmod = build.load_lastmod()
+        entry = lastmod.get(path.lstrip("/"))
+        etag = f'W/"{entry["sha256"]}"' if entry else '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        fresh = self.headers.get("If-None-Match") == etag
+        self.send_response(304 if fresh else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")  # ここだけ no-store にしない（ETagで確かめ直させる）
+        if not fresh:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+        http.server.BaseHTTPRequestHandler.end_headers(self)
+        if not fresh:
+            self.wfile.write(body)
+
+    def serve_events(self):
+        q = queue.Queue()
+        with _clients_lock:
+            _clients.append(q)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        try:
+            while True:
+                try:
+                    msg = f"data: {q.get(timeout=15)}\n\n"
+                except queue.Empty:
+                    msg = ": ping\n\n"  # 接続維持
+                self.wfile.write(msg.encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with _clients_lock:
+                _clients.remove(q)
+
+    def log_message(self, fmt, *args):
+        pass  # アクセスログは出さない（ビルドの行を読みやすくする）
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--port", type=int, default=8000)
+    args = ap.parse_args(argv)
+
+    build.main()
+    threading.Thread(target=watch, daemon=True).start()
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", args.port), Handler)
+    srv.daemon_threads = True
+    print(f"監視中: data/ site/templates/ site/static/ site/js/ → http://localhost:{args.port}/ （Ctrl+Cで終了）", flush=True)
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
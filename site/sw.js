@@ -0,0 +1,61 @@
+// service worker。build.py が先頭に PRECACHE（distの相対パス → 中身のハッシュ）を差し込んで dist/sw.js に書く。
+// - 事前キャッシュ: ハッシュが変わったもの・まだ持っていないものだけ取り直す。一覧から消えたものは捨てる
+// - ページ: キャッシュから即返し、裏で取り直して次に備える（電波の弱い場所でも即表示、圏外でも開ける）
+// - 指紋付きの static/js/: 名前が同じなら中身も同じなので、持っていればそのまま返す
+var CACHE = 'shinseider';
+var BASE = self.registration.scope;  // 相対パスはここから解決する（サブパス配信でも動くように）
+var MANIFEST_KEY = BASE + '__precache-manifest';
+
+function abs(path){ return new URL(path, BASE).href; }
+
+self.addEventListener('install', function(e){
+  e.waitUntil(caches.open(CACHE).then(function(cache){
+    return cache.match(MANIFEST_KEY).then(function(r){ return r ? r.json() : {}; }).then(function(old){
+      var next = {};
+      return Promise.all(Object.keys(PRECACHE).map(function(path){
+        var url = abs(path);
+        return cache.match(url).then(function(hit){
+          if (hit && old[path] === PRECACHE[path]) { next[path] = PRECACHE[path]; return; }
+          return fetch(url, {cache: 'reload'}).then(function(res){
+            if (!res.ok) return;
+            next[path] = PRECACHE[path];
+            return cache.put(url, res);
+          }).catch(function(){});  // 取れなかったものは次の更新で取り直す（インストール自体は止めない）
+        });
+      })).then(function(){
+        return cache.put(MANIFEST_KEY, new Response(JSON.stringify(next)));
+      });
+    });
+  }).then(function(){ return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function(e){
+  var keep = {};
+  Object.keys(PRECACHE).forEach(function(path){ keep[abs(path)] = true; });
+  keep[MANIFEST_KEY] = true;
+  e.waitUntil(caches.open(CACHE).then(function(cache){
+    return cache.keys().then(function(reqs){
+      return Promise.all(reqs.filter(function(r){ return !keep[r.url]; }).map(function(r){ return cache.delete(r); }));
+    });
+  }).then(function(){ return self.clients.claim(); }));
+});
+
+self.addEventListener('fetch', function(e){
+  var req = e.request;
+  if (req.method !== 'GET' || req.url.indexOf(BASE) !== 0) return;
+  var url = req.url.split('#')[0].split('?')[0];
+  if (url === BASE) url = abs('index.html');
+  if (!(url.slice(BASE.length) in PRECACHE)) return;  // 一覧にないもの（ics・外部計測など）は素通し
+  e.respondWith(caches.open(CACHE).then(function(cache){
+    return cache.match(url).then(function(hit){
+      if (hit && url.indexOf(abs('static/js/')) === 0) return hit;
+      var update = fetch(req).then(function(res){
+        if (res.ok) return cache.put(url, res.clone()).then(function(){ return res; });
+        return res;
+      });
+      if (!hit) return update;
+      e.waitUntil(update.catch(function(){}));
+      return hit;
+    });
+  }));
+});
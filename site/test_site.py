@@ -1,12 +1,29 @@
 #!/usr/bin/env python3
 """サイトの回帰テスト: ビルド → 語彙リーク検査 → 動作検査。
-公開ゲートのE2E項目の実体。`python3 site/test_site.py` で全部走る。"""
+公開ゲートのE2E項目の実体。`python3 site/test_site.py` で全部走る。
+
+ビルドは1回だけ行い、検査は独立したシナリオに分けてワーカープロセスで並列に回す。
+各シナリオは新しいブラウザコンテキスト（localStorageも別）で動くので、順序に依存しない。
+  -j N   ワーカー数（既定: CPU数、上限4）
+  -k 語  名前にその語を含むシナリオだけ走らせる（例: -k leak / -k perf）
+perf:<ページ> は重さを実測して site/perf_budget.yaml の予算と比べ、実測値を
+site/.reports/perf_report.json に書き出す（走らせたページの分だけ。生成物なのでコミットしない）。"""
+import argparse
+import json
+import os
 import subprocess
 import sys
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import yaml
+
 ROOT = Path(__file__).resolve().parent.parent
 DIST = ROOT / "site" / "dist"
+BUDGET_FILE = ROOT / "site" / "perf_budget.yaml"
+REPORT_FILE = ROOT / "site" / ".reports" / "perf_report.json"  # .gitignore
 
 # 画面に出てはいけない語彙
 LEAK_WORDS = [
@@ -17,7 +34,8 @@ LEAK_WORDS = [
     "解錠", "逆引き", "ステータスの階段", "Tier",
     "世界の現実", "事実の系譜", "政策の末端", "ドメイン", "作戦室",
 ]
-PAGES = ["index", "workspace", "check", "entry", "schedule", "cool", "subsidy", "trust", "about", "ambassadors", "news"]
+PAGES = ["index", "workspace", "check", "entry", "fukabori", "schedule", "cool", "subsidy", "policy", "trust", "about",
+         "ambassadors", "news", "search"]
 
 SAMPLE_ENTRY = """## 現業と自分
 金属加工の会社で営業を5年やっています。年商3億円、従業員20名。
@@ -32,142 +50,337 @@ SAMPLE_ENTRY = """## 現業と自分
 """
 
 
-def main():
-    subprocess.run([sys.executable, str(ROOT / "site" / "build.py")], check=True, capture_output=True)
+# ---------- シナリオ ----------
+# 各シナリオは (pg, fail) を受け取る。pgは専用コンテキストの新しいページ、failは失敗文言の追記先。
+# 計測値を返すシナリオ（perf）は dict を返す
+
+def leak_scan(name):
+    """1. 語彙リーク検査（表示テキストに対して）。ページごとに独立シナリオにする"""
+    def run(pg, fail):
+        pg.goto(f"file://{DIST}/{name}.html")
+        body = pg.inner_text("body")
+        for w in LEAK_WORDS:
+            if w in body:
+                fail(f"語彙リーク {name}: {w}")
+    return run
+
+
+def check_minimal(pg, fail):
+    """2a. 適合チェック: 必須のQ1・Q2だけで判定できる（補助金質問は任意）"""
+    pg.goto(f"file://{DIST}/check.html")
+    pg.check("input[name=q_age][value=yes]"); pg.check("input[name=q_pos][value=yes]")
+    pg.click("button[type=submit]")
+    pg.wait_for_selector("#result:not([hidden])", timeout=8000)
+    r = pg.inner_text("#result")
+    if "アトツギ甲子園" not in r:
+        fail("最小回答で甲子園判定が出ない")
+    if "未回答のままで大丈夫" not in r:
+        fail("任意未回答の案内が出ない")
+
+
+def check_restore(pg, fail):
+    """2b. 全回答 → 保存 → 準備室で復元"""
+    pg.goto(f"file://{DIST}/check.html")
+    pg.check("input[name=q_age][value=yes]"); pg.check("input[name=q_pos][value=yes]")
+    pg.check("input[name=q_succ][value=yes]");
+    pg.click("button[type=submit]")
+    pg.wait_for_selector("#result:not([hidden])", timeout=8000)
+    if "進み具合" not in pg.inner_text("#result"):
+        fail("チェック結果に進み具合ページへの導線がない")
+    pg.goto(f"file://{DIST}/workspace.html")
+    try:
+        pg.wait_for_selector("#ws-status:not([hidden])", timeout=5000)
+        if "適合の見込み" not in pg.inner_text("#ws-status-text"):
+            fail("準備室の現在地表示が不正")
+    except Exception:
+        fail("準備室で前回チェックが復元されない")
+
+
+def entry_flow(pg, fail):
+    """3. エントリー文づくり: 貼り戻し → 取り込み → 検証 → 復元 → 準備室に進捗"""
+    pg.goto(f"file://{DIST}/entry.html")
+    if "現業と自分" not in (pg.evaluate("() => (window.SHINSEIDER_DATA.entry || {}).prompt") or ""):
+        fail("エントリーページにプロンプト定義がない")
+    ai_btns = pg.eval_on_selector_all(".ai-card .ai-head", "els => els.map(e => e.textContent.trim())")
+    for want in ["Claude", "ChatGPT", "Gemini", "Grok"]:
+        if not any(want in t for t in ai_btns):
+            fail(f"AIボタンに{want}がない: {ai_btns}")
+    # 指示文の透明性: 全文がページ内で確認できる
+    if "現業と自分" not in pg.eval_on_selector("#prompt-view pre", "el => el.textContent"):
+        fail("指示文の全文表示がない")
+    # Geminiカード: クリックで実際に新しいタブが開く（ポップアップブロック回帰の検査）
+    # 注: この砂場ではclaude.ai等はプロキシ遮断でウィンドウ自体が実体化しないため、
+    #     実体化するGeminiのカードを明示的に押す（検査対象は「同期openか」であり宛先ではない）
+    try:
+        with pg.expect_popup(timeout=5000) as pop:
+            pg.click('.ai-card[data-open*="gemini"]')
+        # この環境は外部ネットワーク遮断のため到達先URLは検証しない。
+        # 「新規タブが開くこと」自体がポップアップブロック回帰の検査対象。
+        pop.value.close()
+    except Exception as e:
+        fail(f"Geminiカードで新規タブが開かない: {type(e).__name__}")
+    pg.fill("#paste-area", SAMPLE_ENTRY)
+    pg.click("#import-btn")
+    msg = pg.inner_text("#import-msg")
+    if "5件" not in msg or "そろいました" not in msg:
+        fail(f"貼り戻し取り込みが不正: {msg}")
+    statuses = pg.eval_on_selector_all(".sec-status", "els => els.map(e => e.textContent)")
+    if any("未入力" in s for s in statuses):
+        fail(f"取り込み後も未入力セクションがある: {statuses}")
+    # 予行審査: 骨子入りの審査員プロンプトがコピーできる（骨子が空でないので成功パス）
+    pg.click("#copy-review")
+    try:
+        pg.wait_for_function("document.getElementById('review-msg').textContent.length > 0", timeout=5000)
+    except Exception:
+        fail("予行審査ボタンの応答がない")
+
+    # リロードして復元確認
+    pg.reload()
+    first_text = pg.eval_on_selector(".entry-section .sec-text", "el => el.value")
+    if "金属加工" not in first_text:
+        fail("エントリー骨子がリロード後に復元されない")
+    # 準備室に進捗が出る
+    pg.goto(f"file://{DIST}/workspace.html")
+    ws_entry = pg.inner_text("#ws-entry-text")
+    if "5/5" not in ws_entry:
+        fail(f"準備室のエントリー進捗が不正: {ws_entry}")
+    # エントリーページの状況メッセージ（1行のみ）
+    pg.goto(f"file://{DIST}/entry.html")
+    if "間に合" not in pg.inner_text("#pace-message"):
+        fail("エントリーページに間に合うかメッセージがない")
+
+
+def fukabori_lazy(pg, fail):
+    """3.4 フカボリ: 章の指示文は触れるまで読まない／触れてから押せば同期でタブが開く"""
+    pg.goto(f"file://{DIST}/fukabori.html")
+    loaded = pg.evaluate("() => performance.getEntriesByType('resource').map(e => e.name)")
+    if any("fukabori-ch" in u or "fukabori-critique" in u for u in loaded):
+        fail("フカボリの章の指示文が初期表示で読み込まれている")
+    # entry:flow と同じ理由で、この砂場で実体化するGeminiを選んでおく
+    pg.click('.fk-ai-pick[data-name="Gemini"]')
+    pg.hover('.fk-step[data-chapter="0"] .fk-step-start')
+    try:
+        pg.wait_for_function("() => !!(window.SHINSEIDER_DATA || {}).fukabori_0", timeout=5000)
+    except Exception:
+        fail("章に触れても指示文が読み込まれない")
+        return
+    try:
+        with pg.expect_popup(timeout=5000) as pop:
+            pg.click('.fk-step[data-chapter="0"] .fk-step-start')
+        pop.value.close()
+    except Exception as e:
+        fail(f"フカボリの章ボタンで新規タブが開かない: {type(e).__name__}")
+
+
+def search_query(pg, fail):
+    """3.6 サイト内検索: 索引は問い合わせに要る分片だけ読み、補助金の加点の節が上位に出る"""
+    pg.goto(f"file://{DIST}/search.html?q=" + urllib.parse.quote("加点"))
+    try:
+        pg.wait_for_selector("#search-results li", timeout=5000)
+    except Exception:
+        fail("検索結果が出ない（加点）")
+        return
+    hrefs = pg.eval_on_selector_all("#search-results li a", "els => els.slice(0, 5).map(e => e.getAttribute('href'))")
+    if not any(h.startswith("subsidy.html") for h in hrefs):
+        fail(f"「加点」で補助金ページが上位に出ない: {hrefs}")
+    if not pg.query_selector("#search-results mark"):
+        fail("検索結果に一致箇所の強調がない")
+    shards = pg.evaluate("() => performance.getEntriesByType('resource')"
+                         ".map(e => e.name).filter(u => /search-\\d+\\./.test(u))")
+    if len(shards) != 1:
+        fail(f"2文字の問い合わせで読む分片は1つのはず: {shards}")
+
+
+def nav_current(pg, fail):
+    """3.5 ナビ: 現在地表示"""
+    pg.goto(f"file://{DIST}/subsidy.html")
+    on_txt = pg.eval_on_selector("nav a.on", "el => el.textContent") if pg.query_selector("nav a.on") else None
+    if on_txt != "補助金":
+        fail(f"ナビの現在地表示が不正: {on_txt}")
+
+
+def countdown(pg, fail):
+    """4. カウントダウン（トップは軽く、プランは出さない）"""
+    pg.goto(f"file://{DIST}/index.html")
+    days = pg.inner_text("#countdown-days")
+    if not (days.isdigit() and 0 < int(days) < 200):
+        fail(f"カウントダウン異常: {days}")
+    if pg.query_selector("#pace-plan"):
+        fail("トップに逆算プランが出ている（道筋ページへ分離したはず）")
+    if not pg.query_selector('a[href="schedule.html"]'):
+        fail("トップから道筋ページへの導線がない")
+    for door in ["cool.html", "check.html", "subsidy.html"]:
+        if not pg.query_selector(f'a[href="{door}"]'):
+            fail(f"トップの入り口に{door}への導線がない")
+
+
+def schedule_plan(pg, fail):
+    """5. 道筋ページ: 間に合うかメッセージ＋日付入りプラン"""
+    pg.goto(f"file://{DIST}/schedule.html")
+    pace_msg = pg.inner_text("#pace-message")
+    if "間に合" not in pace_msg:
+        fail(f"道筋ページのメッセージが不正: {pace_msg}")
+    plan_items = pg.eval_on_selector_all("#pace-plan li", "els => els.length")
+    if plan_items < 3:
+        fail(f"逆算プランの項目が少ない: {plan_items}")
+
+
+# 読み込み後に集める値。layout-shift/longtaskはbufferedで読み込み中の分まで拾う
+PERF_JS = """async () => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  let cls = 0, lastLong = 0;
+  try {
+    new PerformanceObserver(l => { for (const e of l.getEntries()) if (!e.hadRecentInput) cls += e.value; })
+      .observe({type: 'layout-shift', buffered: true});
+    new PerformanceObserver(l => { for (const e of l.getEntries()) lastLong = Math.max(lastLong, e.startTime + e.duration); })
+      .observe({type: 'longtask', buffered: true});
+  } catch (_) {}
+  await new Promise(r => setTimeout(r, 500));
+  return {
+    urls: [nav.name].concat(performance.getEntriesByType('resource').map(e => e.name)),
+    dom_nodes: document.getElementsByTagName('*').length,
+    cls: cls,
+    tti_ms: Math.max(nav.domContentLoadedEventEnd, lastLong),
+  };
+}"""
+
+
+def load_budgets():
+    with open(BUDGET_FILE, encoding="utf-8") as f:
+        b = yaml.safe_load(f)
+    return {page: {**b["default"], **lim} for page, lim in b["pages"].items()}
+
+
+def local_bytes(urls):
+    """読み込まれた同一サイトの資源の合計バイト数。file://では転送量が取れないので実ファイルで数える。
+    外部（解析・favicon取得）はこの検査の対象外"""
+    total = 0
+    for u in set(urls):
+        parsed = urllib.parse.urlparse(u)
+        if parsed.scheme == "file":
+            path = Path(urllib.parse.unquote(parsed.path))
+            if path.is_file():
+                total += path.stat().st_size
+    return total
+
+
+def perf_page(name, budget):
+    """6. ページの重さ: 実測して予算と比べる"""
+    def run(pg, fail):
+        cdp = pg.context.new_cdp_session(pg)
+        cdp.send("Performance.enable")
+        pg.goto(f"file://{DIST}/{name}.html", wait_until="load")
+        raw = pg.evaluate(PERF_JS)
+        cdp_metrics = {m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]}
+        got = {
+            "bytes": local_bytes(raw["urls"]),
+            "dom_nodes": raw["dom_nodes"],
+            "script_ms": round(cdp_metrics.get("ScriptDuration", 0) * 1000, 1),
+            "cls": round(raw["cls"], 4),
+            "tti_ms": round(raw["tti_ms"], 1),
+        }
+        for k, v in got.items():
+            if v > budget[k]:
+                fail(f"予算超過 {name}.{k}: {v} > {budget[k]}")
+        return got
+    return run
+
+
+SCENARIOS = {
+    **{f"leak:{name}": leak_scan(name) for name in PAGES},
+    **{f"perf:{name}": perf_page(name, budget) for name, budget in load_budgets().items()},
+    "check:minimal": check_minimal,
+    "check:restore": check_restore,
+    "entry:flow": entry_flow,
+    "fukabori:lazy": fukabori_lazy,
+    "search:query": search_query,
+    "nav:current": nav_current,
+    "index:countdown": countdown,
+    "schedule:plan": schedule_plan,
+}
+
+
+# ---------- 実行 ----------
+
+def run_shard(names):
+    """ワーカー1つ分: ブラウザを1つ起動し、シナリオごとに新しいコンテキストで回す。
+    戻り値は [(シナリオ名, 秒, 失敗文言のリスト, 計測値)]"""
     from playwright.sync_api import sync_playwright
 
-    failures = []
+    results = []
     with sync_playwright() as p:
         b = p.chromium.launch()
-        pg = b.new_page(viewport={"width": 1280, "height": 900})
-        errors = []
-        pg.on("pageerror", lambda e: errors.append(str(e)))
-
-        # 1. 語彙リーク検査（表示テキストに対して）
-        for name in PAGES:
-            pg.goto(f"file://{DIST}/{name}.html")
-            body = pg.inner_text("body")
-            for w in LEAK_WORDS:
-                if w in body:
-                    failures.append(f"語彙リーク {name}: {w}")
-
-        # 2a. 適合チェック: 必須のQ1・Q2だけで判定できる（補助金質問は任意）
-        pg.goto(f"file://{DIST}/check.html")
-        pg.check("input[name=q_age][value=yes]"); pg.check("input[name=q_pos][value=yes]")
-        pg.click("button[type=submit]")
-        pg.wait_for_selector("#result:not([hidden])", timeout=8000)
-        r = pg.inner_text("#result")
-        if "アトツギ甲子園" not in r:
-            failures.append("最小回答で甲子園判定が出ない")
-        if "未回答のままで大丈夫" not in r:
-            failures.append("任意未回答の案内が出ない")
-
-        # 2b. 全回答 → 保存 → 準備室で復元
-        pg.goto(f"file://{DIST}/check.html")
-        pg.check("input[name=q_age][value=yes]"); pg.check("input[name=q_pos][value=yes]")
-        pg.check("input[name=q_succ][value=yes]");
-        pg.click("button[type=submit]")
-        pg.wait_for_selector("#result:not([hidden])", timeout=8000)
-        if "進み具合" not in pg.inner_text("#result"):
-            failures.append("チェック結果に進み具合ページへの導線がない")
-        pg.goto(f"file://{DIST}/workspace.html")
-        try:
-            pg.wait_for_selector("#ws-status:not([hidden])", timeout=5000)
-            if "適合の見込み" not in pg.inner_text("#ws-status-text"):
-                failures.append("準備室の現在地表示が不正")
-        except Exception:
-            failures.append("準備室で前回チェックが復元されない")
-
-        # 3. エントリー文づくり: 貼り戻し → 取り込み → 検証 → 復元 → 作戦室に進捗
-        pg.goto(f"file://{DIST}/entry.html")
-        if "## 現業と自分" not in pg.inner_text("#entry-data") and "現業と自分" not in pg.content():
-            failures.append("エントリーページにプロンプト定義がない")
-        ai_btns = pg.eval_on_selector_all(".ai-card .ai-head", "els => els.map(e => e.textContent.trim())")
-        for want in ["Claude", "ChatGPT", "Gemini", "Grok"]:
-            if not any(want in t for t in ai_btns):
-                failures.append(f"AIボタンに{want}がない: {ai_btns}")
-        # 指示文の透明性: 全文がページ内で確認できる
-        pv = pg.inner_text("#prompt-view")
-        if "現業と自分" not in pg.eval_on_selector("#prompt-view pre", "el => el.textContent"):
-            failures.append("指示文の全文表示がない")
-        # Geminiカード: クリックで実際に新しいタブが開く（ポップアップブロック回帰の検査）
-        # 注: この砂場ではclaude.ai等はプロキシ遮断でウィンドウ自体が実体化しないため、
-        #     実体化するGeminiのカードを明示的に押す（検査対象は「同期openか」であり宛先ではない）
-        try:
-            with pg.expect_popup(timeout=5000) as pop:
-                pg.click('.ai-card[data-open*="gemini"]')
-            # この環境は外部ネットワーク遮断のため到達先URLは検証しない。
-            # 「新規タブが開くこと」自体がポップアップブロック回帰の検査対象。
-            pop.value.close()
-        except Exception as e:
-            failures.append(f"Geminiカードで新規タブが開かない: {type(e).__name__}")
-        pg.fill("#paste-area", SAMPLE_ENTRY)
-        pg.click("#import-btn")
-        msg = pg.inner_text("#import-msg")
-        if "5件" not in msg or "そろいました" not in msg:
-            failures.append(f"貼り戻し取り込みが不正: {msg}")
-        statuses = pg.eval_on_selector_all(".sec-status", "els => els.map(e => e.textContent)")
-        if any("未入力" in s for s in statuses):
-            failures.append(f"取り込み後も未入力セクションがある: {statuses}")
-        # 予行審査: 骨子入りの審査員プロンプトがコピーできる（骨子が空でないので成功パス）
-        pg.click("#copy-review")
-        try:
-            pg.wait_for_function("document.getElementById('review-msg').textContent.length > 0", timeout=5000)
-        except Exception:
-            failures.append("予行審査ボタンの応答がない")
-
-        # リロードして復元確認
-        pg.reload()
-        first_text = pg.eval_on_selector(".entry-section .sec-text", "el => el.value")
-        if "金属加工" not in first_text:
-            failures.append("エントリー骨子がリロード後に復元されない")
-        # 準備室に進捗が出る
-        pg.goto(f"file://{DIST}/workspace.html")
-        ws_entry = pg.inner_text("#ws-entry-text")
-        if "5/5" not in ws_entry:
-            failures.append(f"準備室のエントリー進捗が不正: {ws_entry}")
-
-        # 3.5 ナビ: 現在地表示
-        pg.goto(f"file://{DIST}/subsidy.html")
-        on_txt = pg.eval_on_selector("nav a.on", "el => el.textContent") if pg.query_selector("nav a.on") else None
-        if on_txt != "補助金":
-            failures.append(f"ナビの現在地表示が不正: {on_txt}")
-
-        # 4. カウントダウン（トップは軽く、プランは出さない）
-        pg.goto(f"file://{DIST}/index.html")
-        days = pg.inner_text("#countdown-days")
-        if not (days.isdigit() and 0 < int(days) < 200):
-            failures.append(f"カウントダウン異常: {days}")
-        if pg.query_selector("#pace-plan"):
-            failures.append("トップに逆算プランが出ている（道筋ページへ分離したはず）")
-        if not pg.query_selector('a[href="schedule.html"]'):
-            failures.append("トップから道筋ページへの導線がない")
-        for door in ["cool.html", "check.html", "subsidy.html"]:
-            if not pg.query_selector(f'a[href="{door}"]'):
-                failures.append(f"トップの入り口に{door}への導線がない")
-        # 5. 道筋ページ: 間に合うかメッセージ＋日付入りプラン
-        pg.goto(f"file://{DIST}/schedule.html")
-        pace_msg = pg.inner_text("#pace-message")
-        if "間に合" not in pace_msg:
-            failures.append(f"道筋ページのメッセージが不正: {pace_msg}")
-        plan_items = pg.eval_on_selector_all("#pace-plan li", "els => els.length")
-        if plan_items < 3:
-            failures.append(f"逆算プランの項目が少ない: {plan_items}")
-        # エントリーページの状況メッセージ（1行のみ）
-        pg.goto(f"file://{DIST}/entry.html")
-        if "間に合" not in pg.inner_text("#pace-message"):
-            failures.append("エントリーページに間に合うかメッセージがない")
-
-        if errors:
-            failures.append(f"JSエラー: {errors}")
+        for name in names:
+            ctx = b.new_context(viewport={"width": 1280, "height": 900})
+            pg = ctx.new_page()
+            errors, failures = [], []
+            pg.on("pageerror", lambda e: errors.append(str(e)))
+            t0 = time.perf_counter()
+            metrics = None
+            try:
+                metrics = SCENARIOS[name](pg, failures.append)
+            except Exception as e:
+                failures.append(f"例外 {type(e).__name__}: {e}")
+            if errors:
+                failures.append(f"JSエラー: {errors}")
+            results.append((name, time.perf_counter() - t0, failures, metrics))
+            ctx.close()
         b.close()
+    return results
+
+
+def write_perf_report(results):
+    """計測値を1ページ1行のJSONで書く。キー順を固定して、差分がそのままトレンドとして読めるようにする"""
+    rows = {name.split(":", 1)[1]: m for name, _, _, m in results if name.startswith("perf:") and m}
+    if not rows:
+        return
+    lines = [f'  "{page}": {json.dumps(rows[page], sort_keys=True)}' for page in sorted(rows)]
+    REPORT_FILE.parent.mkdir(exist_ok=True)
+    REPORT_FILE.write_text("{\n" + ",\n".join(lines) + "\n}\n", encoding="utf-8")
+    print(f"→ {REPORT_FILE.relative_to(ROOT)}（{len(rows)}ページ）")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("-j", "--workers", type=int, default=min(4, os.cpu_count() or 1))
+    ap.add_argument("-k", dest="keyword", default="")
+    args = ap.parse_args(argv)
+
+    t_all = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT / "site" / "build.py")], check=True, capture_output=True)
+    t_build = time.perf_counter() - t_all
+
+    names = [n for n in SCENARIOS if args.keyword in n]
+    if not names:
+        print(f"該当するシナリオがない: -k {args.keyword}")
+        return 1
+    workers = max(1, min(args.workers, len(names)))
+    # 重いシナリオ（フロー系）が1つのワーカーに偏らないよう、定義順に配る
+    shards = [names[i::workers] for i in range(workers)]
+    if workers == 1:
+        results = run_shard(shards[0])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = [r for shard in ex.map(run_shard, shards) for r in shard]
+    results.sort(key=lambda r: names.index(r[0]))
+
+    print(f"ビルド {t_build:.2f}s ／ ワーカー {workers}")
+    for name, sec, fs, _ in sorted(results, key=lambda r: -r[1]):
+        print(f"  {sec:6.2f}s  {'NG' if fs else 'ok'}  {name}")
+    print(f"合計 {time.perf_counter() - t_all:.2f}s（シナリオ時間の和 {sum(r[1] for r in results):.2f}s）")
+    write_perf_report(results)
 
+    failures = [f"[{name}] {f}" for name, _, fs, _ in results for f in fs]
+    # 予算のないページは重さが見張られない。distにあるHTMLは全部予算を持つこと
+    unbudgeted = sorted({p.stem for p in DIST.glob("*.html")} - set(load_budgets()))
+    if unbudgeted:
+        failures.append(f"perf_budget.yaml に予算がないページ: {unbudgeted}")
     if failures:
         print("NG:")
         for f in failures:
             print(" -", f)
         return 1
-    print(f"OK: {len(PAGES)}ページ / リークなし / チェック保存・復元 / カウントダウン {days}日")
+    print(f"OK: {len(names)}シナリオ / リークなし / チェック保存・復元 / カウントダウン / 予算内")
     return 0
 
 